@@ -1,19 +1,25 @@
-import json
-import os
 from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Any
 
 from .config import get_settings
 
+try:
+    from mcp_server.security.audit_writer import get_audit_writer
+except ImportError:  # repo root on sys.path instead of src/
+    from src.mcp_server.security.audit_writer import get_audit_writer
 
-def write_audit_log(record: dict[str, Any]) -> None:
+
+def write_audit_log(record: dict[str, Any], sync: bool = False) -> None:
+    """Queue an audit record.
+
+    ``sync`` waits until it is written and raises OSError if it was lost.
+    """
     settings = get_settings()
-    path = settings.AUDIT_LOG_PATH
-    os.makedirs(os.path.dirname(path), exist_ok=True)
     record["ts"] = datetime.now(UTC).isoformat()
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    writer = get_audit_writer(settings.AUDIT_LOG_PATH)
+    if not writer.append(record, sync=sync) and sync:
+        raise OSError(f"Audit record was not written to {writer.path}")
 
 
 def audit_policy_decision(
@@ -45,7 +51,8 @@ def audit_safe_mode_transition(
             "active": active,
             "actor": actor,
             "capabilities": capabilities,
-        }
+        },
+        sync=True,
     )
 
 
@@ -60,7 +67,8 @@ def audit_capability_state(
             "actor": actor,
             "changed": changed,
             "state": full_state,
-        }
+        },
+        sync=True,
     )
 
 
@@ -69,5 +77,6 @@ def audit_tool_registry_loaded(tool_names: Iterable[str]) -> None:
         {
             "event": "tool_registry_loaded",
             "tools": list(tool_names),
-        }
+        },
+        sync=True,
     )
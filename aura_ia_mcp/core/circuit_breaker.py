@@ -104,6 +104,26 @@ class CircuitBreaker:
             self._on_failure()
             raise e
 
+    def before_call(self) -> None:
+        """Raise if the circuit is open (half-opens after the timeout).
+
+        For work ``call`` cannot wrap, such as streams; report the outcome
+        with ``record_success`` / ``record_failure``.
+        """
+        if self.state == CircuitState.OPEN:
+            if self._should_attempt_reset():
+                self.state = CircuitState.HALF_OPEN
+            else:
+                raise Exception("Circuit breaker is OPEN")
+
+    def record_success(self) -> None:
+        """Record a successful call made outside ``call``."""
+        self._on_success()
+
+    def record_failure(self) -> None:
+        """Record a failed call made outside ``call``."""
+        self._on_failure()
+
     def _on_success(self) -> None:
         """Handle successful call."""
         self.failure_count = 0
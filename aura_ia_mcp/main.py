@@ -43,7 +43,7 @@ def create_app() -> FastAPI:
 
     @app.get("/metrics", summary="Prometheus metrics", tags=["observability"])
     def metrics_endpoint() -> Response:  # noqa: D401
-        data = prometheus_exposition()
+        data = prometheus_exposition(max_age=None)
         return Response(content=data, media_type="text/plain; version=0.0.4")
 
     @app.get(
@@ -23,6 +23,7 @@ from .engine import (
     DebateEngine,
     DebateResult,
     DebateRound,
+    close_debate_engine,
     get_debate_engine,
 )
 from .prompts import (
@@ -31,7 +32,22 @@ from .prompts import (
     get_judge_prompt,
     format_debate_transcript,
 )
-from .storage import get_pool, insert_debate, upsert_model_ranking
+from .leaderboard import Leaderboard, ModelRecord, RankingDelta
+from .storage import (
+    fetch_debates,
+    flush_rankings,
+    get_pool,
+    insert_debate,
+    load_rankings,
+    record_debate,
+    upsert_model_ranking,
+)
+from .tournament import (
+    TournamentResult,
+    round_robin_pairings,
+    run_tournament,
+    swiss_pairings,
+)
 
 __all__ = [
     # ELO
@@ -51,9 +67,23 @@ __all__ = [
     "DebateResult",
     "DebateRound",
     "get_debate_engine",
+    "close_debate_engine",
     "get_pool",
     "insert_debate",
+    "record_debate",
     "upsert_model_ranking",
+    "flush_rankings",
+    "load_rankings",
+    "fetch_debates",
+    # Leaderboard
+    "Leaderboard",
+    "ModelRecord",
+    "RankingDelta",
+    # Tournaments
+    "TournamentResult",
+    "round_robin_pairings",
+    "run_tournament",
+    "swiss_pairings",
     # Prompts
     "DEBATE_SYSTEM_PROMPTS",
     "get_debater_prompt",
@@ -6,6 +6,14 @@ Orchestrates multi-model debates with:
 - Judge evaluation
 - ELO rating updates
 - Database persistence
+
+Debates run concurrently: each debate keeps its own state, the shared
+HTTP client is reused across calls, and a per-model semaphore caps how
+many generations each model serves at once. Only the rating update,
+history append and persistence of a finished debate are serialized.
+
+Standings live in an incrementally maintained Leaderboard view; ranking
+rows are flushed to PostgreSQL in batches alongside debate inserts.
 """
 
 from __future__ import annotations
@@ -15,6 +23,7 @@ import logging
 import random
 import re
 import uuid
+from contextlib import asynccontextmanager, nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
@@ -22,12 +31,20 @@ from typing import Optional
 import httpx
 
 from .elo import ELO_K_FACTOR, INITIAL_ELO, calculate_elo_change
+from .leaderboard import Leaderboard
 from .prompts import (
     format_debate_transcript,
     get_debater_prompt,
     get_judge_prompt,
+    get_round_judge_prompt,
+)
+from .storage import (
+    fetch_debates,
+    flush_rankings,
+    get_pool,
+    load_rankings,
+    record_debate,
 )
-from .storage import get_pool, insert_debate, upsert_model_ranking
 from .topics import TopicCategory, get_random_topic
 
 try:
@@ -37,6 +54,9 @@ except ImportError:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+# Token budget for scoring a single round (pipelined debates)
+ROUND_JUDGE_TOKENS = 400
+
 
 @dataclass
 class DebateRound:
@@ -139,14 +159,123 @@ class DebateEngine:
         self,
         ollama_url: str = "http://aura-ia-ollama:11434",
         model_ratings: Optional[dict[str, int]] = None,
+        max_inflight_per_model: int = 2,
+        persist: bool = True,
+        ranking_flush_every: int = 10,
+        pipelined: bool = False,
     ):
+        """
+        Initialize the debate engine.
+
+        Args:
+            ollama_url: Ollama base URL
+            model_ratings: Initial ELO ratings (defaults to INITIAL_ELO)
+            max_inflight_per_model: Concurrent generations allowed per model
+            persist: Write finished debates to PostgreSQL when available
+            ranking_flush_every: Debates between ranking flushes (the
+                debate rows themselves are written per debate)
+            pipelined: Generate both sides of a round concurrently and
+                judge rounds as they finish (see _run_rounds_pipelined)
+        """
         self.ollama_url = ollama_url
         self.model_ratings = model_ratings or {
             m: INITIAL_ELO for m in self.DEBATE_MODELS
         }
+        self.max_inflight_per_model = max(1, max_inflight_per_model)
+        self.persist = persist
+        self.ranking_flush_every = max(1, ranking_flush_every)
+        self.pipelined = pipelined
+        self._leaderboard = Leaderboard(self.model_ratings)
+        self._rankings_loaded = False
         self._debate_history: list[DebateResult] = []
+        # Guards ratings and history, not whole debates or their writes
         self._lock = asyncio.Lock()
+        # Orders ranking writes: elo is stored as an absolute value, so
+        # batches must commit in the order they were taken
+        self._flush_lock = asyncio.Lock()
         self._db_pool: Optional["asyncpg.Pool"] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._model_slots: dict[str, asyncio.Semaphore] = {}
+        self._pending_generations = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Shared HTTP client (connections are reused across debates)."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=120.0)
+        return self._client
+
+    def _model_slot(self, model: str) -> asyncio.Semaphore:
+        """Semaphore limiting in-flight generations for one model."""
+        slot = self._model_slots.get(model)
+        if slot is None:
+            slot = asyncio.Semaphore(self.max_inflight_per_model)
+            self._model_slots[model] = slot
+        return slot
+
+    @asynccontextmanager
+    async def _model_turn(self, model: str):
+        """Hold a model slot, counting the call while it waits and runs."""
+        self._pending_generations += 1
+        try:
+            async with self._model_slot(model):
+                yield
+        finally:
+            self._pending_generations -= 1
+
+    @property
+    def pending_generations(self) -> int:
+        """Generations currently running or waiting for a model slot."""
+        return self._pending_generations
+
+    async def _ensure_pool(self) -> "asyncpg.Pool":
+        """Get the DB pool, seeding the leaderboard from stored rankings."""
+        if self._db_pool is None:
+            self._db_pool = await get_pool()
+        if not self._rankings_loaded:
+            self._rankings_loaded = True
+            # Only a fresh view is seeded; later it is ahead of the DB
+            if not self._debate_history:
+                self._leaderboard.load(await load_rankings(self._db_pool))
+                self.model_ratings.update(self._leaderboard.ratings())
+        return self._db_pool
+
+    async def flush_leaderboard(self) -> int:
+        """
+        Write unflushed ranking changes to the database now.
+
+        Returns:
+            Number of debates whose ranking changes were flushed
+        """
+        if not self.persist or (asyncpg is None and self._db_pool is None):
+            return 0
+        async with self._lock:
+            if not self._leaderboard.pending_debates:
+                return 0
+            try:
+                pool = await self._ensure_pool()
+            except Exception as e:
+                logger.error(f"Failed to flush rankings: {e}")
+                return 0
+            count = self._leaderboard.pending_debates
+            pending = self._leaderboard.take_pending()
+        if not pending:
+            return 0
+        # Taken in the same step as the pending batch, keeping write order
+        async with self._flush_lock:
+            try:
+                await flush_rankings(pool, pending)
+            except Exception as e:
+                self._leaderboard.restore_pending(pending)
+                logger.error(f"Failed to flush rankings: {e}")
+                return 0
+        return count
+
+    async def close(self) -> None:
+        """Flush pending ranking changes and close the shared HTTP client."""
+        await self.flush_leaderboard()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def _generate(
         self,
@@ -159,12 +288,16 @@ class DebateEngine:
 
         Returns:
             Tuple of (response_text, tokens_used, latency_ms)
+
+        Raises:
+            httpx.HTTPError: If the call fails; a failed turn aborts the
+                debate rather than being judged as an argument
         """
-        start = datetime.now()
+        async with self._model_turn(model):
+            start = datetime.now()
 
-        try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(
+            try:
+                response = await self._get_client().post(
                     f"{self.ollama_url}/api/generate",
                     json={
                         "model": model,
@@ -185,10 +318,9 @@ class DebateEngine:
 
                 return text, tokens, latency
 
-        except Exception as e:
-            logger.error(f"Generation failed for {model}: {e}")
-            latency = int((datetime.now() - start).total_seconds() * 1000)
-            return f"[Error: {e}]", 0, latency
+            except Exception as e:
+                logger.error(f"Generation failed for {model}: {e}")
+                raise
 
     def _select_models(
         self,
@@ -262,6 +394,7 @@ class DebateEngine:
         topic_category: Optional[TopicCategory] = None,
         model_a: Optional[str] = None,
         model_b: Optional[str] = None,
+        pipelined: Optional[bool] = None,
     ) -> DebateResult:
         """
         Run a complete debate between two models.
@@ -271,228 +404,91 @@ class DebateEngine:
             topic_category: Category for random topic selection
             model_a: First model (random if None)
             model_b: Second model (random if None)
+            pipelined: Overlap turns and judging (engine default if None)
 
         Returns:
             DebateResult with full outcome
         """
-        async with self._lock:
-            debate_id = str(uuid.uuid4())
-            started_at = datetime.now()
-
-            # Select topic
-            if topic is None:
-                topic, category = get_random_topic(category=topic_category)
-            else:
-                category = topic_category or TopicCategory.REASONING
-
-            # Select models
-            selected_a, selected_b = self._select_models(model_a, model_b)
-
-            # Randomly assign positions
-            if random.random() > 0.5:
-                position_a, position_b = "FOR", "AGAINST"
-            else:
-                position_a, position_b = "AGAINST", "FOR"
-
-            logger.info(
-                f"🎭 Debate #{debate_id[:8]}: {selected_a} vs {selected_b}"
-            )
-            logger.info(f"   Topic: {topic[:50]}...")
-
-            rounds: list[DebateRound] = []
-
-            # Round 1: Opening statements
-            logger.info("   Round 1: Opening statements...")
-
-            # Model A opening
-            prompt_a = get_debater_prompt("opening", topic, position_a)
-            arg_a, tokens_a, latency_a = await self._generate(
-                selected_a, prompt_a
-            )
-            rounds.append(
-                DebateRound(
-                    round_number=1,
-                    round_type="opening",
-                    model_name=selected_a,
-                    position=position_a,
-                    argument=arg_a,
-                    tokens_used=tokens_a,
-                    latency_ms=latency_a,
-                )
-            )
-
-            # Model B opening
-            prompt_b = get_debater_prompt("opening", topic, position_b)
-            arg_b, tokens_b, latency_b = await self._generate(
-                selected_b, prompt_b
-            )
-            rounds.append(
-                DebateRound(
-                    round_number=1,
-                    round_type="opening",
-                    model_name=selected_b,
-                    position=position_b,
-                    argument=arg_b,
-                    tokens_used=tokens_b,
-                    latency_ms=latency_b,
-                )
-            )
-
-            # Round 2: Rebuttals
-            logger.info("   Round 2: Rebuttals...")
-
-            # Model A rebuttal to B's opening
-            prompt_a = get_debater_prompt(
-                "rebuttal", topic, position_a, opponent_argument=arg_b
-            )
-            rebuttal_a, tokens_a, latency_a = await self._generate(
-                selected_a, prompt_a
-            )
-            rounds.append(
-                DebateRound(
-                    round_number=2,
-                    round_type="rebuttal",
-                    model_name=selected_a,
-                    position=position_a,
-                    argument=rebuttal_a,
-                    tokens_used=tokens_a,
-                    latency_ms=latency_a,
-                )
-            )
+        selected_a, selected_b = self._select_models(model_a, model_b)
+        return await self.run_match(
+            selected_a,
+            selected_b,
+            topic=topic,
+            topic_category=topic_category,
+            pipelined=pipelined,
+        )
 
-            # Model B rebuttal to A's opening
-            prompt_b = get_debater_prompt(
-                "rebuttal", topic, position_b, opponent_argument=arg_a
-            )
-            rebuttal_b, tokens_b, latency_b = await self._generate(
-                selected_b, prompt_b
-            )
-            rounds.append(
-                DebateRound(
-                    round_number=2,
-                    round_type="rebuttal",
-                    model_name=selected_b,
-                    position=position_b,
-                    argument=rebuttal_b,
-                    tokens_used=tokens_b,
-                    latency_ms=latency_b,
-                )
-            )
+    async def run_match(
+        self,
+        selected_a: str,
+        selected_b: str,
+        topic: Optional[str] = None,
+        topic_category: Optional[TopicCategory] = None,
+        pipelined: Optional[bool] = None,
+    ) -> DebateResult:
+        """
+        Run a debate between two given models.
 
-            # Round 3: Closing statements
-            logger.info("   Round 3: Closing statements...")
+        Unlike run_debate, the models are used as given (tournaments may
+        include models outside DEBATE_MODELS). Safe to call concurrently:
+        only the final rating update and persistence are serialized.
 
-            # Build history for closing
-            history = format_debate_transcript(
-                [
-                    {
-                        "round_type": "opening",
-                        "model": selected_a,
-                        "position": position_a,
-                        "argument": arg_a,
-                    },
-                    {
-                        "round_type": "opening",
-                        "model": selected_b,
-                        "position": position_b,
-                        "argument": arg_b,
-                    },
-                    {
-                        "round_type": "rebuttal",
-                        "model": selected_a,
-                        "position": position_a,
-                        "argument": rebuttal_a,
-                    },
-                    {
-                        "round_type": "rebuttal",
-                        "model": selected_b,
-                        "position": position_b,
-                        "argument": rebuttal_b,
-                    },
-                ]
-            )
+        Args:
+            pipelined: Overlap turns and judging (defaults to the engine's
+                ``pipelined`` setting)
+        """
+        debate_id = str(uuid.uuid4())
+        started_at = datetime.now()
 
-            # Model A closing
-            prompt_a = get_debater_prompt(
-                "closing", topic, position_a, debate_history=history
-            )
-            closing_a, tokens_a, latency_a = await self._generate(
-                selected_a, prompt_a
-            )
-            rounds.append(
-                DebateRound(
-                    round_number=3,
-                    round_type="closing",
-                    model_name=selected_a,
-                    position=position_a,
-                    argument=closing_a,
-                    tokens_used=tokens_a,
-                    latency_ms=latency_a,
-                )
-            )
+        # Select topic
+        if topic is None:
+            topic, category = get_random_topic(category=topic_category)
+        else:
+            category = topic_category or TopicCategory.REASONING
 
-            # Model B closing
-            prompt_b = get_debater_prompt(
-                "closing", topic, position_b, debate_history=history
-            )
-            closing_b, tokens_b, latency_b = await self._generate(
-                selected_b, prompt_b
-            )
-            rounds.append(
-                DebateRound(
-                    round_number=3,
-                    round_type="closing",
-                    model_name=selected_b,
-                    position=position_b,
-                    argument=closing_b,
-                    tokens_used=tokens_b,
-                    latency_ms=latency_b,
-                )
-            )
+        # Randomly assign positions
+        if random.random() > 0.5:
+            position_a, position_b = "FOR", "AGAINST"
+        else:
+            position_a, position_b = "AGAINST", "FOR"
 
-            # Judge evaluation
-            logger.info("   Judging...")
+        logger.info(
+            f"🎭 Debate #{debate_id[:8]}: {selected_a} vs {selected_b}"
+        )
+        logger.info(f"   Topic: {topic[:50]}...")
+
+        if pipelined is None:
+            pipelined = self.pipelined
+        run_rounds = (
+            self._run_rounds_pipelined
+            if pipelined
+            else self._run_rounds_sequential
+        )
+        rounds, verdict, winner_pos, score_a, score_b = await run_rounds(
+            topic, selected_a, selected_b, position_a, position_b
+        )
 
-            full_transcript = format_debate_transcript(
-                [
-                    {
-                        "round_type": r.round_type,
-                        "model": r.model_name,
-                        "position": r.position,
-                        "argument": r.argument,
-                    }
-                    for r in rounds
-                ]
-            )
+        # Determine winning model
+        if winner_pos == "A":
+            winner_model = selected_a
+            elo_score_a = 1.0
+        elif winner_pos == "B":
+            winner_model = selected_b
+            elo_score_a = 0.0
+        else:
+            winner_model = None
+            elo_score_a = 0.5
 
-            judge_prompt = get_judge_prompt(
-                topic=topic,
-                model_a=selected_a,
-                model_b=selected_b,
-                position_a=position_a,
-                position_b=position_b,
-                transcript=full_transcript,
-            )
+        completed_at = datetime.now()
 
-            verdict, _, _ = await self._generate(
-                self.JUDGE_MODEL, judge_prompt, max_tokens=1500
-            )
+        async with self._lock:
+            if self.persist and asyncpg is not None:
+                try:
+                    await self._ensure_pool()
+                except Exception as e:
+                    logger.error(f"Debate database unavailable: {e}")
 
-            # Parse verdict
-            winner_pos, score_a, score_b = self._parse_judge_verdict(verdict)
-
-            # Determine winning model
-            if winner_pos == "A":
-                winner_model = selected_a
-                elo_score_a = 1.0
-            elif winner_pos == "B":
-                winner_model = selected_b
-                elo_score_a = 0.0
-            else:
-                winner_model = None
-                elo_score_a = 0.5
-
-            # Calculate ELO changes
+            # Calculate ELO changes from the ratings at settlement time
             elo_before_a = self.model_ratings.get(selected_a, INITIAL_ELO)
             elo_before_b = self.model_ratings.get(selected_b, INITIAL_ELO)
 
@@ -504,8 +500,6 @@ class DebateEngine:
             self.model_ratings[selected_a] = elo_before_a + elo_change_a
             self.model_ratings[selected_b] = elo_before_b + elo_change_b
 
-            completed_at = datetime.now()
-
             # Build result
             result = DebateResult(
                 debate_id=debate_id,
@@ -533,123 +527,464 @@ class DebateEngine:
             )
 
             self._debate_history.append(result)
-
-            # Persist to DB if asyncpg is available
-            if asyncpg is not None:
+            self._leaderboard.apply(result)
+
+            pool = self._db_pool if self.persist else None
+            pending = None
+            if (
+                pool is not None
+                and self._leaderboard.pending_debates
+                >= self.ranking_flush_every
+            ):
+                pending = self._leaderboard.take_pending()
+
+        # Persist to DB if asyncpg is available, outside the settlement
+        # lock. Only writes carrying ranking deltas are ordered.
+        if pool is not None:
+            async with self._flush_lock if pending else nullcontext():
                 try:
-                    if self._db_pool is None:
-                        self._db_pool = await get_pool()
-
-                    await insert_debate(self._db_pool, result)
-
-                    # Update rankings: outcomes
-                    if winner_model is None:
-                        await upsert_model_ranking(
-                            self._db_pool,
-                            selected_a,
-                            self.model_ratings[selected_a],
-                            elo_change_a,
-                            "draw",
-                        )
-                        await upsert_model_ranking(
-                            self._db_pool,
-                            selected_b,
-                            self.model_ratings[selected_b],
-                            elo_change_b,
-                            "draw",
-                        )
-                    elif winner_model == selected_a:
-                        await upsert_model_ranking(
-                            self._db_pool,
-                            selected_a,
-                            self.model_ratings[selected_a],
-                            elo_change_a,
-                            "win",
-                        )
-                        await upsert_model_ranking(
-                            self._db_pool,
-                            selected_b,
-                            self.model_ratings[selected_b],
-                            elo_change_b,
-                            "loss",
-                        )
-                    else:
-                        await upsert_model_ranking(
-                            self._db_pool,
-                            selected_a,
-                            self.model_ratings[selected_a],
-                            elo_change_a,
-                            "loss",
-                        )
-                        await upsert_model_ranking(
-                            self._db_pool,
-                            selected_b,
-                            self.model_ratings[selected_b],
-                            elo_change_b,
-                            "win",
-                        )
+                    await record_debate(pool, result, pending)
                 except Exception as e:
+                    if pending:
+                        self._leaderboard.restore_pending(pending)
                     logger.error(f"Failed to persist debate: {e}")
 
-            # Log outcome
-            duration = (completed_at - started_at).total_seconds()
-            logger.info(
-                f"   ✅ Winner: {winner_model or 'Tie'} ({score_a:.0f} vs {score_b:.0f})"
+        # Log outcome
+        duration = (completed_at - started_at).total_seconds()
+        logger.info(
+            f"   ✅ Winner: {winner_model or 'Tie'} ({score_a:.0f} vs {score_b:.0f})"
+        )
+        logger.info(
+            f"   ELO: {selected_a} {elo_change_a:+d}, {selected_b} {elo_change_b:+d}"
+        )
+        logger.info(f"   Duration: {duration:.1f}s")
+
+        return result
+
+    async def _run_rounds_sequential(
+        self,
+        topic: str,
+        selected_a: str,
+        selected_b: str,
+        position_a: str,
+        position_b: str,
+    ) -> tuple[list[DebateRound], str, Optional[str], float, float]:
+        """
+        Run all rounds turn by turn, then judge the full transcript.
+
+        Returns:
+            Tuple of (rounds, verdict, winner_position, score_a, score_b)
+        """
+        rounds: list[DebateRound] = []
+
+        # Round 1: Opening statements
+        logger.info("   Round 1: Opening statements...")
+
+        # Model A opening
+        prompt_a = get_debater_prompt("opening", topic, position_a)
+        arg_a, tokens_a, latency_a = await self._generate(selected_a, prompt_a)
+        rounds.append(
+            DebateRound(
+                round_number=1,
+                round_type="opening",
+                model_name=selected_a,
+                position=position_a,
+                argument=arg_a,
+                tokens_used=tokens_a,
+                latency_ms=latency_a,
             )
-            logger.info(
-                f"   ELO: {selected_a} {elo_change_a:+d}, {selected_b} {elo_change_b:+d}"
+        )
+
+        # Model B opening
+        prompt_b = get_debater_prompt("opening", topic, position_b)
+        arg_b, tokens_b, latency_b = await self._generate(selected_b, prompt_b)
+        rounds.append(
+            DebateRound(
+                round_number=1,
+                round_type="opening",
+                model_name=selected_b,
+                position=position_b,
+                argument=arg_b,
+                tokens_used=tokens_b,
+                latency_ms=latency_b,
             )
-            logger.info(f"   Duration: {duration:.1f}s")
+        )
 
-            return result
+        # Round 2: Rebuttals
+        logger.info("   Round 2: Rebuttals...")
 
-    async def get_leaderboard(self) -> list[dict]:
-        """Get current model rankings (prefers DB, falls back to memory)."""
-        if asyncpg is not None and self._db_pool is not None:
-            try:
-                async with self._db_pool.acquire() as conn:
-                    rows = await conn.fetch(
-                        """
-                        SELECT model_name AS model, elo_rating AS elo, wins, losses, draws, total_debates
-                        FROM model_rankings
-                        ORDER BY elo_rating DESC
-                        """
-                    )
-                    return [dict(row) for row in rows]
-            except Exception as e:
-                logger.error(f"Falling back to in-memory leaderboard: {e}")
+        # Model A rebuttal to B's opening
+        prompt_a = get_debater_prompt(
+            "rebuttal", topic, position_a, opponent_argument=arg_b
+        )
+        rebuttal_a, tokens_a, latency_a = await self._generate(
+            selected_a, prompt_a
+        )
+        rounds.append(
+            DebateRound(
+                round_number=2,
+                round_type="rebuttal",
+                model_name=selected_a,
+                position=position_a,
+                argument=rebuttal_a,
+                tokens_used=tokens_a,
+                latency_ms=latency_a,
+            )
+        )
 
-        rankings = []
-        for model, rating in sorted(
-            self.model_ratings.items(),
-            key=lambda x: x[1],
-            reverse=True,
-        ):
-            wins = sum(1 for d in self._debate_history if d.winner == model)
-            losses = sum(
-                1
-                for d in self._debate_history
-                if d.winner
-                and d.winner != model
-                and (d.model_a == model or d.model_b == model)
+        # Model B rebuttal to A's opening
+        prompt_b = get_debater_prompt(
+            "rebuttal", topic, position_b, opponent_argument=arg_a
+        )
+        rebuttal_b, tokens_b, latency_b = await self._generate(
+            selected_b, prompt_b
+        )
+        rounds.append(
+            DebateRound(
+                round_number=2,
+                round_type="rebuttal",
+                model_name=selected_b,
+                position=position_b,
+                argument=rebuttal_b,
+                tokens_used=tokens_b,
+                latency_ms=latency_b,
             )
-            draws = sum(
-                1
-                for d in self._debate_history
-                if d.winner is None
-                and (d.model_a == model or d.model_b == model)
+        )
+
+        # Round 3: Closing statements
+        logger.info("   Round 3: Closing statements...")
+
+        # Build history for closing
+        history = format_debate_transcript(
+            [
+                {
+                    "round_type": "opening",
+                    "model": selected_a,
+                    "position": position_a,
+                    "argument": arg_a,
+                },
+                {
+                    "round_type": "opening",
+                    "model": selected_b,
+                    "position": position_b,
+                    "argument": arg_b,
+                },
+                {
+                    "round_type": "rebuttal",
+                    "model": selected_a,
+                    "position": position_a,
+                    "argument": rebuttal_a,
+                },
+                {
+                    "round_type": "rebuttal",
+                    "model": selected_b,
+                    "position": position_b,
+                    "argument": rebuttal_b,
+                },
+            ]
+        )
+
+        # Model A closing
+        prompt_a = get_debater_prompt(
+            "closing", topic, position_a, debate_history=history
+        )
+        closing_a, tokens_a, latency_a = await self._generate(
+            selected_a, prompt_a
+        )
+        rounds.append(
+            DebateRound(
+                round_number=3,
+                round_type="closing",
+                model_name=selected_a,
+                position=position_a,
+                argument=closing_a,
+                tokens_used=tokens_a,
+                latency_ms=latency_a,
             )
-            rankings.append(
+        )
+
+        # Model B closing
+        prompt_b = get_debater_prompt(
+            "closing", topic, position_b, debate_history=history
+        )
+        closing_b, tokens_b, latency_b = await self._generate(
+            selected_b, prompt_b
+        )
+        rounds.append(
+            DebateRound(
+                round_number=3,
+                round_type="closing",
+                model_name=selected_b,
+                position=position_b,
+                argument=closing_b,
+                tokens_used=tokens_b,
+                latency_ms=latency_b,
+            )
+        )
+
+        # Judge evaluation
+        logger.info("   Judging...")
+
+        full_transcript = format_debate_transcript(
+            [
                 {
-                    "model": model,
-                    "elo": rating,
-                    "wins": wins,
-                    "losses": losses,
-                    "draws": draws,
-                    "total_debates": wins + losses + draws,
+                    "round_type": r.round_type,
+                    "model": r.model_name,
+                    "position": r.position,
+                    "argument": r.argument,
                 }
+                for r in rounds
+            ]
+        )
+
+        judge_prompt = get_judge_prompt(
+            topic=topic,
+            model_a=selected_a,
+            model_b=selected_b,
+            position_a=position_a,
+            position_b=position_b,
+            transcript=full_transcript,
+        )
+
+        verdict, _, _ = await self._generate(
+            self.JUDGE_MODEL, judge_prompt, max_tokens=1500
+        )
+
+        # Parse verdict
+        winner_pos, score_a, score_b = self._parse_judge_verdict(verdict)
+
+        return rounds, verdict, winner_pos, score_a, score_b
+
+    async def _run_rounds_pipelined(
+        self,
+        topic: str,
+        selected_a: str,
+        selected_b: str,
+        position_a: str,
+        position_b: str,
+    ) -> tuple[list[DebateRound], str, Optional[str], float, float]:
+        """
+        Run rounds with both sides generating concurrently.
+
+        Within a round the two turns only depend on earlier rounds, so they
+        are generated together. Each completed round is scored by the judge
+        in the background while the next round is generated; the verdict
+        is the majority of round winners, with scores averaged over rounds.
+
+        Returns:
+            Tuple of (rounds, verdict, winner_position, score_a, score_b)
+        """
+        judgements: list[tuple[str, asyncio.Task]] = []
+
+        async def turn(
+            round_number: int,
+            round_type: str,
+            model: str,
+            position: str,
+            **kwargs,
+        ) -> DebateRound:
+            prompt = get_debater_prompt(round_type, topic, position, **kwargs)
+            argument, tokens, latency = await self._generate(model, prompt)
+            return DebateRound(
+                round_number=round_number,
+                round_type=round_type,
+                model_name=model,
+                position=position,
+                argument=argument,
+                tokens_used=tokens,
+                latency_ms=latency,
+            )
+
+        def judge(round_a: DebateRound, round_b: DebateRound) -> None:
+            prompt = get_round_judge_prompt(
+                topic=topic,
+                round_type=round_a.round_type,
+                model_a=selected_a,
+                model_b=selected_b,
+                position_a=position_a,
+                position_b=position_b,
+                argument_a=round_a.argument,
+                argument_b=round_b.argument,
+            )
+            task = asyncio.create_task(
+                self._generate(
+                    self.JUDGE_MODEL, prompt, max_tokens=ROUND_JUDGE_TOKENS
+                )
+            )
+            judgements.append((round_a.round_type, task))
+
+        async def both(first, second) -> tuple[DebateRound, DebateRound]:
+            # Unlike gather, a failing side cancels the other turn
+            try:
+                async with asyncio.TaskGroup() as group:
+                    task_a = group.create_task(first)
+                    task_b = group.create_task(second)
+            except ExceptionGroup as failure:
+                raise failure.exceptions[0] from None
+            return task_a.result(), task_b.result()
+
+        try:
+            logger.info("   Round 1: Opening statements...")
+            opening_a, opening_b = await both(
+                turn(1, "opening", selected_a, position_a),
+                turn(1, "opening", selected_b, position_b),
+            )
+            judge(opening_a, opening_b)
+
+            logger.info("   Round 2: Rebuttals...")
+            rebuttal_a, rebuttal_b = await both(
+                turn(
+                    2,
+                    "rebuttal",
+                    selected_a,
+                    position_a,
+                    opponent_argument=opening_b.argument,
+                ),
+                turn(
+                    2,
+                    "rebuttal",
+                    selected_b,
+                    position_b,
+                    opponent_argument=opening_a.argument,
+                ),
+            )
+            judge(rebuttal_a, rebuttal_b)
+
+            logger.info("   Round 3: Closing statements...")
+            history = format_debate_transcript(
+                [
+                    {
+                        "round_type": r.round_type,
+                        "model": r.model_name,
+                        "position": r.position,
+                        "argument": r.argument,
+                    }
+                    for r in (opening_a, opening_b, rebuttal_a, rebuttal_b)
+                ]
+            )
+            closing_a, closing_b = await both(
+                turn(
+                    3,
+                    "closing",
+                    selected_a,
+                    position_a,
+                    debate_history=history,
+                ),
+                turn(
+                    3,
+                    "closing",
+                    selected_b,
+                    position_b,
+                    debate_history=history,
+                ),
             )
-        return rankings
+            judge(closing_a, closing_b)
+
+            logger.info("   Judging...")
+            verdicts = await asyncio.gather(*(task for _, task in judgements))
+        finally:
+            for _, task in judgements:
+                if not task.done():
+                    task.cancel()
+
+        rounds = [
+            opening_a,
+            opening_b,
+            rebuttal_a,
+            rebuttal_b,
+            closing_a,
+            closing_b,
+        ]
+
+        # Combine round judgements
+        wins = {"A": 0, "B": 0}
+        scores_a, scores_b, sections = [], [], []
+        for (round_type, _), (text, _, _) in zip(
+            judgements, verdicts, strict=True
+        ):
+            round_winner, round_a, round_b = self._parse_judge_verdict(text)
+            if round_winner is not None:
+                wins[round_winner] += 1
+            scores_a.append(round_a)
+            scores_b.append(round_b)
+            sections.append(f"=== {round_type.upper()} ===\n{text}")
+
+        score_a = sum(scores_a) / len(scores_a)
+        score_b = sum(scores_b) / len(scores_b)
+        if wins["A"] > wins["B"]:
+            winner_pos = "A"
+        elif wins["B"] > wins["A"]:
+            winner_pos = "B"
+        else:
+            winner_pos = None
+
+        summary = {"A": "Model A", "B": "Model B", None: "Tie"}[winner_pos]
+        verdict = "\n\n".join(
+            sections
+            + [
+                f"ROUNDS WON: Model A {wins['A']}, Model B {wins['B']}\n"
+                f"WINNER: {summary}"
+            ]
+        )
+        return rounds, verdict, winner_pos, score_a, score_b
+
+    async def run_tournament(
+        self,
+        models: Optional[list[str]] = None,
+        format: str = "round_robin",
+        rounds: Optional[int] = None,
+        max_concurrent: int = 4,
+        topic: Optional[str] = None,
+        topic_category: Optional[TopicCategory] = None,
+    ):
+        """Run a round-robin or Swiss tournament (see tournament.py)."""
+        from .tournament import run_tournament
+
+        return await run_tournament(
+            self,
+            models=models,
+            format=format,
+            rounds=rounds,
+            max_concurrent=max_concurrent,
+            topic=topic,
+            topic_category=topic_category,
+        )
+
+    async def get_leaderboard(
+        self, category: Optional[str] = None
+    ) -> list[dict]:
+        """
+        Get current model rankings from the materialized view.
+
+        Args:
+            category: Restrict win/loss/draw counts to one topic category
+        """
+        if self.persist and asyncpg is not None and not self._rankings_loaded:
+            async with self._lock:
+                try:
+                    await self._ensure_pool()
+                except Exception as e:
+                    logger.error(f"Using in-memory leaderboard only: {e}")
+                    self._rankings_loaded = True
+        return self._leaderboard.standings(category)
+
+    async def verify_leaderboard(self) -> list[str]:
+        """
+        Rebuild standings from stored debates and compare with the view.
+
+        Uses the debates table when connected, else in-memory history.
+
+        Returns:
+            Mismatches between the live view and the rebuild (empty if
+            consistent)
+        """
+        debates: list = self._debate_history
+        if self._db_pool is not None:
+            try:
+                debates = await fetch_debates(self._db_pool)
+            except Exception as e:
+                logger.error(f"Verifying against in-memory history: {e}")
+        return self._leaderboard.verify(debates, self.model_ratings)
 
     async def get_debate_history(self, limit: int = 10) -> list[dict]:
         """Get recent debate history."""
@@ -733,3 +1068,9 @@ async def get_debate_engine() -> DebateEngine:
     if _debate_engine is None:
         _debate_engine = DebateEngine()
     return _debate_engine
+
+
+async def close_debate_engine() -> None:
+    """Flush and close the singleton, if one was created (for shutdown)."""
+    if _debate_engine is not None:
+        await _debate_engine.close()
@@ -0,0 +1,264 @@
+"""
+Aura IA Debate Leaderboard
+
+In-memory materialized view of model standings:
+- Ratings and win/loss/draw counts are updated as each verdict lands
+- Per-topic-category splits are kept alongside the overall record
+- Reads sort the per-model records, independent of debate history size
+- Ranking changes accumulate as deltas and are flushed to PostgreSQL in
+  batches (see storage.record_debate)
+
+The view can be rebuilt offline from stored debates (recorded ELO before
+and change per debate) and compared against the live view to verify
+consistency.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .elo import INITIAL_ELO
+
+OUTCOMES = ("wins", "losses", "draws")
+
+
+@dataclass
+class ModelRecord:
+    """Materialized standings of one model."""
+
+    model: str
+    elo: int = INITIAL_ELO
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+    # category -> {"wins": n, "losses": n, "draws": n}
+    categories: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def total_debates(self) -> int:
+        return self.wins + self.losses + self.draws
+
+    def to_dict(self) -> dict:
+        return {
+            "model": self.model,
+            "elo": self.elo,
+            "wins": self.wins,
+            "losses": self.losses,
+            "draws": self.draws,
+            "total_debates": self.total_debates,
+        }
+
+
+@dataclass
+class RankingDelta:
+    """Unflushed ranking change of one model (counts are increments)."""
+
+    elo: int
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+
+    @property
+    def debates(self) -> int:
+        return self.wins + self.losses + self.draws
+
+
+def _get(debate: Any, name: str) -> Any:
+    """Read a field from a DebateResult or a stored debate row/dict."""
+    if isinstance(debate, dict):
+        return debate.get(name)
+    return getattr(debate, name)
+
+
+def _outcomes(winner: str | None, model_a: str) -> tuple[str, str]:
+    if winner is None:
+        return "draws", "draws"
+    if winner == model_a:
+        return "wins", "losses"
+    return "losses", "wins"
+
+
+class Leaderboard:
+    """Incrementally maintained model standings."""
+
+    def __init__(self, ratings: dict[str, int] | None = None):
+        """
+        Initialize the view.
+
+        Args:
+            ratings: Starting ratings for models without debates yet
+        """
+        self._records: dict[str, ModelRecord] = {
+            model: ModelRecord(model=model, elo=elo)
+            for model, elo in (ratings or {}).items()
+        }
+        self._pending: dict[str, RankingDelta] = {}
+        self._pending_debates = 0
+
+    def _record(self, model: str, elo: int) -> ModelRecord:
+        record = self._records.get(model)
+        if record is None:
+            record = ModelRecord(model=model, elo=elo)
+            self._records[model] = record
+        return record
+
+    def apply(self, debate: Any) -> None:
+        """Fold one finished debate into the view (O(1))."""
+        model_a = _get(debate, "model_a")
+        model_b = _get(debate, "model_b")
+        category = _get(debate, "topic_category") or "unknown"
+        outcome_a, outcome_b = _outcomes(_get(debate, "winner"), model_a)
+
+        for model, side, outcome in (
+            (model_a, "a", outcome_a),
+            (model_b, "b", outcome_b),
+        ):
+            elo_before = _get(debate, f"elo_before_{side}")
+            if elo_before is None:  # rows stored before ELO was recorded
+                known = self._records.get(model)
+                elo_before = known.elo if known else INITIAL_ELO
+            record = self._record(model, elo_before)
+            record.elo = elo_before + _get(debate, f"elo_change_{side}")
+            setattr(record, outcome, getattr(record, outcome) + 1)
+            split = record.categories.setdefault(
+                category, dict.fromkeys(OUTCOMES, 0)
+            )
+            split[outcome] += 1
+
+            delta = self._pending.get(model)
+            if delta is None:
+                delta = RankingDelta(elo=record.elo)
+                self._pending[model] = delta
+            delta.elo = record.elo
+            setattr(delta, outcome, getattr(delta, outcome) + 1)
+
+        self._pending_debates += 1
+
+    def load(self, rows: Iterable[dict]) -> None:
+        """Seed records from stored rankings (replaces counts and ratings)."""
+        for row in rows:
+            record = self._record(row["model"], row["elo"])
+            record.elo = row["elo"]
+            record.wins = row.get("wins") or 0
+            record.losses = row.get("losses") or 0
+            record.draws = row.get("draws") or 0
+
+    def standings(self, category: str | None = None) -> list[dict]:
+        """
+        Current standings, highest rated first.
+
+        Args:
+            category: Restrict counts to one topic category (models without
+                debates in that category are omitted)
+        """
+        records = sorted(
+            self._records.values(), key=lambda r: r.elo, reverse=True
+        )
+        if category is None:
+            return [r.to_dict() for r in records]
+
+        standings = []
+        for record in records:
+            split = record.categories.get(category)
+            if split is None:
+                continue
+            standings.append(
+                {
+                    "model": record.model,
+                    "elo": record.elo,
+                    **split,
+                    "total_debates": sum(split.values()),
+                }
+            )
+        return standings
+
+    def ratings(self) -> dict[str, int]:
+        """Current rating of every model."""
+        return {model: r.elo for model, r in self._records.items()}
+
+    # -------------------------------------------------------------------------
+    # Batched persistence
+    # -------------------------------------------------------------------------
+
+    @property
+    def pending_debates(self) -> int:
+        """Debates applied since the last flush."""
+        return self._pending_debates
+
+    def take_pending(self) -> dict[str, RankingDelta]:
+        """Hand over unflushed deltas (restore them if the flush fails)."""
+        pending = self._pending
+        self._pending = {}
+        self._pending_debates = 0
+        return pending
+
+    def restore_pending(self, pending: dict[str, RankingDelta]) -> None:
+        """Put back deltas from a failed flush, merged with newer ones."""
+        debates = sum(delta.debates for delta in pending.values()) // 2
+        for model, delta in pending.items():
+            newer = self._pending.get(model)
+            if newer is None:
+                self._pending[model] = delta
+                continue
+            for outcome in OUTCOMES:
+                setattr(
+                    newer,
+                    outcome,
+                    getattr(newer, outcome) + getattr(delta, outcome),
+                )
+        self._pending_debates += debates
+
+    # -------------------------------------------------------------------------
+    # Offline rebuild
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def rebuild(
+        cls,
+        debates: Iterable[Any],
+        ratings: dict[str, int] | None = None,
+    ) -> Leaderboard:
+        """
+        Replay debates (oldest first) into a fresh view.
+
+        Each model starts from the ELO recorded before its first debate;
+        ``ratings`` only covers models that never debated.
+        """
+        view = cls(ratings)
+        for debate in debates:
+            view.apply(debate)
+        view.take_pending()
+        return view
+
+    def verify(
+        self,
+        debates: Iterable[Any],
+        ratings: dict[str, int] | None = None,
+    ) -> list[str]:
+        """
+        Compare the live view against a rebuild from ``debates``.
+
+        Returns:
+            Human-readable mismatches (empty when consistent)
+        """
+        rebuilt = self.rebuild(debates, ratings)
+        mismatches = []
+        for model in sorted(set(self._records) | set(rebuilt._records)):
+            live = self._records.get(model)
+            expected = rebuilt._records.get(model)
+            if live is None or expected is None:
+                mismatches.append(
+                    f"{model}: only in {'rebuild' if live is None else 'view'}"
+                )
+                continue
+            for name in ("elo", *OUTCOMES):
+                if getattr(live, name) != getattr(expected, name):
+                    mismatches.append(
+                        f"{model}.{name}: view {getattr(live, name)} "
+                        f"!= rebuild {getattr(expected, name)}"
+                    )
+            if live.categories != expected.categories:
+                mismatches.append(f"{model}.categories differ")
+        return mismatches
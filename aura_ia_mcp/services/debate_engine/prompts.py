@@ -98,6 +98,33 @@ KEY STRENGTHS:
 AREAS FOR IMPROVEMENT:
 - Model A: [improvements]
 - Model B: [improvements]""",
+
+    "judge_round": """You are an impartial judge scoring one round of a debate between two AI models.
+
+RULES:
+- Score only the arguments made in this round
+- Evaluate logic, evidence, responsiveness and clarity
+- Evaluate arguments, not which position you personally agree with
+- Be brief (under 100 words of reasoning)
+
+Topic: {topic}
+Round: {round_type}
+
+Model A ({model_a}) argued {position_a}:
+{argument_a}
+
+Model B ({model_b}) argued {position_b}:
+{argument_b}
+
+Provide your judgment in this format:
+SCORES:
+- Model A: [score]/100
+- Model B: [score]/100
+
+WINNER: [Model A / Model B / Tie]
+
+REASONING:
+[Short justification]""",
 }
 
 
@@ -178,6 +205,45 @@ def get_judge_prompt(
     )
 
 
+def get_round_judge_prompt(
+    topic: str,
+    round_type: str,
+    model_a: str,
+    model_b: str,
+    position_a: str,
+    position_b: str,
+    argument_a: str,
+    argument_b: str,
+) -> str:
+    """
+    Get the prompt for scoring a single completed round.
+    
+    Args:
+        topic: The debate topic
+        round_type: "opening", "rebuttal", or "closing"
+        model_a: Name of model A
+        model_b: Name of model B
+        position_a: Position model A argued
+        position_b: Position model B argued
+        argument_a: Model A's argument in this round
+        argument_b: Model B's argument in this round
+    
+    Returns:
+        Formatted round judge prompt
+    """
+    template = DEBATE_SYSTEM_PROMPTS["judge_round"]
+    return template.format(
+        topic=topic,
+        round_type=round_type,
+        model_a=model_a,
+        model_b=model_b,
+        position_a=position_a,
+        position_b=position_b,
+        argument_a=argument_a,
+        argument_b=argument_b,
+    )
+
+
 def format_debate_transcript(rounds: list[dict]) -> str:
     """
     Format debate rounds into a readable transcript.
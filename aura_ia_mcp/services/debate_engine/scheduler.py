@@ -2,13 +2,23 @@
 Aura IA Debate Scheduler
 
 Manages scheduled debates:
-- Cron-like scheduling (every 6 hours)
+- Cron-style scheduling (``DEBATE_SCHEDULE_CRON``) or a fixed interval
+- Load-aware dispatch: due debates are deferred while chat requests are in
+  flight, loaded models use too much memory or generations are queued
+- Backlog with a catch-up policy for slots that were deferred
 - Background task management
 - Auto-selection of topics and models
 """
 
+from __future__ import annotations
+
 import asyncio
 import logging
+import os
+import sys
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -16,15 +26,262 @@ from .engine import get_debate_engine
 
 logger = logging.getLogger(__name__)
 
+CRON_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+}
+_MONTH_NAMES = {
+    name: i + 1
+    for i, name in enumerate(
+        "jan feb mar apr may jun jul aug sep oct nov dec".split()
+    )
+}
+_DAY_NAMES = {
+    name: i for i, name in enumerate("sun mon tue wed thu fri sat".split())
+}
+CATCH_UP_POLICIES = ("latest", "all")
+
+
+class CronSchedule:
+    """
+    Five-field cron expression: minute hour day-of-month month day-of-week.
+
+    Supports ``*``, ``a``, ``a-b``, ``*/n``, ``a-b/n``, ``a/n``, comma
+    lists, month/day names (``jan``, ``mon``) and the ``@daily`` style
+    aliases. Day-of-week 0 and 7 are Sunday. As in cron, when both day
+    fields are restricted a time matches if either one does.
+    """
+
+    def __init__(self, expression: str):
+        self.expression = expression.strip()
+        fields = CRON_ALIASES.get(
+            self.expression.lower(), self.expression
+        ).split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression!r}")
+        self.minutes = self._parse(fields[0], 0, 59)
+        self.hours = self._parse(fields[1], 0, 23)
+        self.days = self._parse(fields[2], 1, 31)
+        self.months = self._parse(fields[3], 1, 12, _MONTH_NAMES)
+        weekdays = self._parse(fields[4], 0, 7, _DAY_NAMES)
+        self.weekdays = {d % 7 for d in weekdays}
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    @staticmethod
+    def _parse(
+        field: str,
+        low: int,
+        high: int,
+        names: Optional[dict[str, int]] = None,
+    ) -> set[int]:
+        def value(token: str) -> int:
+            token = token.lower()
+            number = names.get(token) if names else None
+            if number is None:
+                number = int(token)
+            if not low <= number <= high:
+                raise ValueError(f"{token} out of range {low}-{high}")
+            return number
+
+        values: set[int] = set()
+        for part in field.split(","):
+            span, _, step_text = part.partition("/")
+            step = int(step_text) if step_text else 1
+            if step < 1:
+                raise ValueError(f"Invalid step in {part!r}")
+            if span == "*":
+                start, end = low, high
+            elif "-" in span:
+                first, last = span.split("-", 1)
+                start, end = value(first), value(last)
+            else:
+                start = value(span)
+                end = high if step_text else start
+            if start > end:
+                raise ValueError(f"Invalid range {part!r}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """First matching minute strictly after ``moment``."""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(
+            minutes=1
+        )
+        # Leap-day schedules can be four years apart
+        limit = candidate + timedelta(days=366 * 4 + 1)
+        while candidate < limit:
+            if candidate.month not in self.months:
+                year = candidate.year + candidate.month // 12
+                month = candidate.month % 12 + 1
+                candidate = candidate.replace(
+                    year=year, month=month, day=1, hour=0, minute=0
+                )
+            elif not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(
+                    days=1
+                )
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"Cron expression never fires: {self.expression!r}")
+
+
+@dataclass
+class LoadSignals:
+    """Live load readings used to decide whether a debate may start."""
+
+    inflight_requests: int = 0  # interactive chat requests being served
+    model_ram_gb: float = 0.0  # memory of currently loaded models
+    max_ram_gb: float = 0.0  # model memory budget (0 = unknown)
+    queue_depth: int = 0  # generations running or waiting for a model
+
+
+@dataclass
+class LoadPolicy:
+    """Thresholds above which scheduled debates are deferred."""
+
+    max_inflight_requests: int = 0
+    max_ram_fraction: float = 0.85
+    max_queue_depth: int = 0
+    # Seconds between load checks while a debate is deferred
+    check_interval: float = 30.0
+    # Minimum seconds between two scheduled debates (catch-up throttle)
+    min_spacing: float = 300.0
+    # Slots deferred longer than this are dropped (0 = never drop)
+    max_delay_minutes: float = 180.0
+
+    def defer_reason(self, signals: LoadSignals) -> Optional[str]:
+        """Why a debate must wait, or None if it may start now."""
+        if signals.inflight_requests > self.max_inflight_requests:
+            return f"{signals.inflight_requests} chat requests in flight"
+        if (
+            signals.max_ram_gb > 0
+            and signals.model_ram_gb
+            > signals.max_ram_gb * self.max_ram_fraction
+        ):
+            return (
+                f"loaded models use {signals.model_ram_gb:.1f}/"
+                f"{signals.max_ram_gb:.1f} GB"
+            )
+        if signals.queue_depth > self.max_queue_depth:
+            return f"{signals.queue_depth} generations queued"
+        return None
+
+
+LoadProbe = Callable[[], Awaitable[LoadSignals]]
+
+
+async def default_load_probe() -> LoadSignals:
+    """
+    Read load from services already running in this process.
+
+    Modules that are not loaded are not imported; their signals read as
+    idle. A signal whose source raises is logged and also reads as idle,
+    so one broken service does not stall debates. Only a probe that
+    raises as a whole makes ``DebateScheduler.tick`` defer the debate.
+    """
+    signals = LoadSignals()
+
+    chat_module = sys.modules.get("mcp_server.services.chat_service")
+    chat_service = getattr(chat_module, "_chat_service", None)
+    if chat_service is not None:
+        try:
+            signals.inflight_requests = chat_service.get_watchdog_status()[
+                "inflight"
+            ]
+        except Exception as e:
+            logger.debug(f"Chat load unavailable: {e}")
+
+    lifecycle = sys.modules.get("aura_ia_mcp.services.model_gateway.lifecycle")
+    manager = getattr(lifecycle, "model_manager", None)
+    if manager is not None:
+        try:
+            signals.model_ram_gb = manager._get_current_ram_usage()
+            signals.max_ram_gb = manager.max_ram_gb
+        except Exception as e:
+            logger.debug(f"Model memory unavailable: {e}")
+
+    try:
+        engine = await get_debate_engine()
+        signals.queue_depth = engine.pending_generations
+    except Exception as e:
+        logger.debug(f"Debate queue depth unavailable: {e}")
+
+    return signals
+
 
 class DebateScheduler:
     """Schedules and runs automated debates."""
 
-    def __init__(self, interval_hours: int = 6):
+    def __init__(
+        self,
+        interval_hours: int = 6,
+        cron: Optional[str] = None,
+        policy: Optional[LoadPolicy] = None,
+        load_probe: Optional[LoadProbe] = None,
+        catch_up: str = "latest",
+        max_backlog: int = 4,
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            interval_hours: Hours between debates when no cron is given
+            cron: Cron expression for debate slots (overrides interval)
+            policy: Load thresholds for deferring debates
+            load_probe: Async callable returning LoadSignals
+            catch_up: "latest" runs one debate for all deferred slots,
+                "all" runs every deferred slot (spaced by min_spacing)
+            max_backlog: Deferred slots kept before the oldest is dropped
+            clock: Time source (for tests)
+        """
+        if catch_up not in CATCH_UP_POLICIES:
+            raise ValueError(
+                f"Unknown catch-up policy {catch_up!r}, "
+                f"expected one of {CATCH_UP_POLICIES}"
+            )
         self.interval_hours = interval_hours
+        self.cron = CronSchedule(cron) if cron else None
+        self.policy = policy or LoadPolicy()
+        self.load_probe = load_probe or default_load_probe
+        self.catch_up = catch_up
+        self.max_backlog = max(1, max_backlog)
+        self._clock = clock
         self._task: Optional[asyncio.Task] = None
         self._running = False
         self._last_run: Optional[datetime] = None
+        self._next_slot: Optional[datetime] = None
+        self._backlog: deque[datetime] = deque()
+        self._last_signals: Optional[LoadSignals] = None
+        self._last_deferral: Optional[str] = None
+        self.stats = {
+            "runs": 0,
+            "deferrals": 0,
+            "coalesced": 0,
+            "dropped": 0,
+        }
+
+    def _slot_after(self, moment: datetime) -> datetime:
+        if self.cron is not None:
+            return self.cron.next_after(moment)
+        return moment + timedelta(hours=self.interval_hours)
 
     async def start(self) -> None:
         """Start the scheduler background task."""
@@ -32,13 +289,24 @@ class DebateScheduler:
             return
 
         self._running = True
+        if self._next_slot is None:
+            now = self._clock()
+            # Interval mode: first run after 1 minute to let system stabilize
+            self._next_slot = (
+                self.cron.next_after(now)
+                if self.cron is not None
+                else now + timedelta(minutes=1)
+            )
         self._task = asyncio.create_task(self._scheduler_loop())
-        logger.info(
-            f"🕰️ Debate Scheduler started (Interval: {self.interval_hours}h)"
+        schedule = (
+            f"Cron: {self.cron.expression}"
+            if self.cron
+            else f"Interval: {self.interval_hours}h"
         )
+        logger.info(f"🕰️ Debate Scheduler started ({schedule})")
 
     async def stop(self) -> None:
-        """Stop the scheduler."""
+        """Stop the scheduler and flush batched ranking changes."""
         self._running = False
         if self._task:
             self._task.cancel()
@@ -46,39 +314,108 @@ class DebateScheduler:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        try:
+            engine = await get_debate_engine()
+            await engine.flush_leaderboard()
+        except Exception as e:
+            logger.error(f"Failed to flush debate rankings: {e}")
         logger.info("🛑 Debate Scheduler stopped")
 
+    def _enqueue_due(self, now: datetime) -> None:
+        """Move every slot that has come due into the backlog."""
+        while self._next_slot is not None and self._next_slot <= now:
+            self._backlog.append(self._next_slot)
+            if len(self._backlog) > self.max_backlog:
+                self._backlog.popleft()
+                self.stats["dropped"] += 1
+            self._next_slot = self._slot_after(self._next_slot)
+
+    def _drop_stale(self, now: datetime) -> None:
+        if not self.policy.max_delay_minutes:
+            return
+        cutoff = now - timedelta(minutes=self.policy.max_delay_minutes)
+        while self._backlog and self._backlog[0] < cutoff:
+            slot = self._backlog.popleft()
+            self.stats["dropped"] += 1
+            logger.warning(
+                f"Dropped debate slot {slot:%Y-%m-%d %H:%M} "
+                f"(deferred over {self.policy.max_delay_minutes:.0f} min)"
+            )
+
+    def _take_slot(self) -> datetime:
+        if self.catch_up == "latest":
+            self.stats["coalesced"] += len(self._backlog) - 1
+            slot = self._backlog[-1]
+            self._backlog.clear()
+            return slot
+        return self._backlog.popleft()
+
+    async def tick(self) -> Optional[str]:
+        """
+        Run one scheduling step.
+
+        Returns:
+            "ran", "deferred", "throttled", or None when nothing is due
+        """
+        now = self._clock()
+        self._enqueue_due(now)
+        self._drop_stale(now)
+        if not self._backlog:
+            return None
+
+        if (
+            self._last_run is not None
+            and (now - self._last_run).total_seconds()
+            < self.policy.min_spacing
+        ):
+            return "throttled"
+
+        try:
+            signals = await self.load_probe()
+        except Exception as e:
+            logger.error(f"Load probe failed, deferring debate: {e}")
+            signals = None
+        self._last_signals = signals
+        reason = (
+            self.policy.defer_reason(signals)
+            if signals is not None
+            else "load probe failed"
+        )
+        if reason is not None:
+            if self._last_deferral != reason:
+                logger.info(f"⏸️ Scheduled debate deferred: {reason}")
+            self._last_deferral = reason
+            self.stats["deferrals"] += 1
+            return "deferred"
+
+        self._last_deferral = None
+        slot = self._take_slot()
+        logger.info(f"Running debate slot {slot:%Y-%m-%d %H:%M}")
+        await self.run_scheduled_debate()
+        self._last_run = self._clock()
+        self.stats["runs"] += 1
+        return "ran"
+
     async def _scheduler_loop(self) -> None:
         """Main scheduling loop."""
         while self._running:
             try:
-                # Calculate time to next run
-                now = datetime.now()
-                if self._last_run is None:
-                    # First run: Wait 1 minute to let system stabilize, then run
-                    next_run = now + timedelta(minutes=1)
-                else:
-                    next_run = self._last_run + timedelta(
-                        hours=self.interval_hours
-                    )
-
-                wait_seconds = (next_run - now).total_seconds()
-
-                if wait_seconds > 0:
+                outcome = await self.tick()
+                if outcome == "ran":
+                    continue
+                if outcome is None and self._next_slot is not None:
+                    wait_seconds = (
+                        self._next_slot - self._clock()
+                    ).total_seconds()
                     logger.debug(
-                        f"Next debate scheduled for {next_run.strftime('%H:%M:%S')}"
+                        f"Next debate scheduled for {self._next_slot:%H:%M:%S}"
                     )
-                    await asyncio.sleep(
-                        min(60, wait_seconds)
-                    )  # Check cancellation every 60s
-
-                    # Re-check time
-                    if datetime.now() < next_run:
-                        continue
-
-                # Run scheduled debate
-                await self.run_scheduled_debate()
-                self._last_run = datetime.now()
+                else:
+                    wait_seconds = self.policy.check_interval
+                # Check cancellation and load at least every check interval
+                await asyncio.sleep(
+                    max(1.0, min(self.policy.check_interval, wait_seconds))
+                )
 
             except asyncio.CancelledError:
                 break
@@ -86,6 +423,28 @@ class DebateScheduler:
                 logger.error(f"Error in debate scheduler: {e}")
                 await asyncio.sleep(60)  # Retry delay
 
+    def get_status(self) -> dict:
+        """Scheduler state, backlog and the latest load readings."""
+        return {
+            "running": self._running,
+            "schedule": (
+                self.cron.expression
+                if self.cron
+                else f"every {self.interval_hours}h"
+            ),
+            "catch_up": self.catch_up,
+            "next_run": (
+                self._next_slot.isoformat() if self._next_slot else None
+            ),
+            "last_run": self._last_run.isoformat() if self._last_run else None,
+            "backlog": [slot.isoformat() for slot in self._backlog],
+            "deferred_reason": self._last_deferral,
+            "load": (
+                asdict(self._last_signals) if self._last_signals else None
+            ),
+            **self.stats,
+        }
+
     async def run_scheduled_debate(self) -> None:
         """Execute a scheduled debate."""
         logger.info("🤖 Starting scheduled debate...")
@@ -108,8 +467,22 @@ _scheduler: Optional[DebateScheduler] = None
 
 
 async def get_scheduler() -> DebateScheduler:
-    """Get scheduler singleton."""
+    """Get scheduler singleton (configured from DEBATE_SCHEDULE_* env)."""
     global _scheduler
     if _scheduler is None:
-        _scheduler = DebateScheduler()
+        _scheduler = DebateScheduler(
+            cron=os.getenv("DEBATE_SCHEDULE_CRON") or None,
+            policy=LoadPolicy(
+                max_inflight_requests=int(
+                    os.getenv("DEBATE_SCHEDULE_MAX_INFLIGHT", "0")
+                ),
+                max_ram_fraction=float(
+                    os.getenv("DEBATE_SCHEDULE_MAX_RAM_FRACTION", "0.85")
+                ),
+                max_queue_depth=int(
+                    os.getenv("DEBATE_SCHEDULE_MAX_QUEUE", "0")
+                ),
+            ),
+            catch_up=os.getenv("DEBATE_SCHEDULE_CATCH_UP", "latest"),
+        )
     return _scheduler
@@ -7,11 +7,22 @@ from __future__ import annotations
 import os
 from typing import Optional
 
-import asyncpg
+try:
+    import asyncpg  # type: ignore
+except ImportError:  # pragma: no cover
+    asyncpg = None
+
+OUTCOME_FIELDS = {
+    "win": "wins",
+    "loss": "losses",
+    "draw": "draws",
+}
 
 
 async def get_pool() -> asyncpg.Pool:
     """Get a shared asyncpg pool configured from environment."""
+    if asyncpg is None:
+        raise RuntimeError("asyncpg is not installed")
     host = os.getenv("POSTGRES_HOST", "aura-ia-postgres")
     port = int(os.getenv("POSTGRES_PORT", "5432"))
     user = os.getenv("POSTGRES_USER", "Admin")
@@ -29,74 +40,71 @@ async def get_pool() -> asyncpg.Pool:
     )
 
 
-async def upsert_model_ranking(
-    pool: asyncpg.Pool,
+async def _update_ranking(
+    conn: asyncpg.Connection,
     model: str,
     elo: int,
-    elo_change: int,
     outcome: str,
 ) -> None:
-    """Update model_rankings wins/losses/draws and rating."""
-    outcome_field = {
-        "win": "wins",
-        "loss": "losses",
-        "draw": "draws",
-    }[outcome]
-
-    async with pool.acquire() as conn:
-        await conn.execute(
-            f"""
-            UPDATE model_rankings
-            SET elo_rating = $1,
-                {outcome_field} = {outcome_field} + 1,
-                total_debates = total_debates + 1,
-                updated_at = NOW()
-            WHERE model_name = $2
-            """,
-            elo,
-            model,
-        )
+    outcome_field = OUTCOME_FIELDS[outcome]
+    await conn.execute(
+        f"""
+        UPDATE model_rankings
+        SET elo_rating = $1,
+            {outcome_field} = {outcome_field} + 1,
+            total_debates = total_debates + 1,
+            updated_at = NOW()
+        WHERE model_name = $2
+        """,
+        elo,
+        model,
+    )
 
 
-async def insert_debate(
-    pool: asyncpg.Pool,
-    result,
-) -> None:
-    """Persist debate summary and rounds."""
-    async with pool.acquire() as conn:
-        await conn.execute(
-            """
-            INSERT INTO debates (
-                id, topic, topic_category, model_a, model_b, judge_model,
-                winner, elo_change_a, elo_change_b, elo_before_a, elo_before_b,
-                score_a, score_b, verdict, started_at, completed_at, status, total_rounds
-            ) VALUES (
-                $1, $2, $3, $4, $5, $6,
-                $7, $8, $9, $10, $11,
-                $12, $13, $14, $15, $16, 'completed', 3
-            )
-            ON CONFLICT (id) DO NOTHING
-            """,
-            result.debate_id,
-            result.topic,
-            result.topic_category,
-            result.model_a,
-            result.model_b,
-            result.__dict__.get("judge_model", "llama3.1:8b"),
-            result.winner,
-            result.elo_change_a,
-            result.elo_change_b,
-            result.elo_before_a,
-            result.elo_before_b,
-            result.score_a,
-            result.score_b,
-            result.verdict,
-            result.started_at,
-            result.completed_at,
+async def _insert_debate(conn: asyncpg.Connection, result) -> None:
+    await conn.execute(
+        """
+        INSERT INTO debates (
+            id, topic, topic_category, model_a, model_b, judge_model,
+            winner, elo_change_a, elo_change_b, elo_before_a, elo_before_b,
+            score_a, score_b, verdict, started_at, completed_at, status, total_rounds
+        ) VALUES (
+            $1, $2, $3, $4, $5, $6,
+            $7, $8, $9, $10, $11,
+            $12, $13, $14, $15, $16, 'completed', 3
         )
+        ON CONFLICT (id) DO NOTHING
+        """,
+        result.debate_id,
+        result.topic,
+        result.topic_category,
+        result.model_a,
+        result.model_b,
+        result.__dict__.get("judge_model", "llama3.1:8b"),
+        result.winner,
+        result.elo_change_a,
+        result.elo_change_b,
+        result.elo_before_a,
+        result.elo_before_b,
+        result.score_a,
+        result.score_b,
+        result.verdict,
+        result.started_at,
+        result.completed_at,
+    )
 
-        rounds_payload = [
+    await conn.executemany(
+        """
+        INSERT INTO debate_rounds (
+            id, debate_id, round_number, round_type, model_name, position,
+            argument, tokens_used, latency_ms
+        ) VALUES (
+            gen_random_uuid(), $1, $2, $3, $4, $5, $6, $7, $8
+        )
+        """,
+        [
             (
+                result.debate_id,
                 r.round_number,
                 r.round_type,
                 r.model_name,
@@ -106,28 +114,97 @@ async def insert_debate(
                 r.latency_ms,
             )
             for r in result.rounds
-        ]
-
-        await conn.executemany(
-            """
-            INSERT INTO debate_rounds (
-                id, debate_id, round_number, round_type, model_name, position,
-                argument, tokens_used, latency_ms
-            ) VALUES (
-                gen_random_uuid(), $1, $2, $3, $4, $5, $6, $7, $8
-            )
-            """,
-            [
-                (
-                    result.debate_id,
-                    rn,
-                    rt,
-                    mn,
-                    pos,
-                    arg,
-                    tok,
-                    lat,
-                )
-                for (rn, rt, mn, pos, arg, tok, lat) in rounds_payload
-            ],
-        )
+        ],
+    )
+
+
+async def _apply_ranking_deltas(conn: asyncpg.Connection, deltas) -> None:
+    await conn.executemany(
+        """
+        UPDATE model_rankings
+        SET elo_rating = $1,
+            wins = wins + $2,
+            losses = losses + $3,
+            draws = draws + $4,
+            total_debates = total_debates + $5,
+            last_debate_at = NOW(),
+            updated_at = NOW()
+        WHERE model_name = $6
+        """,
+        [
+            (d.elo, d.wins, d.losses, d.draws, d.debates, model)
+            for model, d in sorted(deltas.items())
+        ],
+    )
+
+
+async def upsert_model_ranking(
+    pool: asyncpg.Pool,
+    model: str,
+    elo: int,
+    elo_change: int,
+    outcome: str,
+) -> None:
+    """Update model_rankings wins/losses/draws and rating."""
+    async with pool.acquire() as conn:
+        await _update_ranking(conn, model, elo, outcome)
+
+
+async def insert_debate(
+    pool: asyncpg.Pool,
+    result,
+) -> None:
+    """Persist debate summary and rounds."""
+    async with pool.acquire() as conn, conn.transaction():
+        await _insert_debate(conn, result)
+
+
+async def record_debate(
+    pool: asyncpg.Pool,
+    result,
+    ranking_deltas=None,
+) -> None:
+    """
+    Persist a finished debate, plus a batch of ranking changes, atomically.
+
+    The debate row, its rounds and the given model_rankings deltas (see
+    leaderboard.RankingDelta, keyed by model) share a single transaction,
+    so a failure part-way leaves no partial debate and no ranking change
+    behind. Counts are applied as increments, so batches from several
+    debates can be flushed together.
+    """
+    async with pool.acquire() as conn, conn.transaction():
+        await _insert_debate(conn, result)
+        if ranking_deltas:
+            await _apply_ranking_deltas(conn, ranking_deltas)
+
+
+async def flush_rankings(pool: asyncpg.Pool, ranking_deltas) -> None:
+    """Apply a batch of ranking deltas in one transaction."""
+    if not ranking_deltas:
+        return
+    async with pool.acquire() as conn, conn.transaction():
+        await _apply_ranking_deltas(conn, ranking_deltas)
+
+
+async def load_rankings(pool: asyncpg.Pool) -> list[dict]:
+    """Stored rating and win/loss/draw counts of every model."""
+    async with pool.acquire() as conn:
+        rows = await conn.fetch("""
+            SELECT model_name AS model, elo_rating AS elo, wins, losses, draws
+            FROM model_rankings
+            """)
+    return [dict(row) for row in rows]
+
+
+async def fetch_debates(pool: asyncpg.Pool) -> list[dict]:
+    """Every completed debate's outcome, oldest first (for rebuilds)."""
+    async with pool.acquire() as conn:
+        rows = await conn.fetch("""
+            SELECT model_a, model_b, winner, topic_category,
+                   elo_before_a, elo_before_b, elo_change_a, elo_change_b
+            FROM debates
+            WHERE status = 'completed'
+            ORDER BY completed_at, started_at
+            """)
+    return [dict(row) for row in rows]
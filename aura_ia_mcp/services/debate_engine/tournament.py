@@ -0,0 +1,284 @@
+"""
+Aura IA Debate Tournaments
+
+Runs a bracket of debates between N models concurrently:
+- Round-robin: every pair debates once, all debates scheduled at once
+- Swiss: fixed number of rounds, each round pairing models with similar
+  tournament scores (no rematches where avoidable); debates within a
+  round run concurrently
+
+Concurrency is bounded twice: ``max_concurrent`` caps debates in flight
+for the tournament, and the engine's per-model semaphore caps in-flight
+generations per model. Each debate is isolated: it picks its own topic
+and positions, and a failing debate is recorded without cancelling the
+others. Each finished debate is settled and persisted atomically by the
+engine.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from .topics import TopicCategory
+
+if TYPE_CHECKING:
+    from .engine import DebateEngine, DebateResult
+
+logger = logging.getLogger(__name__)
+
+TOURNAMENT_FORMATS = ("round_robin", "swiss")
+
+
+@dataclass
+class Standing:
+    """A model's record within one tournament."""
+
+    model: str
+    points: float = 0.0
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+    byes: int = 0
+    opponents: list[str] = field(default_factory=list)
+
+    def to_dict(self, elo: int) -> dict:
+        return {
+            "model": self.model,
+            "points": self.points,
+            "wins": self.wins,
+            "losses": self.losses,
+            "draws": self.draws,
+            "byes": self.byes,
+            "elo": elo,
+        }
+
+
+@dataclass
+class TournamentResult:
+    """Complete result of a tournament."""
+
+    tournament_id: str
+    format: str
+    models: list[str]
+    debates: list[DebateResult]
+    errors: list[dict]
+    standings: list[dict]
+    rounds_played: int
+    started_at: datetime
+    completed_at: datetime
+
+    @property
+    def duration_seconds(self) -> float:
+        return (self.completed_at - self.started_at).total_seconds()
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        duration = self.duration_seconds
+        return {
+            "tournament_id": self.tournament_id,
+            "format": self.format,
+            "models": self.models,
+            "rounds_played": self.rounds_played,
+            "standings": self.standings,
+            "debates": [d.to_dict() for d in self.debates],
+            "errors": self.errors,
+            "started_at": self.started_at.isoformat(),
+            "completed_at": self.completed_at.isoformat(),
+            "duration_seconds": duration,
+            "debates_per_minute": (
+                len(self.debates) * 60 / duration if duration > 0 else 0.0
+            ),
+        }
+
+
+def round_robin_pairings(models: list[str]) -> list[tuple[str, str]]:
+    """Every pair of models once, alternating who speaks first."""
+    pairings = []
+    for i, model_a in enumerate(models):
+        for j in range(i + 1, len(models)):
+            pair = (model_a, models[j])
+            pairings.append(pair if (i + j) % 2 == 0 else pair[::-1])
+    return pairings
+
+
+def swiss_pairings(
+    standings: dict[str, Standing],
+    ratings: dict[str, int],
+) -> tuple[list[tuple[str, str]], str | None]:
+    """
+    Pair models for the next Swiss round.
+
+    Models are ranked by tournament points, then ELO. Each model is paired
+    with the highest-ranked remaining model it has not met yet, backtracking
+    when a greedy choice would force a later rematch (rematches are allowed
+    only when no rematch-free pairing exists). With an odd field, the
+    lowest-ranked model without a bye sits out.
+
+    Returns:
+        Tuple of (pairings, model receiving a bye or None)
+    """
+    ranked = sorted(
+        standings.values(),
+        key=lambda s: (s.points, ratings.get(s.model, 0)),
+        reverse=True,
+    )
+    pool = [s.model for s in ranked]
+
+    bye = None
+    if len(pool) % 2:
+        candidates = [m for m in reversed(pool) if not standings[m].byes]
+        bye = candidates[0] if candidates else pool[-1]
+        pool.remove(bye)
+
+    pairings = _pair_without_rematch(pool, standings)
+    if pairings is None:
+        pairings = []
+        while pool:
+            model = pool.pop(0)
+            played = standings[model].opponents
+            opponent = next((m for m in pool if m not in played), pool[0])
+            pool.remove(opponent)
+            pairings.append((model, opponent))
+    return pairings, bye
+
+
+def _pair_without_rematch(
+    pool: list[str], standings: dict[str, Standing]
+) -> list[tuple[str, str]] | None:
+    """Rank-ordered pairing with no rematches, or None if impossible."""
+    if not pool:
+        return []
+    model, rest = pool[0], pool[1:]
+    for opponent in rest:
+        if opponent in standings[model].opponents:
+            continue
+        remaining = [m for m in rest if m != opponent]
+        tail = _pair_without_rematch(remaining, standings)
+        if tail is not None:
+            return [(model, opponent)] + tail
+    return None
+
+
+async def run_tournament(
+    engine: DebateEngine,
+    models: list[str] | None = None,
+    format: str = "round_robin",
+    rounds: int | None = None,
+    max_concurrent: int = 4,
+    topic: str | None = None,
+    topic_category: TopicCategory | None = None,
+) -> TournamentResult:
+    """
+    Run a debate tournament.
+
+    Args:
+        engine: Debate engine (its per-model limit applies to all debates)
+        models: Competing models (defaults to engine.DEBATE_MODELS)
+        format: "round_robin" or "swiss"
+        rounds: Swiss rounds (default ceil(log2(N)); ignored for round-robin)
+        max_concurrent: Maximum debates in flight at once
+        topic: Fixed topic for every debate (random per debate if None)
+        topic_category: Category for random topic selection
+
+    Returns:
+        TournamentResult with debates, failures and final standings
+    """
+    if format not in TOURNAMENT_FORMATS:
+        raise ValueError(
+            f"Unknown tournament format {format!r}, "
+            f"expected one of {TOURNAMENT_FORMATS}"
+        )
+    models = list(dict.fromkeys(models or engine.DEBATE_MODELS))
+    if len(models) < 2:
+        raise ValueError("A tournament needs at least two models")
+
+    tournament_id = str(uuid.uuid4())
+    started_at = datetime.now()
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+    standings = {m: Standing(model=m) for m in models}
+    debates: list[DebateResult] = []
+    errors: list[dict] = []
+
+    logger.info(
+        f"🏆 Tournament #{tournament_id[:8]} ({format}): {len(models)} models"
+    )
+
+    async def play(model_a: str, model_b: str) -> None:
+        async with semaphore:
+            try:
+                result = await engine.run_match(
+                    model_a,
+                    model_b,
+                    topic=topic,
+                    topic_category=topic_category,
+                )
+            except Exception as e:
+                logger.error(f"Debate {model_a} vs {model_b} failed: {e}")
+                errors.append(
+                    {"model_a": model_a, "model_b": model_b, "error": str(e)}
+                )
+                return
+
+        debates.append(result)
+        record_a, record_b = standings[model_a], standings[model_b]
+        record_a.opponents.append(model_b)
+        record_b.opponents.append(model_a)
+        if result.winner is None:
+            for record in (record_a, record_b):
+                record.draws += 1
+                record.points += 0.5
+        else:
+            winner, loser = (
+                (record_a, record_b)
+                if result.winner == model_a
+                else (record_b, record_a)
+            )
+            winner.wins += 1
+            winner.points += 1.0
+            loser.losses += 1
+
+    async def play_all(pairings: list[tuple[str, str]]) -> None:
+        await asyncio.gather(*(play(a, b) for a, b in pairings))
+
+    if format == "round_robin":
+        await play_all(round_robin_pairings(models))
+        rounds_played = 1
+    else:
+        rounds_played = rounds or max(1, math.ceil(math.log2(len(models))))
+        for _ in range(rounds_played):
+            pairings, bye = swiss_pairings(standings, engine.model_ratings)
+            if bye is not None:
+                standings[bye].byes += 1
+                standings[bye].points += 1.0
+            await play_all(pairings)
+
+    ranked = sorted(
+        standings.values(),
+        key=lambda s: (s.points, engine.model_ratings.get(s.model, 0)),
+        reverse=True,
+    )
+    result = TournamentResult(
+        tournament_id=tournament_id,
+        format=format,
+        models=models,
+        debates=debates,
+        errors=errors,
+        standings=[
+            s.to_dict(engine.model_ratings.get(s.model, 0)) for s in ranked
+        ],
+        rounds_played=rounds_played,
+        started_at=started_at,
+        completed_at=datetime.now(),
+    )
+    logger.info(
+        f"   🏁 Tournament #{tournament_id[:8]}: {len(debates)} debates, "
+        f"{len(errors)} failed, leader {ranked[0].model} "
+        f"in {result.duration_seconds:.1f}s"
+    )
+    return result
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from typing import Any
 
 
@@ -10,6 +11,24 @@ class BaseModelBackend(ABC):
         """Generate text from the model."""
         pass
 
+    async def generate_stream(
+        self, prompt: str, **kwargs: Any
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream generation events (see adapters/streaming.py).
+
+        Backends without native streaming emit the full response as a
+        single chunk.
+        """
+        result = await self.generate(prompt, **kwargs)
+        if result.get("success") is False:
+            yield {"error": result.get("error", "Generation failed")}
+            return
+        text = result.get("response", "")
+        if text:
+            yield {"chunk": text}
+        yield {**result, "done": True, "total_text": text}
+
     @abstractmethod
     async def embed(self, text: str) -> list[float]:
         """Generate embeddings for the text."""
@@ -49,6 +49,13 @@ from .base_cloud import (
     ResourceOffloadManager,
 )
 
+# Shared HTTP connections
+from .connections import (
+    CloudConnectionManager,
+    ConnectionTimings,
+    get_connection_manager,
+)
+
 # Factory and gateway
 from .factory import (
     CloudAdapterFactory,
@@ -91,6 +98,9 @@ __all__ = [
     "CloudCircuitBreaker",
     "CloudSecurityManager",
     "ResourceOffloadManager",
+    # Connections
+    "CloudConnectionManager",
+    "ConnectionTimings",
     # Provider adapters
     "GeminiAdapter",
     "MinimaxAdapter",
@@ -110,6 +120,7 @@ __all__ = [
     "get_cloud_factory",
     "get_cloud_adapter",
     "get_free_cloud_adapter",
+    "get_connection_manager",
     "get_unified_gateway",
     "generate",
 ]
@@ -6,7 +6,9 @@ This module provides the foundation for all cloud model adapters with:
 - Circuit breaker for fault tolerance
 - Resource offloading rules (LOCAL FIRST, cloud as fallback)
 - Security validation and PII filtering
-- Rate limiting and quota management
+- Queueing token-bucket admission (RPM + TPM) and quota management
+- Shared persistent HTTP clients (see connections.py)
+- Streaming generation with incremental sanitization and budget settlement
 
 RESOURCE OFFLOADING RULES:
 1. ALWAYS prefer local Ollama models when available
@@ -28,14 +30,41 @@ import os
 import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional
 
 import httpx
+from prometheus_client import Counter, Histogram
+
+from ..streaming import StreamUsage, truncate_chunk
+from .connections import (
+    CloudConnectionManager,
+    get_connection_manager,
+    track_connection_timings,
+)
 
 logger = logging.getLogger(__name__)
 
+_admission_wait = Histogram(
+    "cloud_admission_wait_seconds",
+    "Time cloud requests waited for rate-limit capacity",
+    ["provider"],
+    buckets=[0.0, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0],
+)
+_admission_rejections = Counter(
+    "cloud_admission_rejections_total",
+    "Cloud requests rejected by admission control",
+    ["provider", "reason"],  # deadline, daily_limit, budget
+)
+_generation_seconds = Histogram(
+    "cloud_generation_seconds",
+    "Cloud API time excluding connection setup",
+    ["provider"],
+    buckets=[0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0],
+)
+
 
 # =============================================================================
 # Cloud Provider Configuration
@@ -334,13 +363,55 @@ class ProviderUsage:
     total_cost: float = 0.0
     daily_requests: int = 0
     daily_reset_time: float = field(default_factory=time.time)
-    minute_requests: list = field(
-        default_factory=list
-    )  # Timestamps for rate limiting
+    admission_waits: int = 0
+    admission_wait_total_s: float = 0.0
+    admission_wait_max_s: float = 0.0
+    admission_rejections: int = 0
+
+
+@dataclass
+class TokenBucket:
+    """Continuously refilling token bucket."""
+
+    capacity: float
+    refill_per_second: float
+    tokens: float = -1.0  # -1 = start full
+    last_refill: float = field(default_factory=time.monotonic)
+
+    def __post_init__(self) -> None:
+        if self.tokens < 0:
+            self.tokens = self.capacity
+
+    def refill(self, now: float) -> None:
+        """Add tokens accrued since the last refill."""
+        elapsed = max(0.0, now - self.last_refill)
+        self.tokens = min(
+            self.capacity, self.tokens + elapsed * self.refill_per_second
+        )
+        self.last_refill = now
+
+    def time_until(self, amount: float) -> float:
+        """Seconds until `amount` tokens are available (after refill)."""
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        if self.refill_per_second <= 0:
+            return float("inf")
+        return (amount - self.tokens) / self.refill_per_second
+
+    def consume(self, amount: float) -> None:
+        """Take tokens; may go negative when correcting estimates."""
+        self.tokens -= amount
 
 
 class CloudProviderBudget:
-    """Per-provider budget and rate limit management."""
+    """
+    Per-provider budget and admission control.
+
+    Each model gets a request bucket (RPM) and a token bucket (TPM).
+    Callers wait for capacity up to a deadline instead of failing
+    immediately; daily quotas and USD budgets still reject at once.
+    """
 
     def __init__(
         self,
@@ -352,6 +423,7 @@ class CloudProviderBudget:
         self.daily_budget_usd = daily_budget_usd
         self.daily_request_limit = daily_request_limit
         self.usage = ProviderUsage()
+        self._buckets: dict[str, tuple[TokenBucket, TokenBucket]] = {}
         self._lock = asyncio.Lock()
 
     def _reset_daily_if_needed(self) -> None:
@@ -363,62 +435,156 @@ class CloudProviderBudget:
             self.usage.daily_reset_time = current_time
             logger.info(f"Daily counters reset for {self.provider.value}")
 
-    def _clean_minute_window(self) -> None:
-        """Remove request timestamps older than 1 minute."""
-        current_time = time.time()
-        self.usage.minute_requests = [
-            ts for ts in self.usage.minute_requests if current_time - ts < 60
-        ]
-
-    async def check_rate_limit(
+    def _get_buckets(
         self, model_config: CloudModelConfig
+    ) -> tuple[TokenBucket, TokenBucket]:
+        """Get or create (requests, tokens) buckets for a model."""
+        buckets = self._buckets.get(model_config.model_id)
+        if buckets is None:
+            buckets = (
+                TokenBucket(
+                    capacity=model_config.rate_limit_rpm,
+                    refill_per_second=model_config.rate_limit_rpm / 60,
+                ),
+                TokenBucket(
+                    capacity=model_config.rate_limit_tpm,
+                    refill_per_second=model_config.rate_limit_tpm / 60,
+                ),
+            )
+            self._buckets[model_config.model_id] = buckets
+        return buckets
+
+    def _check_quota(self, model_config: CloudModelConfig) -> Optional[str]:
+        """Return a rejection reason for non-refilling limits, if any."""
+        # Check daily limit for free tier
+        if model_config.is_free_tier and model_config.free_tier_daily_limit:
+            if self.usage.daily_requests >= model_config.free_tier_daily_limit:
+                return f"Daily free tier limit ({model_config.free_tier_daily_limit}) exceeded"
+
+        # Check daily budget
+        if (
+            self.daily_budget_usd > 0
+            and self.usage.total_cost >= self.daily_budget_usd
+        ):
+            return f"Daily budget (${self.daily_budget_usd}) exceeded"
+
+        return None
+
+    def estimated_wait(
+        self, model_config: CloudModelConfig, tokens: int = 0
+    ) -> float:
+        """Seconds until a request of `tokens` would be admitted."""
+        requests, token_bucket = self._get_buckets(model_config)
+        now = time.monotonic()
+        requests.refill(now)
+        token_bucket.refill(now)
+        return max(requests.time_until(1), token_bucket.time_until(tokens))
+
+    def _record_wait(self, waited: float) -> None:
+        if waited <= 0:
+            return
+        self.usage.admission_waits += 1
+        self.usage.admission_wait_total_s += waited
+        self.usage.admission_wait_max_s = max(
+            self.usage.admission_wait_max_s, waited
+        )
+
+    def _reject(self, reason_label: str, message: str) -> tuple[bool, str]:
+        self.usage.admission_rejections += 1
+        _admission_rejections.labels(
+            provider=self.provider.value, reason=reason_label
+        ).inc()
+        return False, message
+
+    async def acquire(
+        self,
+        model_config: CloudModelConfig,
+        tokens: int = 0,
+        timeout: float = 30.0,
     ) -> tuple[bool, str]:
-        """Check if request is within rate limits."""
-        async with self._lock:
-            self._reset_daily_if_needed()
-            self._clean_minute_window()
-
-            # Check RPM (requests per minute)
-            if len(self.usage.minute_requests) >= model_config.rate_limit_rpm:
-                wait_time = 60 - (time.time() - self.usage.minute_requests[0])
-                return False, f"Rate limit exceeded. Wait {wait_time:.1f}s"
-
-            # Check daily limit for free tier
-            if model_config.is_free_tier:
-                if (
-                    self.usage.daily_requests
-                    >= model_config.free_tier_daily_limit
-                ):
-                    return (
-                        False,
-                        f"Daily free tier limit ({model_config.free_tier_daily_limit}) exceeded",
+        """
+        Wait for rate-limit capacity and reserve it.
+
+        Reserves one request plus `tokens` from the model's buckets. Waits
+        up to `timeout` seconds; returns (False, reason) if capacity will
+        not be available in time or a daily quota is exhausted.
+        """
+        start = time.monotonic()
+        deadline = start + max(0.0, timeout)
+
+        while True:
+            async with self._lock:
+                self._reset_daily_if_needed()
+                quota_error = self._check_quota(model_config)
+                if quota_error:
+                    label = (
+                        "budget" if "budget" in quota_error else "daily_limit"
+                    )
+                    return self._reject(label, quota_error)
+
+                wait = self.estimated_wait(model_config, tokens)
+                now = time.monotonic()
+                if wait <= 0:
+                    requests, token_bucket = self._get_buckets(model_config)
+                    requests.consume(1)
+                    token_bucket.consume(min(tokens, token_bucket.capacity))
+                    waited = now - start
+                    self._record_wait(waited)
+                    _admission_wait.labels(
+                        provider=self.provider.value
+                    ).observe(waited)
+                    return True, "OK"
+
+                if now + wait > deadline:
+                    return self._reject(
+                        "deadline",
+                        f"Rate limit exceeded. Wait {wait:.1f}s",
                     )
 
-            # Check daily budget
-            if (
-                self.daily_budget_usd > 0
-                and self.usage.total_cost >= self.daily_budget_usd
-            ):
-                return (
-                    False,
-                    f"Daily budget (${self.daily_budget_usd}) exceeded",
-                )
+            # Sleep outside the lock so other callers can be admitted
+            await asyncio.sleep(wait)
 
-            return True, "OK"
+    async def check_rate_limit(
+        self, model_config: CloudModelConfig, tokens: int = 0
+    ) -> tuple[bool, str]:
+        """Non-waiting admission check (reserves capacity on success)."""
+        return await self.acquire(model_config, tokens=tokens, timeout=0.0)
+
+    async def release(
+        self, model_config: CloudModelConfig, tokens: int
+    ) -> None:
+        """Return reserved tokens for a request that did not complete."""
+        async with self._lock:
+            _, token_bucket = self._get_buckets(model_config)
+            token_bucket.refill(time.monotonic())
+            token_bucket.tokens = min(
+                token_bucket.capacity,
+                token_bucket.tokens + min(tokens, token_bucket.capacity),
+            )
 
     async def record_request(
         self,
         model_config: CloudModelConfig,
         input_tokens: int,
         output_tokens: int,
+        reserved_tokens: int = 0,
     ) -> None:
-        """Record a successful request."""
+        """Record a successful request and settle its token reservation."""
         async with self._lock:
             self.usage.total_requests += 1
             self.usage.total_input_tokens += input_tokens
             self.usage.total_output_tokens += output_tokens
             self.usage.daily_requests += 1
-            self.usage.minute_requests.append(time.time())
+
+            # Charge actual usage against TPM, refunding the reservation
+            _, token_bucket = self._get_buckets(model_config)
+            token_bucket.refill(time.monotonic())
+            token_bucket.tokens = min(
+                token_bucket.capacity,
+                token_bucket.tokens
+                + min(reserved_tokens, token_bucket.capacity)
+                - (input_tokens + output_tokens),
+            )
 
             # Calculate cost
             input_cost = (input_tokens / 1000) * model_config.input_cost_per_1k
@@ -442,6 +608,12 @@ class CloudProviderBudget:
             "budget_remaining_usd": max(
                 0, self.daily_budget_usd - self.usage.total_cost
             ),
+            "admission_waits": self.usage.admission_waits,
+            "admission_wait_total_s": round(
+                self.usage.admission_wait_total_s, 3
+            ),
+            "admission_wait_max_s": round(self.usage.admission_wait_max_s, 3),
+            "admission_rejections": self.usage.admission_rejections,
         }
 
 
@@ -608,6 +780,12 @@ class CloudSecurityManager:
 
         return response
 
+    def sanitize_chunk(self, chunk: str, emitted: int) -> tuple[str, bool]:
+        """Sanitize a streamed chunk; returns (chunk, stop_streaming)."""
+        return truncate_chunk(
+            chunk, emitted, self.max_output_length, "\n\n[Output truncated]"
+        )
+
     def hash_for_logging(self, data: str) -> str:
         """Hash sensitive data for logging."""
         return hashlib.sha256(data.encode()).hexdigest()[:12]
@@ -753,12 +931,17 @@ class BaseCloudAdapter(ABC):
         provider_budget: CloudProviderBudget,
         circuit_breaker: Optional[CloudCircuitBreaker] = None,
         security_manager: Optional[CloudSecurityManager] = None,
+        connection_manager: Optional[CloudConnectionManager] = None,
     ):
         self.model_config = model_config
         self.api_key = api_key
         self.provider_budget = provider_budget
         self.circuit_breaker = circuit_breaker or CloudCircuitBreaker()
         self.security_manager = security_manager or CloudSecurityManager()
+        self.connections = connection_manager or get_connection_manager()
+        self.admission_timeout = float(
+            os.environ.get("CLOUD_ADMISSION_TIMEOUT", "30")
+        )
 
         logger.info(
             f"Initialized {model_config.display_name} adapter "
@@ -780,6 +963,40 @@ class BaseCloudAdapter(ABC):
         """
         pass
 
+    async def _stream_api(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        usage: StreamUsage,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Stream text deltas from the cloud API, filling ``usage`` as counts arrive.
+
+        Providers without a streaming endpoint emit the full response as a
+        single delta.
+        """
+        text, usage.input_tokens, usage.output_tokens = await self._call_api(
+            prompt=prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        yield text
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get the provider's shared HTTP client."""
+        return self.connections.get_client(self.model_config.provider.value)
+
+    async def close(self) -> None:  # noqa: B027 - optional override hook
+        """Release adapter resources.
+
+        HTTP clients are shared per provider and closed by the connection
+        manager, so there is nothing to close here by default.
+        """
+        return
+
     async def generate(
         self,
         prompt: str,
@@ -808,14 +1025,20 @@ class BaseCloudAdapter(ABC):
                 "error": f"Service unavailable: {cb_reason}",
             }
 
-        # 3. Rate limit check
-        rate_ok, rate_reason = await self.provider_budget.check_rate_limit(
-            self.model_config
+        # 3. Admission control (waits for RPM/TPM capacity)
+        reserved_tokens = self.estimate_tokens(prompt) + max_tokens
+        rate_ok, rate_reason = await self.provider_budget.acquire(
+            self.model_config,
+            tokens=reserved_tokens,
+            timeout=kwargs.pop("admission_timeout", self.admission_timeout),
         )
         if not rate_ok:
             return {"success": False, "error": rate_reason}
 
         # 4. Call API with retry
+        timings = track_connection_timings()
+        call_start = time.time()
+        settled = False
         try:
             response_text, input_tokens, output_tokens = await self._call_api(
                 prompt=prompt,
@@ -832,10 +1055,20 @@ class BaseCloudAdapter(ABC):
             # 6. Record success
             self.circuit_breaker.record_success()
             await self.provider_budget.record_request(
-                self.model_config, input_tokens, output_tokens
+                self.model_config,
+                input_tokens,
+                output_tokens,
+                reserved_tokens=reserved_tokens,
             )
+            settled = True
 
             latency_ms = (time.time() - start_time) * 1000
+            generation_ms = max(
+                0.0, (time.time() - call_start) * 1000 - timings.handshake_ms
+            )
+            _generation_seconds.labels(
+                provider=self.model_config.provider.value
+            ).observe(generation_ms / 1000)
 
             logger.info(
                 f"Cloud request success: model={self.model_config.model_id}, "
@@ -851,6 +1084,9 @@ class BaseCloudAdapter(ABC):
                 "input_tokens": input_tokens,
                 "output_tokens": output_tokens,
                 "latency_ms": latency_ms,
+                "generation_ms": generation_ms,
+                "connect_ms": timings.connect_ms,
+                "tls_ms": timings.tls_ms,
                 "is_free_tier": self.model_config.is_free_tier,
             }
 
@@ -858,6 +1094,132 @@ class BaseCloudAdapter(ABC):
             self.circuit_breaker.record_failure(str(e))
             logger.error(f"Cloud API error: {self.model_config.model_id}: {e}")
             return {"success": False, "error": str(e)}
+        finally:
+            # Also runs when the call is cancelled (e.g. a losing hedge)
+            if not settled:
+                await self.provider_budget.release(
+                    self.model_config, reserved_tokens
+                )
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        user_id: str = "anonymous",
+        temperature: float = 0.3,
+        max_tokens: int = 2048,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream generation with the same enterprise stack as generate().
+
+        Yields ``{"chunk": str}`` per sanitized delta, then a final
+        ``{"done": True, ...}`` event, or a terminal ``{"error": str}``.
+        The admission reservation is settled against actual usage even
+        when the consumer stops reading early.
+        """
+        start_time = time.time()
+
+        valid, reason = self.security_manager.validate_input(prompt, user_id)
+        if not valid:
+            yield {"error": reason}
+            return
+
+        available, cb_reason = self.circuit_breaker.is_available()
+        if not available:
+            yield {"error": f"Service unavailable: {cb_reason}"}
+            return
+
+        reserved_tokens = self.estimate_tokens(prompt) + max_tokens
+        rate_ok, rate_reason = await self.provider_budget.acquire(
+            self.model_config,
+            tokens=reserved_tokens,
+            timeout=kwargs.pop("admission_timeout", self.admission_timeout),
+        )
+        if not rate_ok:
+            yield {"error": rate_reason}
+            return
+
+        usage = StreamUsage()
+        parts: list[str] = []
+        emitted = 0
+        truncated = False
+        first_chunk_ms: Optional[float] = None
+        error: Optional[str] = None
+        exhausted = False
+
+        try:
+            async for delta in self._stream_api(
+                prompt=prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                usage=usage,
+                **kwargs,
+            ):
+                if not delta:
+                    continue
+                chunk, truncated = self.security_manager.sanitize_chunk(
+                    delta, emitted
+                )
+                emitted += len(chunk)
+                parts.append(chunk)
+                if first_chunk_ms is None:
+                    first_chunk_ms = (time.time() - start_time) * 1000
+                yield {"chunk": chunk}
+                if truncated:
+                    break
+            exhausted = True
+        except Exception as e:
+            error = str(e)
+        finally:
+            total_text = "".join(parts)
+            # Failed, cancelled or closed before any output: nothing used
+            if not parts and (error is not None or not exhausted):
+                await self.provider_budget.release(
+                    self.model_config, reserved_tokens
+                )
+            else:
+                usage.input_tokens = (
+                    usage.input_tokens or self.estimate_tokens(prompt)
+                )
+                usage.output_tokens = (
+                    usage.output_tokens or self.estimate_tokens(total_text)
+                )
+                await self.provider_budget.record_request(
+                    self.model_config,
+                    usage.input_tokens,
+                    usage.output_tokens,
+                    reserved_tokens=reserved_tokens,
+                )
+
+        if error is not None:
+            self.circuit_breaker.record_failure(error)
+            logger.error(
+                f"Cloud stream error: {self.model_config.model_id}: {error}"
+            )
+            yield {"error": error}
+            return
+
+        self.circuit_breaker.record_success()
+        latency_ms = (time.time() - start_time) * 1000
+        logger.info(
+            f"Cloud stream success: model={self.model_config.model_id}, "
+            f"user={user_id}, tokens={usage.input_tokens}+{usage.output_tokens}, "
+            f"first_chunk={first_chunk_ms or 0:.0f}ms, latency={latency_ms:.0f}ms"
+        )
+
+        yield {
+            "done": True,
+            "success": True,
+            "total_text": total_text,
+            "model": self.model_config.model_id,
+            "provider": self.model_config.provider.value,
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+            "latency_ms": latency_ms,
+            "first_chunk_ms": first_chunk_ms,
+            "truncated": truncated,
+            "is_free_tier": self.model_config.is_free_tier,
+        }
 
     async def health_check(self) -> dict[str, Any]:
         """Check adapter health."""
@@ -0,0 +1,445 @@
+"""
+Shared HTTP Connection Pools for Cloud Adapters.
+
+Every adapter used to own a private httpx.AsyncClient, so each model paid
+its own DNS lookup, TCP connect and TLS handshake, and clients were never
+reused across models of the same provider. This module keeps one
+long-lived client per provider (per base URL) instead:
+
+- HTTP/2 multiplexing when the ``h2`` package is installed (falls back to
+  HTTP/1.1 keep-alive otherwise)
+- Tuned keep-alive limits so idle connections survive between requests
+- Cached DNS resolution for new connections
+- Startup warm-up to open connections before the first real request
+- Connect/TLS time recorded separately from generation time
+
+Usage:
+    manager = get_connection_manager()
+    client = manager.get_client("google")
+    response = await client.post(url, json=body)
+
+    timings = track_connection_timings()
+    await client.post(url, json=body)
+    print(timings.connect_ms, timings.tls_ms)
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+import socket
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpcore
+import httpx
+from prometheus_client import CollectorRegistry, Counter, Histogram
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Default metrics (can be overridden with custom registry)
+_default_handshake_seconds = Histogram(
+    "cloud_connection_handshake_seconds",
+    "Time spent opening cloud provider connections",
+    ["provider", "phase"],  # connect (DNS + TCP), tls
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+)
+_default_connections_opened = Counter(
+    "cloud_connections_opened_total",
+    "New connections opened to cloud providers",
+    ["provider"],
+)
+
+
+# =============================================================================
+# Per-request Connection Timings
+# =============================================================================
+
+
+@dataclass
+class ConnectionTimings:
+    """Connection setup cost attributed to the current request."""
+
+    connect_ms: float = 0.0  # DNS + TCP connect
+    tls_ms: float = 0.0
+    new_connections: int = 0
+
+    @property
+    def handshake_ms(self) -> float:
+        """Total time spent establishing connections."""
+        return self.connect_ms + self.tls_ms
+
+
+_current_timings: ContextVar[ConnectionTimings | None] = ContextVar(
+    "cloud_connection_timings", default=None
+)
+
+
+def track_connection_timings() -> ConnectionTimings:
+    """
+    Start collecting connection timings for the current task.
+
+    Requests issued through managed clients afterwards (in the same
+    asyncio task) add their connect/TLS time to the returned object.
+    """
+    timings = ConnectionTimings()
+    _current_timings.set(timings)
+    return timings
+
+
+# =============================================================================
+# DNS Cache
+# =============================================================================
+
+
+class CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """
+    Network backend that caches resolved addresses for new connections.
+
+    TLS still verifies against the original hostname because httpcore
+    passes the request origin as the SNI/server hostname.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        backend: httpcore.AsyncNetworkBackend | None = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self._backend = backend or httpcore.AnyIOBackend()
+        self._cache: dict[tuple[str, int], tuple[str, float]] = {}
+        self.lookups = 0
+        self.hits = 0
+
+    async def resolve(self, host: str, port: int) -> str:
+        """Resolve host to an address, using the cache when fresh."""
+        key = (host, port)
+        cached = self._cache.get(key)
+        if cached and cached[1] > time.monotonic():
+            self.hits += 1
+            return cached[0]
+
+        self.lookups += 1
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        address = infos[0][4][0]
+        self._cache[key] = (address, time.monotonic() + self.ttl_seconds)
+        return address
+
+    def invalidate(self, host: str, port: int) -> None:
+        """Drop a cached address (e.g. after a failed connect)."""
+        self._cache.pop((host, port), None)
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Any = None,
+    ) -> httpcore.AsyncNetworkStream:
+        address = await self.resolve(host, port)
+        try:
+            return await self._backend.connect_tcp(
+                address,
+                port,
+                timeout=timeout,
+                local_address=local_address,
+                socket_options=socket_options,
+            )
+        except Exception:
+            self.invalidate(host, port)
+            raise
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Any = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+# =============================================================================
+# Connection Manager
+# =============================================================================
+
+
+class CloudConnectionManager:
+    """
+    Owns one persistent httpx.AsyncClient per provider and base URL.
+
+    Adapters borrow clients from here instead of creating their own, and
+    only the manager closes them (see CloudAdapterFactory.close_all).
+    """
+
+    def __init__(
+        self,
+        http2: bool | None = None,
+        max_connections: int = 50,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 120.0,
+        connect_timeout: float = 10.0,
+        dns_ttl_seconds: float = 300.0,
+        metrics_registry: CollectorRegistry | None = None,
+    ):
+        """
+        Initialize connection manager.
+
+        Args:
+            http2: Negotiate HTTP/2 (defaults to whether h2 is installed)
+            max_connections: Connection cap per provider client
+            max_keepalive_connections: Idle connections kept per client
+            keepalive_expiry: Seconds an idle connection stays open
+            connect_timeout: Timeout for establishing a connection
+            dns_ttl_seconds: How long resolved addresses are reused
+            metrics_registry: Optional Prometheus registry (for test isolation)
+        """
+        if http2 and not HTTP2_AVAILABLE:
+            logger.warning(
+                "HTTP/2 requested but the h2 package is not installed; "
+                "using HTTP/1.1 keep-alive"
+            )
+        self.http2 = (
+            HTTP2_AVAILABLE if http2 is None else (http2 and HTTP2_AVAILABLE)
+        )
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.connect_timeout = connect_timeout
+        self.dns = CachingNetworkBackend(ttl_seconds=dns_ttl_seconds)
+
+        self._clients: dict[tuple[str, str], httpx.AsyncClient] = {}
+        self.stats = {
+            "clients_created": 0,
+            "connections_opened": 0,
+            "warmups": 0,
+            "warmup_failures": 0,
+            "dns_cache_installed": True,
+        }
+
+        if metrics_registry is not None:
+            self._m_handshake = Histogram(
+                "cloud_connection_handshake_seconds",
+                "Time spent opening cloud provider connections",
+                ["provider", "phase"],
+                registry=metrics_registry,
+            )
+            self._m_opened = Counter(
+                "cloud_connections_opened_total",
+                "New connections opened to cloud providers",
+                ["provider"],
+                registry=metrics_registry,
+            )
+        else:
+            self._m_handshake = _default_handshake_seconds
+            self._m_opened = _default_connections_opened
+
+    # -------------------------------------------------------------------------
+    # Clients
+    # -------------------------------------------------------------------------
+
+    def get_client(
+        self, provider: str, base_url: str = ""
+    ) -> httpx.AsyncClient:
+        """Get (or lazily create) the shared client for a provider."""
+        key = (provider, base_url)
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = self._create_client(provider, base_url)
+            self._clients[key] = client
+        return client
+
+    def _create_client(
+        self, provider: str, base_url: str
+    ) -> httpx.AsyncClient:
+        transport = httpx.AsyncHTTPTransport(
+            http2=self.http2, limits=self.limits
+        )
+        self._install_dns_cache(transport, provider)
+
+        async def attach_trace(request: httpx.Request) -> None:
+            request.extensions["trace"] = self._make_trace(provider)
+
+        self.stats["clients_created"] += 1
+        logger.info(
+            f"Created shared HTTP client for {provider} "
+            f"(http2={self.http2})"
+        )
+        return httpx.AsyncClient(
+            base_url=base_url,
+            transport=transport,
+            timeout=httpx.Timeout(60.0, connect=self.connect_timeout),
+            event_hooks={"request": [attach_trace]},
+        )
+
+    def _install_dns_cache(
+        self, transport: httpx.AsyncHTTPTransport, provider: str
+    ) -> None:
+        """Point the transport's connection pool at the DNS cache.
+
+        httpx has no public hook for the network backend, so this relies
+        on the pool layout of the pinned httpx version (pyproject.toml,
+        which bounds httpcore to 1.x). If that layout changes, the client
+        still works without the cache and ``dns_cache_installed`` reports
+        False.
+        """
+        pool = getattr(transport, "_pool", None)
+        if isinstance(pool, httpcore.AsyncConnectionPool) and hasattr(
+            pool, "_network_backend"
+        ):
+            pool._network_backend = self.dns
+            return
+        self.stats["dns_cache_installed"] = False
+        logger.warning(
+            f"DNS cache not installed for {provider}: unsupported httpx "
+            f"{httpx.__version__} transport layout"
+        )
+
+    def _make_trace(self, provider: str):
+        started: dict[str, float] = {}
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            if event_name.endswith(".started"):
+                started[event_name[: -len(".started")]] = time.perf_counter()
+                return
+            if event_name == "connection.connect_tcp.complete":
+                self._record_phase(provider, "connect", started, event_name)
+                self.stats["connections_opened"] += 1
+                self._m_opened.labels(provider=provider).inc()
+                timings = _current_timings.get()
+                if timings is not None:
+                    timings.new_connections += 1
+            elif event_name == "connection.start_tls.complete":
+                self._record_phase(provider, "tls", started, event_name)
+
+        return trace
+
+    def _record_phase(
+        self,
+        provider: str,
+        phase: str,
+        started: dict[str, float],
+        event_name: str,
+    ) -> None:
+        begin = started.pop(event_name[: -len(".complete")], None)
+        if begin is None:
+            return
+        elapsed = time.perf_counter() - begin
+        self._m_handshake.labels(provider=provider, phase=phase).observe(
+            elapsed
+        )
+        timings = _current_timings.get()
+        if timings is not None:
+            if phase == "connect":
+                timings.connect_ms += elapsed * 1000
+            else:
+                timings.tls_ms += elapsed * 1000
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    async def warm_up(
+        self, endpoints: dict[str, str], timeout: float = 5.0
+    ) -> dict[str, bool]:
+        """
+        Open connections ahead of the first request.
+
+        Args:
+            endpoints: Provider name -> any URL on the provider's host
+            timeout: Per-provider warm-up timeout
+
+        Returns:
+            Provider name -> whether a connection was established
+        """
+
+        async def warm(provider: str, url: str) -> bool:
+            parts = urlsplit(url)
+            origin = f"{parts.scheme}://{parts.netloc}"
+            client = self.get_client(provider)
+            try:
+                # Any response (even 404) means DNS, TCP and TLS are done
+                # and the connection is now idle in the keep-alive pool.
+                await client.head(origin, timeout=timeout)
+                return True
+            except Exception as e:
+                self.stats["warmup_failures"] += 1
+                logger.warning(
+                    f"Connection warm-up failed for {provider}: {e}"
+                )
+                return False
+
+        providers = list(endpoints)
+        results = await asyncio.gather(
+            *(warm(p, endpoints[p]) for p in providers)
+        )
+        self.stats["warmups"] += 1
+        return dict(zip(providers, results, strict=True))
+
+    async def close(self) -> None:
+        """Close every shared client."""
+        for (provider, _), client in list(self._clients.items()):
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(
+                    f"Error closing HTTP client for {provider}: {e}"
+                )
+        self._clients.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get connection manager statistics."""
+        return {
+            **self.stats,
+            "http2": self.http2,
+            "open_clients": sum(
+                1 for c in self._clients.values() if not c.is_closed
+            ),
+            "dns_lookups": self.dns.lookups,
+            "dns_cache_hits": self.dns.hits,
+        }
+
+
+# =============================================================================
+# Global Instance
+# =============================================================================
+
+
+def create_connection_manager_from_env() -> CloudConnectionManager:
+    """Create connection manager configured from environment variables."""
+    http2_env = os.getenv("CLOUD_HTTP2")
+    return CloudConnectionManager(
+        http2=None if http2_env is None else http2_env == "1",
+        max_connections=int(os.getenv("CLOUD_MAX_CONNECTIONS", "50")),
+        max_keepalive_connections=int(
+            os.getenv("CLOUD_MAX_KEEPALIVE_CONNECTIONS", "20")
+        ),
+        keepalive_expiry=float(os.getenv("CLOUD_KEEPALIVE_EXPIRY", "120")),
+        dns_ttl_seconds=float(os.getenv("CLOUD_DNS_TTL_SECONDS", "300")),
+    )
+
+
+_global_manager: dict[str, CloudConnectionManager] = {}
+
+
+def get_connection_manager() -> CloudConnectionManager:
+    """Get or create global connection manager instance."""
+    manager = _global_manager.get("default")
+    if manager is None:
+        manager = _global_manager["default"] = (
+            create_connection_manager_from_env()
+        )
+    return manager
@@ -7,6 +7,7 @@ Provides:
 - Shared budget tracking per provider
 - Unified health checking
 - Adapter pooling and reuse
+- Shared HTTP connections per provider (warm-up + lifecycle)
 
 Usage:
     factory = CloudAdapterFactory()
@@ -36,6 +37,7 @@ from .base_cloud import (
     CloudProviderBudget,
     CloudSecurityManager,
 )
+from .connections import CloudConnectionManager, get_connection_manager
 from .gemini import GeminiAdapter, create_gemini_adapter
 from .kimi import KimiAdapter, create_kimi_adapter
 from .minimax import MinimaxAdapter, create_minimax_adapter
@@ -106,6 +108,17 @@ PROVIDER_DEFAULTS: dict[str, str] = {
 }
 
 
+# Interchangeable models: queued requests are spread across a group
+EQUIVALENT_MODELS: list[list[str]] = [
+    # Gemini free-tier flash models (separate RPM quotas)
+    ["gemini-1.5-flash", "gemini-1.5-flash-8b", "gemini-2.0-flash-exp"],
+    # Ollama Cloud general reasoning models (FREE)
+    ["deepseek-v3.1-671b", "gpt-oss-120b"],
+    # Moonshot Kimi context tiers (larger tiers accept smaller prompts)
+    ["kimi-k2-8k", "kimi-k2-32k", "kimi-k2-128k"],
+]
+
+
 # =============================================================================
 # Cloud Adapter Factory
 # =============================================================================
@@ -129,6 +142,7 @@ class CloudAdapterFactory:
         minimax_group_id: Optional[str] = None,
         moonshot_api_key: Optional[str] = None,
         dashscope_api_key: Optional[str] = None,
+        connection_manager: Optional[CloudConnectionManager] = None,
     ):
         # API keys (from params or environment)
         self._api_keys = {
@@ -150,6 +164,7 @@ class CloudAdapterFactory:
         self._budgets: dict[CloudProvider, CloudProviderBudget] = {}
         self._circuit_breakers: dict[CloudProvider, CloudCircuitBreaker] = {}
         self._security_manager = CloudSecurityManager()
+        self._connections = connection_manager or get_connection_manager()
 
         # Adapter cache (per model)
         self._adapters: dict[str, BaseCloudAdapter] = {}
@@ -249,6 +264,7 @@ class CloudAdapterFactory:
                 provider_budget=budget,
                 circuit_breaker=circuit_breaker,
                 security_manager=self._security_manager,
+                connection_manager=self._connections,
             )
         elif provider == CloudProvider.GOOGLE:
             adapter = GeminiAdapter(
@@ -257,6 +273,7 @@ class CloudAdapterFactory:
                 provider_budget=budget,
                 circuit_breaker=circuit_breaker,
                 security_manager=self._security_manager,
+                connection_manager=self._connections,
             )
         elif provider == CloudProvider.MINIMAX:
             adapter = MinimaxAdapter(
@@ -266,6 +283,7 @@ class CloudAdapterFactory:
                 provider_budget=budget,
                 circuit_breaker=circuit_breaker,
                 security_manager=self._security_manager,
+                connection_manager=self._connections,
             )
         elif provider == CloudProvider.MOONSHOT:
             adapter = KimiAdapter(
@@ -274,6 +292,7 @@ class CloudAdapterFactory:
                 provider_budget=budget,
                 circuit_breaker=circuit_breaker,
                 security_manager=self._security_manager,
+                connection_manager=self._connections,
             )
         elif provider == CloudProvider.ALIBABA:
             adapter = QwenCloudAdapter(
@@ -282,6 +301,7 @@ class CloudAdapterFactory:
                 provider_budget=budget,
                 circuit_breaker=circuit_breaker,
                 security_manager=self._security_manager,
+                connection_manager=self._connections,
             )
 
         if adapter:
@@ -290,6 +310,53 @@ class CloudAdapterFactory:
 
         return adapter
 
+    def get_equivalent_models(self, model_id: str) -> list[str]:
+        """Get models interchangeable with model_id (itself first)."""
+        for group in EQUIVALENT_MODELS:
+            if model_id in group:
+                return [model_id] + [m for m in group if m != model_id]
+        return [model_id]
+
+    def select_adapter(
+        self,
+        model_id: str,
+        estimated_tokens: int = 0,
+    ) -> Optional[BaseCloudAdapter]:
+        """
+        Get the adapter among model_id's equivalents that can be admitted
+        soonest.
+
+        The requested model wins ties, so traffic only spreads to
+        equivalent models once its own rate-limit buckets are queueing.
+        Models whose context window is too small are skipped.
+        """
+        best: Optional[BaseCloudAdapter] = None
+        best_wait = float("inf")
+
+        for candidate in self.get_equivalent_models(model_id):
+            config = ALL_CLOUD_MODELS.get(candidate)
+            if config is None or config.context_window < estimated_tokens:
+                continue
+            adapter = self.get_adapter(candidate)
+            if adapter is None:
+                continue
+            if not adapter.circuit_breaker.is_available()[0]:
+                continue
+            wait = adapter.provider_budget.estimated_wait(
+                adapter.model_config, estimated_tokens
+            )
+            if wait < best_wait:
+                best, best_wait = adapter, wait
+            if wait == 0:
+                break
+
+        if best is not None and best.model_config.model_id != model_id:
+            logger.info(
+                f"Spreading request from {model_id} to "
+                f"{best.model_config.model_id} (wait {best_wait:.1f}s)"
+            )
+        return best
+
     def get_adapter_for_provider(
         self,
         provider_name: str,
@@ -374,6 +441,7 @@ class CloudAdapterFactory:
             "providers_with_keys": sum(
                 1 for k in self._api_keys.values() if k
             ),
+            "connections": self._connections.get_stats(),
         }
 
     def get_budget_stats(self) -> dict[str, Any]:
@@ -407,8 +475,36 @@ class CloudAdapterFactory:
             models, key=lambda x: (not x["is_free_tier"], x["provider"])
         )
 
+    async def warm_up(self, timeout: float = 5.0) -> dict[str, bool]:
+        """
+        Open connections to every configured remote provider.
+
+        Ollama Cloud is reached through the local Ollama daemon, so there is
+        no remote handshake worth pre-paying and it is skipped.
+        """
+        endpoints: dict[str, str] = {}
+        for config in ALL_CLOUD_MODELS.values():
+            provider = config.provider
+            if provider == CloudProvider.OLLAMA_CLOUD:
+                continue
+            if (
+                self._api_keys.get(provider)
+                and provider.value not in endpoints
+            ):
+                endpoints[provider.value] = config.api_endpoint
+
+        if not endpoints:
+            return {}
+        results = await self._connections.warm_up(endpoints, timeout=timeout)
+        logger.info(f"Cloud connection warm-up: {results}")
+        return results
+
+    def get_connection_stats(self) -> dict[str, Any]:
+        """Get shared connection pool statistics."""
+        return self._connections.get_stats()
+
     async def close_all(self) -> None:
-        """Close all adapter HTTP clients."""
+        """Close all adapters and their shared HTTP clients."""
         for model_id, adapter in self._adapters.items():
             try:
                 await adapter.close()
@@ -416,6 +512,7 @@ class CloudAdapterFactory:
                 logger.warning(f"Error closing adapter {model_id}: {e}")
 
         self._adapters.clear()
+        await self._connections.close()
         logger.info("All cloud adapters closed")
 
 
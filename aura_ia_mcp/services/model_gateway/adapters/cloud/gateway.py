@@ -9,6 +9,9 @@ Routes requests between local Ollama and cloud providers based on:
 
 Features:
 - Automatic fallback (local → cloud)
+- Hedged requests: cloud fires when local misses its p95-derived deadline
+- Cached background health probing (no per-request ping)
+- Streaming generation (generate_stream) with the same routing/fallback
 - Transparent model routing
 - Unified API interface
 - Cost tracking across providers
@@ -24,12 +27,18 @@ RESOURCE OFFLOADING RULES:
 4. Log all routing decisions
 """
 
+import asyncio
 import logging
+import math
 import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Optional
 
+from ...response_cache import ResponseCache, get_response_cache
 from ..ollama import OllamaBackend
 from .factory import CloudAdapterFactory, get_cloud_factory
 
@@ -111,6 +120,123 @@ MODEL_ALIASES: dict[str, dict[str, str]] = {
 }
 
 
+# =============================================================================
+# Hedging Support
+# =============================================================================
+
+
+class LocalHealthProber:
+    """
+    Background health prober for the local Ollama backend.
+
+    Requests read the cached state instead of paying an extra round-trip.
+    The probe loop starts lazily on first use inside a running event loop.
+    """
+
+    def __init__(
+        self,
+        check: Callable[[], Awaitable[bool]],
+        interval_seconds: float = 10.0,
+    ):
+        self._check = check
+        self.interval_seconds = interval_seconds
+        self.healthy: Optional[bool] = None
+        self.last_checked: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def probe(self) -> bool:
+        """Run a single health check and cache the result."""
+        try:
+            healthy = bool(await self._check())
+        except Exception:
+            healthy = False
+        if healthy != self.healthy and self.healthy is not None:
+            logger.info(
+                f"Local backend health changed: "
+                f"{'healthy' if healthy else 'unhealthy'}"
+            )
+        self.healthy = healthy
+        self.last_checked = time.time()
+        return healthy
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.probe()
+
+    def start(self) -> None:
+        """Start the background probe loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop the background probe loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def is_healthy(self) -> bool:
+        """Return cached health, probing once if nothing is known yet."""
+        self.start()
+        if self.healthy is None:
+            return await self.probe()
+        return self.healthy
+
+    def record_success(self) -> None:
+        """Passively mark healthy after a successful real request."""
+        self.healthy = True
+        self.last_checked = time.time()
+
+
+class LatencyTracker:
+    """Rolling latency window used to derive the hedge deadline."""
+
+    def __init__(
+        self,
+        window_size: int = 200,
+        min_samples: int = 20,
+        default_deadline_s: float = 8.0,
+        min_deadline_s: float = 0.5,
+        max_deadline_s: float = 30.0,
+    ):
+        self.samples: deque[float] = deque(maxlen=window_size)
+        self.min_samples = min_samples
+        self.default_deadline_s = default_deadline_s
+        self.min_deadline_s = min_deadline_s
+        self.max_deadline_s = max_deadline_s
+
+    def record(self, latency_s: float) -> None:
+        """Record a successful local latency."""
+        self.samples.append(latency_s)
+
+    def record_censored(self, elapsed_s: float) -> None:
+        """Record a call cut off after ``elapsed_s`` (hedge lost, timeout).
+
+        The true latency is at least ``elapsed_s``; keeping it as a sample
+        stops the p95 drifting down to only the calls that finished.
+        """
+        self.samples.append(elapsed_s)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Nearest-rank percentile of the window, or None if empty."""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        rank = max(1, math.ceil(pct / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def hedge_deadline(self) -> float:
+        """Seconds to wait on local before firing the hedge."""
+        if len(self.samples) < self.min_samples:
+            return self.default_deadline_s
+        p95 = self.percentile(95) or self.default_deadline_s
+        return min(self.max_deadline_s, max(self.min_deadline_s, p95))
+
+
 # =============================================================================
 # Unified Model Gateway
 # =============================================================================
@@ -133,11 +259,22 @@ class UnifiedModelGateway:
         cloud_factory: Optional[CloudAdapterFactory] = None,
         default_policy: RoutingPolicy = RoutingPolicy.LOCAL_FIRST,
         local_context_limit: int = 131072,  # 128K default
+        response_cache: Optional[ResponseCache] = None,
+        hedging_enabled: bool = True,
+        hedge_cloud_model: str = "gemini-1.5-flash",  # FREE TIER
+        health_probe_interval: float = 10.0,
     ):
         self.ollama = ollama_backend or OllamaBackend()
         self.cloud_factory = cloud_factory or get_cloud_factory()
         self.default_policy = default_policy
         self.local_context_limit = local_context_limit
+        self.response_cache = response_cache
+        self.hedging_enabled = hedging_enabled
+        self.hedge_cloud_model = hedge_cloud_model
+        self.local_health = LocalHealthProber(
+            self._check_local_health, health_probe_interval
+        )
+        self.local_latency = LatencyTracker()
 
         # Statistics
         self.stats = {
@@ -145,6 +282,9 @@ class UnifiedModelGateway:
             "cloud_requests": 0,
             "fallback_count": 0,
             "errors": 0,
+            "cache_hits": 0,
+            "hedged_requests": 0,
+            "hedge_cloud_wins": 0,
         }
 
         logger.info(
@@ -285,6 +425,7 @@ class UnifiedModelGateway:
         max_tokens: int = 2048,
         force_cloud: bool = False,
         force_local: bool = False,
+        cache_route: Optional[str] = "gateway",
         **kwargs: Any,
     ) -> dict[str, Any]:
         """
@@ -299,6 +440,7 @@ class UnifiedModelGateway:
             max_tokens: Maximum output tokens
             force_cloud: Force cloud routing
             force_local: Force local routing
+            cache_route: Response cache route name (None bypasses the cache)
 
         Returns:
             dict with response and metadata
@@ -306,6 +448,32 @@ class UnifiedModelGateway:
         start_time = time.time()
         policy = policy or self.default_policy
 
+        # Serve idempotent requests from the response cache
+        cache_params = {
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "policy": policy.value,
+            "force_cloud": force_cloud,
+            "force_local": force_local,
+            **kwargs,
+        }
+        use_cache = (
+            self.response_cache is not None
+            and cache_route is not None
+            and self.response_cache.is_cacheable(cache_route, cache_params)
+        )
+        if use_cache:
+            cached = await self.response_cache.aget(
+                cache_route, model, prompt, cache_params
+            )
+            if cached is not None:
+                self.stats["cache_hits"] += 1
+                cached["cached"] = True
+                cached.setdefault("routing", {})["latency_ms"] = (
+                    time.time() - start_time
+                ) * 1000
+                return cached
+
         # Make routing decision
         decision = self._decide_route(
             model=model,
@@ -360,6 +528,11 @@ class UnifiedModelGateway:
             "latency_ms": latency_ms,
         }
 
+        if use_cache and result.get("success"):
+            await self.response_cache.aput(
+                cache_route, model, prompt, cache_params, result
+            )
+
         return result
 
     async def _execute_local(
@@ -371,6 +544,7 @@ class UnifiedModelGateway:
         **kwargs: Any,
     ) -> dict[str, Any]:
         """Execute request on local Ollama."""
+        started = time.monotonic()
         try:
             response = await self.ollama.generate(
                 prompt=prompt,
@@ -382,6 +556,8 @@ class UnifiedModelGateway:
             )
 
             self.stats["local_requests"] += 1
+            self.local_latency.record(time.monotonic() - started)
+            self.local_health.record_success()
 
             return {
                 "success": True,
@@ -391,6 +567,9 @@ class UnifiedModelGateway:
                 "is_local": True,
             }
 
+        except asyncio.CancelledError:
+            self.local_latency.record_censored(time.monotonic() - started)
+            raise
         except Exception as e:
             self.stats["errors"] += 1
             logger.error(f"Local generation failed: {e}")
@@ -411,7 +590,9 @@ class UnifiedModelGateway:
     ) -> dict[str, Any]:
         """Execute request on cloud provider."""
         try:
-            adapter = self.cloud_factory.get_adapter(model)
+            adapter = self.cloud_factory.select_adapter(
+                model, self._estimate_tokens(prompt) + max_tokens
+            )
             if not adapter:
                 # Try default free adapter
                 adapter = self.cloud_factory.get_free_adapter()
@@ -457,25 +638,122 @@ class UnifiedModelGateway:
         max_tokens: int,
         **kwargs: Any,
     ) -> dict[str, Any]:
-        """Execute with local-first, cloud-fallback strategy."""
-        # Try local first
-        local_healthy = await self._check_local_health()
+        """
+        Execute with local-first, cloud-fallback strategy.
 
-        if local_healthy:
-            result = await self._execute_local(
+        Local health comes from the cached background prober. With hedging
+        enabled, the cloud request fires once local misses its p95-derived
+        deadline; whichever succeeds first wins and the loser is cancelled.
+        """
+        if not await self.local_health.is_healthy():
+            return await self._execute_fallback(
+                prompt, user_id, temperature, max_tokens, **kwargs
+            )
+
+        local_task = asyncio.create_task(
+            self._execute_local(
                 prompt, local_model, temperature, max_tokens, **kwargs
             )
-            if result.get("success"):
-                return result
-            logger.warning(
-                f"Local failed, falling back to cloud: {result.get('error')}"
+        )
+        deadline = (
+            self.local_latency.hedge_deadline()
+            if self.hedging_enabled
+            else None
+        )
+
+        try:
+            done, _ = await asyncio.wait({local_task}, timeout=deadline)
+            if done:
+                result = local_task.result()
+                if result.get("success"):
+                    return result
+                logger.warning(
+                    f"Local failed, falling back to cloud: {result.get('error')}"
+                )
+                return await self._execute_fallback(
+                    prompt, user_id, temperature, max_tokens, **kwargs
+                )
+
+            return await self._race_hedge(
+                local_task,
+                deadline,
+                prompt,
+                user_id,
+                temperature,
+                max_tokens,
+                **kwargs,
             )
+        finally:
+            if not local_task.done():
+                local_task.cancel()
 
-        # Fallback to cloud
+    async def _race_hedge(
+        self,
+        local_task: asyncio.Task,
+        deadline: float,
+        prompt: str,
+        user_id: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Race a slow local request against a cloud hedge."""
+        self.stats["hedged_requests"] += 1
+        logger.info(
+            f"Local exceeded hedge deadline ({deadline:.2f}s), "
+            f"firing cloud hedge"
+        )
+        cloud_task = asyncio.create_task(
+            self._execute_cloud(
+                prompt=prompt,
+                model=self.hedge_cloud_model,
+                user_id=user_id,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs,
+            )
+        )
+        pending = {local_task, cloud_task}
+        result: dict[str, Any] = {}
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    result = task.result()
+                    if not result.get("success"):
+                        continue
+                    if task is cloud_task:
+                        self.stats["fallback_count"] += 1
+                        self.stats["hedge_cloud_wins"] += 1
+                        result["is_fallback"] = True
+                    result["hedged"] = True
+                    return result
+            # Both failed: report the cloud error as the final fallback
+            cloud_result = cloud_task.result()
+            cloud_result["is_fallback"] = True
+            cloud_result["hedged"] = True
+            return cloud_result
+        finally:
+            for task in (local_task, cloud_task):
+                if not task.done():
+                    task.cancel()
+
+    async def _execute_fallback(
+        self,
+        prompt: str,
+        user_id: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Fallback to the free-tier cloud model."""
         self.stats["fallback_count"] += 1
         cloud_result = await self._execute_cloud(
             prompt=prompt,
-            model="gemini-1.5-flash",  # FREE TIER
+            model=self.hedge_cloud_model,
             user_id=user_id,
             temperature=temperature,
             max_tokens=max_tokens,
@@ -484,9 +762,227 @@ class UnifiedModelGateway:
         cloud_result["is_fallback"] = True
         return cloud_result
 
+    # -------------------------------------------------------------------------
+    # Streaming
+    # -------------------------------------------------------------------------
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        model: str = "default",
+        user_id: str = "anonymous",
+        policy: Optional[RoutingPolicy] = None,
+        temperature: float = 0.3,
+        max_tokens: int = 2048,
+        force_cloud: bool = False,
+        force_local: bool = False,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream text using the appropriate backend.
+
+        Routing matches generate(). Hybrid requests fall back to cloud if
+        local fails before its first chunk; once text has been emitted a
+        failure is reported as a terminal error event. The final ``done``
+        event carries the routing metadata.
+        """
+        start_time = time.time()
+        policy = policy or self.default_policy
+
+        decision = self._decide_route(
+            model=model,
+            prompt=prompt,
+            policy=policy,
+            force_cloud=force_cloud,
+            force_local=force_local,
+        )
+        logger.info(
+            f"Streaming routing decision: {decision.target.value} → "
+            f"{decision.model_id} (reason: {decision.reason})"
+        )
+
+        if decision.target == RoutingTarget.LOCAL:
+            stream = self._stream_local(
+                prompt, decision.model_id, temperature, max_tokens, **kwargs
+            )
+        elif decision.target == RoutingTarget.CLOUD:
+            stream = self._stream_cloud(
+                prompt,
+                decision.model_id,
+                user_id,
+                temperature,
+                max_tokens,
+                **kwargs,
+            )
+        else:  # HYBRID
+            stream = self._stream_hybrid(
+                prompt,
+                decision.model_id,
+                user_id,
+                temperature,
+                max_tokens,
+                **kwargs,
+            )
+
+        async with aclosing(stream) as events:
+            async for event in events:
+                if event.get("done"):
+                    event["routing"] = {
+                        "decision": decision.target.value,
+                        "model": decision.model_id,
+                        "provider": decision.provider,
+                        "reason": decision.reason,
+                        "is_fallback": event.get("is_fallback", False),
+                        "latency_ms": (time.time() - start_time) * 1000,
+                    }
+                yield event
+
+    async def _stream_local(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream from local Ollama."""
+        started = time.monotonic()
+        stream = self.ollama.generate_stream(
+            prompt=prompt,
+            model=model,
+            options={
+                "temperature": temperature,
+                "num_predict": max_tokens,
+            },
+        )
+        finished = False
+        try:
+            async with aclosing(stream) as events:
+                async for event in events:
+                    if "error" in event:
+                        finished = True
+                        self.stats["errors"] += 1
+                        logger.error(f"Local stream failed: {event['error']}")
+                        event["provider"] = "ollama"
+                    elif event.get("done"):
+                        finished = True
+                        self.stats["local_requests"] += 1
+                        self.local_latency.record(time.monotonic() - started)
+                        self.local_health.record_success()
+                        event.update(
+                            model=model, provider="ollama", is_local=True
+                        )
+                    yield event
+        except (asyncio.CancelledError, GeneratorExit):
+            if not finished:
+                # Cancelled or closed by the consumer before completion
+                self.local_latency.record_censored(time.monotonic() - started)
+            raise
+
+    async def _stream_cloud(
+        self,
+        prompt: str,
+        model: str,
+        user_id: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream from a cloud provider."""
+        adapter = (
+            self.cloud_factory.select_adapter(
+                model, self._estimate_tokens(prompt) + max_tokens
+            )
+            or self.cloud_factory.get_free_adapter()
+        )
+        if not adapter:
+            self.stats["errors"] += 1
+            yield {
+                "error": f"No cloud adapter available for {model}",
+                "provider": "cloud",
+            }
+            return
+
+        stream = adapter.generate_stream(
+            prompt=prompt,
+            user_id=user_id,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        async with aclosing(stream) as events:
+            async for event in events:
+                if "error" in event:
+                    self.stats["errors"] += 1
+                    event.setdefault("provider", "cloud")
+                elif event.get("done"):
+                    self.stats["cloud_requests"] += 1
+                    event["is_local"] = False
+                yield event
+
+    async def _stream_hybrid(
+        self,
+        prompt: str,
+        local_model: str,
+        user_id: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream local-first; fall back to cloud before the first chunk."""
+        if await self.local_health.is_healthy():
+            emitted = False
+            local_failed = False
+            local = self._stream_local(
+                prompt, local_model, temperature, max_tokens, **kwargs
+            )
+            async with aclosing(local) as events:
+                async for event in events:
+                    if "error" in event and not emitted:
+                        logger.warning(
+                            "Local stream failed before first chunk, "
+                            f"falling back to cloud: {event['error']}"
+                        )
+                        local_failed = True
+                        break
+                    emitted = emitted or "chunk" in event
+                    yield event
+            if not local_failed:
+                return
+
+        fallback = self._stream_fallback(
+            prompt, user_id, temperature, max_tokens, **kwargs
+        )
+        async with aclosing(fallback) as events:
+            async for event in events:
+                yield event
+
+    async def _stream_fallback(
+        self,
+        prompt: str,
+        user_id: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream from the free-tier cloud fallback model."""
+        self.stats["fallback_count"] += 1
+        stream = self._stream_cloud(
+            prompt=prompt,
+            model=self.hedge_cloud_model,
+            user_id=user_id,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        async with aclosing(stream) as events:
+            async for event in events:
+                event["is_fallback"] = True
+                yield event
+
     async def health_check(self) -> dict[str, Any]:
         """Check health of all backends."""
-        local_health = await self._check_local_health()
+        local_health = await self.local_health.probe()
         cloud_health = await self.cloud_factory.health_check_all()
 
         return {
@@ -496,6 +992,12 @@ class UnifiedModelGateway:
             },
             "cloud": cloud_health,
             "stats": self.stats,
+            "hedge_deadline_s": self.local_latency.hedge_deadline(),
+            "response_cache": (
+                self.response_cache.get_stats()
+                if self.response_cache is not None
+                else None
+            ),
             "default_policy": self.default_policy.value,
         }
 
@@ -520,6 +1022,10 @@ class UnifiedModelGateway:
         """Get budget statistics from cloud factory."""
         return self.cloud_factory.get_budget_stats()
 
+    async def close(self) -> None:
+        """Stop background tasks."""
+        await self.local_health.stop()
+
 
 # =============================================================================
 # Global Gateway Instance
@@ -533,7 +1039,9 @@ def get_unified_gateway() -> UnifiedModelGateway:
     """Get or create global gateway instance."""
     global _global_gateway
     if _global_gateway is None:
-        _global_gateway = UnifiedModelGateway()
+        _global_gateway = UnifiedModelGateway(
+            response_cache=get_response_cache()
+        )
     return _global_gateway
 
 
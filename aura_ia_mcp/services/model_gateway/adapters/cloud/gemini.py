@@ -20,10 +20,10 @@ API Reference: https://ai.google.dev/api/generate-content
 import asyncio
 import logging
 import os
+from collections.abc import AsyncIterator
 from typing import Any, Optional
 
-import httpx
-
+from ..streaming import StreamUsage, iter_sse_json
 from .base_cloud import (
     ALL_CLOUD_MODELS,
     GOOGLE_MODELS,
@@ -34,6 +34,7 @@ from .base_cloud import (
     CloudProviderBudget,
     CloudSecurityManager,
 )
+from .connections import CloudConnectionManager
 
 logger = logging.getLogger(__name__)
 
@@ -133,6 +134,7 @@ class GeminiAdapter(BaseCloudAdapter):
         provider_budget: Optional[CloudProviderBudget] = None,
         circuit_breaker: Optional[CloudCircuitBreaker] = None,
         security_manager: Optional[CloudSecurityManager] = None,
+        connection_manager: Optional[CloudConnectionManager] = None,
         safety_settings: Optional[list] = None,
         timeout: float = 60.0,
     ):
@@ -166,22 +168,11 @@ class GeminiAdapter(BaseCloudAdapter):
             provider_budget=provider_budget,
             circuit_breaker=circuit_breaker,
             security_manager=security_manager,
+            connection_manager=connection_manager,
         )
 
         self.safety_settings = safety_settings or GeminiSafetyLevel.DEFAULT
         self.timeout = timeout
-        self._http_client: Optional[httpx.AsyncClient] = None
-
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(timeout=self.timeout)
-        return self._http_client
-
-    async def close(self) -> None:
-        """Close HTTP client."""
-        if self._http_client and not self._http_client.is_closed:
-            await self._http_client.aclose()
 
     async def _call_api(
         self,
@@ -229,6 +220,7 @@ class GeminiAdapter(BaseCloudAdapter):
         response = await client.post(
             url,
             json=request_body,
+            timeout=self.timeout,
             headers={"Content-Type": "application/json"},
         )
 
@@ -336,36 +328,21 @@ class GeminiAdapter(BaseCloudAdapter):
             "error": "All Gemini models rate limited or unavailable",
         }
 
-    async def generate_stream(
+    async def _stream_api(
         self,
         prompt: str,
-        user_id: str = "anonymous",
-        temperature: float = 0.3,
-        max_tokens: int = 2048,
+        temperature: float,
+        max_tokens: int,
+        usage: StreamUsage,
         **kwargs: Any,
-    ):
+    ) -> AsyncIterator[str]:
         """
-        Stream generation (yields chunks).
+        Stream from Gemini's streamGenerateContent endpoint (SSE).
 
-        Note: Uses streamGenerateContent endpoint.
+        Usage metadata arrives with the stream and is cumulative.
         """
-        # Security validation
-        valid, reason = self.security_manager.validate_input(prompt, user_id)
-        if not valid:
-            yield {"error": reason}
-            return
-
-        # Rate limit check
-        rate_ok, rate_reason = await self.provider_budget.check_rate_limit(
-            self.model_config
-        )
-        if not rate_ok:
-            yield {"error": rate_reason}
-            return
-
         client = await self._get_client()
 
-        # Stream endpoint
         stream_url = (
             self.model_config.api_endpoint.replace(
                 ":generateContent", ":streamGenerateContent"
@@ -382,55 +359,37 @@ class GeminiAdapter(BaseCloudAdapter):
             "safetySettings": self.safety_settings,
         }
 
-        total_text = ""
-        input_tokens = 0
-        output_tokens = 0
+        system_instruction = kwargs.get("system_instruction")
+        if system_instruction:
+            request_body["systemInstruction"] = {
+                "parts": [{"text": system_instruction}]
+            }
 
-        try:
-            async with client.stream(
-                "POST", stream_url, json=request_body
-            ) as response:
-                async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        import json
-
-                        data = json.loads(line[6:])
-
-                        if "candidates" in data:
-                            for candidate in data["candidates"]:
-                                if "content" in candidate:
-                                    for part in candidate["content"].get(
-                                        "parts", []
-                                    ):
-                                        if "text" in part:
-                                            chunk = part["text"]
-                                            total_text += chunk
-                                            yield {"chunk": chunk}
-
-                        # Update token counts
-                        if "usageMetadata" in data:
-                            usage = data["usageMetadata"]
-                            input_tokens = usage.get("promptTokenCount", 0)
-                            output_tokens = usage.get(
-                                "candidatesTokenCount", 0
-                            )
-
-            # Record usage after stream completes
-            await self.provider_budget.record_request(
-                self.model_config, input_tokens, output_tokens
-            )
-            self.circuit_breaker.record_success()
+        async with client.stream(
+            "POST", stream_url, json=request_body, timeout=self.timeout
+        ) as response:
+            if response.status_code == 429:
+                raise RateLimitError(
+                    f"Rate limited on {self.model_config.model_id}"
+                )
+            if response.status_code != 200:
+                await response.aread()
+                raise GeminiAPIError(
+                    f"Gemini API error ({response.status_code}): {response.text}"
+                )
 
-            yield {
-                "done": True,
-                "total_text": total_text,
-                "input_tokens": input_tokens,
-                "output_tokens": output_tokens,
-            }
+            async for data in iter_sse_json(response):
+                for candidate in data.get("candidates", []):
+                    if candidate.get("finishReason") == "SAFETY":
+                        raise SafetyBlockError("Response blocked for safety")
+                    for part in candidate.get("content", {}).get("parts", []):
+                        if "text" in part:
+                            yield part["text"]
 
-        except Exception as e:
-            self.circuit_breaker.record_failure(str(e))
-            yield {"error": str(e)}
+                if "usageMetadata" in data:
+                    meta = data["usageMetadata"]
+                    usage.input_tokens = meta.get("promptTokenCount", 0)
+                    usage.output_tokens = meta.get("candidatesTokenCount", 0)
 
     async def count_tokens(self, text: str) -> dict[str, int]:
         """
@@ -446,6 +405,7 @@ class GeminiAdapter(BaseCloudAdapter):
             response = await client.post(
                 url,
                 json={"contents": [{"parts": [{"text": text}]}]},
+                timeout=self.timeout,
             )
 
             if response.status_code == 200:
@@ -12,10 +12,10 @@ Features:
 
 import logging
 import os
+from collections.abc import AsyncIterator
 from typing import Any, Optional
 
-import httpx
-
+from ..streaming import StreamUsage, iter_sse_json
 from .base_cloud import (
     MOONSHOT_MODELS,
     BaseCloudAdapter,
@@ -25,6 +25,7 @@ from .base_cloud import (
     CloudProviderBudget,
     CloudSecurityManager,
 )
+from .connections import CloudConnectionManager
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +48,7 @@ class KimiAdapter(BaseCloudAdapter):
         provider_budget: Optional[CloudProviderBudget] = None,
         circuit_breaker: Optional[CloudCircuitBreaker] = None,
         security_manager: Optional[CloudSecurityManager] = None,
+        connection_manager: Optional[CloudConnectionManager] = None,
         timeout: float = 60.0,
     ):
         self.api_key = api_key or os.environ.get("MOONSHOT_API_KEY", "")
@@ -74,37 +76,19 @@ class KimiAdapter(BaseCloudAdapter):
             provider_budget=provider_budget,
             circuit_breaker=circuit_breaker,
             security_manager=security_manager,
+            connection_manager=connection_manager,
         )
 
         self.timeout = timeout
-        self._http_client: Optional[httpx.AsyncClient] = None
-
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(timeout=self.timeout)
-        return self._http_client
-
-    async def close(self) -> None:
-        """Close HTTP client."""
-        if self._http_client and not self._http_client.is_closed:
-            await self._http_client.aclose()
 
-    async def _call_api(
+    def _build_request_body(
         self,
         prompt: str,
         temperature: float,
         max_tokens: int,
-        **kwargs: Any,
-    ) -> tuple[str, int, int]:
-        """
-        Call Moonshot API (OpenAI-compatible format).
-
-        POST https://api.moonshot.cn/v1/chat/completions
-        """
-        client = await self._get_client()
-
-        # Build messages in OpenAI format
+        kwargs: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Build an OpenAI-format chat completion request."""
         messages = kwargs.get("messages", [])
         if not messages:
             messages = [{"role": "user", "content": prompt}]
@@ -114,7 +98,7 @@ class KimiAdapter(BaseCloudAdapter):
         if system:
             messages = [{"role": "system", "content": system}] + messages
 
-        request_body = {
+        return {
             "model": self.model_config.model_id,
             "messages": messages,
             "temperature": temperature,
@@ -122,13 +106,34 @@ class KimiAdapter(BaseCloudAdapter):
             "top_p": 0.95,
         }
 
+    def _headers(self) -> dict[str, str]:
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+        }
+
+    async def _call_api(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any,
+    ) -> tuple[str, int, int]:
+        """
+        Call Moonshot API (OpenAI-compatible format).
+
+        POST https://api.moonshot.cn/v1/chat/completions
+        """
+        client = await self._get_client()
+        request_body = self._build_request_body(
+            prompt, temperature, max_tokens, kwargs
+        )
+
         response = await client.post(
             self.model_config.api_endpoint,
             json=request_body,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}",
-            },
+            timeout=self.timeout,
+            headers=self._headers(),
         )
 
         if response.status_code == 429:
@@ -158,6 +163,50 @@ class KimiAdapter(BaseCloudAdapter):
 
         return response_text, input_tokens, output_tokens
 
+    async def _stream_api(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        usage: StreamUsage,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Stream from Moonshot using OpenAI-style SSE deltas."""
+        client = await self._get_client()
+        request_body = self._build_request_body(
+            prompt, temperature, max_tokens, kwargs
+        )
+        request_body["stream"] = True
+
+        async with client.stream(
+            "POST",
+            self.model_config.api_endpoint,
+            json=request_body,
+            timeout=self.timeout,
+            headers=self._headers(),
+        ) as response:
+            if response.status_code == 429:
+                raise KimiRateLimitError("Rate limit exceeded")
+            if response.status_code != 200:
+                await response.aread()
+                raise KimiAPIError(
+                    f"Kimi error ({response.status_code}): {response.text}"
+                )
+
+            async for data in iter_sse_json(response):
+                for choice in data.get("choices", []):
+                    content = choice.get("delta", {}).get("content")
+                    if content:
+                        yield content
+                    # Moonshot reports usage on the final choice
+                    if choice.get("usage"):
+                        data.setdefault("usage", choice["usage"])
+                if data.get("usage"):
+                    usage.input_tokens = data["usage"].get("prompt_tokens", 0)
+                    usage.output_tokens = data["usage"].get(
+                        "completion_tokens", 0
+                    )
+
     def select_model_for_context(self, token_count: int) -> str:
         """Select appropriate model based on context size."""
         if token_count <= 6000:
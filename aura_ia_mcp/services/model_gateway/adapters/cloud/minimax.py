@@ -14,8 +14,6 @@ import logging
 import os
 from typing import Any, Optional
 
-import httpx
-
 from .base_cloud import (
     MINIMAX_MODELS,
     BaseCloudAdapter,
@@ -25,6 +23,7 @@ from .base_cloud import (
     CloudProviderBudget,
     CloudSecurityManager,
 )
+from .connections import CloudConnectionManager
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +45,7 @@ class MinimaxAdapter(BaseCloudAdapter):
         provider_budget: Optional[CloudProviderBudget] = None,
         circuit_breaker: Optional[CloudCircuitBreaker] = None,
         security_manager: Optional[CloudSecurityManager] = None,
+        connection_manager: Optional[CloudConnectionManager] = None,
         timeout: float = 60.0,
     ):
         self.api_key = api_key or os.environ.get("MINIMAX_API_KEY", "")
@@ -73,21 +73,10 @@ class MinimaxAdapter(BaseCloudAdapter):
             provider_budget=provider_budget,
             circuit_breaker=circuit_breaker,
             security_manager=security_manager,
+            connection_manager=connection_manager,
         )
 
         self.timeout = timeout
-        self._http_client: Optional[httpx.AsyncClient] = None
-
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(timeout=self.timeout)
-        return self._http_client
-
-    async def close(self) -> None:
-        """Close HTTP client."""
-        if self._http_client and not self._http_client.is_closed:
-            await self._http_client.aclose()
 
     async def _call_api(
         self,
@@ -129,6 +118,7 @@ class MinimaxAdapter(BaseCloudAdapter):
         response = await client.post(
             url,
             json=request_body,
+            timeout=self.timeout,
             headers={
                 "Content-Type": "application/json",
                 "Authorization": f"Bearer {self.api_key}",
@@ -18,10 +18,12 @@ No API key required - just use `ollama run <model>` CLI or HTTP API.
 
 import logging
 import os
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 
+from ..streaming import StreamUsage, iter_ndjson
 from .base_cloud import (
     OLLAMA_CLOUD_MODELS,
     BaseCloudAdapter,
@@ -30,6 +32,7 @@ from .base_cloud import (
     CloudProviderBudget,
     CloudSecurityManager,
 )
+from .connections import CloudConnectionManager
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +61,7 @@ class OllamaCloudAdapter(BaseCloudAdapter):
         provider_budget: CloudProviderBudget | None = None,
         circuit_breaker: CloudCircuitBreaker | None = None,
         security_manager: CloudSecurityManager | None = None,
+        connection_manager: CloudConnectionManager | None = None,
         timeout: float = 120.0,
     ):
         # Get model config
@@ -79,17 +83,12 @@ class OllamaCloudAdapter(BaseCloudAdapter):
             ),
             circuit_breaker=circuit_breaker,
             security_manager=security_manager,
+            connection_manager=connection_manager,
         )
 
         self.base_url = base_url or OLLAMA_API_URL
         self.timeout = timeout
 
-        # HTTP client for Ollama API
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=httpx.Timeout(timeout=timeout),
-        )
-
         # Map model_id to Ollama model name (CLI format)
         self._ollama_model_map = {
             "deepseek-v3.1-671b": "deepseek-v3.1:671b-cloud",
@@ -110,26 +109,25 @@ class OllamaCloudAdapter(BaseCloudAdapter):
         """Get the Ollama CLI-compatible model name."""
         return self._ollama_model_map.get(self.model_id, self.model_id)
 
-    async def _call_api(
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared client for this adapter's base URL."""
+        return self.connections.get_client(
+            self.model_config.provider.value, self.base_url
+        )
+
+    def _build_payload(
         self,
         prompt: str,
         temperature: float,
         max_tokens: int,
-        **kwargs: Any,
-    ) -> tuple[str, int, int]:
-        """
-        Call the Ollama Cloud API.
-
-        This implements the abstract method from BaseCloudAdapter.
-
-        Returns: (response_text, input_tokens, output_tokens)
-        """
-        ollama_model = self._get_ollama_model_name()
-
+        kwargs: dict[str, Any],
+        stream: bool,
+    ) -> dict[str, Any]:
+        """Build an Ollama /api/generate payload."""
         payload: dict[str, Any] = {
-            "model": ollama_model,
+            "model": self._get_ollama_model_name(),
             "prompt": prompt,
-            "stream": False,
+            "stream": stream,
             "options": {
                 "num_predict": max_tokens,
                 "temperature": temperature,
@@ -141,10 +139,31 @@ class OllamaCloudAdapter(BaseCloudAdapter):
             payload["system"] = kwargs["system"]
         if "context" in kwargs:
             payload["context"] = kwargs["context"]
+        return payload
 
-        response = await self._client.post(
+    async def _call_api(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any,
+    ) -> tuple[str, int, int]:
+        """
+        Call the Ollama Cloud API.
+
+        This implements the abstract method from BaseCloudAdapter.
+
+        Returns: (response_text, input_tokens, output_tokens)
+        """
+        payload = self._build_payload(
+            prompt, temperature, max_tokens, kwargs, stream=False
+        )
+
+        client = await self._get_client()
+        response = await client.post(
             "/api/generate",
             json=payload,
+            timeout=self.timeout,
         )
         response.raise_for_status()
         data = response.json()
@@ -156,10 +175,39 @@ class OllamaCloudAdapter(BaseCloudAdapter):
 
         return text, prompt_eval_count, eval_count
 
+    async def _stream_api(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        usage: StreamUsage,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Stream from Ollama's NDJSON /api/generate endpoint."""
+        payload = self._build_payload(
+            prompt, temperature, max_tokens, kwargs, stream=True
+        )
+
+        client = await self._get_client()
+        async with client.stream(
+            "POST", "/api/generate", json=payload, timeout=self.timeout
+        ) as response:
+            response.raise_for_status()
+            async for data in iter_ndjson(response):
+                if data.get("error"):
+                    raise RuntimeError(data["error"])
+                if data.get("response"):
+                    yield data["response"]
+                if data.get("done"):
+                    usage.input_tokens = data.get("prompt_eval_count", 0)
+                    usage.output_tokens = data.get("eval_count", 0)
+                    return
+
     async def health_check(self) -> dict[str, Any]:
         """Check Ollama Cloud service health."""
         try:
-            response = await self._client.get("/api/tags")
+            client = await self._get_client()
+            response = await client.get("/api/tags", timeout=self.timeout)
             response.raise_for_status()
 
             return {
@@ -177,10 +225,6 @@ class OllamaCloudAdapter(BaseCloudAdapter):
                 "model": self.model_id,
             }
 
-    async def close(self) -> None:
-        """Close HTTP client."""
-        await self._client.aclose()
-
     async def list_available_models(self) -> list[str]:
         """List all available Ollama Cloud models."""
         return list(OLLAMA_CLOUD_MODELS.keys())
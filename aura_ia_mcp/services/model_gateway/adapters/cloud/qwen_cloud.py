@@ -13,10 +13,10 @@ Features:
 
 import logging
 import os
+from collections.abc import AsyncIterator
 from typing import Any, Optional
 
-import httpx
-
+from ..streaming import StreamUsage, iter_sse_json
 from .base_cloud import (
     ALIBABA_MODELS,
     BaseCloudAdapter,
@@ -26,6 +26,7 @@ from .base_cloud import (
     CloudProviderBudget,
     CloudSecurityManager,
 )
+from .connections import CloudConnectionManager
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +48,7 @@ class QwenCloudAdapter(BaseCloudAdapter):
         provider_budget: Optional[CloudProviderBudget] = None,
         circuit_breaker: Optional[CloudCircuitBreaker] = None,
         security_manager: Optional[CloudSecurityManager] = None,
+        connection_manager: Optional[CloudConnectionManager] = None,
         timeout: float = 60.0,
     ):
         self.api_key = api_key or os.environ.get("DASHSCOPE_API_KEY", "")
@@ -74,39 +76,19 @@ class QwenCloudAdapter(BaseCloudAdapter):
             provider_budget=provider_budget,
             circuit_breaker=circuit_breaker,
             security_manager=security_manager,
+            connection_manager=connection_manager,
         )
 
         self.timeout = timeout
-        self._http_client: Optional[httpx.AsyncClient] = None
-
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(timeout=self.timeout)
-        return self._http_client
-
-    async def close(self) -> None:
-        """Close HTTP client."""
-        if self._http_client and not self._http_client.is_closed:
-            await self._http_client.aclose()
 
-    async def _call_api(
+    def _build_request_body(
         self,
         prompt: str,
         temperature: float,
         max_tokens: int,
-        **kwargs: Any,
-    ) -> tuple[str, int, int]:
-        """
-        Call DashScope API.
-
-        POST https://dashscope.aliyuncs.com/api/v1/services/aigc/text-generation/generation
-
-        DashScope uses a unique format (not OpenAI-compatible).
-        """
-        client = await self._get_client()
-
-        # Build messages
+        kwargs: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Build a DashScope generation request."""
         messages = kwargs.get("messages", [])
         if not messages:
             messages = [{"role": "user", "content": prompt}]
@@ -117,7 +99,7 @@ class QwenCloudAdapter(BaseCloudAdapter):
             messages = [{"role": "system", "content": system}] + messages
 
         # DashScope-specific request format
-        request_body = {
+        return {
             "model": self.model_config.model_id,
             "input": {
                 "messages": messages,
@@ -130,13 +112,36 @@ class QwenCloudAdapter(BaseCloudAdapter):
             },
         }
 
+    def _headers(self) -> dict[str, str]:
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+        }
+
+    async def _call_api(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any,
+    ) -> tuple[str, int, int]:
+        """
+        Call DashScope API.
+
+        POST https://dashscope.aliyuncs.com/api/v1/services/aigc/text-generation/generation
+
+        DashScope uses a unique format (not OpenAI-compatible).
+        """
+        client = await self._get_client()
+        request_body = self._build_request_body(
+            prompt, temperature, max_tokens, kwargs
+        )
+
         response = await client.post(
             self.model_config.api_endpoint,
             json=request_body,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}",
-            },
+            timeout=self.timeout,
+            headers=self._headers(),
         )
 
         if response.status_code == 429:
@@ -175,6 +180,49 @@ class QwenCloudAdapter(BaseCloudAdapter):
 
         return response_text, input_tokens, output_tokens
 
+    async def _stream_api(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        usage: StreamUsage,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Stream from DashScope (SSE with incremental output)."""
+        client = await self._get_client()
+        request_body = self._build_request_body(
+            prompt, temperature, max_tokens, kwargs
+        )
+        request_body["parameters"]["incremental_output"] = True
+
+        async with client.stream(
+            "POST",
+            self.model_config.api_endpoint,
+            json=request_body,
+            timeout=self.timeout,
+            headers={**self._headers(), "X-DashScope-SSE": "enable"},
+        ) as response:
+            if response.status_code == 429:
+                raise QwenRateLimitError("Rate limit exceeded")
+            if response.status_code != 200:
+                await response.aread()
+                raise QwenAPIError(
+                    f"Qwen error ({response.status_code}): {response.text}"
+                )
+
+            async for data in iter_sse_json(response):
+                if "code" in data and data["code"] != "Success":
+                    raise QwenAPIError(
+                        f"Qwen API error: {data.get('message', 'Unknown error')}"
+                    )
+                for choice in data.get("output", {}).get("choices", []):
+                    content = choice.get("message", {}).get("content")
+                    if content:
+                        yield content
+                if data.get("usage"):
+                    usage.input_tokens = data["usage"].get("input_tokens", 0)
+                    usage.output_tokens = data["usage"].get("output_tokens", 0)
+
     def select_model_for_task(
         self,
         task_type: str = "general",
@@ -17,6 +17,7 @@ import hashlib
 import logging
 import time
 from collections import defaultdict
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional
@@ -24,6 +25,7 @@ from typing import Any, Optional
 import httpx
 
 from .base import BaseModelBackend
+from .streaming import iter_ndjson, truncate_chunk
 
 HTTP_OK = 200
 logger = logging.getLogger(__name__)
@@ -679,6 +681,12 @@ class OllamaSecurityManager:
 
         return response
 
+    def sanitize_chunk(self, chunk: str, emitted: int) -> tuple[str, bool]:
+        """Sanitize a streamed chunk; returns (chunk, stop_streaming)."""
+        return truncate_chunk(
+            chunk, emitted, self.max_output_length, "... [truncated]"
+        )
+
     def hash_sensitive_data(self, data: str) -> str:
         """Hash sensitive data for logging."""
         return hashlib.sha256(data.encode()).hexdigest()[:16]
@@ -711,21 +719,25 @@ class OllamaBackend(BaseModelBackend):
 
         logger.info(f"OllamaBackend initialized: {base_url}, model={model}")
 
-    async def generate(
+    async def _prepare_request(
         self,
         prompt: str,
-        user_id: str = "anonymous",
-        conversation_id: Optional[str] = None,
-        task_type: TaskType = TaskType.GENERAL,
-        **kwargs: Any,
-    ) -> dict[str, Any]:
-        """Generate text using Ollama API with enterprise features."""
-        start_time = time.time()
+        user_id: str,
+        conversation_id: Optional[str],
+        task_type: TaskType,
+        kwargs: dict[str, Any],
+    ) -> tuple[str, str, Optional[str]]:
+        """
+        Validate, select a model, check budget and apply context.
 
+        Pops gateway-only options from ``kwargs``.
+
+        Returns: (model, prompt, error) - error is None when the request may proceed
+        """
         # Security validation
         valid, reason = self.security_manager.validate_input(prompt, user_id)
         if not valid:
-            return {"error": reason, "success": False}
+            return self.model, prompt, reason
 
         # Select model if auto-selection enabled
         model = kwargs.pop("model", None) or self.model
@@ -744,7 +756,7 @@ class OllamaBackend(BaseModelBackend):
             user_id, prompt, model, max_tokens
         )
         if not budget_ok:
-            return {"error": budget_msg, "success": False}
+            return model, prompt, budget_msg
 
         # Get conversation context if available
         if conversation_id:
@@ -756,6 +768,80 @@ class OllamaBackend(BaseModelBackend):
                 )
                 prompt = f"{context_str}\nuser: {prompt}"
 
+        return model, prompt, None
+
+    def _record_completion(
+        self,
+        user_id: str,
+        model: str,
+        prompt: str,
+        output_text: str,
+        latency_ms: float,
+        conversation_id: Optional[str],
+        input_tokens: Optional[int] = None,
+        output_tokens: Optional[int] = None,
+    ) -> tuple[int, int]:
+        """Record usage, performance and context for a finished request."""
+        input_tokens = input_tokens or self.token_manager.estimate_tokens(
+            prompt
+        )
+        output_tokens = output_tokens or self.token_manager.estimate_tokens(
+            output_text
+        )
+
+        # Record metrics
+        self.token_manager.record_usage(
+            user_id, input_tokens, output_tokens, model
+        )
+        self.performance_monitor.record_request(
+            model=model,
+            latency_ms=latency_ms,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            success=True,
+        )
+        self.model_selector.record_performance(model, latency_ms / 1000, True)
+
+        # Update conversation context
+        if conversation_id:
+            self.context_manager.add_message(
+                conversation_id, "user", prompt, model
+            )
+            self.context_manager.add_message(
+                conversation_id, "assistant", output_text, model
+            )
+
+        return input_tokens, output_tokens
+
+    def _record_failure(
+        self, model: str, prompt: str, latency_ms: float
+    ) -> None:
+        """Record a failed request in the performance monitor."""
+        self.performance_monitor.record_request(
+            model=model,
+            latency_ms=latency_ms,
+            input_tokens=self.token_manager.estimate_tokens(prompt),
+            output_tokens=0,
+            success=False,
+        )
+
+    async def generate(
+        self,
+        prompt: str,
+        user_id: str = "anonymous",
+        conversation_id: Optional[str] = None,
+        task_type: TaskType = TaskType.GENERAL,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Generate text using Ollama API with enterprise features."""
+        start_time = time.time()
+
+        model, prompt, error = await self._prepare_request(
+            prompt, user_id, conversation_id, task_type, kwargs
+        )
+        if error:
+            return {"error": error, "success": False}
+
         # Execute with error recovery
         async def _do_generate():
             async with httpx.AsyncClient() as client:
@@ -779,43 +865,16 @@ class OllamaBackend(BaseModelBackend):
         latency_ms = (time.time() - start_time) * 1000
 
         if not success:
-            self.performance_monitor.record_request(
-                model=model,
-                latency_ms=latency_ms,
-                input_tokens=self.token_manager.estimate_tokens(prompt),
-                output_tokens=0,
-                success=False,
-            )
+            self._record_failure(model, prompt, latency_ms)
             return {"error": error_msg, "success": False}
 
         # Process successful response
         output_text = result.get("response", "")
         output_text = self.security_manager.sanitize_output(output_text)
 
-        input_tokens = self.token_manager.estimate_tokens(prompt)
-        output_tokens = self.token_manager.estimate_tokens(output_text)
-
-        # Record metrics
-        self.token_manager.record_usage(
-            user_id, input_tokens, output_tokens, model
+        input_tokens, output_tokens = self._record_completion(
+            user_id, model, prompt, output_text, latency_ms, conversation_id
         )
-        self.performance_monitor.record_request(
-            model=model,
-            latency_ms=latency_ms,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            success=True,
-        )
-        self.model_selector.record_performance(model, latency_ms / 1000, True)
-
-        # Update conversation context
-        if conversation_id:
-            self.context_manager.add_message(
-                conversation_id, "user", prompt, model
-            )
-            self.context_manager.add_message(
-                conversation_id, "assistant", output_text, model
-            )
 
         return {
             "success": True,
@@ -829,6 +888,141 @@ class OllamaBackend(BaseModelBackend):
             )["remaining"],
         }
 
+    async def generate_stream(
+        self,
+        prompt: str,
+        user_id: str = "anonymous",
+        conversation_id: Optional[str] = None,
+        task_type: TaskType = TaskType.GENERAL,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream text from Ollama's NDJSON API.
+
+        Yields ``{"chunk": str}`` events followed by a final ``done`` event
+        (or a terminal ``error``). Connection failures are retried only
+        until the first chunk has been emitted. Usage is recorded even if
+        the consumer stops reading early.
+        """
+        start_time = time.time()
+
+        model, prompt, error = await self._prepare_request(
+            prompt, user_id, conversation_id, task_type, kwargs
+        )
+        if error:
+            yield {"error": error}
+            return
+
+        available, reason = self.error_recovery.is_available()
+        if not available:
+            yield {"error": reason}
+            return
+
+        parts: list[str] = []
+        emitted = 0
+        truncated = False
+        final: dict[str, Any] = {}
+        recorded = False
+        delay = self.error_recovery.retry_delay
+
+        try:
+            for attempt in range(self.error_recovery.max_retries):
+                try:
+                    async with (
+                        httpx.AsyncClient() as client,
+                        client.stream(
+                            "POST",
+                            f"{self.base_url}/api/generate",
+                            json={
+                                "model": model,
+                                "prompt": prompt,
+                                "stream": True,
+                                **kwargs,
+                            },
+                            timeout=120.0,
+                        ) as response,
+                    ):
+                        response.raise_for_status()
+                        async for data in iter_ndjson(response):
+                            if data.get("error"):
+                                raise RuntimeError(data["error"])
+                            delta = data.get("response", "")
+                            if delta:
+                                chunk, truncated = (
+                                    self.security_manager.sanitize_chunk(
+                                        delta, emitted
+                                    )
+                                )
+                                emitted += len(chunk)
+                                parts.append(chunk)
+                                yield {"chunk": chunk}
+                                if truncated:
+                                    break
+                            if data.get("done"):
+                                final = data
+                                break
+                    break
+                except Exception as e:
+                    last_error = str(e)
+                    logger.warning(
+                        f"Ollama stream attempt {attempt + 1}/"
+                        f"{self.error_recovery.max_retries} failed: {last_error}"
+                    )
+                    # Tokens already reached the consumer: cannot retry
+                    if parts or attempt == self.error_recovery.max_retries - 1:
+                        self.error_recovery.record_failure(last_error)
+                        if not parts:
+                            self._record_failure(
+                                model,
+                                prompt,
+                                (time.time() - start_time) * 1000,
+                            )
+                        yield {"error": last_error}
+                        return
+                    await asyncio.sleep(delay)
+                    delay *= self.error_recovery.backoff_multiplier
+
+            self.error_recovery.record_success()
+            latency_ms = (time.time() - start_time) * 1000
+            output_text = "".join(parts)
+            input_tokens, output_tokens = self._record_completion(
+                user_id,
+                model,
+                prompt,
+                output_text,
+                latency_ms,
+                conversation_id,
+                final.get("prompt_eval_count"),
+                final.get("eval_count"),
+            )
+            recorded = True
+
+            yield {
+                "done": True,
+                "success": True,
+                "total_text": output_text,
+                "model": model,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "latency_ms": latency_ms,
+                "truncated": truncated,
+                "user_budget_remaining": self.token_manager.get_user_stats(
+                    user_id
+                )["remaining"],
+            }
+        finally:
+            # Consumer stopped early or the stream broke mid-way: still
+            # charge the tokens that were generated.
+            if parts and not recorded:
+                self._record_completion(
+                    user_id,
+                    model,
+                    prompt,
+                    "".join(parts),
+                    (time.time() - start_time) * 1000,
+                    None,
+                )
+
     async def embed(self, text: str) -> list[float]:
         """Generate embeddings using Ollama API."""
         async with httpx.AsyncClient() as client:
@@ -0,0 +1,84 @@
+"""
+Streaming helpers shared by model backends.
+
+Every backend exposes ``generate_stream()`` as an async iterator of event
+dicts:
+
+- ``{"chunk": str}`` for each (sanitized) text delta
+- ``{"done": True, "total_text": str, "input_tokens": int, ...}`` once
+- ``{"error": str}`` if generation fails (terminal)
+
+Providers speak two wire formats: server-sent events (Gemini and the
+OpenAI-style APIs) and newline-delimited JSON (Ollama).
+"""
+
+import json
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StreamUsage:
+    """Token usage reported by a provider while streaming."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+async def iter_sse_json(
+    response: httpx.Response,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield JSON payloads from a server-sent events response."""
+    async for line in response.aiter_lines():
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if not data:
+            continue
+        if data == "[DONE]":
+            return
+        try:
+            yield json.loads(data)
+        except json.JSONDecodeError:
+            logger.warning(f"Skipping malformed SSE payload: {data[:80]}")
+
+
+async def iter_ndjson(
+    response: httpx.Response,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield JSON objects from a newline-delimited JSON response."""
+    async for raw in response.aiter_lines():
+        line = raw.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning(f"Skipping malformed NDJSON line: {line[:80]}")
+
+
+def truncate_chunk(
+    chunk: str, emitted: int, max_length: int, marker: str
+) -> tuple[str, bool]:
+    """
+    Apply an output length limit incrementally.
+
+    Args:
+        chunk: Next text delta
+        emitted: Characters already sent to the consumer
+        max_length: Maximum total output length
+        marker: Suffix appended when the limit is hit
+
+    Returns:
+        (chunk to emit, whether the stream must stop)
+    """
+    remaining = max_length - emitted
+    if len(chunk) <= remaining:
+        return chunk, False
+    return chunk[: max(remaining, 0)] + marker, True
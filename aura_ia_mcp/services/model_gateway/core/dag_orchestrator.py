@@ -7,24 +7,40 @@ system for coordinating multiple agents in complex workflows.
 Features:
 - DAG-based workflow definition
 - Parallel and sequential task execution
+- Event-driven scheduling: a task is dispatched the moment its last
+  dependency completes (no wave barriers)
 - Dependency management
 - Error handling and retry logic
 - Progress tracking and visualization
 - Audit trail for compliance
+- Checkpointed runs: completed task results are journaled to SQLite so an
+  interrupted workflow can be resumed by its workflow_id
+- Optional step memoization: deterministic tasks with identical resolved
+  inputs reuse an earlier output across workflow executions
 """
 
 import asyncio
 import hashlib
+import heapq
+import inspect
 import json
 import logging
 import os
 import time
+from collections import defaultdict
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+try:
+    from mcp_server.hnsc.step_memo import StepMemo
+    from mcp_server.hnsc.workflow_journal import WorkflowJournal
+except ImportError:  # repo root on sys.path instead of src/
+    from src.mcp_server.hnsc.step_memo import StepMemo
+    from src.mcp_server.hnsc.workflow_journal import WorkflowJournal
+
 logger = logging.getLogger(__name__)
 
 
@@ -76,6 +92,20 @@ class TaskResult:
             "metadata": self.metadata,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TaskResult":
+        return cls(
+            task_id=data["task_id"],
+            status=TaskStatus(data["status"]),
+            output=data.get("output"),
+            error=data.get("error"),
+            started_at=data.get("started_at", 0.0),
+            completed_at=data.get("completed_at", 0.0),
+            duration_ms=data.get("duration_ms", 0.0),
+            retries=data.get("retries", 0),
+            metadata=data.get("metadata", {}),
+        )
+
 
 @dataclass
 class Task:
@@ -93,6 +123,8 @@ class Task:
     retry_delay_seconds: float = 5.0
     skip_on_upstream_failure: bool = False
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Identifies what the handler computes for step memoization
+    memo_key: str | None = None
 
     # Runtime state
     status: TaskStatus = TaskStatus.PENDING
@@ -114,6 +146,40 @@ class Task:
         }
 
 
+def memo_identity(task: Task) -> str | None:
+    """Identity of a task's handler for memo keys, or None to not memoize.
+
+    An explicit ``memo_key`` wins. Otherwise only module-level functions
+    qualify: closures, lambdas and bound methods can share a qualname
+    while computing different things.
+    """
+    if task.memo_key:
+        return task.memo_key
+    handler = task.handler
+    if (
+        inspect.isfunction(handler)
+        and handler.__closure__ is None
+        and "<" not in handler.__qualname__
+    ):
+        return f"{handler.__module__}.{handler.__qualname__}"
+    return None
+
+
+def task_fingerprint(task: Task) -> str:
+    """Hash the parts of a task definition that determine its output."""
+    content = json.dumps(
+        {
+            "name": task.name,
+            "agent_role": task.agent_role,
+            "inputs": task.inputs,
+            "dependencies": sorted(task.dependencies),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+
 @dataclass
 class WorkflowResult:
     """Result of a complete workflow execution."""
@@ -164,12 +230,15 @@ class DAGOrchestrator:
     - Error handling, retries, and circuit breaking
     - Progress tracking and callbacks
     - Audit logging for compliance
+    - Optional checkpoint journal for resuming interrupted runs
     """
 
     def __init__(
         self,
         max_concurrent_tasks: int = 10,
         audit_log_path: str | None = None,
+        checkpoint_store: WorkflowJournal | None = None,
+        step_memo: StepMemo | None = None,
     ):
         self.max_concurrent_tasks = max_concurrent_tasks
         self.audit_enabled = os.environ.get("DAG_AUDIT_LOG", "1") in (
@@ -180,6 +249,15 @@ class DAGOrchestrator:
             "DAG_AUDIT_PATH", "logs/dag_audit.jsonl"
         )
 
+        # Checkpointing is opt-in: pass a store or set DAG_CHECKPOINT_PATH
+        checkpoint_path = os.environ.get("DAG_CHECKPOINT_PATH")
+        if checkpoint_store is None and checkpoint_path:
+            checkpoint_store = WorkflowJournal(checkpoint_path)
+        self.checkpoint_store = checkpoint_store
+
+        # Memoized tasks are keyed by task name + resolved inputs
+        self.step_memo = step_memo
+
         # Runtime state
         self.tasks: dict[str, Task] = {}
         self.workflows: dict[str, dict[str, Any]] = {}
@@ -199,6 +277,36 @@ class DAGOrchestrator:
         content = f"{name}:{timestamp}"
         return hashlib.sha256(content.encode()).hexdigest()[:16]
 
+    def _restorable(
+        self, stored: dict[str, Any] | None
+    ) -> dict[str, dict[str, Any]]:
+        """Checkpointed results that can be reused, as ``to_dict()`` data.
+
+        Only completed results whose task still exists with an unchanged
+        fingerprint are returned, and only if every upstream task is
+        restored as well (a re-run upstream may change this task's inputs).
+        Failed tasks run again on resume.
+        """
+        restored: dict[str, dict[str, Any]] = {}
+        for task_id, step in (stored or {}).get("steps", {}).items():
+            task = self.tasks.get(task_id)
+            if (
+                task is not None
+                and step["status"] == TaskStatus.COMPLETED.value
+                and step["fingerprint"] == task_fingerprint(task)
+            ):
+                restored[task_id] = step["result"]
+
+        changed = True
+        while changed:
+            changed = False
+            for task_id in list(restored):
+                deps = self.tasks[task_id].dependencies
+                if not all(dep_id in restored for dep_id in deps):
+                    del restored[task_id]
+                    changed = True
+        return restored
+
     def _compute_audit_hash(self, results: dict[str, TaskResult]) -> str:
         """Compute hash for audit integrity."""
         content = json.dumps(
@@ -234,6 +342,7 @@ class DAGOrchestrator:
         priority: TaskPriority = TaskPriority.NORMAL,
         timeout_seconds: float = 300.0,
         max_retries: int = 3,
+        memo_key: str | None = None,
     ) -> Task:
         """Create and add a new task."""
         task = Task(
@@ -246,6 +355,7 @@ class DAGOrchestrator:
             priority=priority,
             timeout_seconds=timeout_seconds,
             max_retries=max_retries,
+            memo_key=memo_key,
         )
         self.add_task(task)
         return task
@@ -369,6 +479,31 @@ class DAGOrchestrator:
             if dep_task.result and dep_task.result.output:
                 resolved_inputs[f"upstream_{dep_id}"] = dep_task.result.output
 
+        memo_inputs: dict[str, Any] = {}
+        memo = self.step_memo
+        identity = memo_identity(task) if memo else None
+        if memo and identity is None:
+            memo = None
+        if memo:
+            memo_inputs = {"handler": identity, "inputs": resolved_inputs}
+            hit, output = memo.get(task.name, memo_inputs)
+            if hit:
+                now = time.time()
+                result = TaskResult(
+                    task_id=task.id,
+                    status=TaskStatus.COMPLETED,
+                    output=output,
+                    started_at=started_at,
+                    completed_at=now,
+                    duration_ms=(now - started_at) * 1000,
+                    metadata={"memoized": True},
+                )
+                task.status = TaskStatus.COMPLETED
+                task.result = result
+                if self.on_task_complete:
+                    self.on_task_complete(task, result)
+                return result
+
         while retries <= task.max_retries:
             try:
                 task.status = TaskStatus.RUNNING
@@ -403,6 +538,9 @@ class DAGOrchestrator:
                 task.status = TaskStatus.COMPLETED
                 task.result = result
 
+                if memo:
+                    memo.put(task.name, memo_inputs, output)
+
                 if self.on_task_complete:
                     self.on_task_complete(task, result)
 
@@ -453,6 +591,7 @@ class DAGOrchestrator:
         name: str = "workflow",
         context: dict[str, Any] | None = None,
         fail_fast: bool = False,
+        workflow_id: str | None = None,
     ) -> WorkflowResult:
         """
         Execute the workflow DAG.
@@ -461,6 +600,8 @@ class DAGOrchestrator:
             name: Workflow name for tracking
             context: Shared context passed to all tasks
             fail_fast: Stop on first failure
+            workflow_id: Stable run ID; with a checkpoint store, tasks
+                already completed under this ID are restored, not re-run
 
         Returns:
             WorkflowResult with all task results
@@ -468,7 +609,7 @@ class DAGOrchestrator:
         # Validate DAG first
         self.validate_dag()
 
-        workflow_id = self._generate_workflow_id(name)
+        workflow_id = workflow_id or self._generate_workflow_id(name)
         started_at = time.time()
         context = context or {}
 
@@ -487,77 +628,171 @@ class DAGOrchestrator:
             task.status = TaskStatus.PENDING
             task.result = None
 
+        store = self.checkpoint_store
+        restored: dict[str, TaskResult] = {}
+        # Journal writes run in threads; awaited before the run finishes
+        checkpoints: list[asyncio.Future] = []
+        if store:
+            stored = await asyncio.to_thread(store.load_workflow, workflow_id)
+            await asyncio.to_thread(
+                store.save_run, workflow_id, {"name": name}, "running"
+            )
+            for task_id, data in self._restorable(stored).items():
+                result = TaskResult.from_dict(data)
+                result.metadata["restored"] = True
+                restored[task_id] = result
+            if restored:
+                logger.info(
+                    f"Workflow {workflow_id}: restored {len(restored)} "
+                    f"completed tasks from checkpoint"
+                )
+
         async def run_task_with_semaphore(task: Task) -> TaskResult:
             async with self.semaphore:
                 return await self._execute_task(task, context)
 
-        # Process tasks until all complete
-        while len(completed) + len(failed) < len(self.tasks):
-            # Get ready tasks
-            ready = self.get_ready_tasks(completed, failed)
-
-            if not ready:
-                # No tasks ready - might be deadlock or all complete
-                remaining = len(self.tasks) - len(completed) - len(failed)
-                if remaining > 0:
-                    logger.error(
-                        f"Workflow stuck: {remaining} tasks cannot proceed"
+        # Completion-driven scheduling: track the number of unfinished
+        # dependencies per task and dispatch successors as soon as it drops
+        # to zero, so one slow task only delays its own descendants.
+        indegree: dict[str, int] = {}
+        dependents: dict[str, list[str]] = defaultdict(list)
+        for task_id, task in self.tasks.items():
+            deps = set(task.dependencies)
+            indegree[task_id] = len(deps)
+            for dep_id in deps:
+                dependents[dep_id].append(task_id)
+
+        # Max-heap on priority; sequence number keeps insertion order stable
+        ready: list[tuple[int, int, str]] = []
+        sequence = 0
+
+        def push_ready(task_id: str) -> None:
+            nonlocal sequence
+            heapq.heappush(
+                ready,
+                (-self.tasks[task_id].priority.value, sequence, task_id),
+            )
+            sequence += 1
+
+        def fail_downstream(task_id: str) -> None:
+            """Resolve every transitive dependent of a failed task."""
+            stack = list(dependents[task_id])
+            while stack:
+                dep_id = stack.pop()
+                if dep_id in failed:
+                    continue
+                task = self.tasks[dep_id]
+                status = (
+                    TaskStatus.SKIPPED
+                    if task.skip_on_upstream_failure
+                    else TaskStatus.FAILED
+                )
+                task.status = status
+                task.result = TaskResult(
+                    task_id=dep_id,
+                    status=status,
+                    error="Upstream dependency failed",
+                )
+                results[dep_id] = task.result
+                failed.add(dep_id)
+                stack.extend(dependents[dep_id])
+
+        def record(task: Task, result: TaskResult) -> None:
+            results[task.id] = result
+            if store:
+                checkpoints.append(
+                    asyncio.ensure_future(
+                        asyncio.to_thread(
+                            store.record,
+                            workflow_id,
+                            task.id,
+                            result.status.value,
+                            result.to_dict(),
+                            fingerprint=task_fingerprint(task),
+                        )
                     )
-                    break
-                break
-
-            # Execute ready tasks in parallel
-            tasks_to_run = [run_task_with_semaphore(task) for task in ready]
-
-            if fail_fast:
-                # Run one at a time to catch failures early
-                for task, coro in zip(ready, tasks_to_run, strict=False):
-                    result = await coro
-                    results[task.id] = result
-
-                    if result.status == TaskStatus.COMPLETED:
-                        completed.add(task.id)
-                    else:
-                        failed.add(task.id)
-                        if fail_fast:
-                            logger.info(
-                                f"Workflow {workflow_id} stopping due to fail_fast"
-                            )
-                            # Cancel remaining
-                            for t in self.tasks.values():
-                                if t.status == TaskStatus.PENDING:
-                                    t.status = TaskStatus.CANCELLED
-                                    results[t.id] = TaskResult(
-                                        task_id=t.id,
-                                        status=TaskStatus.CANCELLED,
-                                        error="Cancelled due to upstream failure",
-                                    )
-                            break
-            else:
-                # Run all ready tasks in parallel
-                task_results = await asyncio.gather(
-                    *tasks_to_run, return_exceptions=True
                 )
+            if result.status == TaskStatus.COMPLETED:
+                completed.add(task.id)
+                for dep_id in dependents[task.id]:
+                    indegree[dep_id] -= 1
+                    if indegree[dep_id] == 0 and dep_id not in failed:
+                        push_ready(dep_id)
+            else:
+                failed.add(task.id)
+                fail_downstream(task.id)
+
+        # Restored tasks count as done without being dispatched
+        for task_id, result in restored.items():
+            task = self.tasks[task_id]
+            task.status = TaskStatus.COMPLETED
+            task.result = result
+            results[task_id] = result
+            completed.add(task_id)
+            for dep_id in dependents[task_id]:
+                indegree[dep_id] -= 1
+
+        for task_id, count in indegree.items():
+            if count == 0 and task_id not in completed:
+                push_ready(task_id)
 
-                for task, result in zip(ready, task_results, strict=False):
-                    if isinstance(result, Exception):
+        in_flight: dict[asyncio.Task, Task] = {}
+        stopped = False
+
+        try:
+            while ready or in_flight:
+                # Dispatch highest-priority ready tasks up to the limit
+                while ready and len(in_flight) < self.max_concurrent_tasks:
+                    task = self.tasks[heapq.heappop(ready)[2]]
+                    task.status = TaskStatus.QUEUED
+                    in_flight[
+                        asyncio.create_task(run_task_with_semaphore(task))
+                    ] = task
+
+                done, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for finished in done:
+                    task = in_flight.pop(finished)
+                    try:
+                        result = finished.result()
+                    except Exception as e:
                         result = TaskResult(
                             task_id=task.id,
                             status=TaskStatus.FAILED,
-                            error=str(result),
+                            error=str(e),
                         )
                         task.status = TaskStatus.FAILED
                         task.result = result
+                    record(task, result)
 
-                    results[task.id] = result
-
-                    if result.status == TaskStatus.COMPLETED:
-                        completed.add(task.id)
-                    else:
-                        failed.add(task.id)
-
-            if fail_fast and failed:
-                break
+                if fail_fast and failed:
+                    logger.info(
+                        f"Workflow {workflow_id} stopping due to fail_fast"
+                    )
+                    stopped = True
+                    break
+        finally:
+            for running in in_flight:
+                running.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            if checkpoints:
+                await asyncio.gather(*checkpoints, return_exceptions=True)
+
+        if stopped:
+            # Cancel everything that did not get to finish
+            for t in self.tasks.values():
+                if t.id not in completed and t.id not in failed:
+                    t.status = TaskStatus.CANCELLED
+                    results[t.id] = TaskResult(
+                        task_id=t.id,
+                        status=TaskStatus.CANCELLED,
+                        error="Cancelled due to upstream failure",
+                    )
+        elif len(completed) + len(failed) < len(self.tasks):
+            remaining = len(self.tasks) - len(completed) - len(failed)
+            logger.error(f"Workflow stuck: {remaining} tasks cannot proceed")
 
         # Determine overall status
         completed_at = time.time()
@@ -582,10 +817,22 @@ class DAGOrchestrator:
                 "total_tasks": len(self.tasks),
                 "completed": len(completed),
                 "failed": len(failed),
+                "restored": len(restored),
             },
             audit_hash=self._compute_audit_hash(results),
         )
 
+        if store:
+            await asyncio.to_thread(
+                store.set_status,
+                workflow_id,
+                (
+                    "cancelled"
+                    if stopped
+                    else "failed" if failed else "completed"
+                ),
+            )
+
         # Log audit
         self._log_audit(workflow_result)
 
@@ -599,6 +846,39 @@ class DAGOrchestrator:
 
         return workflow_result
 
+    async def resume(
+        self,
+        workflow_id: str,
+        context: dict[str, Any] | None = None,
+        fail_fast: bool = False,
+    ) -> WorkflowResult:
+        """
+        Resume a checkpointed run.
+
+        The caller re-registers the same tasks (handlers are code, so they
+        are not journaled); completed tasks are restored and only the
+        remaining work runs.
+
+        Raises:
+            WorkflowExecutionError: If checkpointing is disabled or the run
+                is unknown
+        """
+        if not self.checkpoint_store:
+            raise WorkflowExecutionError("Checkpointing is not enabled")
+        run = await asyncio.to_thread(
+            self.checkpoint_store.load_workflow, workflow_id
+        )
+        if run is None:
+            raise WorkflowExecutionError(
+                f"Unknown workflow run: {workflow_id}"
+            )
+        return await self.execute(
+            name=run["definition"]["name"],
+            context=context,
+            fail_fast=fail_fast,
+            workflow_id=workflow_id,
+        )
+
     def visualize_dag(self) -> str:
         """Generate Mermaid diagram of the DAG."""
         lines = ["graph TD"]
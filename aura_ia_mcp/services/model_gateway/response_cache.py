@@ -0,0 +1,560 @@
+"""Response cache for idempotent LLM queries.
+
+Caches complete generation results keyed by (model, normalized prompt,
+sampling params) so repeated deterministic questions are answered from
+memory instead of being regenerated.
+
+Features:
+- Opt-in, per-route enablement with route-specific TTLs
+- Only caches requests at or below a route's max temperature
+- Size-bounded LRU eviction
+- Optional semantic lookup on prompt embeddings (strict threshold);
+  async callers use ``aget``/``aput`` so embedding runs off the event loop
+- Prometheus hit/miss/eviction metrics
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import numpy as np
+from prometheus_client import CollectorRegistry, Counter, Gauge
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Default metrics (can be overridden with custom registry)
+_default_cache_requests = Counter(
+    "model_gateway_response_cache_requests_total",
+    "Response cache lookups",
+    ["route", "result"],  # hit, semantic_hit, miss, bypass
+)
+_default_cache_evictions = Counter(
+    "model_gateway_response_cache_evictions_total",
+    "Response cache evictions",
+    ["reason"],  # capacity, expired
+)
+_default_cache_size = Gauge(
+    "model_gateway_response_cache_entries",
+    "Number of entries in the response cache",
+)
+
+
+@dataclass
+class RouteCachePolicy:
+    """Caching policy for a single route."""
+
+    ttl_seconds: float = 3600.0
+    max_temperature: float = 0.0  # Only cache (near-)deterministic requests
+
+
+# Routes that may use the cache once it is enabled
+DEFAULT_ROUTE_POLICIES: dict[str, RouteCachePolicy] = {
+    "gateway": RouteCachePolicy(ttl_seconds=3600.0),
+    "chat_completions": RouteCachePolicy(ttl_seconds=3600.0),
+    "ollama_consult": RouteCachePolicy(ttl_seconds=3600.0),
+    "intent_classifier": RouteCachePolicy(
+        ttl_seconds=86400.0, max_temperature=0.1
+    ),
+}
+
+
+@dataclass
+class CacheEntry:
+    """A cached generation result."""
+
+    key: str
+    route: str
+    scope: str  # route + model + params; semantic matches stay inside it
+    response: dict[str, Any]
+    expires_at: float
+    embedding: Optional[np.ndarray] = None
+    hits: int = 0
+    created_at: float = field(default_factory=time.time)
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace so formatting-only differences share a key."""
+    return _WHITESPACE_RE.sub(" ", prompt).strip()
+
+
+def _canonical_params(params: Optional[dict[str, Any]]) -> str:
+    """Serialize sampling params deterministically."""
+    return json.dumps(
+        params or {}, sort_keys=True, separators=(",", ":"), default=str
+    )
+
+
+class ResponseCache:
+    """Size-bounded TTL cache for idempotent LLM responses.
+
+    Exact lookups hash (model, normalized prompt, sampling params). When an
+    ``embed_fn`` is configured, a miss falls back to a cosine-similarity
+    search over prompts cached with the same route, model and params, and
+    only returns an entry above ``similarity_threshold``.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        max_entries: int = 1024,
+        route_policies: Optional[dict[str, RouteCachePolicy]] = None,
+        embed_fn: Optional[Callable[[str], list[float]]] = None,
+        similarity_threshold: float = 0.97,
+        metrics_registry: CollectorRegistry | None = None,
+    ):
+        """Initialize response cache.
+
+        Args:
+            enabled: Master switch; a disabled cache never hits or stores
+            max_entries: Maximum cached responses before LRU eviction
+            route_policies: Routes allowed to use the cache and their policy
+            embed_fn: Optional prompt embedder for semantic lookups
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            metrics_registry: Optional Prometheus registry (for test isolation)
+        """
+        self.enabled = enabled
+        self.max_entries = max(1, max_entries)
+        self.route_policies = (
+            dict(DEFAULT_ROUTE_POLICIES)
+            if route_policies is None
+            else dict(route_policies)
+        )
+        self.embed_fn = embed_fn
+        self.similarity_threshold = similarity_threshold
+
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._scopes: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+        if metrics_registry is not None:
+            self._m_requests = Counter(
+                "model_gateway_response_cache_requests_total",
+                "Response cache lookups",
+                ["route", "result"],
+                registry=metrics_registry,
+            )
+            self._m_evictions = Counter(
+                "model_gateway_response_cache_evictions_total",
+                "Response cache evictions",
+                ["reason"],
+                registry=metrics_registry,
+            )
+            self._m_size = Gauge(
+                "model_gateway_response_cache_entries",
+                "Number of entries in the response cache",
+                registry=metrics_registry,
+            )
+        else:
+            self._m_requests = _default_cache_requests
+            self._m_evictions = _default_cache_evictions
+            self._m_size = _default_cache_size
+
+    # -------------------------------------------------------------------------
+    # Policy
+    # -------------------------------------------------------------------------
+
+    def is_enabled(self, route: str) -> bool:
+        """Check whether caching is enabled for a route."""
+        return self.enabled and route in self.route_policies
+
+    def enable_route(
+        self, route: str, policy: Optional[RouteCachePolicy] = None
+    ) -> None:
+        """Enable (or update) caching for a route."""
+        self.route_policies[route] = policy or RouteCachePolicy()
+
+    def disable_route(self, route: str) -> None:
+        """Disable caching for a route."""
+        self.route_policies.pop(route, None)
+
+    def is_cacheable(
+        self, route: str, params: Optional[dict[str, Any]] = None
+    ) -> bool:
+        """Check whether a request with these params may be cached."""
+        if not self.is_enabled(route):
+            return False
+        temperature = (params or {}).get("temperature")
+        if temperature is None:
+            return False
+        return float(temperature) <= self.route_policies[route].max_temperature
+
+    # -------------------------------------------------------------------------
+    # Keys
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def make_key(
+        model: str, prompt: str, params: Optional[dict[str, Any]] = None
+    ) -> str:
+        """Build the exact-match cache key."""
+        payload = "\x1f".join(
+            [model, normalize_prompt(prompt), _canonical_params(params)]
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @staticmethod
+    def _make_scope(
+        route: str, model: str, params: Optional[dict[str, Any]]
+    ) -> str:
+        return f"{route}|{model}|{_canonical_params(params)}"
+
+    def _embed(self, prompt: str) -> Optional[np.ndarray]:
+        if self.embed_fn is None:
+            return None
+        try:
+            vector = np.asarray(
+                self.embed_fn(normalize_prompt(prompt)), dtype=np.float32
+            )
+        except Exception as e:
+            logger.warning(f"Response cache embedding failed: {e}")
+            return None
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    # -------------------------------------------------------------------------
+    # Lookup / store
+    # -------------------------------------------------------------------------
+
+    def get(
+        self,
+        route: str,
+        model: str,
+        prompt: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> Optional[dict[str, Any]]:
+        """Return a cached response, or None on miss.
+
+        The returned dict is a copy; callers may annotate it freely.
+        """
+        if not self.is_cacheable(route, params):
+            self._m_requests.labels(route=route, result="bypass").inc()
+            return None
+        now = time.time()
+        response = self._exact_lookup(route, model, prompt, params, now)
+        if response is not None:
+            return response
+        query = self._embed(prompt) if self.embed_fn is not None else None
+        return self._finish_lookup(route, model, params, query, now)
+
+    async def aget(
+        self,
+        route: str,
+        model: str,
+        prompt: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> Optional[dict[str, Any]]:
+        """``get`` for async callers: the prompt is embedded in a thread."""
+        if not self.is_cacheable(route, params):
+            self._m_requests.labels(route=route, result="bypass").inc()
+            return None
+        now = time.time()
+        response = self._exact_lookup(route, model, prompt, params, now)
+        if response is not None:
+            return response
+        query = None
+        if self.embed_fn is not None:
+            query = await asyncio.to_thread(self._embed, prompt)
+        return self._finish_lookup(route, model, params, query, now)
+
+    def _exact_lookup(
+        self,
+        route: str,
+        model: str,
+        prompt: str,
+        params: Optional[dict[str, Any]],
+        now: float,
+    ) -> Optional[dict[str, Any]]:
+        key = self.make_key(model, prompt, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                self._remove(key, reason="expired")
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                entry.hits += 1
+                self.stats["hits"] += 1
+                self._m_requests.labels(route=route, result="hit").inc()
+                return copy.deepcopy(entry.response)
+        return None
+
+    def _finish_lookup(
+        self,
+        route: str,
+        model: str,
+        params: Optional[dict[str, Any]],
+        query: Optional[np.ndarray],
+        now: float,
+    ) -> Optional[dict[str, Any]]:
+        """Semantic fallback after an exact miss, then count the miss."""
+        if query is not None:
+            match = self._semantic_lookup(
+                self._make_scope(route, model, params), query, now
+            )
+            if match is not None:
+                self._m_requests.labels(
+                    route=route, result="semantic_hit"
+                ).inc()
+                return match
+
+        with self._lock:
+            self.stats["misses"] += 1
+        self._m_requests.labels(route=route, result="miss").inc()
+        return None
+
+    def _semantic_lookup(
+        self, scope: str, query: np.ndarray, now: float
+    ) -> Optional[dict[str, Any]]:
+        with self._lock:
+            keys = [
+                k
+                for k in self._scopes.get(scope, ())
+                if self._entries[k].embedding is not None
+            ]
+            if not keys:
+                return None
+            matrix = np.stack([self._entries[k].embedding for k in keys])
+            scores = matrix @ query
+            best = int(np.argmax(scores))
+            if float(scores[best]) < self.similarity_threshold:
+                return None
+
+            entry = self._entries[keys[best]]
+            if entry.expires_at <= now:
+                self._remove(entry.key, reason="expired")
+                return None
+            self._entries.move_to_end(entry.key)
+            entry.hits += 1
+            self.stats["semantic_hits"] += 1
+            return copy.deepcopy(entry.response)
+
+    def put(
+        self,
+        route: str,
+        model: str,
+        prompt: str,
+        params: Optional[dict[str, Any]],
+        response: dict[str, Any],
+        ttl_seconds: Optional[float] = None,
+    ) -> bool:
+        """Store a response. Returns True if it was cached."""
+        if not self.is_cacheable(route, params):
+            return False
+        embedding = self._embed(prompt) if self.embed_fn is not None else None
+        return self._store(
+            route,
+            model,
+            prompt,
+            params,
+            response,
+            ttl_seconds=ttl_seconds,
+            embedding=embedding,
+        )
+
+    async def aput(
+        self,
+        route: str,
+        model: str,
+        prompt: str,
+        params: Optional[dict[str, Any]],
+        response: dict[str, Any],
+        ttl_seconds: Optional[float] = None,
+    ) -> bool:
+        """``put`` for async callers: the prompt is embedded in a thread."""
+        if not self.is_cacheable(route, params):
+            return False
+        embedding = None
+        if self.embed_fn is not None:
+            embedding = await asyncio.to_thread(self._embed, prompt)
+        return self._store(
+            route,
+            model,
+            prompt,
+            params,
+            response,
+            ttl_seconds=ttl_seconds,
+            embedding=embedding,
+        )
+
+    def _store(
+        self,
+        route: str,
+        model: str,
+        prompt: str,
+        params: Optional[dict[str, Any]],
+        response: dict[str, Any],
+        *,
+        ttl_seconds: Optional[float],
+        embedding: Optional[np.ndarray],
+    ) -> bool:
+        ttl = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else self.route_policies[route].ttl_seconds
+        )
+        key = self.make_key(model, prompt, params)
+        scope = self._make_scope(route, model, params)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key, reason=None)
+            self._entries[key] = CacheEntry(
+                key=key,
+                route=route,
+                scope=scope,
+                response=copy.deepcopy(response),
+                expires_at=time.time() + ttl,
+                embedding=embedding,
+            )
+            self._scopes.setdefault(scope, set()).add(key)
+            self.stats["stores"] += 1
+
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest, reason="capacity")
+
+            self._m_size.set(len(self._entries))
+        return True
+
+    def _remove(self, key: str, reason: Optional[str]) -> None:
+        """Remove an entry. Caller must hold the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        scope_keys = self._scopes.get(entry.scope)
+        if scope_keys is not None:
+            scope_keys.discard(key)
+            if not scope_keys:
+                del self._scopes[entry.scope]
+        if reason == "capacity":
+            self.stats["evictions"] += 1
+        elif reason == "expired":
+            self.stats["expirations"] += 1
+        if reason:
+            self._m_evictions.labels(reason=reason).inc()
+        self._m_size.set(len(self._entries))
+
+    def purge_expired(self) -> int:
+        """Drop all expired entries. Returns the number removed."""
+        now = time.time()
+        with self._lock:
+            expired = [
+                k for k, e in self._entries.items() if e.expires_at <= now
+            ]
+            for key in expired:
+                self._remove(key, reason="expired")
+        return len(expired)
+
+    def clear(self, route: Optional[str] = None) -> None:
+        """Clear all entries, or only those belonging to a route."""
+        with self._lock:
+            if route is None:
+                self._entries.clear()
+                self._scopes.clear()
+            else:
+                for key in [
+                    k for k, e in self._entries.items() if e.route == route
+                ]:
+                    self._remove(key, reason=None)
+            self._m_size.set(len(self._entries))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = (
+                self.stats["hits"]
+                + self.stats["semantic_hits"]
+                + self.stats["misses"]
+            )
+            hits = self.stats["hits"] + self.stats["semantic_hits"]
+            return {
+                **self.stats,
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "routes": sorted(self.route_policies),
+                "semantic": self.embed_fn is not None,
+                "hit_rate": (hits / lookups) if lookups else 0.0,
+            }
+
+
+def create_response_cache_from_env() -> ResponseCache:
+    """Create ResponseCache from environment variables.
+
+    Environment variables:
+        RESPONSE_CACHE_ENABLED: Enable the cache (default: 0)
+        RESPONSE_CACHE_ROUTES: Comma-separated routes (default: all known)
+        RESPONSE_CACHE_TTL_SECONDS: Override TTL for every enabled route
+        RESPONSE_CACHE_MAX_ENTRIES: LRU capacity (default: 1024)
+        RESPONSE_CACHE_SEMANTIC: Enable embedding lookups (default: 0)
+        RESPONSE_CACHE_SIMILARITY: Semantic hit threshold (default: 0.97)
+
+    Returns:
+        Configured ResponseCache instance
+    """
+    enabled = os.getenv("RESPONSE_CACHE_ENABLED", "0") == "1"
+    max_entries = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1024"))
+    threshold = float(os.getenv("RESPONSE_CACHE_SIMILARITY", "0.97"))
+
+    routes_env = os.getenv("RESPONSE_CACHE_ROUTES", "")
+    names = [r.strip() for r in routes_env.split(",") if r.strip()] or list(
+        DEFAULT_ROUTE_POLICIES
+    )
+    policies = {
+        name: copy.copy(DEFAULT_ROUTE_POLICIES.get(name, RouteCachePolicy()))
+        for name in names
+    }
+    ttl_env = os.getenv("RESPONSE_CACHE_TTL_SECONDS")
+    if ttl_env:
+        for policy in policies.values():
+            policy.ttl_seconds = float(ttl_env)
+
+    embed_fn = None
+    if enabled and os.getenv("RESPONSE_CACHE_SEMANTIC", "0") == "1":
+        try:
+            from .embedding_service import create_embedding_service_from_env
+
+            embed_fn = create_embedding_service_from_env().encode_single
+        except ImportError as e:
+            logger.warning(f"Semantic response cache unavailable: {e}")
+
+    return ResponseCache(
+        enabled=enabled,
+        max_entries=max_entries,
+        route_policies=policies,
+        embed_fn=embed_fn,
+        similarity_threshold=threshold,
+    )
+
+
+_global_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get or create global response cache instance."""
+    global _global_cache
+    if _global_cache is None:
+        _global_cache = create_response_cache_from_env()
+    return _global_cache
@@ -1,6 +1,11 @@
+import json
+import os
+import time
+from collections.abc import AsyncIterator
 from typing import Optional
 
 from fastapi import APIRouter, FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from ...core.circuit_breaker import CircuitBreaker
@@ -10,6 +15,7 @@ from .chat_router import ChatRequest, get_chat_router, route_message
 from .core.conversation_logger import ConversationLogger
 from .core.token_budget import TokenBudgetManager
 from .lifecycle import ChatMode, get_model_manager, model_manager
+from .response_cache import get_response_cache
 
 router = APIRouter(prefix="/v1")
 
@@ -19,6 +25,7 @@ budget_manager = TokenBudgetManager()
 rate_limiter = RateLimiter(capacity=100, refill_rate=10.0)
 circuit_breaker = CircuitBreaker(failure_threshold=5, timeout_seconds=60)
 conversation_logger = ConversationLogger()
+response_cache = get_response_cache()
 
 
 class ChatMessage(BaseModel):
@@ -31,6 +38,66 @@ class ChatCompletionRequest(BaseModel):
     messages: list[ChatMessage]
     temperature: float | None = 0.7
     max_tokens: int | None = None
+    stream: bool = False
+
+
+async def _stream_chat_completion(
+    request: ChatCompletionRequest,
+    prompt: str,
+    sampling: dict,
+    client_id: str,
+) -> AsyncIterator[str]:
+    """Relay backend stream events as OpenAI-style SSE chunks."""
+    created = int(time.time())
+    parts: list[str] = []
+
+    def _sse(delta: dict, finish_reason: Optional[str] = None) -> str:
+        payload = {
+            "id": "chatcmpl-stream",
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": request.model,
+            "choices": [
+                {"index": 0, "delta": delta, "finish_reason": finish_reason}
+            ],
+        }
+        return f"data: {json.dumps(payload)}\n\n"
+
+    yield _sse({"role": "assistant"})
+    try:
+        async for event in backend.generate_stream(
+            prompt=prompt, model=request.model, options=sampling
+        ):
+            if "chunk" in event:
+                parts.append(event["chunk"])
+                yield _sse({"content": event["chunk"]})
+            elif "error" in event:
+                circuit_breaker.record_failure()
+                yield f"data: {json.dumps({'error': event['error']})}\n\n"
+                break
+            elif event.get("done"):
+                circuit_breaker.record_success()
+                yield _sse({}, finish_reason="stop")
+    except Exception:
+        circuit_breaker.record_failure()
+        raise
+    yield "data: [DONE]\n\n"
+
+    conversation_logger.log_conversation(
+        messages=[
+            *[
+                {"role": m.role, "content": m.content}
+                for m in request.messages
+            ],
+            {"role": "assistant", "content": "".join(parts)},
+        ],
+        metadata={
+            "model": request.model,
+            "client_id": client_id,
+            "endpoint": "/v1/chat/completions",
+            "stream": True,
+        },
+    )
 
 
 @router.post("/chat/completions")
@@ -50,17 +117,39 @@ async def chat_completions(request: ChatCompletionRequest, req: Request):
     # 2. Generate Response (with circuit breaker)
     try:
         prompt = full_prompt
+        sampling = {
+            "temperature": request.temperature,
+            "num_predict": request.max_tokens,
+        }
 
-        # Use circuit breaker to protect against backend failures
-        response = await circuit_breaker.call(
-            backend.generate,
-            prompt=prompt,
-            model=request.model,
-            options={
-                "temperature": request.temperature,
-                "num_predict": request.max_tokens,
-            },
+        if request.stream:
+            # Outcome is recorded as the stream finishes
+            circuit_breaker.before_call()
+            return StreamingResponse(
+                _stream_chat_completion(request, prompt, sampling, client_id),
+                media_type="text/event-stream",
+            )
+
+        # Deterministic requests may be served from the response cache
+        response = await response_cache.aget(
+            "chat_completions", request.model, prompt, sampling
         )
+        if response is None:
+            # Use circuit breaker to protect against backend failures
+            response = await circuit_breaker.call(
+                backend.generate,
+                prompt=prompt,
+                model=request.model,
+                options=sampling,
+            )
+            if response.get("success"):
+                await response_cache.aput(
+                    "chat_completions",
+                    request.model,
+                    prompt,
+                    sampling,
+                    response,
+                )
 
         # 3. Format Response (OpenAI style)
         response_data = {
@@ -384,6 +473,12 @@ async def unload_model(model_name: str):
     return {"status": "unloaded", "model": model_name}
 
 
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """Get response cache statistics."""
+    return response_cache.get_stats()
+
+
 @router.get("/router/stats")
 async def get_router_stats():
     """Get chat router statistics."""
@@ -424,6 +519,14 @@ def register(app: FastAPI, settings) -> None:
         except Exception as e:
             logger.warning(f"⚠️ Model Lifecycle Manager startup warning: {e}")
 
+        if os.getenv("CLOUD_CONNECTION_WARMUP", "1") == "1":
+            try:
+                from .adapters.cloud import get_cloud_factory
+
+                await get_cloud_factory().warm_up()
+            except Exception as e:
+                logger.warning(f"⚠️ Cloud connection warm-up warning: {e}")
+
     @app.on_event("shutdown")
     async def shutdown_model_lifecycle():
         """Cleanup model lifecycle manager on shutdown."""
@@ -435,3 +538,10 @@ def register(app: FastAPI, settings) -> None:
             logger.info("✅ Model Lifecycle Manager stopped")
         except Exception as e:
             logger.warning(f"⚠️ Model Lifecycle Manager shutdown warning: {e}")
+
+        try:
+            from .adapters.cloud import get_connection_manager
+
+            await get_connection_manager().close()
+        except Exception as e:
+            logger.warning(f"⚠️ Cloud connection shutdown warning: {e}")
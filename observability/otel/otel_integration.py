@@ -17,6 +17,23 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, TypeVar
 
+try:
+    from mcp_server.trace_sampling import (
+        AdaptiveBudget,
+        OtelRouteSampler,
+        TailSamplingSpanProcessor,
+        TraceSampler,
+        parse_route_rates,
+    )
+except ImportError:  # repo root on sys.path instead of src/
+    from src.mcp_server.trace_sampling import (
+        AdaptiveBudget,
+        OtelRouteSampler,
+        TailSamplingSpanProcessor,
+        TraceSampler,
+        parse_route_rates,
+    )
+
 # Type imports for stubs (when opentelemetry not installed)
 try:
     from opentelemetry import baggage, metrics, trace
@@ -92,6 +109,14 @@ class TelemetryConfig:
     enable_metrics: bool = True
     enable_logging: bool = True
     sample_rate: float = 1.0  # 100% sampling by default
+    # Per-route head rates, e.g. {"tool/*": 0.1}; see trace_sampling
+    route_sample_rates: dict[str, float] = field(default_factory=dict)
+    # Traces slower than this (or errored) are always exported
+    slow_span_threshold_ms: float = 1000.0
+    # Export budget; 0 disables the adaptive rate
+    max_spans_per_second: float = 0.0
+    # Tail-sample even without route rates or a budget
+    tail_sampling: bool = False
     export_interval_ms: int = 5000
     max_export_batch_size: int = 512
     enable_console_export: bool = False
@@ -117,6 +142,13 @@ class TelemetryConfig:
             enable_logging=os.getenv("OTEL_LOGGING_ENABLED", "true").lower()
             == "true",
             sample_rate=float(os.getenv("OTEL_SAMPLE_RATE", "1.0")),
+            route_sample_rates=parse_route_rates(
+                os.getenv("OTEL_SAMPLE_RATES", "")
+            ),
+            slow_span_threshold_ms=float(os.getenv("OTEL_SLOW_MS", "1000")),
+            max_spans_per_second=float(os.getenv("OTEL_BUDGET_PER_SEC", "0")),
+            tail_sampling=os.getenv("OTEL_TAIL_SAMPLING", "false").lower()
+            == "true",
             export_interval_ms=int(
                 os.getenv("OTEL_EXPORT_INTERVAL_MS", "5000")
             ),
@@ -200,23 +232,46 @@ class AuraTelemetry:
             f"(tracing={self.config.enable_tracing}, metrics={self.config.enable_metrics})"
         )
 
+    def _trace_sampler(self) -> TraceSampler:
+        config = self.config
+        return TraceSampler(
+            default_rate=config.sample_rate,
+            route_rates=config.route_sample_rates,
+            slow_threshold=config.slow_span_threshold_ms / 1000,
+            budget=AdaptiveBudget(config.max_spans_per_second),
+        )
+
     def _setup_tracing(self, resource: Any) -> None:
         """Setup distributed tracing."""
-        # Create sampler
-        sampler = TraceIdRatioBased(self.config.sample_rate)
-
-        # Create tracer provider
-        provider = TracerProvider(resource=resource, sampler=sampler)
-
-        # Add OTLP exporter
         otlp_exporter = OTLPSpanExporter(endpoint=self.config.otlp_endpoint)
-        provider.add_span_processor(
-            BatchSpanProcessor(
-                otlp_exporter,
-                max_export_batch_size=self.config.max_export_batch_size,
-                schedule_delay_millis=self.config.export_interval_ms,
+        self.trace_sampler = self._trace_sampler()
+
+        if self.config.tail_sampling or self.trace_sampler.active:
+            # Head rates per route; slow/errored traces rescued at the tail
+            provider = TracerProvider(
+                resource=resource,
+                sampler=OtelRouteSampler(self.trace_sampler),
+            )
+            provider.add_span_processor(
+                TailSamplingSpanProcessor(
+                    self.trace_sampler,
+                    otlp_exporter,
+                    max_export_batch_size=self.config.max_export_batch_size,
+                    export_interval=self.config.export_interval_ms / 1000,
+                )
+            )
+        else:
+            provider = TracerProvider(
+                resource=resource,
+                sampler=TraceIdRatioBased(self.config.sample_rate),
+            )
+            provider.add_span_processor(
+                BatchSpanProcessor(
+                    otlp_exporter,
+                    max_export_batch_size=self.config.max_export_batch_size,
+                    schedule_delay_millis=self.config.export_interval_ms,
+                )
             )
-        )
 
         # Optionally add console exporter for debugging
         if self.config.enable_console_export:
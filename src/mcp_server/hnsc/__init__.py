@@ -38,9 +38,11 @@ from .static_reasoning import (
     ReasoningType,
     StaticReasoningLibrary,
 )
+from .step_memo import StepMemo
 from .symbolic_router import SymbolicRouter
 from .tool_intelligence import ToolIntelligenceLayer
 from .workflow_engine import WorkflowEngine
+from .workflow_journal import WorkflowJournal
 
 __all__ = [
     # Controller
@@ -52,6 +54,8 @@ __all__ = [
     "SymbolicRouter",
     # Layer 3: Workflow Engine
     "WorkflowEngine",
+    "WorkflowJournal",
+    "StepMemo",
     # Layer 4: Static Reasoning
     "StaticReasoningLibrary",
     "ReasoningTemplate",
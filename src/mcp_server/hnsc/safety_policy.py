@@ -24,6 +24,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from ..security.audit_writer import get_audit_writer
+
 
 class SafetyLevel(Enum):
     """Safety levels for operations."""
@@ -625,11 +627,9 @@ class SafetyPolicyEngine:
         self._write_log(entry)
 
     def _write_log(self, entry: dict) -> None:
-        """Write an entry to the audit log."""
+        """Queue an entry for the audit log."""
         try:
-            self._log_dir.mkdir(parents=True, exist_ok=True)
-            with open(self._audit_log_path, "a") as f:
-                f.write(json.dumps(entry) + "\n")
+            get_audit_writer(self._audit_log_path).append(entry)
         except Exception:
             pass  # Don't fail on log errors
 
@@ -0,0 +1,262 @@
+"""Step Memo - Reuse Results of Deterministic Workflow Steps.
+
+HNSC workflows and the model gateway's DAG orchestrator frequently repeat
+the same tool call with the same resolved arguments (the same search, the
+same file analysis). The memo keys a step's result by tool name plus
+canonicalized arguments so a repeated workflow short-circuits those steps
+instead of calling the tool again.
+
+Only tools given a TTL are memoized, and only successful results are
+stored (see ``is_success``). Arguments that cannot be canonicalized as
+JSON bypass the memo. Lookups are exported as Prometheus hit/miss/bypass
+counters.
+
+Project Creator: Herman Swanepoel
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from prometheus_client import CollectorRegistry, Counter, Gauge
+
+# Read-only tools whose results are safe to reuse for a short while
+DEFAULT_TOOL_TTLS: dict[str, float] = {
+    "semantic_search": 300.0,
+    "get_documentation": 3600.0,
+    "list_roles": 600.0,
+}
+
+# Default metrics, registered on first use (can be overridden with a
+# custom registry). Lazy, so importing this module under both the
+# mcp_server and src.mcp_server roots does not register them twice.
+_default_metrics: list[tuple[Counter, Counter, Gauge]] = []
+_default_metrics_lock = threading.Lock()
+
+
+def _make_metrics(
+    registry: CollectorRegistry | None = None,
+) -> tuple[Counter, Counter, Gauge]:
+    extra = {} if registry is None else {"registry": registry}
+    return (
+        Counter(
+            "step_memo_requests_total",
+            "Step memo lookups",
+            ["tool", "result"],  # hit, miss, bypass
+            **extra,
+        ),
+        Counter(
+            "step_memo_evictions_total",
+            "Step memo evictions",
+            ["reason"],  # capacity, expired
+            **extra,
+        ),
+        Gauge(
+            "step_memo_entries",
+            "Number of memoized step results",
+            **extra,
+        ),
+    )
+
+
+@dataclass
+class MemoEntry:
+    """A memoized step result."""
+
+    tool: str
+    value: Any
+    expires_at: float
+    hits: int = 0
+
+
+def make_memo_key(tool: str, arguments: dict[str, Any]) -> str | None:
+    """Content address for a tool call, or None if not canonicalizable.
+
+    Such calls are never memoized, rather than risk a wrong hit.
+    """
+    try:
+        canonical = json.dumps(
+            arguments,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(f"{tool}\x1f{canonical}".encode()).hexdigest()
+
+
+def is_success(result: Any) -> bool:
+    """Whether a tool result may be memoized.
+
+    Tool executors report failures as ``{"error": ...}`` or
+    ``{"success": False}`` payloads instead of raising; replaying those
+    would repeat a transient failure for the whole TTL.
+    """
+    if isinstance(result, dict):
+        return not result.get("error") and result.get("success") is not False
+    return True
+
+
+class StepMemo:
+    """Size-bounded, per-tool TTL memo of step results.
+
+    Usage:
+        memo = StepMemo({"semantic_search": 300})
+        engine = WorkflowEngine(step_memo=memo)
+        orchestrator = DAGOrchestrator(step_memo=memo)
+    """
+
+    def __init__(
+        self,
+        tool_ttls: dict[str, float] | None = None,
+        max_entries: int = 512,
+        default_ttl: float | None = None,
+        metrics_registry: CollectorRegistry | None = None,
+    ) -> None:
+        """Initialize the memo.
+
+        Args:
+            tool_ttls: Memoized tools and their TTL in seconds.
+                       Defaults to DEFAULT_TOOL_TTLS.
+            max_entries: Maximum stored results before LRU eviction.
+            default_ttl: TTL for tools not in ``tool_ttls`` (None = do not
+                         memoize them).
+            metrics_registry: Optional Prometheus registry (for test
+                              isolation).
+        """
+        self.tool_ttls = dict(
+            DEFAULT_TOOL_TTLS if tool_ttls is None else tool_ttls
+        )
+        self.default_ttl = default_ttl
+        self.max_entries = max(1, max_entries)
+
+        self._entries: OrderedDict[str, MemoEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "bypasses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+        if metrics_registry is not None:
+            metrics = _make_metrics(metrics_registry)
+        else:
+            with _default_metrics_lock:
+                if not _default_metrics:
+                    _default_metrics.append(_make_metrics())
+                metrics = _default_metrics[0]
+        self._m_requests, self._m_evictions, self._m_size = metrics
+
+    def ttl_for(self, tool: str) -> float | None:
+        """TTL for a tool, or None if the tool is not memoized."""
+        ttl = self.tool_ttls.get(tool, self.default_ttl)
+        return ttl if ttl and ttl > 0 else None
+
+    def is_memoized(self, tool: str) -> bool:
+        """Check whether a tool's results may be reused."""
+        return self.ttl_for(tool) is not None
+
+    def get(self, tool: str, arguments: dict[str, Any]) -> tuple[bool, Any]:
+        """Look up a stored result.
+
+        Returns:
+            (hit, result); the result is a copy the caller may mutate.
+        """
+        key = make_memo_key(tool, arguments) if self.ttl_for(tool) else None
+        if key is None:
+            with self._lock:
+                self.stats["bypasses"] += 1
+            self._m_requests.labels(tool=tool, result="bypass").inc()
+            return False, None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.time():
+                self._remove(key, reason="expired")
+                entry = None
+            if entry is None:
+                self.stats["misses"] += 1
+                self._misses[tool] = self._misses.get(tool, 0) + 1
+                self._m_requests.labels(tool=tool, result="miss").inc()
+                return False, None
+            self._entries.move_to_end(key)
+            entry.hits += 1
+            self.stats["hits"] += 1
+            self._hits[tool] = self._hits.get(tool, 0) + 1
+            value = entry.value
+        self._m_requests.labels(tool=tool, result="hit").inc()
+        return True, copy.deepcopy(value)
+
+    def put(self, tool: str, arguments: dict[str, Any], result: Any) -> bool:
+        """Store a successful result. Returns True if it was memoized."""
+        ttl = self.ttl_for(tool)
+        key = make_memo_key(tool, arguments) if ttl else None
+        if key is None or not is_success(result):
+            return False
+
+        entry = MemoEntry(
+            tool=tool,
+            value=copy.deepcopy(result),
+            expires_at=time.time() + ttl,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self.stats["stores"] += 1
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest, reason="capacity")
+            self._m_size.set(len(self._entries))
+        return True
+
+    def _remove(self, key: str, reason: str) -> None:
+        """Drop an entry (caller holds the lock)."""
+        if self._entries.pop(key, None) is None:
+            return
+        self.stats["expirations" if reason == "expired" else "evictions"] += 1
+        self._m_evictions.labels(reason=reason).inc()
+        self._m_size.set(len(self._entries))
+
+    def invalidate(self, tool: str | None = None) -> int:
+        """Drop stored results for one tool (or all). Returns the count."""
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if tool is None or entry.tool == tool
+            ]
+            for key in keys:
+                del self._entries[key]
+            self._m_size.set(len(self._entries))
+        return len(keys)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit/miss statistics, overall and per tool."""
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                **self.stats,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+                "per_tool": {
+                    tool: {
+                        "hits": self._hits.get(tool, 0),
+                        "misses": self._misses.get(tool, 0),
+                    }
+                    for tool in sorted(set(self._hits) | set(self._misses))
+                },
+            }
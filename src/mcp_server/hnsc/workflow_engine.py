@@ -10,7 +10,10 @@ Key workflows:
     - generate → check → refine
     - diagnose → analyze → fix → verify
 
-All workflows are deterministic and pre-defined.
+All workflows are deterministic and pre-defined. With a WorkflowJournal
+attached, step results are checkpointed as they complete and an
+interrupted workflow can be resumed by ID. With a StepMemo attached,
+repeated read-only tool calls reuse earlier results.
 
 Project Creator: Herman Swanepoel
 """
@@ -18,12 +21,23 @@ Project Creator: Herman Swanepoel
 from __future__ import annotations
 
 import asyncio
+import os
 import time
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from .step_memo import StepMemo
+from .workflow_expressions import (
+    Predicate,
+    Resolver,
+    compile_arguments,
+    compile_condition,
+)
+from .workflow_journal import WorkflowJournal
+
 
 class WorkflowStatus(Enum):
     """Status of a workflow execution."""
@@ -65,6 +79,48 @@ class WorkflowStep:
     condition: str | None = None  # Expression to evaluate
     skip_on_failure: bool = False  # Skip if dependencies failed
 
+    memoized: bool = False  # Result reused from the step memo
+
+    # Compiled condition/argument templates (see compile())
+    _compiled_from: tuple[str | None, dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _predicate: Predicate | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _resolver: Resolver | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def compile(self) -> None:
+        """Compile the condition and argument templates.
+
+        Idempotent; recompiles only if ``condition`` or ``arguments`` was
+        replaced. Call again after editing ``arguments`` in place.
+        """
+        source = self._compiled_from
+        if (
+            source is not None
+            and source[0] == self.condition
+            and source[1] is self.arguments
+        ):
+            return
+        self._predicate = (
+            compile_condition(self.condition) if self.condition else None
+        )
+        self._resolver = compile_arguments(self.arguments)
+        self._compiled_from = (self.condition, self.arguments)
+
+    def should_run(self, context: dict[str, Any]) -> bool:
+        """Evaluate the step condition against the workflow context."""
+        self.compile()
+        return self._predicate is None or self._predicate(context)
+
+    def resolve_arguments(self, context: dict[str, Any]) -> dict[str, Any]:
+        """Substitute ``$var`` references with (typed) context values."""
+        self.compile()
+        return self._resolver(context)
+
     def to_dict(self) -> dict:
         return {
             "id": self.id,
@@ -75,6 +131,7 @@ class WorkflowStep:
             "status": self.status.value,
             "result": self.result,
             "error": self.error,
+            "memoized": self.memoized,
             "duration_ms": (
                 int((self.completed_at - self.started_at) * 1000)
                 if self.started_at and self.completed_at
@@ -99,6 +156,11 @@ class Workflow:
         default_factory=dict
     )  # Shared data between steps
 
+    # Step ID -> step, rebuilt lazily when steps are added or removed
+    _step_index: dict[str, WorkflowStep] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def get_next_steps(self) -> list[WorkflowStep]:
         """Get steps that are ready to execute."""
         ready = []
@@ -119,12 +181,16 @@ class Workflow:
 
         return ready
 
+    def compile(self) -> None:
+        """Compile every step's condition and argument templates."""
+        for step in self.steps:
+            step.compile()
+
     def get_step(self, step_id: str) -> WorkflowStep | None:
         """Get a step by ID."""
-        for step in self.steps:
-            if step.id == step_id:
-                return step
-        return None
+        if len(self._step_index) != len(self.steps):
+            self._step_index = {step.id: step for step in self.steps}
+        return self._step_index.get(step_id)
 
     def is_complete(self) -> bool:
         """Check if all steps are done."""
@@ -191,10 +257,30 @@ class WorkflowEngine:
     This eliminates LLM reasoning about task ordering.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        journal: WorkflowJournal | None = None,
+        step_memo: StepMemo | None = None,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            journal: Optional step checkpoint journal. Defaults to one at
+                     $WORKFLOW_JOURNAL_PATH when that variable is set.
+            step_memo: Optional result memo for read-only tools. Defaults
+                       to one with DEFAULT_TOOL_TTLS when
+                       WORKFLOW_STEP_MEMO=1.
+        """
         self._workflows: dict[str, Workflow] = {}
         self._templates: dict[str, Callable[..., Workflow]] = {}
         self._tool_executor: Callable | None = None
+        journal_path = os.environ.get("WORKFLOW_JOURNAL_PATH")
+        if journal is None and journal_path:
+            journal = WorkflowJournal(journal_path)
+        self._journal = journal
+        if step_memo is None and os.environ.get("WORKFLOW_STEP_MEMO") == "1":
+            step_memo = StepMemo()
+        self._step_memo = step_memo
         self._register_builtin_templates()
 
     def set_tool_executor(self, executor: Callable) -> None:
@@ -471,6 +557,7 @@ class WorkflowEngine:
             return None
 
         workflow = self._templates[template_name](**kwargs)
+        workflow.compile()
         self._workflows[workflow.id] = workflow
         return workflow
 
@@ -489,33 +576,76 @@ class WorkflowEngine:
     ) -> Workflow:
         """Execute a workflow.
 
-        Steps are executed in parallel where dependencies allow.
+        Steps run as soon as their dependencies complete, on a pool of at
+        most ``max_concurrent`` in-flight steps; a finished step frees its
+        slot for the next ready step immediately.
+
+        Steps whose dependencies did not complete are never run: they are
+        marked SKIPPED if ``skip_on_failure`` is set and stay PENDING
+        otherwise.
         """
         if not self._tool_executor:
             raise RuntimeError("Tool executor not set")
 
         workflow.status = WorkflowStatus.RUNNING
         workflow.started_at = time.time()
-
-        try:
-            while not workflow.is_complete():
-                # Get steps ready to execute
-                ready_steps = workflow.get_next_steps()
-
-                if not ready_steps:
-                    # No steps ready - might be stuck
-                    if any(
-                        s.status == StepStatus.PENDING for s in workflow.steps
-                    ):
-                        # There are pending steps but none are ready - dependency issue
-                        workflow.status = WorkflowStatus.FAILED
-                        break
+        workflow.compile()
+        if self._journal:
+            await asyncio.to_thread(self._journal.save_workflow, workflow)
+
+        # Unfinished dependency counts and reverse edges, built once
+        remaining: dict[str, int] = {}
+        dependents: dict[str, list[WorkflowStep]] = {}
+        ready: deque[WorkflowStep] = deque()
+        for step in workflow.steps:
+            if step.status != StepStatus.PENDING:
+                continue
+            pending_deps = 0
+            for dep_id in step.dependencies:
+                dep_step = workflow.get_step(dep_id)
+                if dep_step and dep_step.status == StepStatus.COMPLETED:
                     continue
+                pending_deps += 1
+                dependents.setdefault(dep_id, []).append(step)
+            remaining[step.id] = pending_deps
+            if pending_deps == 0:
+                ready.append(step)
 
-                # Execute ready steps in parallel (up to max_concurrent)
-                batch = ready_steps[:max_concurrent]
-                tasks = [self._execute_step(workflow, step) for step in batch]
-                await asyncio.gather(*tasks)
+        def resolve(step: WorkflowStep) -> None:
+            """Release or skip the dependents of a finished step."""
+            stack = [step]
+            while stack:
+                finished = stack.pop()
+                for dependent in dependents.get(finished.id, ()):
+                    if dependent.status != StepStatus.PENDING:
+                        continue
+                    if finished.status == StepStatus.COMPLETED:
+                        remaining[dependent.id] -= 1
+                        if remaining[dependent.id] == 0:
+                            ready.append(dependent)
+                    elif dependent.skip_on_failure:
+                        dependent.status = StepStatus.SKIPPED
+                        stack.append(dependent)
+
+        in_flight: dict[asyncio.Task, WorkflowStep] = {}
+        max_concurrent = max(1, max_concurrent)
+
+        try:
+            while ready or in_flight:
+                while ready and len(in_flight) < max_concurrent:
+                    step = ready.popleft()
+                    task = asyncio.create_task(
+                        self._execute_step(workflow, step)
+                    )
+                    in_flight[task] = step
+
+                done, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    step = in_flight.pop(task)
+                    task.result()
+                    resolve(step)
 
             # Determine final status
             if workflow.has_failures():
@@ -527,8 +657,79 @@ class WorkflowEngine:
             workflow.status = WorkflowStatus.FAILED
 
         finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
             workflow.completed_at = time.time()
+            if self._journal:
+                await asyncio.to_thread(
+                    self._journal.set_status,
+                    workflow.id,
+                    workflow.status.value,
+                )
+
+        return workflow
+
+    async def resume_workflow(
+        self,
+        workflow_id: str,
+        max_concurrent: int = 3,
+    ) -> Workflow | None:
+        """Resume an interrupted or failed workflow.
+
+        Completed steps keep their results (restored from the journal after
+        a restart); every other step runs again.
 
+        Returns:
+            The executed workflow, or None if the ID is unknown.
+        """
+        workflow = self._workflows.get(workflow_id)
+        if workflow is None and self._journal:
+            stored = await asyncio.to_thread(
+                self._journal.load_workflow, workflow_id
+            )
+            if stored is not None:
+                workflow = self._restore_workflow(stored)
+                self._workflows[workflow.id] = workflow
+        if workflow is None:
+            return None
+
+        for step in workflow.steps:
+            if step.status != StepStatus.COMPLETED:
+                step.status = StepStatus.PENDING
+                step.result = None
+                step.error = None
+                step.started_at = None
+                step.completed_at = None
+                step.memoized = False
+                workflow.context.pop(f"step_{step.id}_result", None)
+
+        return await self.execute_workflow(workflow, max_concurrent)
+
+    @staticmethod
+    def _restore_workflow(stored: dict[str, Any]) -> Workflow:
+        """Rebuild a workflow from its journal record."""
+        definition = stored["definition"]
+        workflow = Workflow(
+            id=definition["id"],
+            name=definition["name"],
+            description=definition["description"],
+            steps=[WorkflowStep(**step) for step in definition["steps"]],
+            created_at=definition["created_at"],
+            context=dict(definition["context"]),
+        )
+        for step in workflow.steps:
+            checkpoint = stored["steps"].get(step.id)
+            if not checkpoint:
+                continue
+            if checkpoint["status"] != StepStatus.COMPLETED.value:
+                continue
+            step.status = StepStatus.COMPLETED
+            step.result = checkpoint["result"]
+            step.started_at = checkpoint["started_at"]
+            step.completed_at = checkpoint["completed_at"]
+            workflow.context[f"step_{step.id}_result"] = step.result
         return workflow
 
     async def _execute_step(
@@ -542,26 +743,25 @@ class WorkflowEngine:
 
         try:
             # Check condition if present
-            if step.condition and not self._evaluate_condition(
-                step.condition, workflow.context
-            ):
+            if not step.should_run(workflow.context):
                 step.status = StepStatus.SKIPPED
                 step.completed_at = time.time()
                 return
 
             # Merge workflow context into arguments
-            args = {**step.arguments}
-            for key, value in workflow.context.items():
-                if f"${key}" in str(args):
-                    # Simple template replacement
-                    for arg_key, arg_val in args.items():
-                        if isinstance(arg_val, str):
-                            args[arg_key] = arg_val.replace(
-                                f"${key}", str(value)
-                            )
-
-            # Execute the tool
-            result = await self._tool_executor(step.tool_name, args)
+            args = step.resolve_arguments(workflow.context)
+
+            memo = self._step_memo
+            hit, result = (
+                memo.get(step.tool_name, args) if memo else (False, None)
+            )
+            if hit:
+                step.memoized = True
+            else:
+                # Execute the tool
+                result = await self._tool_executor(step.tool_name, args)
+                if memo:
+                    memo.put(step.tool_name, args, result)
 
             step.result = result
             step.status = StepStatus.COMPLETED
@@ -575,45 +775,23 @@ class WorkflowEngine:
 
         finally:
             step.completed_at = time.time()
+            if self._journal:
+                await asyncio.to_thread(
+                    self._journal.record_step, workflow.id, step
+                )
 
     def _evaluate_condition(self, condition: str, context: dict) -> bool:
-        """Evaluate a simple condition expression.
+        """Evaluate a condition expression (see workflow_expressions).
 
         Supported:
         - $var == "value"
         - $var != "value"
+        - $var < 3 (also <=, >, >=)
         - $var exists
         - true / false
+        - not / and / or
         """
-        condition = condition.strip()
-
-        if condition.lower() == "true":
-            return True
-        if condition.lower() == "false":
-            return False
-
-        # Variable exists check
-        if condition.endswith(" exists"):
-            var_name = condition[:-7].strip().lstrip("$")
-            return var_name in context
-
-        # Equality check
-        if "==" in condition:
-            parts = condition.split("==")
-            if len(parts) == 2:
-                var_name = parts[0].strip().lstrip("$")
-                expected = parts[1].strip().strip("\"'")
-                return str(context.get(var_name, "")) == expected
-
-        # Inequality check
-        if "!=" in condition:
-            parts = condition.split("!=")
-            if len(parts) == 2:
-                var_name = parts[0].strip().lstrip("$")
-                expected = parts[1].strip().strip("\"'")
-                return str(context.get(var_name, "")) != expected
-
-        return True  # Default: condition met
+        return compile_condition(condition)(context)
 
     def detect_workflow(
         self, intent_category: str, user_input: str
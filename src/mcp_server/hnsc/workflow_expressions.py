@@ -0,0 +1,295 @@
+"""Workflow Expressions - Compiled Conditions and Argument Templates.
+
+Step conditions and ``$var`` argument templates are parsed once into
+closures and then evaluated against the workflow context on every run,
+instead of re-parsing strings per step.
+
+Templates:
+    - A value that is exactly ``"$var"`` is replaced by the typed value
+      (a dict stays a dict, an int stays an int).
+    - ``$var`` inside a longer string is interpolated as text.
+    - ``$var.key.0`` walks into dicts/lists (e.g. step results); a path
+      that cannot be resolved any further is kept as literal text.
+    - Unknown variables are left untouched. Nested dicts/lists are
+      resolved recursively; non-string values are never modified.
+
+Conditions:
+    - ``true`` / ``false``
+    - ``$var exists``
+    - ``$var == value``, ``$var != value`` (text comparison, as before)
+    - ``$var < value`` and ``<=``, ``>``, ``>=`` (numeric when possible)
+    - ``not``, ``and``, ``or`` (``and`` binds tighter than ``or``)
+    Anything else evaluates to true, matching the original evaluator.
+
+Project Creator: Herman Swanepoel
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+Resolver = Callable[[dict[str, Any]], Any]
+Predicate = Callable[[dict[str, Any]], bool]
+
+_VAR_RE = re.compile(r"\$([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z0-9_]+)*)")
+_COMPARISON_RE = re.compile(
+    r"^\$?([A-Za-z_][A-Za-z0-9_.]*)\s*(==|!=|<=|>=|<|>)\s*(.*)$"
+)
+_MISSING = object()
+
+
+# =============================================================================
+# Variable paths
+# =============================================================================
+
+
+def _lookup(context: dict[str, Any], path: tuple[str, ...]) -> tuple[Any, int]:
+    """Resolve as much of a dotted path as possible.
+
+    Returns:
+        (value, parts consumed); value is _MISSING if the root is unknown.
+    """
+    if path[0] not in context:
+        return _MISSING, 0
+    value = context[path[0]]
+    consumed = 1
+    for part in path[1:]:
+        if isinstance(value, dict) and part in value:
+            value = value[part]
+        elif isinstance(value, (list, tuple)) and part.isdigit():
+            index = int(part)
+            if index >= len(value):
+                break
+            value = value[index]
+        else:
+            break
+        consumed += 1
+    return value, consumed
+
+
+def _path_resolver(path: tuple[str, ...], literal: str) -> Resolver:
+    """Resolver for a lone ``$path`` value (keeps the value's type)."""
+
+    def resolve(context: dict[str, Any]) -> Any:
+        value, consumed = _lookup(context, path)
+        if value is _MISSING:
+            return literal
+        if consumed < len(path):
+            return str(value) + "." + ".".join(path[consumed:])
+        return value
+
+    return resolve
+
+
+# =============================================================================
+# Templates
+# =============================================================================
+
+
+def _compile_string(text: str) -> Resolver | None:
+    """Compile a string template, or None if it has no variables."""
+    matches = list(_VAR_RE.finditer(text))
+    if not matches:
+        return None
+
+    if len(matches) == 1 and matches[0].span() == (0, len(text)):
+        return _path_resolver(tuple(matches[0].group(1).split(".")), text)
+
+    # Alternate literal text and variable references
+    parts: list[str | tuple[tuple[str, ...], str]] = []
+    position = 0
+    for match in matches:
+        if match.start() > position:
+            parts.append(text[position : match.start()])
+        parts.append((tuple(match.group(1).split(".")), match.group(0)))
+        position = match.end()
+    if position < len(text):
+        parts.append(text[position:])
+
+    def render(context: dict[str, Any]) -> str:
+        out = []
+        for part in parts:
+            if isinstance(part, str):
+                out.append(part)
+                continue
+            path, literal = part
+            value, consumed = _lookup(context, path)
+            if value is _MISSING:
+                out.append(literal)
+                continue
+            out.append(str(value))
+            if consumed < len(path):
+                out.append("." + ".".join(path[consumed:]))
+        return "".join(out)
+
+    return render
+
+
+def _compile_value(value: Any) -> Resolver | None:
+    """Compile any argument value; None means it is constant."""
+    if isinstance(value, str):
+        return _compile_string(value)
+
+    if isinstance(value, dict):
+        compiled = {k: _compile_value(v) for k, v in value.items()}
+        dynamic = {k: r for k, r in compiled.items() if r is not None}
+        if not dynamic:
+            return None
+
+        def resolve_dict(context: dict[str, Any]) -> dict[str, Any]:
+            resolved = dict(value)
+            for key, resolver in dynamic.items():
+                resolved[key] = resolver(context)
+            return resolved
+
+        return resolve_dict
+
+    if isinstance(value, list):
+        compiled_items = [_compile_value(v) for v in value]
+        if all(r is None for r in compiled_items):
+            return None
+
+        def resolve_list(context: dict[str, Any]) -> list[Any]:
+            return [
+                r(context) if r is not None else v
+                for v, r in zip(value, compiled_items, strict=True)
+            ]
+
+        return resolve_list
+
+    return None
+
+
+def compile_arguments(arguments: dict[str, Any]) -> Resolver:
+    """Compile step arguments into a resolver returning a fresh dict."""
+    resolver = _compile_value(arguments)
+    if resolver is None:
+        return lambda context: dict(arguments)
+    return resolver
+
+
+# =============================================================================
+# Conditions
+# =============================================================================
+
+
+def _parse_literal(text: str) -> tuple[str, float | None]:
+    """Split a literal into its text form and numeric value (if any)."""
+    text = text.strip().strip("\"'")
+    try:
+        return text, float(text)
+    except ValueError:
+        return text, None
+
+
+def _compile_comparison(
+    path: tuple[str, ...], op: str, literal: str
+) -> Predicate:
+    expected, number = _parse_literal(literal)
+
+    def as_text(context: dict[str, Any]) -> str:
+        value, consumed = _lookup(context, path)
+        if value is _MISSING or consumed < len(path):
+            return ""
+        return str(value)
+
+    if op == "==":
+        return lambda context: as_text(context) == expected
+    if op == "!=":
+        return lambda context: as_text(context) != expected
+
+    def ordered(context: dict[str, Any]) -> bool:
+        value, consumed = _lookup(context, path)
+        if value is _MISSING or consumed < len(path):
+            return False
+        left: Any = str(value)
+        right: Any = expected
+        if number is not None:
+            try:
+                left, right = float(value), number
+            except (TypeError, ValueError):
+                pass
+        if op == "<":
+            return left < right
+        if op == "<=":
+            return left <= right
+        if op == ">":
+            return left > right
+        return left >= right
+
+    return ordered
+
+
+def _compile_atom(text: str) -> Predicate:
+    text = text.strip()
+    lowered = text.lower()
+
+    if lowered == "true":
+        return lambda context: True
+    if lowered == "false":
+        return lambda context: False
+    if lowered.startswith("not "):
+        inner = _compile_atom(text[4:])
+        return lambda context: not inner(context)
+
+    if text.endswith(" exists"):
+        path = tuple(text[:-7].strip().lstrip("$").split("."))
+
+        def exists(context: dict[str, Any]) -> bool:
+            value, consumed = _lookup(context, path)
+            return value is not _MISSING and consumed == len(path)
+
+        return exists
+
+    match = _COMPARISON_RE.match(text)
+    if match:
+        path = tuple(match.group(1).split("."))
+        return _compile_comparison(path, match.group(2), match.group(3))
+
+    return lambda context: True  # Default: condition met
+
+
+def _split_keyword(text: str, keyword: str) -> list[str]:
+    """Split on a boolean keyword, ignoring occurrences inside quotes."""
+    pattern = re.compile(rf"\s+{keyword}\s+", re.IGNORECASE)
+    parts, start, quote = [], 0, None
+    position = 0
+    while position < len(text):
+        char = text[position]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        else:
+            match = pattern.match(text, position)
+            if match:
+                parts.append(text[start:position])
+                start = position = match.end()
+                continue
+        position += 1
+    parts.append(text[start:])
+    return parts
+
+
+@lru_cache(maxsize=1024)
+def compile_condition(condition: str) -> Predicate:
+    """Compile a condition expression into a predicate over the context."""
+    alternatives = []
+    for disjunct in _split_keyword(condition.strip(), "or"):
+        terms = [
+            _compile_atom(term) for term in _split_keyword(disjunct, "and")
+        ]
+        if len(terms) == 1:
+            alternatives.append(terms[0])
+        else:
+            alternatives.append(
+                lambda context, terms=terms: all(t(context) for t in terms)
+            )
+
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return lambda context: any(a(context) for a in alternatives)
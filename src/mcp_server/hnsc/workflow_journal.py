@@ -0,0 +1,286 @@
+"""Workflow Journal - Durable Step Checkpoints for Resumable Runs.
+
+Persists each run definition and every step outcome to a local SQLite
+database as it happens. After a restart, a run can be resumed by its ID:
+completed steps are restored and only the remaining steps run.
+
+Used by the HNSC WorkflowEngine and by the model gateway's
+DAGOrchestrator. The methods block on SQLite, so async callers run them
+with ``asyncio.to_thread``.
+
+Steps whose results cannot be stored as JSON are not checkpointed and run
+again on resume.
+
+Project Creator: Herman Swanepoel
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .workflow_engine import Workflow, WorkflowStep
+
+logger = logging.getLogger(__name__)
+
+
+class WorkflowJournal:
+    """SQLite journal of run definitions and step results.
+
+    Each write is committed immediately (WAL mode), so a crash loses at
+    most the steps that were still running.
+
+    Usage:
+        journal = WorkflowJournal("data/workflow_journal.db")
+        engine = WorkflowEngine(journal=journal)
+        ...
+        # after a restart
+        workflow = await engine.resume_workflow("diag_1712345678")
+    """
+
+    def __init__(self, db_path: str | Path = "data/workflow_journal.db"):
+        """Initialize the journal.
+
+        Args:
+            db_path: SQLite database file (created if missing).
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        with self._lock:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS workflows (
+                    id TEXT PRIMARY KEY,
+                    definition TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS workflow_steps (
+                    workflow_id TEXT NOT NULL,
+                    step_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    started_at REAL,
+                    completed_at REAL,
+                    fingerprint TEXT,
+                    PRIMARY KEY (workflow_id, step_id)
+                );
+                """)
+            self._conn.commit()
+
+    def save_workflow(self, workflow: Workflow) -> None:
+        """Store (or update) a workflow definition and its status.
+
+        The initial context is stored with the definition; step results
+        are added back from the step rows on load.
+        """
+        step_keys = {f"step_{step.id}_result" for step in workflow.steps}
+        context = {
+            key: value
+            for key, value in workflow.context.items()
+            if key not in step_keys
+        }
+        definition = {
+            "id": workflow.id,
+            "name": workflow.name,
+            "description": workflow.description,
+            "created_at": workflow.created_at,
+            "context": context,
+            "steps": [
+                {
+                    "id": step.id,
+                    "name": step.name,
+                    "tool_name": step.tool_name,
+                    "arguments": step.arguments,
+                    "dependencies": step.dependencies,
+                    "condition": step.condition,
+                    "skip_on_failure": step.skip_on_failure,
+                }
+                for step in workflow.steps
+            ],
+        }
+        self.save_run(workflow.id, definition, workflow.status.value)
+
+    def save_run(
+        self, run_id: str, definition: dict[str, Any], status: str
+    ) -> None:
+        """Store (or update) a run definition and its status."""
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO workflows (id, definition, status, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    definition = excluded.definition,
+                    status = excluded.status,
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    run_id,
+                    json.dumps(definition, default=str),
+                    status,
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+
+    def set_status(self, workflow_id: str, status: str) -> None:
+        """Update the stored status of a workflow."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE workflows SET status = ?, updated_at = ? WHERE id = ?",
+                (status, time.time(), workflow_id),
+            )
+            self._conn.commit()
+
+    def record_step(self, workflow_id: str, step: WorkflowStep) -> bool:
+        """Persist the outcome of a finished workflow step.
+
+        Returns:
+            False if the step was not checkpointed (it will re-run).
+        """
+        return self.record(
+            workflow_id,
+            step.id,
+            step.status.value,
+            step.result,
+            error=step.error,
+            started_at=step.started_at,
+            completed_at=step.completed_at,
+        )
+
+    def record(
+        self,
+        run_id: str,
+        step_id: str,
+        status: str,
+        result: Any,
+        *,
+        error: str | None = None,
+        started_at: float | None = None,
+        completed_at: float | None = None,
+        fingerprint: str | None = None,
+    ) -> bool:
+        """Persist the outcome of a finished step.
+
+        Args:
+            fingerprint: Optional hash of the step definition, returned by
+                ``load_workflow`` so callers can ignore stale checkpoints.
+
+        Returns:
+            False if the step was not checkpointed (it will re-run).
+        """
+        try:
+            payload = json.dumps(result)
+        except (TypeError, ValueError) as e:
+            logger.warning(
+                f"Step {step_id} result is not JSON-serializable, "
+                f"skipping checkpoint: {e}"
+            )
+            return False
+
+        try:
+            with self._lock:
+                self._conn.execute(
+                    """
+                    INSERT OR REPLACE INTO workflow_steps
+                        (workflow_id, step_id, status, result, error,
+                         started_at, completed_at, fingerprint)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        run_id,
+                        step_id,
+                        status,
+                        payload,
+                        error,
+                        started_at,
+                        completed_at,
+                        fingerprint,
+                    ),
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to checkpoint step {step_id}: {e}")
+            return False
+        return True
+
+    def load_workflow(self, workflow_id: str) -> dict[str, Any] | None:
+        """Load a stored workflow definition with its step outcomes.
+
+        Returns:
+            ``{"definition": ..., "status": ..., "steps": {step_id: row}}``
+            or None if the workflow is unknown.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT definition, status FROM workflows WHERE id = ?",
+                (workflow_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            step_rows = self._conn.execute(
+                "SELECT step_id, status, result, error, started_at, "
+                "completed_at, fingerprint FROM workflow_steps "
+                "WHERE workflow_id = ?",
+                (workflow_id,),
+            ).fetchall()
+
+        steps = {
+            row[0]: {
+                "status": row[1],
+                "result": json.loads(row[2]) if row[2] is not None else None,
+                "error": row[3],
+                "started_at": row[4],
+                "completed_at": row[5],
+                "fingerprint": row[6],
+            }
+            for row in step_rows
+        }
+        return {
+            "definition": json.loads(row[0]),
+            "status": row[1],
+            "steps": steps,
+        }
+
+    def list_resumable(self) -> list[str]:
+        """IDs of workflows that were interrupted or failed."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM workflows "
+                "WHERE status IN ('running', 'failed') "
+                "ORDER BY updated_at DESC"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def delete_workflow(self, workflow_id: str) -> None:
+        """Remove a workflow and its step checkpoints."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM workflow_steps WHERE workflow_id = ?",
+                (workflow_id,),
+            )
+            self._conn.execute(
+                "DELETE FROM workflows WHERE id = ?", (workflow_id,)
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
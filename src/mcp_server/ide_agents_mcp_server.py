@@ -60,6 +60,7 @@ try:
         command_args_schema,
         run_command_adapter,
     )
+    from .tool_events import ToolCallEvent, get_tool_event_bus
 except ImportError:
     # Fallback for when running as script without package context
     import approval as approval_mod
@@ -75,6 +76,7 @@ except ImportError:
         command_args_schema,
         run_command_adapter,
     )
+    from tool_events import ToolCallEvent, get_tool_event_bus
 
     from security import audit_logger
     from src.mcp_server import telemetry
@@ -496,6 +498,10 @@ class AgentsMCPServer:
         self._resource_cache = SimpleCache(ttl_seconds=60.0)  # 1 minute
         self._ready_cache_value: dict[str, Any] | None = None
         self._ready_cache_ts = 0.0
+        # Component sweep behind /health/components (created on first use)
+        self._component_health: Any = None
+        # Post-call bookkeeping for tool invocations (off the request path)
+        self._tool_events = get_tool_event_bus()
         self._register_tools()
         self._register_http_endpoints()
         self._setup_cors()
@@ -921,6 +927,23 @@ class AgentsMCPServer:
                 }
             )
 
+        @self.server.custom_route(
+            "/health/components", methods=["GET"], name="health_components"
+        )
+        async def http_health_components(request: Request) -> JSONResponse:
+            """Per-component health, served from the last sweep."""
+            if self._component_health is None:
+                try:
+                    from .mcp_health_checker import MCPHealthChecker
+                except ImportError:
+                    from mcp_health_checker import MCPHealthChecker
+
+                self._component_health = MCPHealthChecker(
+                    self.config.backend_base_url
+                )
+            report = await self._component_health.get_report()
+            return JSONResponse(report.to_dict())
+
         @self.server.custom_route(
             "/readiness", methods=["GET"], name="readiness"
         )
@@ -1926,6 +1949,7 @@ class AgentsMCPServer:
                 await scheduler.start()
 
                 engine = await get_debate_engine()
+                summary["debate_scheduler"] = scheduler.get_status()
                 summary["debate_leaderboard"] = await engine.get_leaderboard()
                 summary["debate_history"] = await engine.get_debate_history(
                     limit=5
@@ -2625,105 +2649,146 @@ class AgentsMCPServer:
             else name
         )
         if not approval_mod.rate_limiter.allow(rl_key):
-            audit_logger.rate_limited(rl_key)
+            now = time.perf_counter()
+            self._tool_events.publish(
+                self._record_tool_event,
+                ToolCallEvent(
+                    name,
+                    None,
+                    {},
+                    False,
+                    now,
+                    now,
+                    error_code="rate_limited",
+                    rate_limit_key=rl_key,
+                    otel_span=otel_span,
+                ),
+            )
             raise ValueError("rate_limited: please retry shortly")
 
         handler = self.tool_handlers.get(name)
         if handler is None:
             raise ValueError(f"Unknown tool requested: {name}")
 
-        # Telemetry span wrap
         # Use perf_counter to match telemetry's time base
         start = time.perf_counter()
         method = (
             arguments.get("method") if isinstance(arguments, dict) else None
         )
+        # Telemetry, metrics, audit and provenance are recorded off the
+        # request path by the tool event bus (see _record_tool_event)
         try:
             result = await handler(arguments)
-            telemetry.emit_span(
-                name, start_time=start, method=method, success=True
+        except Exception as exc:  # noqa: BLE001
+            self._tool_events.publish(
+                self._record_tool_event,
+                ToolCallEvent(
+                    name,
+                    method,
+                    arguments if isinstance(arguments, dict) else {},
+                    False,
+                    start,
+                    time.perf_counter(),
+                    error_code=exc.__class__.__name__,
+                    error_message=str(exc),
+                    otel_span=otel_span,
+                ),
             )
-            metrics.incr(name, True)
-            try:  # record latency histogram
-                from mcp_server.metrics import record_tool_latency
+            raise
+        self._tool_events.publish(
+            self._record_tool_event,
+            ToolCallEvent(
+                name,
+                method,
+                arguments if isinstance(arguments, dict) else {},
+                True,
+                start,
+                time.perf_counter(),
+                result=result,
+                otel_span=otel_span,
+            ),
+        )
+        return result
 
-                duration = time.perf_counter() - start
-                record_tool_latency(name, duration)
-            except Exception:  # noqa: BLE001
-                pass
+    def _record_tool_event(self, event: ToolCallEvent) -> None:
+        """Post-call bookkeeping; runs on the tool event consumer thread."""
+        if event.rate_limit_key is not None:
+            audit_logger.record(
+                "rate_limited",
+                {"key": event.rate_limit_key, "ts": event.wall_time},
+            )
+            self._end_otel_span(event)
+            return
+
+        telemetry.emit_span(
+            event.name,
+            start_time=event.start,
+            method=event.method,
+            success=event.success,
+            error_code=event.error_code,
+            end_time=event.end,
+            timestamp=event.wall_time,
+        )
+        metrics.incr(event.name, event.success)
+        metrics.record_tool_latency(event.name, event.duration)
+        if event.success:
             # Audit only consolidated command tool run method success
             if (
-                name == "ide_agents_command"
-                and isinstance(arguments, dict)
-                and arguments.get("method") == "run"
+                event.name == "ide_agents_command"
+                and event.method == "run"
             ):
-                audit_logger.command_executed(
-                    arguments.get("command", ""), True
-                )
-            # Provenance (success)
-            try:  # noqa: SIM105
-                from mcp_server.provenance import log_tool_invocation
-
-                duration_ms = (time.perf_counter() - start) * 1000.0
-                log_tool_invocation(
-                    name,
-                    arguments if isinstance(arguments, dict) else {},
-                    True,
-                    duration_ms,
-                    result,
+                audit_logger.record(
+                    "command_executed",
+                    {
+                        "command": event.arguments.get("command", ""),
+                        "success": True,
+                        "exit_code": None,
+                        "ts": event.wall_time,
+                    },
                 )
-            except Exception:  # noqa: BLE001
-                pass
-            # Close OTEL span on success
-            if otel_span is not None:
-                try:
-                    from opentelemetry.trace import Status, StatusCode
-
-                    otel_span.set_status(Status(StatusCode.OK))
-                    otel_span.end()
-                except Exception:
-                    pass
-            return result
-        except Exception as exc:  # noqa: BLE001
-            telemetry.emit_span(
-                name,
-                start_time=start,
-                method=method,
-                success=False,
-                error_code=exc.__class__.__name__,
+        else:
+            audit_logger.record(
+                "tool_failure",
+                {
+                    "tool": event.name,
+                    "error_code": event.error_code,
+                    "ts": event.wall_time,
+                },
+            )
+        try:  # noqa: SIM105
+            from mcp_server.provenance import log_tool_invocation
+
+            log_tool_invocation(
+                event.name,
+                event.arguments,
+                event.success,
+                event.duration * 1000.0,
+                event.result if event.success else None,
+                ts=event.wall_time,
             )
-            metrics.incr(name, False)
-            try:  # record latency even on failure
-                from mcp_server.metrics import record_tool_latency
+        except Exception:  # noqa: BLE001
+            pass
+        self._end_otel_span(event)
 
-                duration = time.perf_counter() - start
-                record_tool_latency(name, duration)
-            except Exception:  # noqa: BLE001
-                pass
-            audit_logger.tool_failure(name, exc.__class__.__name__)
-            try:  # provenance failure
-                from mcp_server.provenance import log_tool_invocation
+    @staticmethod
+    def _end_otel_span(event: ToolCallEvent) -> None:
+        if event.otel_span is None:
+            return
+        try:
+            from opentelemetry.trace import Status, StatusCode
 
-                duration_ms = (time.perf_counter() - start) * 1000.0
-                log_tool_invocation(
-                    name,
-                    arguments if isinstance(arguments, dict) else {},
-                    False,
-                    duration_ms,
-                    None,
+            if event.success:
+                event.otel_span.set_status(Status(StatusCode.OK))
+            else:
+                event.otel_span.set_status(
+                    Status(
+                        StatusCode.ERROR,
+                        event.error_message or event.error_code,
+                    )
                 )
-            except Exception:  # noqa: BLE001
-                pass
-            # Close OTEL span on error
-            if otel_span is not None:
-                try:
-                    from opentelemetry.trace import Status, StatusCode
-
-                    otel_span.set_status(Status(StatusCode.ERROR, str(exc)))
-                    otel_span.end()
-                except Exception:
-                    pass
-            raise
+            event.otel_span.end(end_time=event.end_ns)
+        except Exception:
+            pass
 
     async def _handle_run_command(
         self, arguments: dict[str, Any]
@@ -4021,7 +4086,20 @@ class AgentsMCPServer:
                 await self._bg_health_task
             except Exception:  # noqa: BLE001
                 pass
+        await asyncio.to_thread(self._tool_events.drain)
         telemetry.flush_telemetry()
+        component_health = getattr(self, "_component_health", None)
+        if component_health is not None:
+            await component_health.client.aclose()
+        # Persist debate rankings still batched in memory
+        try:
+            from aura_ia_mcp.services.debate_engine import (
+                close_debate_engine,
+            )
+
+            await close_debate_engine()
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Debate engine shutdown failed: {e}")
         await self.backend.close()
 
     # ---- ULTRA helpers ----
@@ -3,13 +3,21 @@
 Comprehensive verification of all MCP components with REAL functionality testing.
 NO MOCKS - All tests use actual functionality.
 
+Checks run concurrently, each under its own deadline; a check that misses
+it is reported as failed while the others still complete. ``get_report``
+serves the last completed report while a refresh runs in the background,
+so health endpoints do not wait on slow dependencies.
+
 Project Creator: Herman Swanepoel
 Version: 1.0
 """
 
 import asyncio
 import json
+import logging
+import os
 import time
+from collections.abc import Awaitable, Callable
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
@@ -17,6 +25,11 @@ from typing import Any
 
 import httpx
 
+logger = logging.getLogger(__name__)
+
+_CHECK_DEADLINE = float(os.getenv("MCP_HEALTH_CHECK_DEADLINE", "10"))
+_REPORT_MAX_AGE = float(os.getenv("MCP_HEALTH_REPORT_MAX_AGE", "30"))
+
 
 @dataclass
 class HealthResult:
@@ -63,17 +76,47 @@ class HealthReport:
         }
 
 
+def _log_refresh_failure(task: asyncio.Task) -> None:
+    """Log a background sweep that raised (nobody may await it)."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(
+            "Background health sweep failed", exc_info=task.exception()
+        )
+
+
 class MCPHealthChecker:
     """Comprehensive health checker for MCP components with REAL functionality testing."""
 
-    def __init__(self, backend_url: str = "http://127.0.0.1:8001"):
+    # Checks that wait on a model reply get longer than the default
+    CHECK_DEADLINES = {
+        "YoanÉ AI": 30.0,
+        "ULTRA Intelligence": 30.0,
+        "ML Engines": 30.0,
+    }
+
+    def __init__(
+        self,
+        backend_url: str = "http://127.0.0.1:8001",
+        check_deadline: float = _CHECK_DEADLINE,
+        report_max_age: float = _REPORT_MAX_AGE,
+    ):
         """Initialize health checker.
 
         Args:
             backend_url: URL of the backend server
+            check_deadline: Seconds a check may take unless listed in
+                ``CHECK_DEADLINES``
+            report_max_age: Seconds a report is served by ``get_report``
+                before a refresh is started
         """
         self.backend_url = backend_url
         self.client = httpx.AsyncClient(timeout=30.0)
+        self.check_deadline = check_deadline
+        self.check_deadlines = dict(self.CHECK_DEADLINES)
+        self.report_max_age = report_max_age
+        self.last_report: HealthReport | None = None
+        self._last_report_at = 0.0
+        self._refresh_task: asyncio.Task | None = None
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -614,66 +657,78 @@ class MCPHealthChecker:
                 response_time_ms=(time.time() - start_time) * 1000,
             )
 
+    def _checks(
+        self,
+    ) -> list[tuple[str, Callable[[], Awaitable[HealthResult]]]]:
+        return [
+            ("Backend Server", self.check_backend_server),
+            ("YoanÉ AI", self.check_yoane_ai),
+            ("ULTRA Intelligence", self.check_ultra_intelligence),
+            ("GitHub Integration", self.check_github_integration),
+            ("ML Engines", self.check_ml_engines),
+            ("Command Execution", self.check_command_execution),
+            ("MCP Tools", self.check_all_tools),
+        ]
+
+    async def _run_check(
+        self, name: str, check: Callable[[], Awaitable[HealthResult]]
+    ) -> HealthResult:
+        """Run one check under its deadline; never raises."""
+        deadline = self.check_deadlines.get(name, self.check_deadline)
+        start_time = time.time()
+        try:
+            return await asyncio.wait_for(check(), deadline)
+        except TimeoutError:
+            return HealthResult(
+                component=name,
+                status="fail",
+                message=f"Health check timed out after {deadline:.1f}s",
+                details={"timed_out": True, "deadline_seconds": deadline},
+                timestamp=datetime.now(),
+                response_time_ms=(time.time() - start_time) * 1000,
+            )
+        except Exception as e:
+            return HealthResult(
+                component=name,
+                status="fail",
+                message=f"Error running health check: {str(e)}",
+                details={"error": str(e)},
+                timestamp=datetime.now(),
+                response_time_ms=(time.time() - start_time) * 1000,
+            )
+
     async def run_full_health_check(self) -> HealthReport:
-        """Execute all health checks and generate report.
+        """Execute all health checks concurrently and generate report.
 
         Returns:
             HealthReport with complete results
         """
         start_time = time.time()
-        results = []
 
         print("🏥 Running comprehensive MCP health check...")
         print("=" * 60)
 
-        # Run all health checks
-        checks = [
-            ("Backend Server", self.check_backend_server()),
-            ("YoanÉ AI", self.check_yoane_ai()),
-            ("ULTRA Intelligence", self.check_ultra_intelligence()),
-            ("GitHub Integration", self.check_github_integration()),
-            ("ML Engines", self.check_ml_engines()),
-            ("Command Execution", self.check_command_execution()),
-            ("MCP Tools", self.check_all_tools()),
-        ]
-
-        for name, check_coro in checks:
-            print(f"\n🔍 Checking {name}...")
-            result = await check_coro
-            results.append(result)
+        # Run all health checks; the sweep takes as long as the slowest
+        checks = self._checks()
+        print(f"\n🔍 Checking {len(checks)} components concurrently...")
+        results = list(
+            await asyncio.gather(
+                *(self._run_check(name, check) for name, check in checks)
+            )
+        )
 
+        for result in results:
             # Print result
             status_icon = (
                 "✅"
                 if result.status == "pass"
                 else "⚠️" if result.status == "warning" else "❌"
             )
-            print(f"{status_icon} {result.message}")
+            print(f"{status_icon} {result.component}: {result.message}")
             print(f"   Response time: {result.response_time_ms:.2f}ms")
 
-        # Calculate summary
-        passed = sum(1 for r in results if r.status == "pass")
-        failed = sum(1 for r in results if r.status == "fail")
-        warnings = sum(1 for r in results if r.status == "warning")
-
-        overall_status = (
-            "pass"
-            if failed == 0 and warnings == 0
-            else "warning" if failed == 0 else "fail"
-        )
-
-        duration = time.time() - start_time
-
-        report = HealthReport(
-            overall_status=overall_status,
-            total_checks=len(results),
-            passed=passed,
-            failed=failed,
-            warnings=warnings,
-            results=results,
-            timestamp=datetime.now(),
-            duration_seconds=duration,
-        )
+        report = self.generate_report(results)
+        report.duration_seconds = time.time() - start_time
 
         print("\n" + "=" * 60)
         print("📊 Health Check Summary:")
@@ -682,10 +737,44 @@ class MCPHealthChecker:
         print(f"   ⚠️  Warnings: {report.warnings}")
         print(f"   ❌ Failed: {report.failed}")
         print(f"   Duration: {report.duration_seconds:.2f}s")
-        print(f"   Overall: {overall_status.upper()}")
+        print(f"   Overall: {report.overall_status.upper()}")
 
+        self.last_report = report
+        self._last_report_at = time.monotonic()
         return report
 
+    def refresh(self) -> asyncio.Task:
+        """Start a background sweep, or return the one in flight."""
+        task = self._refresh_task
+        if task is None or task.done():
+            task = asyncio.create_task(self.run_full_health_check())
+            task.add_done_callback(_log_refresh_failure)
+            self._refresh_task = task
+        return task
+
+    async def get_report(self, max_age: float | None = None) -> HealthReport:
+        """Return a recent report without waiting on slow checks.
+
+        A report younger than ``max_age`` (default ``report_max_age``) is
+        returned as is. An older one is still returned straight away while
+        a refresh runs in the background; only the very first call waits
+        for a sweep.
+
+        Args:
+            max_age: Seconds before the cached report counts as stale
+
+        Returns:
+            The last completed HealthReport
+        """
+        if max_age is None:
+            max_age = self.report_max_age
+        report = self.last_report
+        if report is not None:
+            if time.monotonic() - self._last_report_at >= max_age:
+                self.refresh()
+            return report
+        return await asyncio.shield(self.refresh())
+
     def generate_report(self, results: list[HealthResult]) -> HealthReport:
         """Generate detailed health report with timestamps.
 
@@ -1,97 +1,228 @@
 """In-process metrics collection with Prometheus exposition.
 
-Thread-safe counters maintained for total tool calls, successes, failures,
-per-tool counts, and a Prometheus `/metrics` endpoint.
+Counters are kept for total tool calls, successes, failures, per-tool
+counts, tool latency and backend health checks, and served on a
+Prometheus `/metrics` endpoint.
+
+Writers never take a shared lock: each thread updates its own shard and
+the shards are merged when the metrics are read (``snapshot``,
+``performance_summary`` and the Prometheus collector). Shards of threads
+that have exited are folded into a retired shard so counts survive
+thread pool churn.
+
+The exposition payload is cached and only rendered again once something
+changed. Scrape endpoints can pass ``max_age`` (or ``None`` for
+``METRICS_EXPOSITION_MAX_AGE``) to render at most once per interval.
 """
 
 from __future__ import annotations
 
+import os
 import threading
 import time
+import weakref
+from bisect import bisect_left
+from collections.abc import Iterator
 
 from prometheus_client import (
     CollectorRegistry,
     Counter,
-    Gauge,
     Histogram,
     generate_latest,
 )
+from prometheus_client.core import (
+    CounterMetricFamily,
+    GaugeMetricFamily,
+    HistogramMetricFamily,
+    Metric,
+)
+from prometheus_client.utils import floatToGoString
 
-_lock = threading.Lock()
 _process_start_time = time.time()
-_counters: dict[str, int] = {
-    "tool_calls_total": 0,
-    "tool_calls_success": 0,
-    "tool_calls_failure": 0,
-}
-_per_tool: dict[str, int] = {}
+_EXPOSITION_MAX_AGE = float(os.getenv("METRICS_EXPOSITION_MAX_AGE", "5"))
 
-
-_registry = CollectorRegistry()
-_tool_calls_total = Counter(
-    "tool_calls_total",
-    "Total tool invocations",
-    registry=_registry,
-)
-_tool_calls_success = Counter(
-    "tool_calls_success",
-    "Successful tool invocations",
-    registry=_registry,
-)
-_tool_calls_failure = Counter(
-    "tool_calls_failure",
-    "Failed tool invocations",
-    registry=_registry,
-)
-_tool_last_success_rate = Gauge(
-    "tool_success_rate",
-    "Last computed tool success rate",
-    registry=_registry,
+# Tool call latency buckets (taxonomy: tool_latency_seconds)
+_LATENCY_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.0,
+    5.0,
+    10.0,
 )
 
-# Tool call latency histogram (taxonomy: tool_latency_seconds)
-_tool_call_latency_seconds = Histogram(
-    "tool_latency_seconds",
-    "Tool execution latency distribution (seconds)",
-    labelnames=("tool",),
-    buckets=(
-        0.001,
-        0.005,
-        0.01,
-        0.025,
-        0.05,
-        0.1,
-        0.25,
-        0.5,
-        1.0,
-        2.0,
-        5.0,
-        10.0,
-    ),
-    registry=_registry,
-)
 
-# Backend health check metrics
-_backend_checks_total = Counter(
-    "backend_health_checks_total",
-    "Total backend health checks",
-    registry=_registry,
-)
-_backend_checks_success = Counter(
-    "backend_health_checks_success",
-    "Successful backend health checks",
-    registry=_registry,
-)
-_backend_checks_failure = Counter(
-    "backend_health_checks_failure",
-    "Failed backend health checks",
-    registry=_registry,
-)
-_backend_last_latency_ms = Gauge(
-    "backend_health_last_latency_ms",
-    "Last measured backend health latency (ms)",
-    registry=_registry,
-)
+class _Shard:
+    """Counters written by a single thread."""
+
+    __slots__ = (
+        "owner",
+        "writes",
+        "tool_total",
+        "tool_success",
+        "tool_failure",
+        "per_tool",
+        "latency",
+        "backend_total",
+        "backend_success",
+        "backend_failure",
+    )
+
+    def __init__(self, owner: threading.Thread | None = None) -> None:
+        self.owner = weakref.ref(owner) if owner is not None else None
+        self.writes = 0  # bumped by every update; drives the cache
+        self.tool_total = 0
+        self.tool_success = 0
+        self.tool_failure = 0
+        self.per_tool: dict[str, int] = {}
+        # tool -> per-bucket counts (last slot is +Inf) followed by the sum
+        self.latency: dict[str, list[float]] = {}
+        self.backend_total = 0
+        self.backend_success = 0
+        self.backend_failure = 0
+
+    def alive(self) -> bool:
+        owner = self.owner() if self.owner is not None else None
+        return owner is not None and owner.is_alive()
+
+    def merge(self, other: _Shard) -> None:
+        """Add ``other`` into this shard.
+
+        ``other`` may still be written by its owner; dict copies are taken
+        first so a concurrent insert cannot break the iteration.
+        """
+        self.writes += other.writes
+        self.tool_total += other.tool_total
+        self.tool_success += other.tool_success
+        self.tool_failure += other.tool_failure
+        self.backend_total += other.backend_total
+        self.backend_success += other.backend_success
+        self.backend_failure += other.backend_failure
+        for tool, count in list(other.per_tool.items()):
+            self.per_tool[tool] = self.per_tool.get(tool, 0) + count
+        for tool, values in list(other.latency.items()):
+            mine = self.latency.get(tool)
+            if mine is None:
+                self.latency[tool] = list(values)
+            else:
+                for i, value in enumerate(list(values)):
+                    mine[i] += value
+
+
+_local = threading.local()
+_shards: list[_Shard] = []
+_retired = _Shard()
+_shards_lock = threading.Lock()  # shard registration and merging only
+_backend_last_latency_ms = [0.0]  # single slot, set by any thread
+
+
+def _shard() -> _Shard:
+    """Shard of the calling thread (registered on first use)."""
+    try:
+        return _local.shard
+    except AttributeError:
+        shard = _Shard(threading.current_thread())
+        with _shards_lock:
+            _shards.append(shard)
+        _local.shard = shard
+        return shard
+
+
+def _live_shards() -> list[_Shard]:
+    """Retire shards of exited threads and return all shards to read."""
+    with _shards_lock:
+        live = []
+        for shard in _shards:
+            if shard.alive():
+                live.append(shard)
+            else:
+                _retired.merge(shard)
+        _shards[:] = live
+        return [_retired, *live]
+
+
+def _merged() -> _Shard:
+    total = _Shard()
+    for shard in _live_shards():
+        total.merge(shard)
+    return total
+
+
+def _generation() -> int:
+    """Number of updates so far; changes whenever any metric changed."""
+    return sum(shard.writes for shard in _live_shards())
+
+
+class _ShardCollector:
+    """Prometheus collector reading the merged shards at scrape time."""
+
+    def collect(self) -> Iterator[Metric]:
+        merged = _merged()
+        yield CounterMetricFamily(
+            "tool_calls_total",
+            "Total tool invocations",
+            value=merged.tool_total,
+        )
+        yield CounterMetricFamily(
+            "tool_calls_success",
+            "Successful tool invocations",
+            value=merged.tool_success,
+        )
+        yield CounterMetricFamily(
+            "tool_calls_failure",
+            "Failed tool invocations",
+            value=merged.tool_failure,
+        )
+        yield GaugeMetricFamily(
+            "tool_success_rate",
+            "Last computed tool success rate",
+            value=_success_rate(merged),
+        )
+        latency = HistogramMetricFamily(
+            "tool_latency_seconds",
+            "Tool execution latency distribution (seconds)",
+            labels=("tool",),
+        )
+        for tool, values in sorted(merged.latency.items()):
+            buckets = []
+            cumulative = 0.0
+            for bound, count in zip(
+                (*_LATENCY_BUCKETS, float("inf")), values, strict=False
+            ):
+                cumulative += count
+                buckets.append((floatToGoString(bound), cumulative))
+            latency.add_metric([tool], buckets, sum_value=values[-1])
+        yield latency
+        yield CounterMetricFamily(
+            "backend_health_checks_total",
+            "Total backend health checks",
+            value=merged.backend_total,
+        )
+        yield CounterMetricFamily(
+            "backend_health_checks_success",
+            "Successful backend health checks",
+            value=merged.backend_success,
+        )
+        yield CounterMetricFamily(
+            "backend_health_checks_failure",
+            "Failed backend health checks",
+            value=merged.backend_failure,
+        )
+        yield GaugeMetricFamily(
+            "backend_health_last_latency_ms",
+            "Last measured backend health latency (ms)",
+            value=_backend_last_latency_ms[0],
+        )
+
+
+_registry = CollectorRegistry()
+_registry.register(_ShardCollector())
 
 # Cost and usage metrics (taxonomy: model_tokens_total, model_cost_usd_total)
 _model_tokens_total = Counter(
@@ -114,20 +245,27 @@ _model_inference_duration_seconds = Histogram(
     registry=_registry,
 )
 
+_exposition_lock = threading.Lock()
+# (generation, monotonic render time, payload) of the last render
+_exposition_cache: list[tuple[int, float, bytes]] = []
+
+
+def _success_rate(shard: _Shard) -> float:
+    if shard.tool_total:
+        return shard.tool_success / shard.tool_total
+    return 0.0
+
 
 def incr(tool_name: str, success: bool) -> None:
-    with _lock:
-        _counters["tool_calls_total"] += 1
-        if success:
-            _counters["tool_calls_success"] += 1
-        else:
-            _counters["tool_calls_failure"] += 1
-        _per_tool[tool_name] = _per_tool.get(tool_name, 0) + 1
-        _tool_calls_total.inc()
-        if success:
-            _tool_calls_success.inc()
-        else:
-            _tool_calls_failure.inc()
+    shard = _shard()
+    shard.tool_total += 1
+    if success:
+        shard.tool_success += 1
+    else:
+        shard.tool_failure += 1
+    per_tool = shard.per_tool
+    per_tool[tool_name] = per_tool.get(tool_name, 0) + 1
+    shard.writes += 1
 
 
 def record_tool_latency(tool_name: str, duration_seconds: float) -> None:
@@ -140,46 +278,66 @@ def record_tool_latency(tool_name: str, duration_seconds: float) -> None:
     try:
         if duration_seconds < 0:
             return
-        _tool_call_latency_seconds.labels(tool=tool_name).observe(
-            duration_seconds
-        )
+        shard = _shard()
+        values = shard.latency.get(tool_name)
+        if values is None:
+            values = [0.0] * (len(_LATENCY_BUCKETS) + 2)
+            shard.latency[tool_name] = values
+        values[bisect_left(_LATENCY_BUCKETS, duration_seconds)] += 1
+        values[-1] += duration_seconds
+        shard.writes += 1
     except Exception:  # noqa: BLE001
         # Defensive: never raise from metrics path
         pass
 
 
 def snapshot() -> dict[str, object]:  # noqa: ANN401
-    with _lock:
-        if _counters["tool_calls_total"]:
-            success_rate = (
-                _counters["tool_calls_success"] / _counters["tool_calls_total"]
-            )
-        else:
-            success_rate = 0.0
-        _tool_last_success_rate.set(success_rate)
-        elapsed = max(0.0, time.time() - _process_start_time)
-        return {
-            **_counters,
-            "per_tool": dict(sorted(_per_tool.items())),
-            "success_rate": success_rate,
-            "uptime_seconds": elapsed,
-        }
-
-
-def prometheus_exposition() -> bytes:
-    """Return Prometheus metrics payload."""
-    return generate_latest(_registry)
+    merged = _merged()
+    elapsed = max(0.0, time.time() - _process_start_time)
+    return {
+        "tool_calls_total": merged.tool_total,
+        "tool_calls_success": merged.tool_success,
+        "tool_calls_failure": merged.tool_failure,
+        "per_tool": dict(sorted(merged.per_tool.items())),
+        "success_rate": _success_rate(merged),
+        "uptime_seconds": elapsed,
+    }
+
+
+def prometheus_exposition(max_age: float | None = 0.0) -> bytes:
+    """Return Prometheus metrics payload.
+
+    The cached payload is reused while no metric changed. ``max_age``
+    additionally allows serving a payload up to that many seconds old
+    (``None`` uses ``METRICS_EXPOSITION_MAX_AGE``), which bounds rendering
+    to once per scrape interval.
+    """
+    if max_age is None:
+        max_age = _EXPOSITION_MAX_AGE
+    with _exposition_lock:
+        generation = _generation()
+        now = time.monotonic()
+        if _exposition_cache:
+            cached_generation, rendered_at, payload = _exposition_cache[0]
+            if cached_generation == generation or (
+                now - rendered_at < max_age
+            ):
+                return payload
+        payload = generate_latest(_registry)
+        _exposition_cache[:] = [(generation, now, payload)]
+        return payload
 
 
 def record_backend_health(success: bool, latency_ms: int | None) -> None:
-    with _lock:
-        _backend_checks_total.inc()
-        if success:
-            _backend_checks_success.inc()
-        else:
-            _backend_checks_failure.inc()
-        if latency_ms is not None:
-            _backend_last_latency_ms.set(latency_ms)
+    shard = _shard()
+    shard.backend_total += 1
+    if success:
+        shard.backend_success += 1
+    else:
+        shard.backend_failure += 1
+    if latency_ms is not None:
+        _backend_last_latency_ms[0] = float(latency_ms)
+    shard.writes += 1
 
 
 def performance_summary() -> dict[str, object]:  # noqa: ANN401
@@ -207,12 +365,8 @@ def performance_summary() -> dict[str, object]:  # noqa: ANN401
     calls_total = _safe_int(snap.get("tool_calls_total", 0))
     success = _safe_int(snap.get("tool_calls_success", 0))
     failure = _safe_int(snap.get("tool_calls_failure", 0))
-    # Backend total: derive from success + failure counters (public API)
-    backend_total = _safe_int(
-        _backend_checks_success._value.get()
-    ) + _safe_int(  # noqa: SLF001
-        _backend_checks_failure._value.get()
-    )  # noqa: SLF001
+    merged = _merged()
+    backend_total = merged.backend_success + merged.backend_failure
     return {
         "uptime_seconds": uptime,
         "tool_calls_per_sec": calls_total / uptime,
@@ -254,6 +408,7 @@ def record_model_usage(
     _model_inference_duration_seconds.labels(model=model).observe(
         duration_seconds
     )
+    _shard().writes += 1
 
 
 __all__ = [
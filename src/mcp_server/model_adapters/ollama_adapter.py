@@ -12,6 +12,14 @@ class OllamaAdapter(ModelAdapter):
         super().__init__(name=f"ollama:{model}")
         self._model = model
         self._client = safe_import("ollama")
+        self._async_client: Any = None
+
+    @staticmethod
+    def _options(kwargs: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "temperature": float(kwargs.get("temperature", 0.7)),
+            "num_predict": int(kwargs.get("max_tokens", 256)),
+        }
 
     def generate(self, prompt: str, **kwargs: Any) -> str:  # noqa: ANN401
         if not self._client:
@@ -20,10 +28,25 @@ class OllamaAdapter(ModelAdapter):
             response = self._client.generate(  # noqa: E501
                 model=self._model,
                 prompt=prompt,
-                options={
-                    "temperature": float(kwargs.get("temperature", 0.7)),
-                    "num_predict": int(kwargs.get("max_tokens", 256)),
-                },
+                options=self._options(kwargs),
+            )
+            return str(response.get("response", ""))
+        except Exception as exc:  # noqa: BLE001
+            raise AdapterError(str(exc)) from exc
+
+    async def agenerate(
+        self, prompt: str, **kwargs: Any
+    ) -> str:  # noqa: ANN401
+        """Native async generation; no worker thread per call."""
+        if not self._client:
+            raise AdapterError("ollama package not available")
+        if self._async_client is None:
+            self._async_client = self._client.AsyncClient()
+        try:
+            response = await self._async_client.generate(
+                model=self._model,
+                prompt=prompt,
+                options=self._options(kwargs),
             )
             return str(response.get("response", ""))
         except Exception as exc:  # noqa: BLE001
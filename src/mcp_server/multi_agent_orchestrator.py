@@ -1,11 +1,23 @@
 """Multi-agent orchestration engine for dual-model reasoning workflows.
 
 Implements Strategy → Critic → Synthesizer → Verifier pattern.
+
+Agents are nodes in an execution graph: each declares the agents whose
+output it consumes, and agents without pending dependencies run
+concurrently. Calls are capped per adapter, async-capable adapters
+(``agenerate`` or a coroutine ``generate``) are awaited directly, and
+blocking adapters run in a worker thread.
 """
 
 from __future__ import annotations
 
 import asyncio
+import inspect
+import math
+import re
+from collections import deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
 from typing import Any
 
 
@@ -19,21 +31,149 @@ class AgentRole:
     SAFETY_GUARDIAN = "safety_guardian"
 
 
+@dataclass(frozen=True)
+class AgentNode:
+    """An agent in the execution graph.
+
+    Attributes:
+        name: Unique node name (keys the output)
+        role: Agent role identifier
+        system_prompt: Role-specific system prompt
+        depends_on: Nodes whose output this agent reads, in history order
+        adapter: Model adapter for this agent (None = orchestrator default)
+    """
+
+    name: str
+    role: str
+    system_prompt: str
+    depends_on: tuple[str, ...] = ()
+    adapter: Any = None
+
+
+@dataclass
+class GraphRun:
+    """Outputs of an agent graph execution."""
+
+    outputs: dict[str, dict[str, Any]] = field(default_factory=dict)
+    cancelled: list[str] = field(default_factory=list)  # stopped in flight
+    skipped: list[str] = field(default_factory=list)  # never started
+
+
+DEFAULT_AGENT_GRAPH: tuple[AgentNode, ...] = (
+    AgentNode(
+        "strategy",
+        AgentRole.STRATEGIST,
+        "You are a strategic planner. Break down the problem and outline approach.",
+    ),
+    AgentNode(
+        "critique",
+        AgentRole.CRITIC,
+        "You are a critical evaluator. Identify flaws, edge cases, and risks.",
+        depends_on=("strategy",),
+    ),
+    AgentNode(
+        "synthesis",
+        AgentRole.SYNTHESIZER,
+        "You are a synthesizer. Merge strategy and critique into coherent solution.",
+        depends_on=("strategy", "critique"),
+    ),
+)
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def text_similarity(a: str, b: str) -> float:
+    """Jaccard similarity of the word sets of two texts."""
+    words_a = set(_WORD_RE.findall(a.lower()))
+    words_b = set(_WORD_RE.findall(b.lower()))
+    if not words_a and not words_b:
+        return 1.0
+    return len(words_a & words_b) / len(words_a | words_b)
+
+
+def validate_graph(agents: Sequence[AgentNode]) -> None:
+    """Reject duplicate names, unknown dependencies and cycles.
+
+    Raises:
+        ValueError: If the graph is not a valid DAG
+    """
+    names = [agent.name for agent in agents]
+    if len(set(names)) != len(names):
+        raise ValueError("Agent names must be unique")
+    known = set(names)
+    for agent in agents:
+        missing = set(agent.depends_on) - known
+        if missing:
+            raise ValueError(
+                f"Agent {agent.name!r} depends on unknown {sorted(missing)}"
+            )
+
+    remaining = {agent.name: set(agent.depends_on) for agent in agents}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Agent graph has a cycle: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+
 class MultiAgentOrchestrator:
     """Orchestrates multi-agent reasoning workflow."""
 
-    def __init__(self, model_adapter: Any, arbitration_engine: Any):
+    def __init__(
+        self,
+        model_adapter: Any,
+        arbitration_engine: Any,
+        agent_graph: Sequence[AgentNode] | None = None,
+        max_concurrent_per_adapter: int = 2,
+    ):
         """Initialize orchestrator.
 
         Args:
             model_adapter: Model backend adapter
             arbitration_engine: Arbitration engine for output selection
+            agent_graph: Agents run before arbitration; must contain a
+                ``strategy`` and a ``synthesis`` node (defaults to
+                strategy → critique → synthesis)
+            max_concurrent_per_adapter: In-flight calls allowed per adapter
+                (an adapter's own ``max_concurrency`` attribute wins)
         """
         self.adapter = model_adapter
         self.arbitrator = arbitration_engine
+        self.agent_graph = tuple(agent_graph or DEFAULT_AGENT_GRAPH)
+        validate_graph(self.agent_graph)
+        self.max_concurrent_per_adapter = max(1, max_concurrent_per_adapter)
+        self._adapter_slots: dict[int, asyncio.Semaphore] = {}
+
+    def _adapter_slot(self, adapter: Any) -> asyncio.Semaphore:
+        """Concurrency cap shared by all agents using one adapter."""
+        slot = self._adapter_slots.get(id(adapter))
+        if slot is None:
+            limit = getattr(adapter, "max_concurrency", None)
+            if not isinstance(limit, int) or limit < 1:
+                limit = self.max_concurrent_per_adapter
+            slot = asyncio.Semaphore(limit)
+            self._adapter_slots[id(adapter)] = slot
+        return slot
+
+    async def _generate(self, adapter: Any, prompt: str) -> str:
+        """Call an adapter, natively if it is async-capable."""
+        async with self._adapter_slot(adapter):
+            agenerate = getattr(adapter, "agenerate", None)
+            if inspect.iscoroutinefunction(agenerate):
+                return await agenerate(prompt=prompt)
+            if inspect.iscoroutinefunction(adapter.generate):
+                return await adapter.generate(prompt=prompt)
+            return await asyncio.to_thread(adapter.generate, prompt=prompt)
 
     async def _invoke_agent(
-        self, role: str, context: dict[str, Any], system_prompt: str
+        self,
+        role: str,
+        context: dict[str, Any],
+        system_prompt: str,
+        adapter: Any = None,
     ) -> dict[str, Any]:
         """Invoke single agent with role-specific prompt.
 
@@ -41,6 +181,7 @@ class MultiAgentOrchestrator:
             role: Agent role identifier
             context: Current conversation context
             system_prompt: Role-specific system prompt
+            adapter: Adapter to use (defaults to the orchestrator's)
 
         Returns:
             Agent output with text and metadata
@@ -55,8 +196,8 @@ class MultiAgentOrchestrator:
             messages.extend(context["history"])
 
         # Generate response
-        response = await asyncio.to_thread(
-            self.adapter.generate, prompt=str(messages)
+        response = await self._generate(
+            adapter if adapter is not None else self.adapter, str(messages)
         )
 
         return {
@@ -65,6 +206,142 @@ class MultiAgentOrchestrator:
             "safety_score": 1.0,  # Placeholder
         }
 
+    async def run_graph(
+        self,
+        user_query: str,
+        agents: Sequence[AgentNode] | None = None,
+        stop_when: Callable[[dict[str, dict[str, Any]]], bool] | None = None,
+    ) -> GraphRun:
+        """Run agents as soon as their dependencies have finished.
+
+        Args:
+            user_query: User input
+            agents: Agent graph (defaults to the orchestrator's graph)
+            stop_when: Checked after each completion; returning True
+                cancels agents still running and skips the rest
+
+        Returns:
+            GraphRun with outputs by node name
+
+        Raises:
+            ValueError: If the graph is invalid
+            Exception: The first agent failure (other agents are cancelled)
+        """
+        agents = tuple(agents or self.agent_graph)
+        validate_graph(agents)
+        by_name = {agent.name: agent for agent in agents}
+        waiting_on = {agent.name: set(agent.depends_on) for agent in agents}
+        dependents: dict[str, list[str]] = {name: [] for name in by_name}
+        for agent in agents:
+            for dependency in agent.depends_on:
+                dependents[dependency].append(agent.name)
+
+        run = GraphRun()
+        ready = deque(name for name, deps in waiting_on.items() if not deps)
+        started: set[str] = set()
+        in_flight: dict[asyncio.Task, str] = {}
+
+        def start(agent: AgentNode) -> None:
+            context = {
+                "user_query": user_query,
+                "history": [
+                    {
+                        "role": "assistant",
+                        "content": run.outputs[dependency]["text"],
+                    }
+                    for dependency in agent.depends_on
+                ],
+            }
+            task = asyncio.create_task(
+                self._invoke_agent(
+                    agent.role, context, agent.system_prompt, agent.adapter
+                )
+            )
+            in_flight[task] = agent.name
+            started.add(agent.name)
+
+        try:
+            while ready or in_flight:
+                while ready:
+                    start(by_name[ready.popleft()])
+
+                done, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    name = in_flight.pop(task)
+                    run.outputs[name] = task.result()
+                    for dependent in dependents[name]:
+                        waiting_on[dependent].discard(name)
+                        if not waiting_on[dependent]:
+                            ready.append(dependent)
+
+                if stop_when is not None and stop_when(run.outputs):
+                    break
+        finally:
+            for task, name in in_flight.items():
+                task.cancel()
+                run.cancelled.append(name)
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+        run.skipped = [name for name in by_name if name not in started]
+        return run
+
+    async def run_consensus(
+        self,
+        user_query: str,
+        agents: Sequence[AgentNode],
+        threshold: float = 0.6,
+        min_similarity: float = 0.8,
+        similarity: Callable[[str, str], float] = text_similarity,
+    ) -> dict[str, Any]:
+        """Fan out independent agents and stop once enough of them agree.
+
+        As soon as a group of mutually similar answers reaches
+        ``ceil(threshold * len(agents))``, agents still running are
+        cancelled (a blocking adapter call finishes in its worker thread,
+        but its result is discarded).
+
+        Args:
+            user_query: User input
+            agents: Agents answering the same query
+            threshold: Fraction of agents that must agree
+            min_similarity: Similarity at which two answers agree
+            similarity: Text similarity function in [0, 1]
+
+        Returns:
+            Consensus flag, representative text, supporting and cancelled
+            agents, and every output received
+        """
+        quorum = max(1, math.ceil(threshold * len(agents)))
+        winner: list[str] = []
+
+        def agreeing(outputs: dict[str, dict[str, Any]]) -> bool:
+            names = list(outputs)
+            for name in names:
+                group = [
+                    other
+                    for other in names
+                    if similarity(
+                        outputs[name]["text"], outputs[other]["text"]
+                    )
+                    >= min_similarity
+                ]
+                if len(group) >= quorum:
+                    winner[:] = group
+                    return True
+            return False
+
+        run = await self.run_graph(user_query, agents, stop_when=agreeing)
+        return {
+            "consensus": bool(winner),
+            "text": run.outputs[winner[0]]["text"] if winner else None,
+            "supporters": winner,
+            "cancelled": run.cancelled + run.skipped,
+            "outputs": run.outputs,
+        }
+
     async def orchestrate(
         self, user_query: str, confidence_threshold: float = 0.7
     ) -> dict[str, Any]:
@@ -77,34 +354,11 @@ class MultiAgentOrchestrator:
         Returns:
             Final output with provenance trace
         """
-        context: dict[str, Any] = {"user_query": user_query, "history": []}
-
-        # Phase 1: Strategy Agent
-        strategy_output = await self._invoke_agent(
-            AgentRole.STRATEGIST,
-            context,
-            "You are a strategic planner. Break down the problem and outline approach.",
-        )
-        context["history"].append(
-            {"role": "assistant", "content": strategy_output["text"]}
-        )
-
-        # Phase 2: Critic Agent challenges
-        critic_output = await self._invoke_agent(
-            AgentRole.CRITIC,
-            context,
-            "You are a critical evaluator. Identify flaws, edge cases, and risks.",
-        )
-        context["history"].append(
-            {"role": "assistant", "content": critic_output["text"]}
-        )
-
-        # Phase 3: Synthesizer merges insights
-        synthesizer_output = await self._invoke_agent(
-            AgentRole.SYNTHESIZER,
-            context,
-            "You are a synthesizer. Merge strategy and critique into coherent solution.",
-        )
+        # Phases 1-3: Strategy, Critic and Synthesizer per the agent graph
+        run = await self.run_graph(user_query)
+        strategy_output = run.outputs["strategy"]
+        synthesizer_output = run.outputs["synthesis"]
+        critic_output = run.outputs.get("critique", {"text": ""})
 
         # Phase 4: Arbitrate between strategy and synthesizer
         arbitration = await self.arbitrator.arbitrate(
@@ -118,9 +372,14 @@ class MultiAgentOrchestrator:
 
         # Phase 5: Verifier (optional if low confidence)
         if composite_score < confidence_threshold:
-            context["history"].append(
-                {"role": "assistant", "content": selected["text"]}
-            )
+            context: dict[str, Any] = {
+                "user_query": user_query,
+                "history": [
+                    {"role": "assistant", "content": strategy_output["text"]},
+                    {"role": "assistant", "content": critic_output["text"]},
+                    {"role": "assistant", "content": selected["text"]},
+                ],
+            }
             verifier_output = await self._invoke_agent(
                 AgentRole.VERIFIER,
                 context,
@@ -143,4 +402,12 @@ class MultiAgentOrchestrator:
         }
 
 
-__all__ = ["MultiAgentOrchestrator", "AgentRole"]
+__all__ = [
+    "MultiAgentOrchestrator",
+    "AgentRole",
+    "AgentNode",
+    "GraphRun",
+    "DEFAULT_AGENT_GRAPH",
+    "text_similarity",
+    "validate_graph",
+]
@@ -8,10 +8,10 @@ Writes line-delimited JSON records to `logs/provenance.jsonl` capturing:
   * duration_ms (tools only)
   * metadata (flattened arguments / episode metadata)
 
-This lightweight module avoids external dependencies and keeps write path
-simple. Call `log_tool_invocation` from the MCP dispatch layer after each
-tool execution and `log_episode` from training orchestration when episodes
-start or complete.
+Records go through the shared batched audit writer, so callers never
+block on file I/O. Call `log_tool_invocation` from the MCP dispatch layer
+after each tool execution and `log_episode` from training orchestration
+when episodes start or complete.
 """
 
 from __future__ import annotations
@@ -22,6 +22,8 @@ import time
 from pathlib import Path
 from typing import Any
 
+from .security.audit_writer import get_audit_writer
+
 _PROVENANCE_PATH = Path(
     os.getenv("PROVENANCE_LOG_PATH", "logs/provenance.jsonl")
 )
@@ -37,9 +39,7 @@ def _safe_json(value: Any) -> Any:
 
 
 def _append(record: dict[str, Any]) -> None:
-    line = json.dumps(record, ensure_ascii=False)
-    with _PROVENANCE_PATH.open("a", encoding="utf-8") as handle:
-        handle.write(line + "\n")
+    get_audit_writer(_PROVENANCE_PATH).append(record)
 
 
 def log_tool_invocation(
@@ -48,12 +48,13 @@ def log_tool_invocation(
     success: bool,
     duration_ms: float,
     result: dict[str, Any] | None = None,
+    ts: float | None = None,
 ) -> None:
     rec_meta = None
     if isinstance(result, dict) and "summary" in result:
         rec_meta = _safe_json(result.get("summary"))
     record = {
-        "ts": time.time(),
+        "ts": time.time() if ts is None else ts,
         "kind": "tool",
         "name": name,
         "success": success,
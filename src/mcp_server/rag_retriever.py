@@ -2,12 +2,236 @@
 
 Integrates vector database for knowledge retrieval with adaptive
 summarization when approaching token limits.
+
+Retrieved chunks are packed into the token budget by ``ContextPacker``:
+token counts come from the target model's tokenizer (cached per chunk),
+near-duplicate chunks are merged into the best-scoring copy, and the
+chunks kept are the best fill of the budget by total score (a 0/1
+knapsack on token counts, at bounded resolution). Leftover budget is
+filled with a truncated chunk.
 """
 
 from __future__ import annotations
 
+import logging
+import re
+from collections import OrderedDict
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"\w+")
+_DP_RESOLUTION = 1024  # max budget slots in the knapsack table
+
+
+def _load_tokenizer(model_name: str) -> Any:
+    """Load a Hugging Face tokenizer by name (None if unavailable)."""
+    try:
+        from transformers import AutoTokenizer
+    except ImportError:
+        logger.warning(
+            "transformers not installed; estimating tokens for %s",
+            model_name,
+        )
+        return None
+    try:
+        return AutoTokenizer.from_pretrained(model_name)
+    except Exception as exc:  # noqa: BLE001 - fall back to estimates
+        logger.warning("Tokenizer %s unavailable: %s", model_name, exc)
+        return None
+
+
+def _shingles(text: str, size: int = 3) -> frozenset[tuple[str, ...]]:
+    words = _WORD.findall(text.lower())
+    if len(words) < size:
+        return frozenset([tuple(words)])
+    return frozenset(
+        tuple(words[i : i + size]) for i in range(len(words) - size + 1)
+    )
+
+
+class ContextPacker:
+    """Selects retrieved chunks that best fill a token budget."""
+
+    def __init__(
+        self,
+        tokenizer: Any = None,
+        dedup_threshold: float = 0.9,
+        min_truncated_tokens: int = 50,
+        cache_size: int = 4096,
+    ):
+        """Initialize context packer.
+
+        Args:
+            tokenizer: Target model tokenizer: an object with ``encode``
+                (and ``decode`` for exact truncation), a callable returning
+                a token count, or a Hugging Face model name. Defaults to
+                estimating 4 characters per token.
+            dedup_threshold: Shingle similarity at or above which a chunk
+                is merged into a better-scoring one (> 1 disables)
+            min_truncated_tokens: Smallest truncated chunk worth adding
+            cache_size: Token counts remembered per chunk text
+        """
+        if isinstance(tokenizer, str):
+            tokenizer = _load_tokenizer(tokenizer)
+        self.tokenizer = tokenizer
+        self.dedup_threshold = dedup_threshold
+        self.min_truncated_tokens = min_truncated_tokens
+        self.cache_size = cache_size
+        self._token_cache: OrderedDict[str, int] = OrderedDict()
+
+    def count_tokens(self, text: str) -> int:
+        """Token count of ``text`` for the target model (cached)."""
+        cache = self._token_cache
+        count = cache.get(text)
+        if count is not None:
+            cache.move_to_end(text)
+            return count
+        tokenizer = self.tokenizer
+        if tokenizer is None:
+            count = (len(text) + 3) // 4
+        elif hasattr(tokenizer, "encode"):
+            count = len(tokenizer.encode(text))
+        else:
+            count = int(tokenizer(text))
+        cache[text] = count
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return count
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Longest prefix of ``text`` within ``max_tokens``."""
+        tokenizer = self.tokenizer
+        if hasattr(tokenizer, "encode") and hasattr(tokenizer, "decode"):
+            return tokenizer.decode(tokenizer.encode(text)[:max_tokens])
+        # Estimate, cut at a word boundary, then shrink until it fits
+        prefix = text[: max_tokens * 4]
+        if len(prefix) < len(text) and " " in prefix:
+            prefix = prefix.rsplit(" ", 1)[0]
+        while prefix and self.count_tokens(prefix) > max_tokens:
+            prefix = prefix[: int(len(prefix) * 0.9)]
+        return prefix
+
+    def _dedupe(self, chunks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Merge near-duplicates into the best-scoring copy."""
+        if self.dedup_threshold > 1:
+            return chunks
+        kept: list[tuple[dict[str, Any], frozenset]] = []
+        for chunk in sorted(chunks, key=lambda c: c["score"], reverse=True):
+            shingles = _shingles(chunk["text"])
+            for other, other_shingles in kept:
+                union = len(shingles | other_shingles)
+                overlap = (
+                    len(shingles & other_shingles) / union if union else 1
+                )
+                if overlap >= self.dedup_threshold:
+                    other["duplicates"] += 1
+                    break
+            else:
+                kept.append((chunk, shingles))
+        return [chunk for chunk, _ in kept]
+
+    @staticmethod
+    def _best_fill(
+        items: list[tuple[int, float]], budget: int
+    ) -> tuple[list[int], float]:
+        """0/1 knapsack over (tokens, value); returns indices and value.
+
+        Token counts are scaled so the table has at most
+        ``_DP_RESOLUTION`` columns, rounding up so the pick always fits.
+        """
+        if budget <= 0:
+            return [], 0.0
+        scale = max(1, -(-budget // _DP_RESOLUTION))
+        capacity = budget // scale
+        best = [0.0] * (capacity + 1)
+        taken: list[bytearray] = []
+        for tokens, value in items:
+            weight = -(-tokens // scale)
+            row = bytearray(capacity + 1)
+            for slot in range(capacity, weight - 1, -1):
+                candidate = best[slot - weight] + value
+                if candidate > best[slot]:
+                    best[slot] = candidate
+                    row[slot] = 1
+            taken.append(row)
+        picked = []
+        slot = capacity
+        for index in range(len(items) - 1, -1, -1):
+            if taken[index][slot]:
+                picked.append(index)
+                slot -= -(-items[index][0] // scale)
+        return picked, best[capacity]
+
+    def pack(
+        self, results: list[dict[str, Any]], budget: int
+    ) -> dict[str, Any]:
+        """Choose chunks from search results for a token budget.
+
+        Args:
+            results: Search results with ``text``, ``score``, ``metadata``
+            budget: Token budget for retrieved context
+
+        Returns:
+            Chunks (highest score first) and the tokens they use
+        """
+        chunks = self._dedupe(
+            [
+                {
+                    "text": result.get("text", ""),
+                    "score": result.get("score", 0.0),
+                    "metadata": result.get("metadata", {}),
+                    "truncated": False,
+                    "duplicates": 0,
+                }
+                for result in results
+            ]
+        )
+        for chunk in chunks:
+            chunk["tokens"] = self.count_tokens(chunk["text"])
+
+        fitting = [c for c in chunks if 0 < c["tokens"] <= budget]
+        items = [(c["tokens"], max(c["score"], 0.0)) for c in fitting]
+        picked, value = self._best_fill(items, budget)
+        # Density greedy on exact counts can beat the rounded table
+        greedy, greedy_value, used = [], 0.0, 0
+        for index in sorted(
+            range(len(items)),
+            key=lambda i: items[i][1] / items[i][0],
+            reverse=True,
+        ):
+            if used + items[index][0] <= budget:
+                greedy.append(index)
+                greedy_value += items[index][1]
+                used += items[index][0]
+        if greedy_value > value:
+            picked = greedy
+        selected = [fitting[i] for i in sorted(picked)]
+        total = sum(c["tokens"] for c in selected)
+
+        # Fill what is left with the best remaining chunk, truncated
+        remaining = budget - total
+        if remaining >= self.min_truncated_tokens:
+            chosen = {id(c) for c in selected}
+            leftovers = [c for c in chunks if id(c) not in chosen]
+            if leftovers:
+                best = max(leftovers, key=lambda c: c["score"])
+                text = self.truncate(best["text"], remaining)
+                tokens = self.count_tokens(text)
+                if self.min_truncated_tokens <= tokens <= remaining:
+                    selected.append(
+                        {
+                            **best,
+                            "text": text,
+                            "tokens": tokens,
+                            "truncated": True,
+                        }
+                    )
+                    total += tokens
+
+        selected.sort(key=lambda c: c["score"], reverse=True)
+        return {"chunks": selected, "total_tokens": total}
+
 
 class RAGRetriever:
     """Retrieval-Augmented Generation pipeline."""
@@ -18,6 +242,9 @@ class RAGRetriever:
         embedding_fn: Any,
         top_k: int = 5,
         retrieval_budget_fraction: float = 0.25,
+        *,
+        tokenizer: Any = None,
+        dedup_threshold: float = 0.9,
     ):
         """Initialize RAG retriever.
 
@@ -26,11 +253,16 @@ class RAGRetriever:
             embedding_fn: Function to generate embeddings
             top_k: Number of chunks to retrieve
             retrieval_budget_fraction: Max fraction of token budget for retrieval
+            tokenizer: Target model tokenizer (see ``ContextPacker``)
+            dedup_threshold: Similarity for merging near-duplicate chunks
         """
         self.vector_db = vector_db
         self.embedding_fn = embedding_fn
         self.top_k = top_k
         self.retrieval_budget_fraction = retrieval_budget_fraction
+        self.packer = ContextPacker(
+            tokenizer=tokenizer, dedup_threshold=dedup_threshold
+        )
 
     async def retrieve(self, query: str, max_tokens: int) -> dict[str, Any]:
         """Retrieve relevant context for query.
@@ -53,38 +285,10 @@ class RAGRetriever:
         # Compute token budget for retrieval
         retrieval_budget = int(max_tokens * self.retrieval_budget_fraction)
 
-        # Compress if needed
-        chunks = []
-        token_count = 0
-        for result in results:
-            chunk_text = result.get("text", "")
-            chunk_tokens = len(chunk_text.split())  # Rough estimate
-            if token_count + chunk_tokens > retrieval_budget:
-                # Truncate or skip
-                remaining = retrieval_budget - token_count
-                if remaining > 50:
-                    chunks.append(
-                        {
-                            "text": " ".join(chunk_text.split()[:remaining]),
-                            "score": result.get("score", 0.0),
-                            "metadata": result.get("metadata", {}),
-                            "truncated": True,
-                        }
-                    )
-                break
-            chunks.append(
-                {
-                    "text": chunk_text,
-                    "score": result.get("score", 0.0),
-                    "metadata": result.get("metadata", {}),
-                    "truncated": False,
-                }
-            )
-            token_count += chunk_tokens
-
+        packed = self.packer.pack(results, retrieval_budget)
         return {
-            "chunks": chunks,
-            "total_tokens": token_count,
+            "chunks": packed["chunks"],
+            "total_tokens": packed["total_tokens"],
             "budget": retrieval_budget,
         }
 
@@ -126,4 +330,4 @@ class MockVectorDB:
         ]
 
 
-__all__ = ["RAGRetriever", "MockVectorDB"]
+__all__ = ["RAGRetriever", "ContextPacker", "MockVectorDB"]
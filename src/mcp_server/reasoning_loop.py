@@ -10,12 +10,21 @@ This module captures the complete reasoning journey:
 5. Lessons Learned
 
 All data is fed back to KIRO_MCP for continuous learning.
+
+Completed cycles, their learning data, patterns and optimizations are kept
+in one SQLite database (``reasoning_loop.db`` under the data path) with
+running totals, so cycle statistics do not depend on how many cycles have
+been recorded.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -68,13 +77,304 @@ class ProblemSolutionCycle:
     workspace: str
 
 
+class ReasoningCycleStore:
+    """SQLite store for completed cycles with running aggregates.
+
+    Tables:
+    - cycles: one row per cycle (full cycle and learning data as JSON)
+    - patterns / optimizations: one row per entry, indexed for lookups
+    - cycle_stats: single row of totals updated with every insert
+
+    The totals are also held in memory, so ``stats()`` never touches the
+    database.
+    """
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS cycles (
+            cycle_id TEXT PRIMARY KEY,
+            category TEXT NOT NULL,
+            timestamp_start TEXT NOT NULL,
+            timestamp_end TEXT,
+            success INTEGER NOT NULL,
+            reasoning_steps INTEGER NOT NULL,
+            solution_attempts INTEGER NOT NULL,
+            lessons INTEGER NOT NULL,
+            data TEXT NOT NULL,
+            learning TEXT
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_cycles_category
+        ON cycles(category, timestamp_end DESC)
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS patterns (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cycle_id TEXT NOT NULL,
+            category TEXT NOT NULL,
+            pattern TEXT NOT NULL,
+            timestamp TEXT NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_patterns_text ON patterns(pattern)",
+        """
+        CREATE INDEX IF NOT EXISTS idx_patterns_category
+        ON patterns(category, timestamp DESC)
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS optimizations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cycle_id TEXT NOT NULL,
+            category TEXT NOT NULL,
+            optimization TEXT NOT NULL,
+            timestamp TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_optimizations_text
+        ON optimizations(optimization)
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_optimizations_category
+        ON optimizations(category, timestamp DESC)
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS cycle_stats (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            total_cycles INTEGER NOT NULL DEFAULT 0,
+            successful_cycles INTEGER NOT NULL DEFAULT 0,
+            total_reasoning_steps INTEGER NOT NULL DEFAULT 0,
+            total_lessons INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        "INSERT OR IGNORE INTO cycle_stats (id) VALUES (1)",
+    )
+    _TOTALS = (
+        "total_cycles",
+        "successful_cycles",
+        "total_reasoning_steps",
+        "total_lessons",
+    )
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._get_connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in self._SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+            row = conn.execute(
+                "SELECT total_cycles, successful_cycles, "
+                "total_reasoning_steps, total_lessons "
+                "FROM cycle_stats WHERE id = 1"
+            ).fetchone()
+        self._totals = dict(zip(self._TOTALS, row, strict=True))
+
+    @contextmanager
+    def _get_connection(self) -> Iterator[sqlite3.Connection]:
+        """Get a database connection with context management."""
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def add_cycle(
+        self,
+        cycle: dict[str, Any],
+        learning_data: dict[str, Any] | None = None,
+    ) -> bool:
+        """Store a completed cycle and update the totals.
+
+        Returns:
+            False if a cycle with the same id was already stored
+        """
+        cycle_id = cycle["cycle_id"]
+        category = cycle.get("problem_category", "general")
+        timestamp = cycle.get("timestamp_end") or cycle["timestamp_start"]
+        success = bool(cycle.get("solution_success"))
+        steps = len(cycle.get("reasoning_steps", []))
+        lessons = len(cycle.get("lessons_learned", []))
+        with self._lock, self._get_connection() as conn:
+            inserted = conn.execute(
+                """
+                INSERT OR IGNORE INTO cycles (
+                    cycle_id, category, timestamp_start, timestamp_end,
+                    success, reasoning_steps, solution_attempts, lessons,
+                    data, learning
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    cycle_id,
+                    category,
+                    cycle["timestamp_start"],
+                    cycle.get("timestamp_end"),
+                    int(success),
+                    steps,
+                    len(cycle.get("solution_attempts", [])),
+                    lessons,
+                    json.dumps(cycle),
+                    json.dumps(learning_data) if learning_data else None,
+                ),
+            ).rowcount
+            if not inserted:
+                return False
+            conn.executemany(
+                "INSERT INTO patterns (cycle_id, category, pattern, "
+                "timestamp) VALUES (?, ?, ?, ?)",
+                [
+                    (cycle_id, category, pattern, timestamp)
+                    for pattern in cycle.get("patterns_discovered", [])
+                ],
+            )
+            conn.executemany(
+                "INSERT INTO optimizations (cycle_id, category, "
+                "optimization, timestamp) VALUES (?, ?, ?, ?)",
+                [
+                    (cycle_id, category, optimization, timestamp)
+                    for optimization in cycle.get(
+                        "optimizations_identified", []
+                    )
+                ],
+            )
+            conn.execute(
+                """
+                UPDATE cycle_stats SET
+                    total_cycles = total_cycles + 1,
+                    successful_cycles = successful_cycles + ?,
+                    total_reasoning_steps = total_reasoning_steps + ?,
+                    total_lessons = total_lessons + ?
+                WHERE id = 1
+                """,
+                (int(success), steps, lessons),
+            )
+            conn.commit()
+            totals = self._totals
+            totals["total_cycles"] += 1
+            totals["successful_cycles"] += int(success)
+            totals["total_reasoning_steps"] += steps
+            totals["total_lessons"] += lessons
+        return True
+
+    def import_legacy_files(self, cycles_path: Path) -> int:
+        """Import cycle JSON files written by earlier versions.
+
+        Cycles already in the store are skipped, so this is safe to repeat.
+
+        Returns:
+            Number of cycles imported
+        """
+        imported = 0
+        for cycle_file in sorted(cycles_path.glob("*.json")):
+            try:
+                with open(cycle_file, encoding="utf-8") as f:
+                    cycle = json.load(f)
+                if self.add_cycle(cycle):
+                    imported += 1
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Skipping cycle file {cycle_file.name}: {e}")
+        if imported:
+            logger.info(f"Imported {imported} legacy reasoning cycles")
+        return imported
+
+    def stats(self) -> dict[str, Any]:
+        """Totals over all stored cycles."""
+        totals = dict(self._totals)
+        total_cycles = totals["total_cycles"]
+        return {
+            "total_cycles": total_cycles,
+            "successful_cycles": totals["successful_cycles"],
+            "success_rate": (
+                totals["successful_cycles"] / total_cycles
+                if total_cycles > 0
+                else 0
+            ),
+            "avg_reasoning_steps": (
+                totals["total_reasoning_steps"] / total_cycles
+                if total_cycles > 0
+                else 0
+            ),
+            "total_lessons_learned": totals["total_lessons"],
+        }
+
+    def get_cycle(self, cycle_id: str) -> dict[str, Any] | None:
+        """Full data of one stored cycle."""
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT data FROM cycles WHERE cycle_id = ?", (cycle_id,)
+            ).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def _find(
+        self,
+        table: str,
+        column: str,
+        query: str | None,
+        category: str | None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        clauses = []
+        params: list[Any] = []
+        if query:
+            clauses.append(f"{column} LIKE ?")
+            params.append(f"%{query}%")
+        if category:
+            clauses.append("category = ?")
+            params.append(category)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        params.append(limit)
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                f"SELECT {column}, cycle_id, category, timestamp "
+                f"FROM {table} {where} ORDER BY timestamp DESC, id DESC "
+                "LIMIT ?",
+                params,
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def find_patterns(
+        self,
+        query: str | None = None,
+        category: str | None = None,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        """Recorded patterns, newest first.
+
+        Args:
+            query: Substring the pattern must contain
+            category: Only patterns from cycles of this problem category
+            limit: Maximum number of results
+        """
+        return self._find("patterns", "pattern", query, category, limit)
+
+    def find_optimizations(
+        self,
+        query: str | None = None,
+        category: str | None = None,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        """Recorded optimizations, newest first (same filters as patterns)."""
+        return self._find(
+            "optimizations", "optimization", query, category, limit
+        )
+
+
 class ReasoningLoopManager:
     """Manages the reasoning loop and feedback to KIRO_MCP."""
 
     def __init__(self, data_path: Path):
         self.data_path = data_path
+        # Per-cycle JSON files from earlier versions, imported once
         self.cycles_path = data_path / "reasoning_cycles"
-        self.cycles_path.mkdir(exist_ok=True)
+        db_path = data_path / "reasoning_loop.db"
+        is_new = not db_path.exists()
+        self.store = ReasoningCycleStore(db_path)
+        if is_new and self.cycles_path.is_dir():
+            self.store.import_legacy_files(self.cycles_path)
 
         self.current_cycle: ProblemSolutionCycle | None = None
 
@@ -186,30 +486,13 @@ class ReasoningLoopManager:
         self.current_cycle.patterns_discovered = patterns or []
         self.current_cycle.optimizations_identified = optimizations or []
 
-        # Save to file
-        cycle_file = self.cycles_path / f"{self.current_cycle.cycle_id}.json"
-        with open(cycle_file, "w", encoding="utf-8") as f:
-            json.dump(asdict(self.current_cycle), f, indent=2)
+        cycle_data = asdict(self.current_cycle)
+        self.store.add_cycle(cycle_data, self._extract_learning_data())
 
         logger.info(
             f"Completed and saved cycle: {self.current_cycle.cycle_id}"
         )
 
-        # Extract learning data
-        learning_data = self._extract_learning_data()
-
-        # Save to knowledge base
-        self._save_to_knowledge_base(learning_data)
-
-        # Save patterns
-        if patterns:
-            self._save_patterns(patterns)
-
-        # Save optimizations
-        if optimizations:
-            self._save_optimizations(optimizations)
-
-        cycle_data = asdict(self.current_cycle)
         self.current_cycle = None
 
         return cycle_data
@@ -237,99 +520,31 @@ class ReasoningLoopManager:
             ],
         }
 
-    def _save_to_knowledge_base(self, learning_data: dict[str, Any]) -> None:
-        """Save learning data to knowledge base."""
-        kb_path = self.data_path / "knowledge"
-        kb_path.mkdir(exist_ok=True)
-
-        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
-        kb_file = kb_path / f"learning_{timestamp}.json"
-
-        with open(kb_file, "w", encoding="utf-8") as f:
-            json.dump(learning_data, f, indent=2)
-
-        logger.info(f"Saved learning data to knowledge base: {kb_file.name}")
-
-    def _save_patterns(self, patterns: list[str]) -> None:
-        """Save discovered patterns."""
-        patterns_path = self.data_path / "patterns"
-        patterns_path.mkdir(exist_ok=True)
-
-        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
-        pattern_file = patterns_path / f"patterns_{timestamp}.json"
-
-        with open(pattern_file, "w", encoding="utf-8") as f:
-            json.dump(
-                {
-                    "timestamp": datetime.now(UTC).isoformat(),
-                    "patterns": patterns,
-                    "source_cycle": (
-                        self.current_cycle.cycle_id
-                        if self.current_cycle
-                        else None
-                    ),
-                },
-                f,
-                indent=2,
-            )
-
-        logger.info(f"Saved patterns: {pattern_file.name}")
-
-    def _save_optimizations(self, optimizations: list[str]) -> None:
-        """Save identified optimizations."""
-        opt_path = self.data_path / "optimizations"
-        opt_path.mkdir(exist_ok=True)
-
-        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
-        opt_file = opt_path / f"optimization_{timestamp}.json"
-
-        with open(opt_file, "w", encoding="utf-8") as f:
-            json.dump(
-                {
-                    "timestamp": datetime.now(UTC).isoformat(),
-                    "optimizations": optimizations,
-                    "source_cycle": (
-                        self.current_cycle.cycle_id
-                        if self.current_cycle
-                        else None
-                    ),
-                },
-                f,
-                indent=2,
-            )
-
-        logger.info(f"Saved optimizations: {opt_file.name}")
-
     def get_cycle_stats(self) -> dict[str, Any]:
         """Get statistics about all completed cycles."""
-        cycles = list(self.cycles_path.glob("*.json"))
-
-        total_cycles = len(cycles)
-        successful_cycles = 0
-        total_reasoning_steps = 0
-        total_lessons = 0
-
-        for cycle_file in cycles:
-            with open(cycle_file, encoding="utf-8") as f:
-                cycle_data = json.load(f)
-                if cycle_data.get("solution_success"):
-                    successful_cycles += 1
-                total_reasoning_steps += len(
-                    cycle_data.get("reasoning_steps", [])
-                )
-                total_lessons += len(cycle_data.get("lessons_learned", []))
+        return self.store.stats()
 
-        return {
-            "total_cycles": total_cycles,
-            "successful_cycles": successful_cycles,
-            "success_rate": (
-                successful_cycles / total_cycles if total_cycles > 0 else 0
-            ),
-            "avg_reasoning_steps": (
-                total_reasoning_steps / total_cycles if total_cycles > 0 else 0
-            ),
-            "total_lessons_learned": total_lessons,
-        }
+    def get_cycle(self, cycle_id: str) -> dict[str, Any] | None:
+        """Get a completed cycle by id."""
+        return self.store.get_cycle(cycle_id)
+
+    def find_patterns(
+        self,
+        query: str | None = None,
+        category: str | None = None,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        """Look up discovered patterns (see ``ReasoningCycleStore``)."""
+        return self.store.find_patterns(query, category, limit)
+
+    def find_optimizations(
+        self,
+        query: str | None = None,
+        category: str | None = None,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        """Look up identified optimizations (see ``ReasoningCycleStore``)."""
+        return self.store.find_optimizations(query, category, limit)
 
 
 # Global instance
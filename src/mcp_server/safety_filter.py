@@ -2,6 +2,16 @@
 
 Implements multi-tier classification (severe, moderate, safe) with
 configurable actions (block, flag, allow).
+
+All tier patterns are compiled into one alternation, so text is scanned
+once and classification stops at the first severe match. A moderate match
+can hide a severe term it overlaps, so such spans are rechecked against
+the severe tier alone. Patterns with named groups or backreferences would
+clash or change meaning once combined; when one is configured, every
+pattern is scanned on its own instead. ``stream()``
+applies the same scan to generated output chunk by chunk, holding back a
+short boundary window so a term split across chunks is still caught and
+a block happens before the offending text is released.
 """
 
 from __future__ import annotations
@@ -9,6 +19,36 @@ from __future__ import annotations
 import re
 from typing import Any
 
+_BLOCKED_TEXT = "[CONTENT BLOCKED: Safety violation detected]"
+_SCOPED_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+# Numbered backreferences and group conditionals shift once combined
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?\(")
+
+
+def _scoped(pattern: re.Pattern[str]) -> str:
+    """Pattern source wrapped so its own flags survive being combined."""
+    flags = "".join(
+        letter for flag, letter in _SCOPED_FLAGS if pattern.flags & flag
+    )
+    return f"(?{flags}:{pattern.pattern})" if flags else pattern.pattern
+
+
+def _combinable(pattern: re.Pattern[str]) -> bool:
+    """Whether a pattern keeps its meaning inside a combined alternation."""
+    return not pattern.groupindex and not _BACKREFERENCE.search(
+        pattern.pattern
+    )
+
+
+def _alternation(patterns: list[re.Pattern[str]], prefix: str) -> list[str]:
+    """Each pattern as a group named ``<prefix><index>``."""
+    return [f"(?P<{prefix}{i}>{_scoped(p)})" for i, p in enumerate(patterns)]
+
 
 class SafetyFilter:
     """Content moderation filter for model outputs."""
@@ -23,39 +63,106 @@ class SafetyFilter:
         self.moderate_patterns = [
             re.compile(r"\b(controversial|sensitive)\b", re.IGNORECASE),
         ]
+        self._combined_key: tuple[Any, ...] = ()
+        self._combined: tuple[re.Pattern[str], re.Pattern[str]] | None = None
 
-    def classify(self, text: str) -> dict[str, Any]:
-        """Classify content safety level.
+    def _patterns(self) -> tuple[re.Pattern[str], re.Pattern[str]] | None:
+        """Alternations over all tiers and over the severe tier alone.
 
-        Args:
-            text: Content to classify
+        Rebuilt if the lists change. Each tier pattern becomes a named
+        group ``s<n>`` or ``m<n>``, so ``match.lastgroup`` tells which tier
+        matched. None if some pattern cannot be combined.
+        """
+        key = (*self.severe_patterns, None, *self.moderate_patterns)
+        if key != self._combined_key:
+            self._combined_key = key
+            self._combined = None
+            severe = _alternation(self.severe_patterns, "s")
+            moderate = _alternation(self.moderate_patterns, "m")
+            patterns = [*self.severe_patterns, *self.moderate_patterns]
+            if all(_combinable(p) for p in patterns):
+                try:
+                    # (?!) never matches: an empty filter allows everything
+                    self._combined = (
+                        re.compile("|".join(severe + moderate) or "(?!)"),
+                        re.compile("|".join(severe) or "(?!)"),
+                    )
+                except re.error:
+                    pass
+        return self._combined
 
-        Returns:
-            Classification result with category, confidence, and matches
+    def _scan(
+        self, text: str, pos: int = 0, endpos: int | None = None
+    ) -> tuple[str | None, list[str]]:
+        """First severe match and the moderate matches before it.
+
+        Only matches starting in ``[pos, endpos)`` are considered; text
+        before ``pos`` still counts as context for ``\\b``.
         """
-        severe_matches = []
-        for pattern in self.severe_patterns:
-            matches = pattern.findall(text)
-            severe_matches.extend(matches)
+        combined = self._patterns()
+        if combined is None:
+            return self._scan_each(text, pos, endpos)
+        every_tier, severe_tier = combined
+        moderate: list[str] = []
+        severe_ahead: re.Match[str] | None = None
+        searched = False
+        for match in every_tier.finditer(text, pos):
+            if endpos is not None and match.start() >= endpos:
+                break
+            if match.lastgroup[0] == "s":
+                return match.group(), moderate
+            # A severe term overlapping this match was skipped by the scan
+            if not searched or (
+                severe_ahead is not None
+                and severe_ahead.start() < match.start()
+            ):
+                severe_ahead = severe_tier.search(text, match.start())
+                searched = True
+            if severe_ahead is not None and severe_ahead.start() < match.end():
+                return severe_ahead.group(), moderate
+            moderate.append(match.group())
+        return None, moderate
+
+    def _scan_each(
+        self, text: str, pos: int, endpos: int | None
+    ) -> tuple[str | None, list[str]]:
+        """``_scan`` with one pass per pattern."""
 
-        moderate_matches = []
-        for pattern in self.moderate_patterns:
-            matches = pattern.findall(text)
-            moderate_matches.extend(matches)
+        def matches(patterns: list[re.Pattern[str]]) -> list[re.Match[str]]:
+            found = [
+                match
+                for pattern in patterns
+                for match in pattern.finditer(text, pos)
+                if endpos is None or match.start() < endpos
+            ]
+            return sorted(found, key=lambda match: match.start())
 
-        if severe_matches:
+        severe = matches(self.severe_patterns)
+        first = severe[0] if severe else None
+        moderate = [
+            match.group()
+            for match in matches(self.moderate_patterns)
+            if first is None or match.start() < first.start()
+        ]
+        return (first.group() if first else None), moderate
+
+    @staticmethod
+    def _classification(
+        severe: str | None, moderate: list[str]
+    ) -> dict[str, Any]:
+        if severe is not None:
             return {
                 "category": "severe",
                 "confidence": 0.9,
                 "action": "block",
-                "matches": severe_matches,
+                "matches": [severe],
             }
-        elif moderate_matches:
+        elif moderate:
             return {
                 "category": "moderate",
                 "confidence": 0.7,
                 "action": "flag",
-                "matches": moderate_matches,
+                "matches": moderate,
             }
         else:
             return {
@@ -65,6 +172,18 @@ class SafetyFilter:
                 "matches": [],
             }
 
+    def classify(self, text: str) -> dict[str, Any]:
+        """Classify content safety level.
+
+        Args:
+            text: Content to classify
+
+        Returns:
+            Classification result with category, confidence, and matches
+            (for severe content, the first severe match only)
+        """
+        return self._classification(*self._scan(text))
+
     def filter_output(self, text: str) -> dict[str, Any]:
         """Apply safety filter to output.
 
@@ -79,7 +198,7 @@ class SafetyFilter:
         if classification["action"] == "block":
             return {
                 "decision": "blocked",
-                "filtered_text": "[CONTENT BLOCKED: Safety violation detected]",
+                "filtered_text": _BLOCKED_TEXT,
                 "classification": classification,
             }
         elif classification["action"] == "flag":
@@ -95,5 +214,92 @@ class SafetyFilter:
                 "classification": classification,
             }
 
+    def stream(self, window: int = 64) -> SafetyStream:
+        """Start filtering a streamed response.
+
+        Args:
+            window: Characters held back at the end of the stream until
+                more text arrives; must exceed the longest term matched
+
+        Returns:
+            Stream to ``feed`` chunks into and ``close`` at the end
+        """
+        return SafetyStream(self, window)
+
+
+class SafetyStream:
+    """Incremental safety filter over streamed output chunks.
+
+    ``feed`` returns the text that is safe to forward so far. The last
+    ``window`` characters are held back, because a term may continue in
+    the next chunk. Once a severe term is seen, ``blocked`` is set and
+    nothing more is released, so the caller can stop generation.
+
+    Usage:
+        stream = SafetyFilter().stream()
+        for chunk in tokens:
+            text = stream.feed(chunk)
+            if stream.blocked:
+                break  # cancel generation
+            send(text)
+        result = stream.close()  # same shape as filter_output()
+    """
+
+    def __init__(self, safety_filter: SafetyFilter, window: int = 64):
+        self._filter = safety_filter
+        self.window = max(1, window)
+        self._buffer = ""  # released context + text not yet released
+        self._start = 0  # index in _buffer of the first unreleased char
+        self._released: list[str] = []
+        self._severe: str | None = None
+        self._moderate: list[str] = []
+
+    @property
+    def blocked(self) -> bool:
+        """Whether a severe term was found."""
+        return self._severe is not None
+
+    def _advance(self, cut: int) -> str:
+        """Scan up to ``cut`` and release that text unless blocked."""
+        if cut <= self._start:
+            return ""
+        severe, moderate = self._filter._scan(self._buffer, self._start, cut)
+        self._moderate.extend(moderate)
+        if severe is not None:
+            self._severe = severe
+            self._buffer = ""
+            return ""
+        text = self._buffer[self._start : cut]
+        self._released.append(text)
+        # Keep a window of released text as context for the next scan
+        keep_from = max(0, cut - self.window)
+        self._buffer = self._buffer[keep_from:]
+        self._start = cut - keep_from
+        return text
+
+    def feed(self, chunk: str) -> str:
+        """Add a chunk; return the text that can be forwarded now."""
+        if self.blocked:
+            return ""
+        self._buffer += chunk
+        return self._advance(len(self._buffer) - self.window)
+
+    def close(self) -> dict[str, Any]:
+        """Flush the held-back tail and return the overall result."""
+        tail = "" if self.blocked else self._advance(len(self._buffer))
+        result = self._filter._classification(self._severe, self._moderate)
+        if result["action"] == "block":
+            decision = "blocked"
+            filtered_text = _BLOCKED_TEXT
+        else:
+            decision = "flagged" if result["action"] == "flag" else "allowed"
+            filtered_text = "".join(self._released)
+        return {
+            "decision": decision,
+            "filtered_text": filtered_text,
+            "classification": result,
+            "tail": tail,
+        }
+
 
-__all__ = ["SafetyFilter"]
+__all__ = ["SafetyFilter", "SafetyStream"]
@@ -1,16 +1,29 @@
-"""Simple anomaly detector over security audit log.
+"""Streaming anomaly detector over security audit events.
 
-Computes frequency of events and flags spikes above thresholds.
+Events are counted as they are appended to the security audit log (via a
+subscription on its audit writer) into per-minute buckets held in a ring.
+``analyze`` sums only the buckets inside the requested window, so its cost
+does not depend on how large the log has grown. At startup the counters
+are rebuilt from the tail of the log.
+
+Two kinds of anomaly are reported:
+  * threshold: more events of a type in the window than a static limit
+  * spike: the recent (15m) rate of a type is ``spike_factor`` times its
+    rate over the rest of the window
 """
 
 from __future__ import annotations
 
 import json
 import os
+import threading
 import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+from .audit_writer import get_audit_writer
+
 _AUDIT_FILE = Path("logs/security_audit.jsonl")
 _DEFAULT_THRESHOLDS = {
     "rate_limited": int(os.getenv("ANOMALY_THRESHOLD_RATE_LIMITED", "10")),
@@ -19,63 +32,218 @@ _DEFAULT_THRESHOLDS = {
     ),
     "tool_failure": int(os.getenv("ANOMALY_THRESHOLD_TOOL_FAILURE", "15")),
 }
+_SPIKE_FACTOR = float(os.getenv("ANOMALY_SPIKE_FACTOR", "3.0"))
+_SPIKE_MIN_COUNT = int(os.getenv("ANOMALY_SPIKE_MIN_COUNT", "5"))
 
 _DEF_WINDOW_SEC = 3600
+_SHORT_WINDOW_SEC = 900  # 15m snapshot
+_TAIL_BYTES = 4 * 1024 * 1024
 
 
-def analyze(window_seconds: int = _DEF_WINDOW_SEC) -> dict[str, Any]:
-    now = time.time()
-    counts: dict[str, int] = {}
-    recent: dict[str, int] = {}
-    recent_short: dict[str, int] = {}
-    short_window = min(900, window_seconds)  # 15m snapshot
-    if not _AUDIT_FILE.exists():
+class AnomalyDetector:
+    """Time-bucketed event counters with threshold and spike checks."""
+
+    def __init__(
+        self,
+        *,
+        bucket_seconds: int = 60,
+        retention_seconds: int = 24 * 3600,
+        thresholds: dict[str, int] | None = None,
+        spike_factor: float = _SPIKE_FACTOR,
+        spike_min_count: int = _SPIKE_MIN_COUNT,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.bucket_seconds = bucket_seconds
+        self.size = max(1, retention_seconds // bucket_seconds)
+        self.thresholds = (
+            _DEFAULT_THRESHOLDS if thresholds is None else thresholds
+        )
+        self.spike_factor = spike_factor
+        self.spike_min_count = spike_min_count
+        self.clock = clock
+        # Slot i holds bucket number n where n % size == i
+        self._bucket_ids = [-1] * self.size
+        self._counts: list[dict[str, int]] = [{} for _ in range(self.size)]
+        self._lock = threading.Lock()
+        self._source: Any = None
+        self._live_from = 0.0
+
+    def observe(self, entry: dict[str, Any]) -> None:
+        """Count one audit entry (entries without a numeric ts are ignored)."""
+        try:
+            ts = float(entry.get("ts", 0))
+        except (TypeError, ValueError):
+            return
+        bucket = int(ts // self.bucket_seconds)
+        newest = int(self.clock() // self.bucket_seconds)
+        if bucket <= newest - self.size:
+            return  # older than the ring
+        slot = bucket % self.size
+        etype = entry.get("type")
+        with self._lock:
+            if self._bucket_ids[slot] != bucket:
+                if self._bucket_ids[slot] > bucket:
+                    return  # slot already reused by a newer bucket
+                self._bucket_ids[slot] = bucket
+                self._counts[slot] = {}
+            counts = self._counts[slot]
+            counts[etype] = counts.get(etype, 0) + 1
+
+    def load_tail(
+        self,
+        path: Path,
+        max_bytes: int = _TAIL_BYTES,
+        until: float | None = None,
+    ) -> int:
+        """Rebuild counters from the last ``max_bytes`` of a JSONL log.
+
+        Entries stamped at or after ``until`` are skipped.
+
+        Returns:
+            Number of entries counted
+        """
+        try:
+            with path.open("rb") as handle:
+                handle.seek(0, os.SEEK_END)
+                size = handle.tell()
+                handle.seek(max(0, size - max_bytes))
+                data = handle.read()
+        except OSError:
+            return 0
+        lines = data.splitlines()
+        if size > max_bytes and lines:
+            lines = lines[1:]  # first line is cut off
+        loaded = 0
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(entry, dict):
+                continue
+            ts = entry.get("ts")
+            if until is not None and isinstance(ts, (int, float)):
+                if ts >= until:
+                    continue
+            self.observe(entry)
+            loaded += 1
+        return loaded
+
+    def attach(self, path: Path) -> None:
+        """Follow the audit log at ``path``.
+
+        The first call also loads the log tail: entries stamped before the
+        subscription come from the file, later ones from the subscription.
+        """
+        writer = get_audit_writer(path)
+        if writer is self._source:
+            return
+        first = self._source is None
+        self._source = writer
+        cutoff = self.clock()
+        if first:
+            self._live_from = cutoff
+        writer.subscribe(self._observe_live)
+        if first:
+            writer.flush()
+            self.load_tail(path, until=cutoff)
+
+    def _observe_live(self, entry: dict[str, Any]) -> None:
+        ts = entry.get("ts")
+        if isinstance(ts, (int, float)) and ts >= self._live_from:
+            self.observe(entry)
+
+    def _window(self, seconds: float, end_bucket: int) -> dict[str, int]:
+        """Sum the buckets covering ``seconds`` up to ``end_bucket``."""
+        buckets = min(self.size, max(1, int(seconds // self.bucket_seconds)))
+        totals: dict[str, int] = {}
+        with self._lock:
+            for bucket in range(end_bucket, end_bucket - buckets, -1):
+                slot = bucket % self.size
+                if self._bucket_ids[slot] != bucket:
+                    continue
+                for etype, count in self._counts[slot].items():
+                    totals[etype] = totals.get(etype, 0) + count
+        return totals
+
+    def analyze(self, window_seconds: int = _DEF_WINDOW_SEC) -> dict[str, Any]:
+        """Event counts, trends and anomalies for the trailing window."""
+        window_seconds = min(window_seconds, self.size * self.bucket_seconds)
+        short_window = min(_SHORT_WINDOW_SEC, window_seconds)
+        now_bucket = int(self.clock() // self.bucket_seconds)
+
+        counts = self._window(self.size * self.bucket_seconds, now_bucket)
+        recent = self._window(window_seconds, now_bucket)
+        recent_short = self._window(short_window, now_bucket)
+
+        anomalies: list[dict[str, Any]] = []
+        for etype, limit in self.thresholds.items():
+            val = recent.get(etype, 0)
+            if val > limit:
+                anomalies.append(
+                    {
+                        "type": etype,
+                        "kind": "threshold",
+                        "count": val,
+                        "threshold": limit,
+                    }
+                )
+
+        trend = {}
+        baseline_seconds = window_seconds - short_window
+        for etype, val in recent.items():
+            sval = recent_short.get(etype, 0)
+            accel_short = (sval / short_window) if short_window else 0.0
+            accel_long = (val / window_seconds) if window_seconds else 0.0
+            trend[etype] = {
+                "short_window": sval,
+                "long_window": val,
+                "acceleration": accel_short - accel_long,
+            }
+            if baseline_seconds <= 0 or sval < self.spike_min_count:
+                continue
+            rate = sval / short_window * 60
+            baseline_rate = (val - sval) / baseline_seconds * 60
+            if rate > self.spike_factor * baseline_rate:
+                anomalies.append(
+                    {
+                        "type": etype,
+                        "kind": "spike",
+                        "count": sval,
+                        "rate_per_min": round(rate, 3),
+                        "baseline_per_min": round(baseline_rate, 3),
+                        "factor": self.spike_factor,
+                    }
+                )
+
         return {
             "events": counts,
             "recent": recent,
             "recent_short": recent_short,
-            "anomalies": [],
-        }
-    for line in _AUDIT_FILE.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        try:
-            entry = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        etype = entry.get("type")
-        raw_ts = entry.get("ts", 0)
-        try:
-            ts = float(raw_ts)
-        except (TypeError, ValueError):
-            # Skip entries with invalid timestamps
-            continue
-        counts[etype] = counts.get(etype, 0) + 1
-        age = now - ts
-        if age <= window_seconds:
-            recent[etype] = recent.get(etype, 0) + 1
-        if age <= short_window:
-            recent_short[etype] = recent_short.get(etype, 0) + 1
-    anomalies = []
-    for etype, limit in _DEFAULT_THRESHOLDS.items():
-        val = recent.get(etype, 0)
-        if val > limit:
-            anomalies.append({"type": etype, "count": val, "threshold": limit})
-    trend = {}
-    for etype, val in recent.items():
-        sval = recent_short.get(etype, 0)
-        accel_short = (sval / short_window) if short_window else 0.0
-        accel_long = (val / window_seconds) if window_seconds else 0.0
-        trend[etype] = {
-            "short_window": sval,
-            "long_window": val,
-            "acceleration": accel_short - accel_long,
+            "trend": trend,
+            "anomalies": anomalies,
+            "window_seconds": window_seconds,
         }
-    return {
-        "events": counts,
-        "recent": recent,
-        "recent_short": recent_short,
-        "trend": trend,
-        "anomalies": anomalies,
-        "window_seconds": window_seconds,
-    }
+
+
+_detector: AnomalyDetector | None = None
+_detector_lock = threading.Lock()
+
+
+def get_detector() -> AnomalyDetector:
+    """Process-wide detector following the security audit log."""
+    global _detector
+    with _detector_lock:
+        if _detector is None:
+            _detector = AnomalyDetector()
+        # Re-attaches if the writer was replaced (e.g. after close)
+        _detector.attach(_AUDIT_FILE)
+    return _detector
+
+
+def analyze(window_seconds: int = _DEF_WINDOW_SEC) -> dict[str, Any]:
+    """Summarize security audit events over the trailing window.
+
+    ``events`` covers the detector's retention (24h), not the whole file.
+    """
+    return get_detector().analyze(window_seconds)
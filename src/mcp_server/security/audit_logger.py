@@ -2,87 +2,120 @@
 
 Captures security-relevant events: approvals requested/granted, rate limits,
 command executions, and tool failures.
+
+Events go through the shared batched audit writer. The log rotates at 5MB
+or daily; the writer thread only renames the file, and rotated logs are
+gzip-compressed into numbered archives by a background thread.
 """
 
 from __future__ import annotations
 
 import gzip
 import json
+import shutil
 import threading
 import time
 from pathlib import Path
 from typing import Any, Dict
 
+from .audit_writer import AuditWriter, get_audit_writer
+
 _AUDIT_DIR = Path("logs")
 _AUDIT_FILE = _AUDIT_DIR / "security_audit.jsonl"
 _MAX_SIZE_BYTES = 5 * 1024 * 1024  # 5MB
 _MAX_FILES = 5
-_PURGE_AFTER = 10  # hard cap beyond rotated gzip archives
+_PURGE_AFTER = 10  # stale archive numbers cleaned up when shifting
 _ROTATION_INTERVAL_SEC = 24 * 3600  # daily
-_lock = threading.Lock()
+_lock = threading.Lock()  # serializes archive compression
 _META_FILE = _AUDIT_DIR / "security_audit.meta.json"
 
 
-def _rotate_if_needed() -> None:
+def _last_rotation_ts() -> float | None:
+    """Previous rotation time, read once when the writer is configured."""
     try:
-        stat = _AUDIT_FILE.stat()
-        meta = {}
-        if _META_FILE.exists():
-            meta = json.loads(_META_FILE.read_text(encoding="utf-8"))
-        last_ts = meta.get("last_rotation_ts", stat.st_mtime)
-        need_rotation = (
-            stat.st_size > _MAX_SIZE_BYTES
-            or (time.time() - last_ts) > _ROTATION_INTERVAL_SEC
-        )
-        if not need_rotation:
-            return
-        # Find next index
-        for idx in range(_MAX_FILES, 0, -1):
-            old = _AUDIT_DIR / f"security_audit.{idx}.jsonl"
-            newer = _AUDIT_DIR / f"security_audit.{idx+1}.jsonl"
-            if newer.exists():
-                newer.unlink(missing_ok=True)  # type: ignore[arg-type]
-            if old.exists():
-                old.rename(newer)
-        rotated_path = _AUDIT_DIR / "security_audit.1.jsonl"
-        _AUDIT_FILE.rename(rotated_path)
-        # gzip compress rotated file
+        meta = json.loads(_META_FILE.read_text(encoding="utf-8"))
+        return float(meta["last_rotation_ts"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    try:
+        return _AUDIT_FILE.stat().st_mtime
+    except OSError:
+        return None
+
+
+def _rotate(path: Path) -> None:
+    """Move the live log aside; runs on the audit writer thread.
+
+    Only a rename happens here. Compression, archive numbering and the
+    meta file are handled by a background thread.
+    """
+    pending = path.with_name(f"security_audit.pending-{time.time_ns()}.jsonl")
+    path.rename(pending)
+    threading.Thread(
+        target=_archive_pending,
+        args=(time.time(),),
+        name="security-audit-archive",
+        daemon=True,
+    ).start()
+
+
+def _shift_archives() -> None:
+    for idx in range(_PURGE_AFTER, 0, -1):
+        archive = _AUDIT_DIR / f"security_audit.{idx}.jsonl.gz"
+        if not archive.exists():
+            continue
+        if idx >= _MAX_FILES:
+            archive.unlink(missing_ok=True)
+        else:
+            archive.rename(_AUDIT_DIR / f"security_audit.{idx + 1}.jsonl.gz")
+
+
+def _archive_pending(rotated_at: float) -> None:
+    """Gzip rotated logs (streamed) into security_audit.1.jsonl.gz."""
+    with _lock:
+        for pending in sorted(_AUDIT_DIR.glob("security_audit.pending-*")):
+            if pending.suffix != ".jsonl":
+                continue
+            partial = pending.with_suffix(".jsonl.gz.tmp")
+            try:
+                with (
+                    pending.open("rb") as src,
+                    gzip.open(partial, "wb") as dst,
+                ):
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+                _shift_archives()
+                partial.rename(_AUDIT_DIR / "security_audit.1.jsonl.gz")
+                pending.unlink(missing_ok=True)
+            except OSError:
+                partial.unlink(missing_ok=True)
         try:
-            raw = rotated_path.read_bytes()
-            with gzip.open(rotated_path.with_suffix(".jsonl.gz"), "wb") as gz:
-                gz.write(raw)
-            rotated_path.unlink(missing_ok=True)  # type: ignore[arg-type]
+            _META_FILE.write_text(
+                json.dumps({"last_rotation_ts": rotated_at}), encoding="utf-8"
+            )
         except OSError:
             pass
-        # Purge archives beyond purge limit
-        for extra in range(_PURGE_AFTER, _MAX_FILES + 1, -1):
-            p = _AUDIT_DIR / f"security_audit.{extra}.jsonl.gz"
-            if p.exists():
-                try:
-                    p.unlink()
-                except OSError:
-                    pass
-        _AUDIT_FILE.write_text("", encoding="utf-8")
-        meta["last_rotation_ts"] = time.time()
-        _META_FILE.write_text(json.dumps(meta), encoding="utf-8")
-    except FileNotFoundError:
-        return
-    except OSError:
-        return
 
 
-def _ensure() -> None:
-    _AUDIT_DIR.mkdir(parents=True, exist_ok=True)
+def _writer() -> AuditWriter:
+    writer = get_audit_writer(_AUDIT_FILE)
+    if not writer.rotates:
+        writer.set_rotation(
+            _rotate,
+            max_bytes=_MAX_SIZE_BYTES,
+            max_age=_ROTATION_INTERVAL_SEC,
+            last_rotation=_last_rotation_ts(),
+        )
+    return writer
 
 
 def record(event_type: str, data: Dict[str, Any]) -> None:
-    _ensure()
-    _rotate_if_needed()
     entry = {"ts": time.time(), "type": event_type, **data}
-    line = json.dumps(entry, ensure_ascii=False)
-    with _lock:
-        with _AUDIT_FILE.open("a", encoding="utf-8") as f:
-            f.write(line + "\n")
+    _writer().append(entry)
+
+
+def flush(timeout: float | None = 5.0) -> bool:
+    """Wait until queued audit events have been written to the log."""
+    return _writer().flush(timeout)
 
 
 # Convenience wrappers
@@ -0,0 +1,407 @@
+"""Shared append-only writer for JSONL audit and provenance logs.
+
+Callers serialize a record and push the line onto an in-memory ring; a
+background thread drains the ring and appends each batch to the file with
+a single buffered write. Appending costs microseconds instead of a file
+open per record.
+
+Backpressure: when the ring is full, ``append`` waits up to
+``block_timeout`` seconds for the flusher (``overflow="block"``), or drops
+the record straight away (``overflow="drop"``). Dropped records are
+counted in ``stats``.
+
+Durability: ``fsync_interval`` sets how often a flushed batch is also
+fsynced (0 = every batch, < 0 = never, leave it to the OS). ``append(...,
+sync=True)`` and ``flush()`` wait until the record has been written, for
+events that must be on disk before the caller continues; a sync append
+returns False if its batch could not be written or was not written within
+``sync_timeout`` seconds.
+
+Rotation: ``set_rotation`` hands the flusher a callback that moves the
+file aside once it would exceed ``max_bytes`` or is older than
+``max_age``. The file size is tracked from the bytes written and rotation
+state is kept in memory, so the check costs nothing per record and the
+disk is only consulted when a rotation looks due.
+
+Writers are shared per file path, so every sink appending to the same log
+goes through one ring and one flusher.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_CAPACITY = int(os.getenv("AUDIT_WRITER_CAPACITY", "10000"))
+_DEFAULT_FLUSH_INTERVAL = (
+    float(os.getenv("AUDIT_WRITER_FLUSH_MS", "50")) / 1000
+)
+_DEFAULT_FSYNC_INTERVAL = float(os.getenv("AUDIT_FSYNC_INTERVAL", "1.0"))
+_DEFAULT_OVERFLOW = os.getenv("AUDIT_WRITER_OVERFLOW", "block")
+
+
+class AuditWriter:
+    """Batched, thread-backed appender for one JSONL file."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        capacity: int = _DEFAULT_CAPACITY,
+        batch_size: int = 512,
+        flush_interval: float = _DEFAULT_FLUSH_INTERVAL,
+        fsync_interval: float = _DEFAULT_FSYNC_INTERVAL,
+        overflow: str = _DEFAULT_OVERFLOW,
+        block_timeout: float = 1.0,
+        sync_timeout: float = 5.0,
+    ) -> None:
+        if overflow not in ("block", "drop"):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.path = Path(path)
+        self.capacity = max(1, capacity)
+        self.batch_size = max(1, min(batch_size, self.capacity))
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.sync_timeout = sync_timeout
+
+        self._ring: deque[str] = deque()
+        self._cond = threading.Condition()
+        self._wake = threading.Event()
+        self._appended = 0  # sequence number of the newest queued line
+        self._written = 0  # sequence number of the newest written line
+        # Outcome of each sync append still waited on (None until flushed)
+        self._sync_outcomes: dict[int, bool | None] = {}
+        self._last_fsync = time.monotonic()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._rotate: Callable[[Path], None] | None = None
+        self._max_bytes = 0
+        self._max_age = 0.0
+        self._last_rotation = 0.0
+        self._size: int | None = None  # file size, tracked from writes
+        self._listeners: tuple[Callable[[dict[str, Any]], None], ...] = ()
+        self.stats = {
+            "appended": 0,
+            "written": 0,
+            "batches": 0,
+            "dropped": 0,
+            "write_errors": 0,
+            "fsyncs": 0,
+            "rotations": 0,
+        }
+
+    def set_rotation(
+        self,
+        rotate: Callable[[Path], None],
+        max_bytes: int = 0,
+        max_age: float = 0.0,
+        last_rotation: float | None = None,
+    ) -> None:
+        """Rotate the file from the flusher thread.
+
+        Args:
+            rotate: Moves the current file away (called with its path)
+            max_bytes: Rotate before a batch would grow the file past this
+            max_age: Rotate when this many seconds passed since the last
+                rotation (0 = no age limit)
+            last_rotation: Unix time of the previous rotation (default now)
+        """
+        self._rotate = rotate
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+        self._last_rotation = (
+            time.time() if last_rotation is None else last_rotation
+        )
+
+    def subscribe(self, listener: Callable[[dict[str, Any]], None]) -> None:
+        """Call ``listener`` with every dict record appended from now on.
+
+        Listeners run on the appending thread and must be cheap.
+        """
+        self._listeners = (*self._listeners, listener)
+
+    @property
+    def rotates(self) -> bool:
+        """Whether a rotation callback is configured."""
+        return self._rotate is not None
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def append(self, record: dict[str, Any] | str, sync: bool = False) -> bool:
+        """Queue one record (a dict or a pre-serialized line).
+
+        Args:
+            record: Record to append
+            sync: Wait until the record has been written to the file
+
+        Returns:
+            False if the record was dropped (ring full or writer closed),
+            or with ``sync``, if writing it failed
+        """
+        line = (
+            record
+            if isinstance(record, str)
+            else json.dumps(record, ensure_ascii=False)
+        )
+        with self._cond:
+            if self._closed:
+                self.stats["dropped"] += 1
+                return False
+            if len(self._ring) >= self.capacity and not self._wait_for_room():
+                self.stats["dropped"] += 1
+                return False
+            self._ring.append(line + "\n")
+            self._appended += 1
+            self.stats["appended"] += 1
+            seq = self._appended
+            backlog = len(self._ring)
+            if sync:
+                self._sync_outcomes[seq] = None
+        if self._listeners and not isinstance(record, str):
+            for listener in self._listeners:
+                try:
+                    listener(record)
+                except Exception:  # noqa: BLE001 - never fail the caller
+                    logger.debug("Audit listener failed", exc_info=True)
+        if self._thread is None:
+            self._start()
+        if sync or backlog >= self.batch_size:
+            self._wake.set()
+        if sync:
+            return self._wait_synced(seq)
+        return True
+
+    def _wait_for_room(self) -> bool:
+        """Backpressure; called with the condition held."""
+        if self.overflow == "drop":
+            return False
+        self._wake.set()
+        deadline = time.monotonic() + self.block_timeout
+        while len(self._ring) >= self.capacity:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._closed:
+                return False
+            self._cond.wait(remaining)
+        return True
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Wait until every record queued so far has been written."""
+        with self._cond:
+            seq = self._appended
+        if self._thread is None or self._written >= seq:
+            return self._written >= seq
+        self._wake.set()
+        return self._wait_written(seq, timeout)
+
+    def _wait_written(self, seq: int, timeout: float | None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._written >= seq or self._closed, timeout
+            ) and (self._written >= seq)
+
+    def _wait_synced(self, seq: int) -> bool:
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._sync_outcomes[seq] is not None
+                or (self._closed and not self._flusher_alive()),
+                self.sync_timeout,
+            )
+            return self._sync_outcomes.pop(seq) is True
+
+    def _flusher_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def pending(self) -> int:
+        """Records queued but not yet written."""
+        return len(self._ring)
+
+    # ------------------------------------------------------------------
+    # Flusher side
+    # ------------------------------------------------------------------
+
+    def _start(self) -> None:
+        with self._cond:
+            if self._thread is not None or self._closed:
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"audit-writer:{self.path.name}",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._drain()
+            with self._cond:
+                if self._closed and not self._ring:
+                    self._cond.notify_all()
+                    return
+
+    def _drain(self) -> None:
+        while True:
+            with self._cond:
+                if not self._ring:
+                    return
+                lines = list(self._ring)
+                self._ring.clear()
+                seq = self._appended
+                self._cond.notify_all()  # room for blocked producers
+            try:
+                ok = self._write_batch(lines)
+            except Exception:  # noqa: BLE001 - keep the flusher alive
+                self.stats["write_errors"] += 1
+                self.stats["dropped"] += len(lines)
+                logger.exception(
+                    "Audit write to %s failed (%d records lost)",
+                    self.path,
+                    len(lines),
+                )
+                ok = False
+            with self._cond:
+                self._written = seq
+                for waiting, outcome in self._sync_outcomes.items():
+                    if outcome is None and waiting <= seq:
+                        self._sync_outcomes[waiting] = ok
+                self._cond.notify_all()
+
+    def _file_size(self) -> int:
+        try:
+            return self.path.stat().st_size
+        except OSError:
+            return 0
+
+    def _rotation_due(self, incoming: int) -> bool:
+        if self._size is None:
+            self._size = self._file_size()
+        by_size = self._max_bytes > 0 and (
+            self._size + incoming > self._max_bytes
+        )
+        by_age = self._max_age > 0 and (
+            time.time() - self._last_rotation > self._max_age
+        )
+        if not (by_size or by_age):
+            return False
+        # Confirm against the disk: the file may have been moved externally
+        self._size = self._file_size()
+        if self._size == 0:
+            return False
+        return by_age or self._size + incoming > self._max_bytes
+
+    def _maybe_rotate(self, incoming: int) -> None:
+        if self._rotate is None or not self._rotation_due(incoming):
+            return
+        try:
+            self._rotate(self.path)
+        except Exception as exc:  # noqa: BLE001 - keep writing on failure
+            logger.warning(
+                "Audit log rotation of %s failed: %s", self.path, exc
+            )
+            return
+        self._size = 0
+        self._last_rotation = time.time()
+        self.stats["rotations"] += 1
+
+    def _write_batch(self, lines: list[str]) -> bool:
+        # Lone surrogates (e.g. decoded from JSON tool arguments) are not
+        # encodable; escape them instead of losing the batch
+        data = "".join(lines).encode("utf-8", errors="backslashreplace")
+        self._maybe_rotate(len(data))
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("ab") as handle:
+                handle.write(data)
+                handle.flush()
+                now = time.monotonic()
+                if self.fsync_interval >= 0 and (
+                    now - self._last_fsync >= self.fsync_interval
+                ):
+                    os.fsync(handle.fileno())
+                    self._last_fsync = now
+                    self.stats["fsyncs"] += 1
+            if self._size is not None:
+                self._size += len(data)
+            self.stats["written"] += len(lines)
+            self.stats["batches"] += 1
+            return True
+        except OSError as exc:
+            self.stats["write_errors"] += 1
+            self.stats["dropped"] += len(lines)
+            logger.warning(
+                "Audit write to %s failed (%d records lost): %s",
+                self.path,
+                len(lines),
+                exc,
+            )
+            return False
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write everything still queued and stop the flusher."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+            self._cond.notify_all()
+        if thread is None:
+            return
+        self._wake.set()
+        thread.join(timeout)
+
+
+_writers: dict[Path, AuditWriter] = {}
+_writers_by_arg: dict[str | Path, AuditWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_audit_writer(path: str | Path, **kwargs: Any) -> AuditWriter:
+    """Return the shared writer for ``path`` (created on first use).
+
+    Keyword arguments configure the writer when it is created and are
+    ignored afterwards.
+    """
+    writer = _writers_by_arg.get(path)
+    if writer is not None and not writer._closed:
+        return writer
+    key = Path(os.path.abspath(path))
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None or writer._closed:
+            writer = AuditWriter(path, **kwargs)
+            _writers[key] = writer
+        _writers_by_arg[path] = writer
+    return writer
+
+
+def flush_all(timeout: float | None = 5.0) -> bool:
+    """Flush every shared writer; False if any timed out."""
+    return all([w.flush(timeout) for w in list(_writers.values())])
+
+
+def close_all() -> None:
+    """Drain and stop every shared writer (registered at exit)."""
+    for writer in list(_writers.values()):
+        writer.close()
+
+
+atexit.register(close_all)
+
+
+__all__ = ["AuditWriter", "get_audit_writer", "flush_all", "close_all"]
@@ -2480,16 +2480,29 @@ graph TD
             }
             task = task_type_map.get(task_type, TaskType.GENERAL)
 
-            result = await backend.generate(
-                prompt=prompt,
-                user_id="mcp_concierge",
-                task_type=task,
-                model=model,
-                auto_select_model=model is None,
-                num_predict=max_tokens,
-                temperature=temperature,
+            from aura_ia_mcp.services.model_gateway.response_cache import (
+                get_response_cache,
             )
 
+            cache = get_response_cache()
+            cache_model = model or f"auto:{task_type}"
+            sampling = {"temperature": temperature, "num_predict": max_tokens}
+            result = cache.get("ollama_consult", cache_model, prompt, sampling)
+            if result is None:
+                result = await backend.generate(
+                    prompt=prompt,
+                    user_id="mcp_concierge",
+                    task_type=task,
+                    model=model,
+                    auto_select_model=model is None,
+                    num_predict=max_tokens,
+                    temperature=temperature,
+                )
+                if result.get("success"):
+                    cache.put(
+                        "ollama_consult", cache_model, prompt, sampling, result
+                    )
+
             if result.get("success"):
                 return {
                     "success": True,
@@ -118,6 +118,17 @@ AC_MODE_ALIASES = {
 }
 
 
+def _get_response_cache():
+    """Return the shared gateway response cache, if the gateway is installed."""
+    try:
+        from aura_ia_mcp.services.model_gateway.response_cache import (
+            get_response_cache,
+        )
+    except ImportError:
+        return None
+    return get_response_cache()
+
+
 class IntentClassifier:
     """Semantic intent classifier using lightweight LLM inference."""
     
@@ -406,11 +417,26 @@ User: "{{message}}"
         # Use LLM for classification with retry logic
         max_retries = 2
         last_error = None
+        prompt = self.prompt_template.replace("{message}", message)
+        options = {
+            "temperature": 0.1,  # Low temp for consistent classification
+            "num_predict": 100,  # Short response - just need JSON
+            "num_ctx": 512,  # Small context for speed
+        }
+        
+        # Identical messages classify identically - reuse cached LLM output
+        cache = _get_response_cache()
+        if cache is not None:
+            cached = cache.get("intent_classifier", self.model, prompt, options)
+            if cached is not None:
+                result = self._parse_llm_response(cached["response"], message)
+                result.classification_time_ms = int((time.time() - start) * 1000)
+                result.used_llm = True
+                result.raw_response = cached["response"]
+                return result
         
         for attempt in range(max_retries):
             try:
-                prompt = self.prompt_template.replace("{message}", message)
-                
                 # Use shorter timeout for retries
                 timeout = self.timeout if attempt == 0 else self.timeout * 0.7
                 
@@ -421,11 +447,7 @@ User: "{{message}}"
                             "model": self.model,
                             "prompt": prompt,
                             "stream": False,
-                            "options": {
-                                "temperature": 0.1,  # Low temp for consistent classification
-                                "num_predict": 100,  # Short response - just need JSON
-                                "num_ctx": 512,  # Small context for speed
-                            },
+                            "options": options,
                         },
                     )
                     
@@ -448,6 +470,14 @@ User: "{{message}}"
                     result.classification_time_ms = int((time.time() - start) * 1000)
                     result.used_llm = True
                     result.raw_response = raw_response
+                    if cache is not None and result.confidence > 0.5:
+                        cache.put(
+                            "intent_classifier",
+                            self.model,
+                            prompt,
+                            options,
+                            {"response": raw_response},
+                        )
                     
                     print(f"🎯 Intent: {result.intent.value} ({result.confidence:.0%}) in {result.classification_time_ms}ms")
                     return result
@@ -8,6 +8,8 @@ import time
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
+from .trace_sampling import TraceSampler
+
 
 def _log_paths() -> tuple[Path, Path]:
     log_dir = Path(os.getenv("MCP_TOOL_SPANS_DIR", "logs"))
@@ -84,6 +86,9 @@ class TelemetryBatcher:
 
 # Global telemetry batcher
 _batcher = TelemetryBatcher()
+# Keeps every span unless MCP_SPAN_SAMPLE_RATE(S) / _BUDGET_PER_SEC are set;
+# slow (MCP_SPAN_SLOW_MS) and failed spans are always kept
+_sampler = TraceSampler.from_env("MCP_SPAN")
 
 
 def emit_span(
@@ -93,11 +98,23 @@ def emit_span(
     success: bool = True,
     error_code: str | None = None,
     extra: dict | None = None,
+    end_time: float | None = None,
+    timestamp: float | None = None,
 ) -> None:
-    """Emit a telemetry span (batched for performance)."""
-    end = time.perf_counter()
+    """Emit a telemetry span (batched for performance).
+
+    ``end_time`` (perf_counter) and ``timestamp`` (unix) default to now;
+    pass them when the span is recorded after the call has finished.
+    Fast successful spans may be dropped by ``_sampler``.
+    """
+    end = time.perf_counter() if end_time is None else end_time
+    if not _sampler.decide(
+        tool_name, duration=end - start_time, error=not success
+    ):
+        return
+    wall = time.time() if timestamp is None else timestamp
     span = ToolSpan(
-        timestamp_ms=int(time.time() * 1000),
+        timestamp_ms=int(wall * 1000),
         tool_name=tool_name,
         method=method,
         duration_ms=int((end - start_time) * 1000),
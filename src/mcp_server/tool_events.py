@@ -0,0 +1,169 @@
+"""Off-path bookkeeping for MCP tool calls.
+
+``_call_tool`` keeps only what decides a call's outcome on the request
+path (rate limit, handler lookup, handler). Everything recorded about the
+call afterwards (telemetry span, metrics, security audit, provenance,
+OpenTelemetry span end) is published as a ``ToolCallEvent`` and handled by
+a background consumer thread.
+
+Publishing is a deque append; the consumer wakes every ``flush_interval``
+or as soon as ``batch_size`` events are queued. When ``capacity`` events
+are waiting, new events are dropped and counted rather than blocking the
+caller. ``drain()`` waits until everything published so far has been
+handled (used on shutdown and by tests).
+
+Set ``MCP_TOOL_EVENTS_INLINE=1`` to handle events synchronously instead.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class ToolCallEvent:
+    """Outcome of one tool invocation (or of a rejected call)."""
+
+    name: str
+    method: str | None
+    arguments: dict[str, Any]
+    success: bool
+    start: float  # perf_counter at dispatch
+    end: float  # perf_counter at completion
+    wall_time: float = field(default_factory=time.time)
+    error_code: str | None = None
+    error_message: str | None = None
+    result: Any = None
+    rate_limit_key: str | None = None  # set when rejected by rate limit
+    otel_span: Any = None
+    end_ns: int = field(default_factory=time.time_ns)
+
+    def __post_init__(self) -> None:
+        # Handled later on another thread: callers may still mutate these
+        self.arguments = dict(self.arguments)
+        if isinstance(self.result, (dict, list)):
+            self.result = copy.copy(self.result)
+
+    @property
+    def duration(self) -> float:
+        """Call duration in seconds."""
+        return self.end - self.start
+
+
+Handler = Callable[[ToolCallEvent], None]
+
+
+class ToolEventBus:
+    """Bounded queue of tool events drained by a background thread."""
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        batch_size: int = 256,
+        flush_interval: float = 0.02,
+        inline: bool = False,
+    ) -> None:
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.inline = inline
+        self._queue: deque[tuple[Handler, ToolCallEvent]] = deque()
+        self._wake = threading.Event()
+        self._cond = threading.Condition()
+        self._published = 0
+        self._handled = 0
+        self._thread: threading.Thread | None = None
+        self.stats = {"published": 0, "handled": 0, "dropped": 0, "errors": 0}
+
+    def publish(self, handler: Handler, event: ToolCallEvent) -> bool:
+        """Queue ``handler(event)``; False if the event was dropped."""
+        if self.inline:
+            self._handle(handler, event)
+            return True
+        queue = self._queue
+        if len(queue) >= self.capacity:
+            self.stats["dropped"] += 1
+            return False
+        queue.append((handler, event))
+        self._published += 1
+        if self._thread is None:
+            self._start()
+        if len(queue) >= self.batch_size:
+            self._wake.set()
+        return True
+
+    def _start(self) -> None:
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="mcp-tool-events", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            handled = 0
+            while self._queue:
+                handler, event = self._queue.popleft()
+                self._handle(handler, event)
+                handled += 1
+            if handled:
+                with self._cond:
+                    self._handled += handled
+                    self._cond.notify_all()
+
+    def _handle(self, handler: Handler, event: ToolCallEvent) -> None:
+        try:
+            handler(event)
+        except Exception:  # noqa: BLE001 - bookkeeping never fails calls
+            self.stats["errors"] += 1
+            logger.debug("Tool event handler failed", exc_info=True)
+        self.stats["handled"] += 1
+
+    def drain(self, timeout: float | None = 5.0) -> bool:
+        """Wait until every event published so far has been handled."""
+        target = self._published
+        if self._thread is None:
+            return True
+        self._wake.set()
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._handled >= target, timeout
+            )
+
+    @property
+    def pending(self) -> int:
+        """Events queued but not yet handled."""
+        return len(self._queue)
+
+
+_bus: ToolEventBus | None = None
+_bus_lock = threading.Lock()
+
+
+def get_tool_event_bus() -> ToolEventBus:
+    """Process-wide tool event bus."""
+    global _bus
+    if _bus is None:
+        with _bus_lock:
+            if _bus is None:
+                _bus = ToolEventBus(
+                    inline=os.getenv("MCP_TOOL_EVENTS_INLINE", "0") == "1"
+                )
+    return _bus
+
+
+__all__ = ["ToolCallEvent", "ToolEventBus", "get_tool_event_bus"]
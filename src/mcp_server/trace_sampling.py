@@ -0,0 +1,443 @@
+"""Adaptive, cost-aware trace sampling.
+
+Shared by the tool span log (``telemetry.emit_span``) and the
+OpenTelemetry integration. A ``TraceSampler`` combines:
+
+* head sampling: each route (tool name, HTTP route, span name) has a rate
+  (``rate_for``); ``head`` decides up front whether a trace is in the
+  regular sample
+* tail rules: once the outcome is known, ``keep`` always keeps slow or
+  errored traces and keeps fast successes only if they were head sampled
+* a spans-per-second budget (``AdaptiveBudget``): the export volume is
+  measured per window and a factor in (0, 1] scales the head rates down
+  while the budget is exceeded and recovers once it is not
+
+Route rates are given as ``"POST /chat=0.05,tool/*=0.2"``; a trailing
+``*`` matches by prefix and the longest matching prefix wins.
+
+For OpenTelemetry, ``OtelRouteSampler`` applies the head rates and still
+records traces outside the sample, and ``TailSamplingSpanProcessor``
+buffers finished spans per trace and exports only the traces ``keep``
+accepts, from a background thread.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Sequence
+from typing import Any
+
+try:
+    from opentelemetry.sdk.trace import SpanProcessor as _SpanProcessorBase
+    from opentelemetry.sdk.trace.sampling import Sampler as _SamplerBase
+except ImportError:  # SDK optional; adapters are only used with it
+    _SpanProcessorBase = object  # type: ignore[assignment,misc]
+    _SamplerBase = object  # type: ignore[assignment,misc]
+
+logger = logging.getLogger(__name__)
+
+_MAX_TRACE_ID = 1 << 64
+_ROUTE_ATTRIBUTES = ("http.route", "mcp.tool.name", "aura.tool_name")
+
+
+def parse_route_rates(spec: str | None) -> dict[str, float]:
+    """Parse ``"route=rate,prefix*=rate"`` into a dict (bad items skipped)."""
+    rates: dict[str, float] = {}
+    for item in (spec or "").split(","):
+        route, sep, rate = item.partition("=")
+        if not sep or not route.strip():
+            continue
+        try:
+            rates[route.strip()] = min(1.0, max(0.0, float(rate)))
+        except ValueError:
+            continue
+    return rates
+
+
+class AdaptiveBudget:
+    """Scales sampling so exported spans stay under a per-second budget."""
+
+    def __init__(
+        self,
+        spans_per_second: float = 0.0,
+        *,
+        window: float = 1.0,
+        min_factor: float = 0.001,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the budget.
+
+        Args:
+            spans_per_second: Export budget (<= 0 disables the limit)
+            window: Seconds between rate adjustments
+            min_factor: Lower bound for the sampling factor
+            clock: Monotonic time source
+        """
+        self.spans_per_second = spans_per_second
+        self.window = window
+        self.min_factor = min_factor
+        self.clock = clock
+        self.factor = 1.0
+        self._count = 0
+        self._window_start = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.spans_per_second > 0
+
+    def record(self, spans: int = 1) -> None:
+        """Count exported spans; adjusts the factor once per window."""
+        if not self.enabled:
+            return
+        self._count += spans
+        now = self.clock()
+        if now - self._window_start >= self.window:
+            self._adjust(now)
+
+    def _adjust(self, now: float) -> None:
+        with self._lock:
+            elapsed = now - self._window_start
+            if elapsed < self.window:
+                return  # another thread adjusted already
+            observed = self._count / elapsed
+            self._count = 0
+            self._window_start = now
+            if observed > self.spans_per_second:
+                factor = self.factor * self.spans_per_second / observed
+            elif observed > 0:
+                # Recover gradually, at most doubling per window
+                factor = self.factor * min(
+                    2.0, self.spans_per_second / observed
+                )
+            else:
+                factor = self.factor * 2.0
+            self.factor = min(1.0, max(self.min_factor, factor))
+
+
+class TraceSampler:
+    """Head sampling per route plus tail rules under an export budget."""
+
+    def __init__(
+        self,
+        *,
+        default_rate: float = 1.0,
+        route_rates: dict[str, float] | None = None,
+        slow_threshold: float = 1.0,
+        budget: AdaptiveBudget | None = None,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        """Initialize the sampler.
+
+        Args:
+            default_rate: Head rate for routes without their own rate
+            route_rates: Head rate per route (``prefix*`` allowed)
+            slow_threshold: Seconds from which a trace is always kept
+            budget: Export budget (default: unlimited)
+            rng: Random source for traces without a trace id
+        """
+        self.default_rate = default_rate
+        self.route_rates = dict(route_rates or {})
+        self._prefixes = sorted(
+            (
+                (route[:-1], rate)
+                for route, rate in self.route_rates.items()
+                if route.endswith("*")
+            ),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self._resolved: dict[str, float] = {}
+        self.slow_threshold = slow_threshold
+        self.budget = budget or AdaptiveBudget()
+        self.rng = rng
+        self.stats = {"slow": 0, "error": 0, "sampled": 0, "dropped": 0}
+
+    @property
+    def active(self) -> bool:
+        """Whether anything would be dropped (rates below 1 or a budget)."""
+        return (
+            self.default_rate < 1.0
+            or any(rate < 1.0 for rate in self.route_rates.values())
+            or self.budget.enabled
+        )
+
+    @classmethod
+    def from_env(cls, prefix: str) -> TraceSampler:
+        """Build from ``<prefix>_SAMPLE_RATE``, ``_SAMPLE_RATES``,
+        ``_SLOW_MS`` and ``_BUDGET_PER_SEC`` environment variables."""
+        return cls(
+            default_rate=float(os.getenv(f"{prefix}_SAMPLE_RATE", "1.0")),
+            route_rates=parse_route_rates(os.getenv(f"{prefix}_SAMPLE_RATES")),
+            slow_threshold=float(os.getenv(f"{prefix}_SLOW_MS", "1000"))
+            / 1000,
+            budget=AdaptiveBudget(
+                float(os.getenv(f"{prefix}_BUDGET_PER_SEC", "0"))
+            ),
+        )
+
+    def rate_for(self, route: str) -> float:
+        """Configured head rate of ``route`` (before the budget factor)."""
+        rate = self._resolved.get(route)
+        if rate is None:
+            rate = self.route_rates.get(route)
+            if rate is None:
+                rate = next(
+                    (r for p, r in self._prefixes if route.startswith(p)),
+                    self.default_rate,
+                )
+            if len(self._resolved) < 4096:
+                self._resolved[route] = rate
+        return rate
+
+    def head(self, route: str, trace_id: int | None = None) -> bool:
+        """Whether a trace on ``route`` is in the regular sample.
+
+        With a trace id the decision is deterministic, so every service
+        seeing the trace agrees.
+        """
+        rate = self.rate_for(route) * self.budget.factor
+        if rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+        if trace_id is not None:
+            return (trace_id % _MAX_TRACE_ID) < rate * _MAX_TRACE_ID
+        return self.rng() < rate
+
+    def keep(
+        self, *, duration: float, error: bool, head_sampled: bool
+    ) -> bool:
+        """Tail decision for a finished trace."""
+        if error:
+            self.stats["error"] += 1
+        elif duration >= self.slow_threshold:
+            self.stats["slow"] += 1
+        elif head_sampled:
+            self.stats["sampled"] += 1
+        else:
+            self.stats["dropped"] += 1
+            return False
+        return True
+
+    def decide(
+        self,
+        route: str,
+        *,
+        duration: float,
+        error: bool,
+        trace_id: int | None = None,
+    ) -> bool:
+        """Head and tail decision for a span whose outcome is known.
+
+        Counts the span against the budget when it is kept.
+        """
+        head_sampled = self.head(route, trace_id)
+        if self.keep(
+            duration=duration, error=error, head_sampled=head_sampled
+        ):
+            self.budget.record()
+            return True
+        return False
+
+
+def _route(name: str, attributes: Any) -> str:
+    for key in _ROUTE_ATTRIBUTES:
+        value = attributes.get(key) if attributes else None
+        if value:
+            return str(value)
+    return name
+
+
+class OtelRouteSampler(_SamplerBase):
+    """OpenTelemetry sampler applying ``TraceSampler`` head rates.
+
+    Root spans are routed by span name (or an ``http.route`` /
+    ``mcp.tool.name`` attribute given at start); child spans follow their
+    parent. Traces outside the head sample are recorded but not marked
+    sampled, so ``TailSamplingSpanProcessor`` can still keep them.
+    """
+
+    def __init__(self, sampler: TraceSampler) -> None:
+        self.sampler = sampler
+
+    def should_sample(
+        self,
+        parent_context: Any,
+        trace_id: int,
+        name: str,
+        kind: Any = None,
+        attributes: Any = None,
+        links: Any = None,
+        trace_state: Any = None,
+    ) -> Any:
+        from opentelemetry import trace
+        from opentelemetry.sdk.trace.sampling import Decision, SamplingResult
+
+        parent = trace.get_current_span(parent_context).get_span_context()
+        if parent.is_valid:
+            sampled = parent.trace_flags.sampled
+            trace_state = parent.trace_state
+        else:
+            sampled = self.sampler.head(_route(name, attributes), trace_id)
+        decision = (
+            Decision.RECORD_AND_SAMPLE if sampled else Decision.RECORD_ONLY
+        )
+        return SamplingResult(decision, attributes, trace_state)
+
+    def get_description(self) -> str:
+        return "OtelRouteSampler"
+
+
+class TailSamplingSpanProcessor(_SpanProcessorBase):
+    """Buffers finished spans per trace and exports the traces kept.
+
+    A trace is decided when its local root span ends, or when it is
+    evicted (``max_traces`` buffered, or older than ``trace_timeout``).
+    Kept spans are exported in batches from a background thread.
+    """
+
+    def __init__(
+        self,
+        sampler: TraceSampler,
+        exporter: Any,
+        *,
+        max_traces: int = 2048,
+        trace_timeout: float = 30.0,
+        max_export_batch_size: int = 512,
+        export_interval: float = 5.0,
+        max_queue_size: int = 8192,
+    ) -> None:
+        self.sampler = sampler
+        self.exporter = exporter
+        self.max_traces = max_traces
+        self.trace_timeout = trace_timeout
+        self.max_export_batch_size = max_export_batch_size
+        self.export_interval = export_interval
+        self.max_queue_size = max_queue_size
+        # trace_id -> (first seen, spans ended so far)
+        self._traces: OrderedDict[int, tuple[float, list[Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._queue: deque[Any] = deque()
+        self._wake = threading.Event()
+        self._export_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._shutdown = False
+        self.stats = {"exported": 0, "dropped_queue_full": 0, "errors": 0}
+
+    def on_start(self, span: Any, parent_context: Any = None) -> None:
+        pass
+
+    def on_end(self, span: Any) -> None:
+        if self._shutdown:
+            return
+        now = time.monotonic()
+        parent = span.parent
+        finished: list[tuple[Any, list[Any]]] = []
+        with self._lock:
+            trace_id = span.context.trace_id
+            entry = self._traces.get(trace_id)
+            if entry is None:
+                entry = self._traces[trace_id] = (now, [])
+            entry[1].append(span)
+            if parent is None or parent.is_remote:
+                finished.append((span, self._traces.pop(trace_id)[1]))
+            while self._traces:
+                oldest_id, (first_seen, spans) = next(
+                    iter(self._traces.items())
+                )
+                if (
+                    len(self._traces) <= self.max_traces
+                    and now - first_seen < self.trace_timeout
+                ):
+                    break
+                del self._traces[oldest_id]
+                finished.append((None, spans))
+        for root, spans in finished:
+            self._decide(root, spans)
+
+    @staticmethod
+    def _duration(span: Any) -> float:
+        if span.end_time is None or span.start_time is None:
+            return 0.0
+        return (span.end_time - span.start_time) / 1e9
+
+    def _decide(self, root: Any, spans: list[Any]) -> None:
+        ref = root or max(spans, key=self._duration)
+        error = any(not span.status.is_ok for span in spans)
+        if not self.sampler.keep(
+            duration=self._duration(ref),
+            error=error,
+            head_sampled=ref.context.trace_flags.sampled,
+        ):
+            return
+        if len(self._queue) + len(spans) > self.max_queue_size:
+            self.stats["dropped_queue_full"] += len(spans)
+            return
+        self.sampler.budget.record(len(spans))
+        self._queue.extend(spans)
+        if self._thread is None:
+            self._start()
+        if len(self._queue) >= self.max_export_batch_size:
+            self._wake.set()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="otel-tail-export", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._shutdown:
+            self._wake.wait(self.export_interval)
+            self._wake.clear()
+            self._export_queued()
+
+    def _export_queued(self) -> None:
+        with self._export_lock:
+            while self._queue:
+                batch: list[Any] = []
+                while self._queue and len(batch) < self.max_export_batch_size:
+                    batch.append(self._queue.popleft())
+                self._export(batch)
+
+    def _export(self, batch: Sequence[Any]) -> None:
+        try:
+            self.exporter.export(batch)
+            self.stats["exported"] += len(batch)
+        except Exception:  # noqa: BLE001 - never break the app on export
+            self.stats["errors"] += 1
+            logger.debug("Span export failed", exc_info=True)
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Decide buffered traces as they are and export everything."""
+        with self._lock:
+            pending = [spans for _, spans in self._traces.values()]
+            self._traces.clear()
+        for spans in pending:
+            self._decide(None, spans)
+        self._export_queued()
+        return True
+
+    def shutdown(self) -> None:
+        self.force_flush()
+        self._shutdown = True
+        self._wake.set()
+        self.exporter.shutdown()
+
+
+__all__ = [
+    "AdaptiveBudget",
+    "OtelRouteSampler",
+    "TailSamplingSpanProcessor",
+    "TraceSampler",
+    "parse_route_rates",
+]
@@ -6,6 +6,10 @@ uses in-memory (no-op) exporter.
 
 Supports both gRPC (port 4317) and HTTP (port 4318) protocols based on
 OTEL_EXPORTER_OTLP_PROTOCOL environment variable.
+
+OTEL_SAMPLE_RATE(S), OTEL_BUDGET_PER_SEC or OTEL_TAIL_SAMPLING switch to
+per-route head sampling with tail rules (see trace_sampling): slow traces
+(OTEL_SLOW_MS) and errored traces are always exported.
 """
 
 from __future__ import annotations
@@ -14,6 +18,12 @@ import logging
 import os
 from typing import Any
 
+from .trace_sampling import (
+    OtelRouteSampler,
+    TailSamplingSpanProcessor,
+    TraceSampler,
+)
+
 # OpenTelemetry tracing initialization (optional).
 
 logger = logging.getLogger("ide_agents.tracing")
@@ -57,7 +67,10 @@ def init_tracing(service_name: str = "ide-agents-mcp") -> bool:
         protocol = os.getenv("OTEL_EXPORTER_OTLP_PROTOCOL", "grpc").lower()
 
         resource = Resource.create({"service.name": service_name})
-        provider = TracerProvider(resource=resource)
+        sampler = TraceSampler.from_env("OTEL")
+        tail_sampling = sampler.active or os.getenv(
+            "OTEL_TAIL_SAMPLING", ""
+        ).lower() in {"1", "true", "yes"}
         span_exporter = None
 
         if endpoint:
@@ -105,7 +118,14 @@ def init_tracing(service_name: str = "ide-agents-mcp") -> bool:
             span_exporter = ConsoleSpanExporter()
             logger.info("Using ConsoleSpanExporter (no OTLP endpoint)")
 
-        processor = BatchSpanProcessor(span_exporter)
+        if tail_sampling:
+            provider = TracerProvider(
+                resource=resource, sampler=OtelRouteSampler(sampler)
+            )
+            processor = TailSamplingSpanProcessor(sampler, span_exporter)
+        else:
+            provider = TracerProvider(resource=resource)
+            processor = BatchSpanProcessor(span_exporter)
         provider.add_span_processor(processor)
         trace.set_tracer_provider(provider)
 
@@ -0,0 +1,120 @@
+"""Tests for the bucketed, streaming security anomaly detector."""
+
+import json
+import time
+
+from src.mcp_server.security.anomaly_detector import AnomalyDetector
+from src.mcp_server.security.audit_writer import get_audit_writer
+
+NOW = 1_800_000_000.0
+
+
+def _detector(**kwargs):
+    clock = {"now": NOW}
+    detector = AnomalyDetector(clock=lambda: clock["now"], **kwargs)
+    return detector, clock
+
+
+def _events(detector, etype, count, minutes_ago):
+    for i in range(count):
+        detector.observe({"type": etype, "ts": NOW - minutes_ago * 60 + i})
+
+
+def test_windows_count_by_age():
+    detector, _ = _detector(thresholds={})
+    _events(detector, "rate_limited", 3, minutes_ago=5)
+    _events(detector, "rate_limited", 4, minutes_ago=30)
+    _events(detector, "tool_failure", 2, minutes_ago=120)
+    _events(detector, "tool_failure", 9, minutes_ago=25 * 60)  # expired
+    detector.observe({"type": "http", "ts": "2026-01-01T00:00:00"})
+
+    summary = detector.analyze(3600)
+    assert summary["recent_short"] == {"rate_limited": 3}
+    assert summary["recent"] == {"rate_limited": 7}
+    assert summary["events"] == {"rate_limited": 7, "tool_failure": 2}
+    assert summary["trend"]["rate_limited"]["short_window"] == 3
+
+
+def test_threshold_and_spike_anomalies():
+    detector, _ = _detector(
+        thresholds={"rate_limited": 20}, spike_factor=3, spike_min_count=5
+    )
+    # Steady 1/min baseline, then a burst in the last 15 minutes
+    for minute in range(16, 60):
+        _events(detector, "rate_limited", 1, minutes_ago=minute)
+    for minute in range(1, 15):
+        _events(detector, "rate_limited", 4, minutes_ago=minute)
+    # Steady traffic is not a spike
+    for minute in range(1, 60):
+        _events(detector, "approval_requested", 2, minutes_ago=minute)
+
+    anomalies = detector.analyze(3600)["anomalies"]
+    kinds = {(a["type"], a["kind"]) for a in anomalies}
+    assert kinds == {("rate_limited", "threshold"), ("rate_limited", "spike")}
+    spike = next(a for a in anomalies if a["kind"] == "spike")
+    assert spike["count"] == 56
+    assert spike["rate_per_min"] > 3 * spike["baseline_per_min"]
+
+
+def test_buckets_expire_as_clock_advances():
+    detector, clock = _detector(retention_seconds=3600, thresholds={})
+    _events(detector, "rate_limited", 5, minutes_ago=1)
+    clock["now"] += 30 * 60
+    assert detector.analyze(3600)["recent"] == {"rate_limited": 5}
+    clock["now"] += 31 * 60
+    assert detector.analyze(3600)["recent"] == {}
+    # A late event for an expired bucket is ignored
+    detector.observe({"type": "rate_limited", "ts": NOW})
+    assert detector.analyze(3600)["events"] == {}
+
+
+def test_attach_loads_tail_then_follows_writer(tmp_path):
+    path = tmp_path / "security_audit.jsonl"
+    now = time.time()
+    lines = [json.dumps({"type": "old", "ts": now - 10})] * 3
+    path.write_text("garbage\n" + "\n".join(lines) + "\n")
+
+    writer = get_audit_writer(path)
+    detector = AnomalyDetector(thresholds={})
+    detector.attach(path)
+    writer.append({"type": "new", "ts": time.time()})
+    detector.attach(path)  # no-op for the same writer
+    assert detector.analyze(900)["recent"] == {"old": 3, "new": 1}
+
+    # A replacement writer is followed without reloading the file
+    writer.close()
+    detector.attach(path)
+    get_audit_writer(path).append(
+        {"type": "new", "ts": time.time()}, sync=True
+    )
+    assert detector.analyze(900)["recent"] == {"old": 3, "new": 2}
+    get_audit_writer(path).close()
+
+
+def test_load_tail_skips_cut_line(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    now = time.time()
+    entry = json.dumps({"type": "x", "ts": now, "pad": "y" * 50})
+    path.write_text("\n".join([entry] * 10) + "\n")
+
+    detector = AnomalyDetector(thresholds={})
+    assert detector.load_tail(path, max_bytes=len(entry) * 3) == 2
+
+
+def test_analyze_cost_independent_of_volume():
+    detector, _ = _detector()
+    start = time.perf_counter()
+    detector.analyze(3600)
+    empty = time.perf_counter() - start
+
+    for i in range(100_000):
+        detector.observe({"type": f"t{i % 5}", "ts": NOW - (i % 86000)})
+    start = time.perf_counter()
+    summary = detector.analyze(3600)
+    full = time.perf_counter() - start
+
+    print(
+        f"\nanalyze: empty {empty * 1e3:.2f}ms, 100k events {full * 1e3:.2f}ms"
+    )
+    assert sum(summary["events"].values()) == 100_000
+    assert full < 0.05
@@ -0,0 +1,269 @@
+"""Tests for the shared batched audit log writer."""
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from aura_ia_mcp.core import audit
+from mcp_server.security import audit_writer
+from src.mcp_server.security.audit_writer import (
+    AuditWriter,
+    get_audit_writer,
+)
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_concurrent_appends_are_batched_in_order(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    writer = AuditWriter(path, flush_interval=0.01, fsync_interval=-1)
+
+    def produce(worker):
+        for i in range(500):
+            writer.append({"worker": worker, "i": i})
+
+    threads = [threading.Thread(target=produce, args=(w,)) for w in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert writer.flush()
+
+    records = _lines(path)
+    assert len(records) == 2000
+    for worker in range(4):
+        seen = [r["i"] for r in records if r["worker"] == worker]
+        assert seen == list(range(500))
+    assert writer.stats["batches"] < 200
+    writer.close()
+
+
+def test_sync_append_is_visible_immediately(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    writer = AuditWriter(path, flush_interval=10)
+    writer.append({"event": "queued"})
+    writer.append({"event": "state_change"}, sync=True)
+
+    assert [r["event"] for r in _lines(path)] == ["queued", "state_change"]
+    writer.close()
+
+
+def test_drop_policy_when_ring_is_full(tmp_path):
+    writer = AuditWriter(tmp_path / "a.jsonl", capacity=3, overflow="drop")
+    writer._thread = object()  # flusher never runs
+    results = [writer.append({"i": i}) for i in range(5)]
+
+    assert results == [True, True, True, False, False]
+    assert writer.stats["dropped"] == 2
+    assert writer.pending == 3
+
+
+def test_block_policy_waits_for_flusher(tmp_path):
+    path = tmp_path / "a.jsonl"
+    writer = AuditWriter(path, capacity=4, flush_interval=10, block_timeout=2)
+    for i in range(50):
+        assert writer.append({"i": i})
+    writer.close()
+
+    assert [r["i"] for r in _lines(path)] == list(range(50))
+    assert writer.stats["dropped"] == 0
+    assert writer.append({"late": True}) is False
+
+
+@pytest.mark.parametrize(
+    ("fsync_interval", "expected"), [(0, 3), (-1, 0), (3600, 0)]
+)
+def test_fsync_cadence(tmp_path, fsync_interval, expected):
+    writer = AuditWriter(tmp_path / "a.jsonl", fsync_interval=fsync_interval)
+    for i in range(3):
+        writer.append({"i": i}, sync=True)
+    assert writer.stats["fsyncs"] == expected
+    writer.close()
+
+
+def test_write_errors_are_counted(tmp_path):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    writer = AuditWriter(blocker / "a.jsonl")
+
+    assert writer.append({"i": 1}, sync=True) is False
+    assert writer.stats["write_errors"] == 1
+    assert writer.stats["dropped"] == 1
+    writer.close()
+
+
+def test_unencodable_record_does_not_stop_the_flusher(tmp_path):
+    path = tmp_path / "a.jsonl"
+    writer = AuditWriter(path, flush_interval=10)
+
+    assert writer.append({"args": "\ud800"}, sync=True) is True
+    assert writer.append({"event": "after"}, sync=True) is True
+    assert writer.flush()
+    assert [r.get("event") for r in _lines(path)] == [None, "after"]
+    writer.close()
+
+
+def test_failed_batch_fails_its_sync_waiters(tmp_path, monkeypatch):
+    writer = AuditWriter(tmp_path / "a.jsonl", flush_interval=10)
+
+    def boom(lines):
+        raise RuntimeError("unexpected")
+
+    monkeypatch.setattr(writer, "_write_batch", boom)
+    assert writer.append({"i": 1}, sync=True) is False
+    assert writer.stats["write_errors"] == 1
+    assert writer._flusher_alive()
+    writer.close()
+
+
+def test_sync_append_times_out(tmp_path):
+    writer = AuditWriter(tmp_path / "a.jsonl", sync_timeout=0.05)
+    writer._thread = object()  # flusher never runs
+
+    assert writer.append({"i": 1}, sync=True) is False
+    assert writer._sync_outcomes == {}
+
+
+def test_lost_governance_record_raises(tmp_path, monkeypatch):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    settings = SimpleNamespace(AUDIT_LOG_PATH=str(blocker / "a.jsonl"))
+    monkeypatch.setattr(audit, "get_settings", lambda: settings)
+
+    with pytest.raises(OSError, match="not written"):
+        audit.write_audit_log({"event": "capability_state"}, sync=True)
+    audit.write_audit_log({"event": "policy_decision"})  # best effort
+    get_audit_writer(settings.AUDIT_LOG_PATH).close()
+
+
+def test_middleware_and_sinks_share_one_writer(tmp_path):
+    path = str(tmp_path / "security_audit.jsonl")
+    writer = audit_writer.get_audit_writer(path)
+    assert audit.get_audit_writer(path) is writer
+    writer.close()
+
+
+def test_writers_are_shared_per_path(tmp_path):
+    path = tmp_path / "shared.jsonl"
+    writer = get_audit_writer(path)
+    assert get_audit_writer(str(path)) is writer
+    writer.close()
+    assert get_audit_writer(path) is not writer
+
+
+def test_append_cost_vs_open_per_record(tmp_path):
+    """Caller-side cost of one audit record, batched vs direct append."""
+    records = [{"type": "http", "path": "/api", "i": i} for i in range(5000)]
+
+    direct = tmp_path / "direct.jsonl"
+    start = time.perf_counter()
+    for record in records:
+        with direct.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record) + "\n")
+    per_open = (time.perf_counter() - start) / len(records)
+
+    writer = AuditWriter(tmp_path / "batched.jsonl", fsync_interval=-1)
+    start = time.perf_counter()
+    for record in records:
+        writer.append(record)
+    per_append = (time.perf_counter() - start) / len(records)
+    assert writer.flush()
+    writer.close()
+
+    print(
+        f"\naudit append: open-per-record {per_open * 1e6:.1f}us, "
+        f"batched {per_append * 1e6:.1f}us"
+    )
+    assert writer.stats["written"] == len(records)
+    assert per_append < per_open
+
+
+def test_rotation_checks_tracked_size_not_disk(tmp_path, monkeypatch):
+    path = tmp_path / "audit.jsonl"
+    rotated = []
+
+    def rotate(current):
+        target = tmp_path / f"rotated.{len(rotated)}.jsonl"
+        current.rename(target)
+        rotated.append(target)
+
+    writer = AuditWriter(path, fsync_interval=-1)
+    writer.set_rotation(rotate, max_bytes=1000)
+    stats = []
+    real_size = writer._file_size
+    monkeypatch.setattr(
+        writer, "_file_size", lambda: stats.append(1) or real_size()
+    )
+    for i in range(100):
+        writer.append({"i": i, "pad": "x" * 40}, sync=True)
+    writer.close()
+
+    files = [*rotated, path]
+    assert all(f.stat().st_size <= 1000 for f in files)
+    assert [r["i"] for f in files for r in _lines(f)] == list(range(100))
+    assert writer.stats["rotations"] == len(rotated) >= 5
+    # One stat up front, then one per rotation to confirm it
+    assert len(stats) == 1 + len(rotated)
+
+
+def test_rotation_by_age(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    path.write_text('{"old": true}\n')
+    moved = tmp_path / "old.jsonl"
+    writer = AuditWriter(path)
+    writer.set_rotation(
+        lambda p: p.rename(moved), max_age=60, last_rotation=time.time() - 61
+    )
+    writer.append({"new": True}, sync=True)
+    writer.append({"newer": True}, sync=True)
+    writer.close()
+
+    assert _lines(moved) == [{"old": True}]
+    assert _lines(path) == [{"new": True}, {"newer": True}]
+
+
+def test_security_audit_rotates_to_gzip_archives(tmp_path, monkeypatch):
+    import gzip
+
+    from src.mcp_server.security import audit_logger
+
+    monkeypatch.setattr(audit_logger, "_AUDIT_DIR", tmp_path)
+    monkeypatch.setattr(
+        audit_logger, "_AUDIT_FILE", tmp_path / "security_audit.jsonl"
+    )
+    monkeypatch.setattr(
+        audit_logger, "_META_FILE", tmp_path / "security_audit.meta.json"
+    )
+    monkeypatch.setattr(audit_logger, "_MAX_SIZE_BYTES", 4000)
+    # An archive numbered past the limit from an older layout
+    (tmp_path / "security_audit.7.jsonl.gz").write_bytes(b"")
+
+    for i in range(500):
+        audit_logger.rate_limited(f"key{i}")
+        if i % 10 == 9:
+            assert audit_logger.flush()
+    writer = audit_logger._writer()
+    writer.close()
+    deadline = time.time() + 5
+    while list(tmp_path.glob("security_audit.pending-*")):
+        assert time.time() < deadline
+        time.sleep(0.01)
+    with audit_logger._lock:
+        pass
+
+    archives = sorted(tmp_path.glob("security_audit.*.jsonl.gz"))
+    assert [a.name for a in archives] == [
+        f"security_audit.{i}.jsonl.gz" for i in range(1, 6)
+    ]
+    newest = gzip.decompress(archives[0].read_bytes()).decode()
+    live = audit_logger._AUDIT_FILE.read_text()
+    keys = [json.loads(line)["key"] for line in (newest + live).splitlines()]
+    assert keys[-1] == "key499"
+    assert keys == [f"key{i}" for i in range(500 - len(keys), 500)]
+    meta = json.loads(audit_logger._META_FILE.read_text())
+    assert meta["last_rotation_ts"] <= time.time()
@@ -0,0 +1,126 @@
+"""Tests for token-bucket admission control on cloud providers."""
+
+import asyncio
+import time
+from dataclasses import replace
+
+from aura_ia_mcp.services.model_gateway.adapters.cloud import (
+    GOOGLE_MODELS,
+    OLLAMA_CLOUD_MODELS,
+    CloudAdapterFactory,
+    CloudProvider,
+    CloudProviderBudget,
+)
+from aura_ia_mcp.services.model_gateway.adapters.cloud.base_cloud import (
+    TokenBucket,
+)
+
+FLASH = GOOGLE_MODELS["gemini-1.5-flash"]
+
+
+def test_token_bucket_refills_over_time():
+    bucket = TokenBucket(capacity=10, refill_per_second=5, last_refill=0.0)
+    bucket.consume(10)
+
+    assert bucket.time_until(5) == 1.0
+    bucket.refill(1.0)
+    assert bucket.tokens == 5
+    bucket.refill(100.0)
+    assert bucket.tokens == 10  # capped at capacity
+
+
+async def test_acquire_waits_for_request_capacity():
+    # 600 RPM -> one request every 0.1s once the burst is spent
+    config = replace(FLASH, rate_limit_rpm=600, free_tier_daily_limit=0)
+    budget = CloudProviderBudget(CloudProvider.GOOGLE)
+    budget._get_buckets(config)[0].tokens = 0
+
+    start = time.monotonic()
+    ok, reason = await budget.acquire(config, timeout=1.0)
+
+    assert ok, reason
+    assert time.monotonic() - start >= 0.09
+    assert budget.get_stats()["admission_waits"] == 1
+
+
+async def test_acquire_rejects_when_deadline_too_short():
+    config = replace(FLASH, rate_limit_rpm=1, free_tier_daily_limit=0)
+    budget = CloudProviderBudget(CloudProvider.GOOGLE)
+
+    assert (await budget.acquire(config, timeout=0.0))[0]
+    ok, reason = await budget.acquire(config, timeout=0.05)
+
+    assert not ok
+    assert "Rate limit exceeded" in reason
+    assert budget.get_stats()["admission_rejections"] == 1
+
+
+async def test_tpm_is_enforced_and_settled():
+    config = replace(FLASH, rate_limit_tpm=1000, free_tier_daily_limit=0)
+    budget = CloudProviderBudget(CloudProvider.GOOGLE)
+
+    assert (await budget.acquire(config, tokens=900, timeout=0.0))[0]
+    assert not (await budget.acquire(config, tokens=900, timeout=0.0))[0]
+
+    # Actual usage was far below the reservation -> capacity refunded
+    await budget.record_request(config, 50, 50, reserved_tokens=900)
+    assert (await budget.acquire(config, tokens=800, timeout=0.0))[0]
+
+
+async def test_unlimited_free_tier_is_not_rejected():
+    config = OLLAMA_CLOUD_MODELS["deepseek-v3.1-671b"]
+    budget = CloudProviderBudget(CloudProvider.OLLAMA_CLOUD)
+
+    assert config.free_tier_daily_limit == 0
+    assert (await budget.acquire(config, timeout=0.0))[0]
+
+
+def test_select_adapter_spreads_to_equivalent_model():
+    factory = CloudAdapterFactory(google_api_key="test-key")
+
+    primary = factory.select_adapter("gemini-1.5-flash")
+    assert primary.model_config.model_id == "gemini-1.5-flash"
+
+    # Exhaust the primary model's request bucket
+    primary.provider_budget._get_buckets(primary.model_config)[0].tokens = 0
+    spread = factory.select_adapter("gemini-1.5-flash")
+
+    assert spread.model_config.model_id != "gemini-1.5-flash"
+    assert spread.model_config.model_id in factory.get_equivalent_models(
+        "gemini-1.5-flash"
+    )
+
+
+async def _cancel_while_in_flight(coro):
+    task = asyncio.create_task(coro)
+    await asyncio.sleep(0.02)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+async def test_cancelled_calls_release_their_reservation():
+    factory = CloudAdapterFactory(google_api_key="test-key")
+    adapter = factory.select_adapter("gemini-1.5-flash")
+    bucket = adapter.provider_budget._get_buckets(adapter.model_config)[1]
+
+    async def slow_call(**kwargs):
+        await asyncio.sleep(10)
+
+    async def slow_stream(**kwargs):
+        await asyncio.sleep(10)
+        yield "never"
+
+    adapter._call_api = slow_call
+    adapter._stream_api = slow_stream
+
+    # e.g. the losing side of a hedge
+    await _cancel_while_in_flight(adapter.generate("hi", max_tokens=500))
+    assert bucket.tokens == bucket.capacity
+
+    stream = adapter.generate_stream("hi", max_tokens=500)
+    await _cancel_while_in_flight(anext(stream))
+    assert bucket.tokens == bucket.capacity
+    assert adapter.provider_budget.get_stats()["total_requests"] == 0
@@ -0,0 +1,134 @@
+"""Tests for shared cloud HTTP connections."""
+
+import asyncio
+import json
+from dataclasses import replace
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from aura_ia_mcp.services.model_gateway.adapters.cloud import (
+    MOONSHOT_MODELS,
+    CloudAdapterFactory,
+    CloudConnectionManager,
+    KimiAdapter,
+)
+from aura_ia_mcp.services.model_gateway.adapters.cloud.connections import (
+    HTTP2_AVAILABLE,
+    track_connection_timings,
+)
+
+COMPLETION = {
+    "choices": [{"message": {"content": "pong"}}],
+    "usage": {"prompt_tokens": 3, "completion_tokens": 1},
+}
+
+
+async def _handle(reader, writer):
+    """Minimal HTTP/1.1 keep-alive server answering every request with JSON."""
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.decode().split("\r\n"):
+                if line.lower().startswith("content-length:"):
+                    length = int(line.split(":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            body = json.dumps(COMPLETION).encode()
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+@pytest.fixture
+async def server_url():
+    server = await asyncio.start_server(_handle, "localhost", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://localhost:{port}"
+    server.close()
+    await server.wait_closed()
+
+
+def _manager() -> CloudConnectionManager:
+    return CloudConnectionManager(metrics_registry=CollectorRegistry())
+
+
+async def test_connections_are_reused_and_dns_is_cached(server_url):
+    manager = _manager()
+    client = manager.get_client("moonshot")
+
+    first = track_connection_timings()
+    await client.get(f"{server_url}/a")
+    second = track_connection_timings()
+    await client.get(f"{server_url}/b")
+
+    assert first.new_connections == 1
+    assert first.connect_ms > 0
+    assert second.new_connections == 0
+    assert second.handshake_ms == 0
+
+    stats = manager.get_stats()
+    assert stats["connections_opened"] == 1
+    assert stats["dns_lookups"] == 1
+    assert stats["dns_cache_installed"]
+    await manager.close()
+    assert manager.get_stats()["open_clients"] == 0
+
+
+async def test_adapters_share_provider_client(server_url):
+    manager = _manager()
+    fast = KimiAdapter(api_key="k", connection_manager=manager)
+    long = KimiAdapter(
+        api_key="k", model_id="kimi-k2-128k", connection_manager=manager
+    )
+    assert await fast._get_client() is await long._get_client()
+
+    fast.model_config = replace(
+        MOONSHOT_MODELS["kimi-k2-8k"],
+        api_endpoint=f"{server_url}/v1/chat/completions",
+    )
+    result = await fast.generate("ping", admission_timeout=0)
+
+    assert result["success"], result
+    assert result["response"] == "pong"
+    assert result["connect_ms"] > 0
+    assert result["tls_ms"] == 0  # plain HTTP
+    assert 0 <= result["generation_ms"] <= result["latency_ms"]
+    await manager.close()
+
+
+async def test_factory_lifecycle(server_url, monkeypatch):
+    for var in (
+        "GOOGLE_API_KEY",
+        "MINIMAX_API_KEY",
+        "MOONSHOT_API_KEY",
+        "DASHSCOPE_API_KEY",
+    ):
+        monkeypatch.delenv(var, raising=False)
+    manager = _manager()
+    factory = CloudAdapterFactory(connection_manager=manager)
+
+    # Only the local Ollama Cloud provider is configured -> nothing remote
+    assert await factory.warm_up() == {}
+
+    results = await manager.warm_up({"moonshot": f"{server_url}/v1/chat"})
+    assert results == {"moonshot": True}
+    assert manager.get_stats()["connections_opened"] == 1
+
+    await factory.close_all()
+    assert manager.get_stats()["open_clients"] == 0
+
+
+def test_http2_degrades_without_h2():
+    manager = CloudConnectionManager(
+        http2=True, metrics_registry=CollectorRegistry()
+    )
+    assert manager.http2 is HTTP2_AVAILABLE
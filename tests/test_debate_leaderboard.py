@@ -0,0 +1,248 @@
+"""Tests for the incrementally maintained debate leaderboard."""
+
+import asyncio
+import random
+import time
+from contextlib import asynccontextmanager
+
+from aura_ia_mcp.services.debate_engine import (
+    DebateEngine,
+    Leaderboard,
+    close_debate_engine,
+)
+from aura_ia_mcp.services.debate_engine import engine as engine_module
+from aura_ia_mcp.services.debate_engine.elo import calculate_elo_change
+from aura_ia_mcp.services.debate_engine.scheduler import DebateScheduler
+
+MODELS = ["m1", "m2", "m3"]
+
+
+def _debates(count: int, seed: int = 7) -> list[dict]:
+    """Random debate outcomes with consistent ELO bookkeeping."""
+    rng = random.Random(seed)
+    ratings = {m: 1500 for m in MODELS}
+    debates = []
+    for _ in range(count):
+        model_a, model_b = rng.sample(MODELS, 2)
+        score_a = rng.choice([1.0, 0.5, 0.0])
+        change_a, change_b = calculate_elo_change(
+            ratings[model_a], ratings[model_b], score_a
+        )
+        debates.append(
+            {
+                "model_a": model_a,
+                "model_b": model_b,
+                "winner": {1.0: model_a, 0.0: model_b}.get(score_a),
+                "topic_category": rng.choice(["coding", "reasoning"]),
+                "elo_before_a": ratings[model_a],
+                "elo_before_b": ratings[model_b],
+                "elo_change_a": change_a,
+                "elo_change_b": change_b,
+            }
+        )
+        ratings[model_a] += change_a
+        ratings[model_b] += change_b
+    return debates
+
+
+def test_incremental_view_matches_rebuild():
+    debates = _debates(200)
+    view = Leaderboard({m: 1500 for m in MODELS})
+    for debate in debates:
+        view.apply(debate)
+
+    assert view.verify(debates) == []
+    standings = view.standings()
+    assert [s["elo"] for s in standings] == sorted(
+        (s["elo"] for s in standings), reverse=True
+    )
+    assert sum(s["total_debates"] for s in standings) == 400
+    coding = view.standings("coding")
+    reasoning = view.standings("reasoning")
+    for model in MODELS:
+        split = sum(
+            s["total_debates"]
+            for s in coding + reasoning
+            if s["model"] == model
+        )
+        overall = next(s for s in standings if s["model"] == model)
+        assert split == overall["total_debates"]
+
+
+def test_verify_reports_drift():
+    debates = _debates(20)
+    view = Leaderboard.rebuild(debates)
+    view._records["m1"].wins += 1
+
+    wins = view._records["m1"].wins
+    assert view.verify(debates) == [
+        f"m1.wins: view {wins} != rebuild {wins - 1}"
+    ]
+
+
+def test_pending_deltas_batch_and_restore():
+    view = Leaderboard({m: 1500 for m in MODELS})
+    debates = _debates(4)
+    for debate in debates[:3]:
+        view.apply(debate)
+    assert view.pending_debates == 3
+
+    batch = view.take_pending()
+    assert view.pending_debates == 0
+    assert sum(d.debates for d in batch.values()) == 6
+
+    # Flush failed: a newer debate landed meanwhile, nothing is lost
+    view.apply(debates[3])
+    view.restore_pending(batch)
+    pending = view.take_pending()
+    assert sum(d.debates for d in pending.values()) == 8
+    ratings = view.ratings()
+    assert all(pending[m].elo == ratings[m] for m in pending)
+
+
+def test_leaderboard_reads_independent_of_history():
+    view = Leaderboard.rebuild(_debates(20000))
+    start = time.perf_counter()
+    for _ in range(1000):
+        view.standings()
+    per_read = (time.perf_counter() - start) / 1000
+    print(f"\nleaderboard read over 20000 debates: {per_read * 1e6:.1f}us")
+    assert per_read < 0.001
+
+
+class FakeConnection:
+    def __init__(self, log):
+        self.log = log
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.log.append("begin")
+        yield
+        self.log.append("commit")
+
+    async def execute(self, query, *args):
+        self.log.append("insert_debate")
+
+    async def executemany(self, query, rows):
+        kind = "rankings" if "model_rankings" in query else "rounds"
+        self.log.append((kind, rows))
+
+
+class FakePool:
+    def __init__(self):
+        self.log = []
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield FakeConnection(self.log)
+
+
+class SlowConnection(FakeConnection):
+    def __init__(self, log, pool):
+        super().__init__(log)
+        self.pool = pool
+
+    async def execute(self, query, *args):
+        self.pool.inflight += 1
+        self.pool.peak = max(self.pool.peak, self.pool.inflight)
+        await asyncio.sleep(0.02)
+        self.pool.inflight -= 1
+        await super().execute(query, *args)
+
+
+class SlowPool(FakePool):
+    def __init__(self):
+        super().__init__()
+        self.inflight = 0
+        self.peak = 0
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield SlowConnection(self.log, self)
+
+
+def _engine(**kwargs) -> DebateEngine:
+    engine = DebateEngine(model_ratings={m: 1500 for m in MODELS}, **kwargs)
+    verdicts = iter(["WINNER: Model A", "WINNER: Tie", "WINNER: Model B"] * 9)
+
+    async def generate(model, prompt, max_tokens=1024):
+        if max_tokens == 1500:
+            return next(verdicts), 3, 1
+        return "argument", 1, 1
+
+    engine._generate = generate
+    return engine
+
+
+async def test_engine_flushes_rankings_in_batches():
+    engine = _engine(ranking_flush_every=3)
+    pool = FakePool()
+    engine._db_pool = pool
+    engine._rankings_loaded = True
+
+    for i in range(7):
+        await engine.run_match(MODELS[i % 3], MODELS[(i + 1) % 3], topic="t")
+
+    flushes = [
+        entry[1]
+        for entry in pool.log
+        if isinstance(entry, tuple) and entry[0] == "rankings"
+    ]
+    assert pool.log.count("insert_debate") == 7
+    assert len(flushes) == 2
+    assert sum(row[4] for row in flushes[0]) == 6  # 3 debates, 2 sides
+    assert engine._leaderboard.pending_debates == 1
+
+    assert await engine.flush_leaderboard() == 1
+    assert engine._leaderboard.pending_debates == 0
+
+    engine._db_pool = None  # verify against in-memory history
+    assert await engine.verify_leaderboard() == []
+
+    board = await engine.get_leaderboard()
+    assert sum(row["total_debates"] for row in board) == 14
+    assert {row["model"]: row["elo"] for row in board} == engine.model_ratings
+
+
+async def test_settlement_does_not_hold_lock_during_writes():
+    engine = _engine()
+    pool = SlowPool()
+    engine._db_pool = pool
+    engine._rankings_loaded = True
+
+    await asyncio.gather(
+        *(engine.run_match("m1", "m2", topic="t") for _ in range(3))
+    )
+
+    # Ratings settle one at a time, the debate inserts overlap
+    assert pool.log.count("insert_debate") == 3
+    assert pool.peak == 3
+    assert len(engine._debate_history) == 3
+
+
+def _ranking_flushes(pool: FakePool) -> int:
+    return sum(
+        1
+        for entry in pool.log
+        if isinstance(entry, tuple) and entry[0] == "rankings"
+    )
+
+
+async def test_shutdown_flushes_batched_rankings(monkeypatch):
+    engine = _engine(ranking_flush_every=10)
+    pool = FakePool()
+    engine._db_pool = pool
+    engine._rankings_loaded = True
+    monkeypatch.setattr(engine_module, "_debate_engine", engine)
+
+    await engine.run_match("m1", "m2", topic="t")
+    assert _ranking_flushes(pool) == 0
+
+    # Stopping the scheduler writes out what was batched so far
+    await DebateScheduler().stop()
+    assert _ranking_flushes(pool) == 1
+    assert engine._leaderboard.pending_debates == 0
+
+    await engine.run_match("m2", "m3", topic="t")
+    await close_debate_engine()
+    assert _ranking_flushes(pool) == 2
@@ -0,0 +1,163 @@
+"""Tests for pipelined debate rounds with per-round judging."""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from aura_ia_mcp.services.debate_engine import DebateEngine
+
+DELAY = 0.03
+
+
+class StubModels:
+    """Deterministic model stub: fixed latency, scripted round verdicts."""
+
+    def __init__(self, fail_on: str | None = None):
+        self.calls: list[tuple[str, float]] = []
+        self.fail_on = fail_on
+        self.start = time.perf_counter()
+
+    async def generate(self, model, prompt, max_tokens=1024):
+        if "Round: " in prompt:
+            kind = "judge:" + prompt.split("Round: ", 1)[1].split("\n", 1)[0]
+        elif "Full debate transcript" in prompt:
+            kind = "judge:full"
+        else:
+            kind = f"{model}:{prompt.split('.', 1)[0][-30:]}"
+        self.calls.append((kind, time.perf_counter() - self.start))
+        if self.fail_on and self.fail_on in prompt:
+            raise RuntimeError("model crashed")
+        await asyncio.sleep(DELAY)
+
+        if kind == "judge:rebuttal":
+            return "Model A: 40/100\nModel B: 70/100\nWINNER: Model B", 5, 1
+        if kind.startswith("judge"):
+            return "Model A: 80/100\nModel B: 60/100\nWINNER: Model A", 5, 1
+        return f"{model} says {prompt[-20:]}", 10, 1
+
+
+def _engine(stub: StubModels) -> DebateEngine:
+    engine = DebateEngine(model_ratings={"a": 1500, "b": 1500}, persist=False)
+    engine._generate = stub.generate
+    return engine
+
+
+async def test_pipelined_verdict_from_round_majority():
+    stub = StubModels()
+    result = await _engine(stub).run_match("a", "b", topic="t", pipelined=True)
+
+    assert [r.round_type for r in result.rounds] == [
+        "opening",
+        "opening",
+        "rebuttal",
+        "rebuttal",
+        "closing",
+        "closing",
+    ]
+    assert [r.model_name for r in result.rounds] == ["a", "b"] * 3
+    # Opening and closing to A, rebuttal to B
+    assert result.winner == "a"
+    assert result.score_a == pytest.approx((80 + 40 + 80) / 3)
+    assert result.score_b == pytest.approx((60 + 70 + 60) / 3)
+    assert result.verdict.endswith("WINNER: Model A")
+    assert "judge:full" not in [kind for kind, _ in stub.calls]
+
+
+async def test_round_judging_overlaps_next_round():
+    stub = StubModels()
+    await _engine(stub).run_match("a", "b", topic="t", pipelined=True)
+
+    started = {}
+    for kind, at in stub.calls:
+        started.setdefault(kind, at)
+    opening_judged = started["judge:opening"]
+    rebuttals = [at for kind, at in stub.calls if "rebuttal" in kind]
+    # The opening is scored while the rebuttals are being generated
+    assert abs(opening_judged - min(rebuttals)) < DELAY / 2
+
+
+async def test_failed_turn_cancels_pending_judgements():
+    stub = StubModels(fail_on="closing statement")
+    engine = _engine(stub)
+    before = len(asyncio.all_tasks())
+
+    with pytest.raises(RuntimeError):
+        await engine.run_match("a", "b", topic="t", pipelined=True)
+    await asyncio.sleep(0)
+
+    assert len(asyncio.all_tasks()) == before
+    assert engine._debate_history == []
+
+
+async def test_failed_side_cancels_the_other_turn():
+    cancelled = []
+
+    async def generate(model, prompt, max_tokens=1024):
+        if model == "a":
+            raise RuntimeError("model crashed")
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(model)
+            raise
+        return "argument", 1, 1
+
+    engine = _engine(StubModels())
+    engine._generate = generate
+    start = time.perf_counter()
+
+    with pytest.raises(RuntimeError, match="model crashed"):
+        await engine.run_match("a", "b", topic="t", pipelined=True)
+
+    assert cancelled == ["b"]
+    assert time.perf_counter() - start < 0.5
+
+
+async def test_failed_ollama_call_aborts_the_round():
+    """A real _generate failure raises instead of being judged as text."""
+    prompts = []
+    cancelled = []
+
+    async def ollama(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        prompts.append(body["prompt"])
+        if body["model"] == "a":
+            return httpx.Response(500, json={"error": "model crashed"})
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(body["model"])
+            raise
+        return httpx.Response(200, json={"response": "argument"})
+
+    engine = DebateEngine(model_ratings={"a": 1500, "b": 1500}, persist=False)
+    engine._client = httpx.AsyncClient(transport=httpx.MockTransport(ollama))
+    try:
+        with pytest.raises(httpx.HTTPStatusError):
+            await engine.run_match("a", "b", topic="t", pipelined=True)
+    finally:
+        await engine.close()
+
+    assert cancelled == ["b"]
+    assert len(prompts) == 2  # the judge never sees the failed turn
+    assert engine._debate_history == []
+
+
+async def test_pipelined_latency_vs_sequential():
+    """End-to-end debate latency against the deterministic stub."""
+    timings = {}
+    for mode in (False, True):
+        engine = _engine(StubModels())
+        start = time.perf_counter()
+        await engine.run_match("a", "b", topic="t", pipelined=mode)
+        timings[mode] = time.perf_counter() - start
+
+    print(
+        f"\ndebate latency: sequential {timings[False] * 1000:.0f}ms, "
+        f"pipelined {timings[True] * 1000:.0f}ms"
+    )
+    # 7 serial calls vs 3 concurrent rounds plus the last round's judging
+    assert timings[True] < timings[False] * 0.75
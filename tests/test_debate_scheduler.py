@@ -0,0 +1,169 @@
+"""Tests for cron-style, load-aware debate scheduling."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from aura_ia_mcp.services.debate_engine.scheduler import (
+    CronSchedule,
+    DebateScheduler,
+    LoadPolicy,
+    LoadSignals,
+)
+
+
+@pytest.mark.parametrize(
+    ("expression", "after", "expected"),
+    [
+        ("*/15 * * * *", "2026-03-02 10:07", "2026-03-02 10:15"),
+        ("@daily", "2026-03-02 10:07", "2026-03-03 00:00"),
+        # Friday evening -> Monday morning
+        ("30 9 * * mon-fri", "2026-03-06 18:00", "2026-03-09 09:30"),
+        ("0 0 29 feb *", "2026-03-01 00:00", "2028-02-29 00:00"),
+        # Both day fields restricted: either matches (the 13th or a Friday)
+        ("0 12 13 * 5", "2026-03-07 00:00", "2026-03-13 12:00"),
+        ("0 0 * * 7", "2026-03-02 00:00", "2026-03-08 00:00"),
+        ("0 22-23/1,3 * dec *", "2026-12-31 22:30", "2026-12-31 23:00"),
+    ],
+)
+def test_cron_next_after(expression, after, expected):
+    fmt = "%Y-%m-%d %H:%M"
+    schedule = CronSchedule(expression)
+    assert schedule.next_after(datetime.strptime(after, fmt)) == (
+        datetime.strptime(expected, fmt)
+    )
+
+
+@pytest.mark.parametrize(
+    ("expression", "message"),
+    [
+        ("* * * *", "needs 5 fields"),
+        ("61 * * * *", "out of range"),
+        ("*/0 * * * *", "Invalid step"),
+        ("5-1 * * * *", "Invalid range"),
+    ],
+)
+def test_cron_rejects_invalid(expression, message):
+    with pytest.raises(ValueError, match=message):
+        CronSchedule(expression)
+
+
+class Harness:
+    """Scheduler with a manual clock, scripted load and recorded runs."""
+
+    def __init__(self, **kwargs):
+        self.now = datetime(2026, 3, 2, 9, 59)
+        self.signals = LoadSignals(max_ram_gb=16.0)
+        self.runs: list[datetime] = []
+        policy = kwargs.pop(
+            "policy", LoadPolicy(min_spacing=0, max_delay_minutes=0)
+        )
+        self.scheduler = DebateScheduler(
+            cron="0 * * * *",
+            policy=policy,
+            load_probe=self.probe,
+            clock=lambda: self.now,
+            **kwargs,
+        )
+        self.scheduler._next_slot = self.scheduler.cron.next_after(self.now)
+
+        async def run():
+            self.runs.append(self.now)
+
+        self.scheduler.run_scheduled_debate = run
+
+    async def probe(self):
+        return self.signals
+
+    async def at(self, hour: int, minute: int = 0):
+        self.now = self.now.replace(hour=hour, minute=minute)
+        return await self.scheduler.tick()
+
+
+async def test_debate_deferred_while_chat_is_busy():
+    h = Harness()
+    assert await h.at(9, 59) is None
+
+    h.signals.inflight_requests = 2
+    assert await h.at(10, 0) == "deferred"
+    assert h.scheduler.get_status()["deferred_reason"] == (
+        "2 chat requests in flight"
+    )
+
+    h.signals.inflight_requests = 0
+    h.signals.model_ram_gb = 15.0
+    assert await h.at(10, 5) == "deferred"
+
+    h.signals.model_ram_gb = 4.0
+    assert await h.at(10, 10) == "ran"
+    assert h.runs == [h.now]
+    status = h.scheduler.get_status()
+    assert status["backlog"] == []
+    assert status["deferrals"] == 2
+    assert status["next_run"] == "2026-03-02T11:00:00"
+
+
+async def test_latest_policy_coalesces_backlog():
+    h = Harness(catch_up="latest")
+    h.signals.queue_depth = 3
+    for hour in (10, 11, 12):
+        assert await h.at(hour) == "deferred"
+    assert len(h.scheduler.get_status()["backlog"]) == 3
+
+    h.signals.queue_depth = 0
+    assert await h.at(12, 30) == "ran"
+    assert await h.at(12, 31) is None
+    assert len(h.runs) == 1
+    assert h.scheduler.stats["coalesced"] == 2
+
+
+async def test_all_policy_catches_up_with_spacing():
+    h = Harness(
+        catch_up="all",
+        max_backlog=2,
+        policy=LoadPolicy(min_spacing=600, max_delay_minutes=0),
+    )
+    h.signals.inflight_requests = 1
+    for hour in (10, 11, 12):
+        await h.at(hour)
+    # Only the two newest slots are kept
+    assert h.scheduler.stats["dropped"] == 1
+
+    h.signals.inflight_requests = 0
+    assert await h.at(12, 1) == "ran"
+    assert await h.at(12, 5) == "throttled"
+    assert await h.at(12, 11) == "ran"
+    assert await h.at(12, 30) is None
+    assert len(h.runs) == 2
+
+
+async def test_stale_slots_are_dropped():
+    h = Harness(policy=LoadPolicy(min_spacing=0, max_delay_minutes=90))
+    h.signals.inflight_requests = 1
+    await h.at(10)
+    await h.at(11)
+    await h.at(11, 45)
+
+    h.signals.inflight_requests = 0
+    assert await h.at(11, 50) == "ran"
+    assert h.scheduler.stats["dropped"] == 1
+    assert h.scheduler.stats["coalesced"] == 0
+
+
+async def test_failing_probe_defers():
+    h = Harness()
+
+    async def broken():
+        raise RuntimeError("metrics down")
+
+    h.scheduler.load_probe = broken
+    assert await h.at(10) == "deferred"
+    assert h.runs == []
+
+
+def test_interval_mode_and_unknown_policy():
+    scheduler = DebateScheduler(interval_hours=6)
+    start = datetime(2026, 3, 2, 10, 0)
+    assert scheduler._slot_after(start) == start + timedelta(hours=6)
+    with pytest.raises(ValueError, match="Unknown catch-up policy"):
+        DebateScheduler(catch_up="never")
@@ -0,0 +1,199 @@
+"""Tests for concurrent debates and tournaments against a stub Ollama."""
+
+import asyncio
+import json
+import time
+from collections import defaultdict
+
+import pytest
+
+from aura_ia_mcp.services.debate_engine import (
+    DebateEngine,
+    run_tournament,
+    swiss_pairings,
+)
+from aura_ia_mcp.services.debate_engine.tournament import Standing
+
+MODELS = ["m1", "m2", "m3", "m4"]
+DELAY = 0.02
+
+
+class StubOllama:
+    """Minimal /api/generate server with a fixed per-call latency.
+
+    The judge always names Model A the winner; in-flight calls are
+    tracked per model so tests can check the engine's limits.
+    """
+
+    def __init__(self):
+        self.inflight = defaultdict(int)
+        self.peak = defaultdict(int)
+        self.calls = 0
+
+    async def handle(self, reader, writer):
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = 0
+        for line in head.decode().split("\r\n"):
+            if line.lower().startswith("content-length:"):
+                length = int(line.split(":", 1)[1])
+        model = json.loads(await reader.readexactly(length))["model"]
+
+        self.calls += 1
+        self.inflight[model] += 1
+        self.peak[model] = max(self.peak[model], self.inflight[model])
+        await asyncio.sleep(DELAY)
+        self.inflight[model] -= 1
+
+        text = "Model A: 80/100\nModel B: 60/100\nWINNER: Model A"
+        body = json.dumps({"response": text, "eval_count": 12}).encode()
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+            + f"Content-Length: {len(body)}\r\n".encode()
+            + b"Connection: close\r\n\r\n"
+            + body
+        )
+        await writer.drain()
+        writer.close()
+
+
+@pytest.fixture()
+async def ollama():
+    stub = StubOllama()
+    server = await asyncio.start_server(stub.handle, "localhost", 0)
+    stub.url = f"http://localhost:{server.sockets[0].getsockname()[1]}"
+    yield stub
+    server.close()
+    await server.wait_closed()
+
+
+def _engine(url: str, **kwargs) -> DebateEngine:
+    return DebateEngine(
+        ollama_url=url,
+        model_ratings={m: 1500 for m in MODELS},
+        persist=False,
+        **kwargs,
+    )
+
+
+async def test_debates_run_concurrently(ollama):
+    engine = _engine(ollama.url)
+    try:
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            engine.run_match("m1", "m2", topic="t"),
+            engine.run_match("m3", "m4", topic="t"),
+        )
+        elapsed = time.perf_counter() - start
+    finally:
+        await engine.close()
+
+    # 7 calls per debate; two debates overlap instead of queueing
+    assert ollama.calls == 14
+    assert elapsed < 14 * DELAY
+    assert [r.winner for r in results] == ["m1", "m3"]
+    assert len(engine._debate_history) == 2
+    assert engine.model_ratings["m1"] > 1500 > engine.model_ratings["m2"]
+
+
+async def test_round_robin_respects_limits(ollama):
+    engine = _engine(ollama.url, max_inflight_per_model=1)
+    try:
+        result = await engine.run_tournament(
+            models=MODELS, max_concurrent=6, topic="t"
+        )
+    finally:
+        await engine.close()
+
+    assert len(result.debates) == 6
+    assert not result.errors
+    pairs = {frozenset((d.model_a, d.model_b)) for d in result.debates}
+    assert len(pairs) == 6
+    assert sum(s["points"] for s in result.standings) == 6
+    assert all(peak == 1 for peak in ollama.peak.values())
+    assert result.to_dict()["debates_per_minute"] > 0
+
+
+async def test_swiss_avoids_rematches_and_gives_byes(ollama):
+    engine = _engine(ollama.url)
+    models = MODELS + ["m5"]
+    engine.model_ratings["m5"] = 1500
+    try:
+        result = await run_tournament(
+            engine, models=models, format="swiss", rounds=3, topic="t"
+        )
+    finally:
+        await engine.close()
+
+    assert result.rounds_played == 3
+    assert len(result.debates) == 6
+    pairs = [frozenset((d.model_a, d.model_b)) for d in result.debates]
+    assert len(set(pairs)) == len(pairs)
+    byes = {s["model"]: s["byes"] for s in result.standings}
+    assert sorted(byes.values()) == [0, 0, 1, 1, 1]
+
+
+def test_swiss_pairs_by_points():
+    standings = {m: Standing(model=m) for m in MODELS}
+    standings["m4"].points = 2
+    standings["m3"].points = 2
+    standings["m3"].opponents = ["m4"]
+    standings["m4"].opponents = ["m3"]
+
+    pairings, bye = swiss_pairings(standings, {"m3": 1600, "m4": 1500})
+
+    assert bye is None
+    # m4 already met m3, so both leaders drop down a score group
+    assert pairings == [("m3", "m1"), ("m4", "m2")]
+
+
+async def test_failed_debate_does_not_stop_tournament(ollama, monkeypatch):
+    engine = _engine(ollama.url)
+    real_run_match = engine.run_match
+
+    async def flaky(model_a, model_b, **kwargs):
+        if {model_a, model_b} == {"m1", "m2"}:
+            raise RuntimeError("judge crashed")
+        return await real_run_match(model_a, model_b, **kwargs)
+
+    monkeypatch.setattr(engine, "run_match", flaky)
+    try:
+        result = await run_tournament(engine, models=MODELS, topic="t")
+    finally:
+        await engine.close()
+
+    assert len(result.debates) == 5
+    assert result.errors == [
+        {"model_a": "m2", "model_b": "m1", "error": "judge crashed"}
+    ]
+
+
+async def test_unknown_format_rejected():
+    with pytest.raises(ValueError, match="Unknown tournament format"):
+        await run_tournament(DebateEngine(persist=False), format="knockout")
+
+
+async def test_tournament_throughput(ollama):
+    """Compare sequential debates with a concurrent round-robin."""
+    pairs = [(a, b) for i, a in enumerate(MODELS) for b in MODELS[i + 1 :]]
+
+    engine = _engine(ollama.url)
+    start = time.perf_counter()
+    for model_a, model_b in pairs:
+        await engine.run_match(model_a, model_b, topic="t")
+    sequential = time.perf_counter() - start
+    await engine.close()
+
+    engine = _engine(ollama.url)
+    start = time.perf_counter()
+    result = await run_tournament(
+        engine, models=MODELS, max_concurrent=6, topic="t"
+    )
+    concurrent = time.perf_counter() - start
+    await engine.close()
+
+    print(
+        f"\n{len(pairs)} debates: sequential {sequential:.2f}s, "
+        f"tournament {concurrent:.2f}s ({sequential / concurrent:.1f}x)"
+    )
+    assert len(result.debates) == len(pairs)
+    assert concurrent < sequential * 0.6
@@ -0,0 +1,121 @@
+"""Tests for hedged local/cloud execution in UnifiedModelGateway."""
+
+import asyncio
+
+from aura_ia_mcp.services.model_gateway.adapters.cloud.gateway import (
+    LatencyTracker,
+    UnifiedModelGateway,
+)
+
+
+class _StubOllama:
+    def __init__(self, delay: float = 0.0, healthy: bool = True):
+        self.delay = delay
+        self.healthy = healthy
+        self.calls = 0
+        self.health_calls = 0
+        self.cancelled = False
+
+    async def generate(self, prompt, model, options):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return {"response": "local"}
+
+    async def health(self):
+        self.health_calls += 1
+        return self.healthy
+
+
+class _StubAdapter:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+
+    async def generate(self, prompt, user_id, temperature, max_tokens):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"success": True, "response": "cloud", "provider": "google"}
+
+
+class _StubFactory:
+    def __init__(self, adapter):
+        self.adapter = adapter
+
+    def select_adapter(self, model, estimated_tokens=0):
+        return self.adapter
+
+    def get_free_adapter(self):
+        return self.adapter
+
+    async def health_check_all(self):
+        return {}
+
+
+def _gateway(ollama, adapter, deadline: float = 0.05):
+    gateway = UnifiedModelGateway(
+        ollama_backend=ollama, cloud_factory=_StubFactory(adapter)
+    )
+    gateway.local_latency = LatencyTracker(default_deadline_s=deadline)
+    return gateway
+
+
+def test_hedge_deadline_tracks_p95():
+    tracker = LatencyTracker(
+        min_samples=10, min_deadline_s=0.01, max_deadline_s=10.0
+    )
+    assert tracker.hedge_deadline() == tracker.default_deadline_s
+
+    for i in range(1, 101):
+        tracker.record(i / 100)
+
+    assert tracker.percentile(95) == 0.95
+    assert tracker.hedge_deadline() == 0.95
+
+
+async def test_fast_local_wins_without_cloud_call():
+    ollama, adapter = _StubOllama(delay=0.0), _StubAdapter()
+    gateway = _gateway(ollama, adapter, deadline=1.0)
+
+    result = await gateway.generate("hi", model="llama3")
+    await gateway.close()
+
+    assert result["response"] == "local"
+    assert adapter.calls == 0
+    assert gateway.stats["hedged_requests"] == 0
+
+
+async def test_slow_local_is_hedged_and_cancelled():
+    ollama, adapter = _StubOllama(delay=5.0), _StubAdapter(delay=0.01)
+    gateway = _gateway(ollama, adapter, deadline=0.05)
+
+    result = await asyncio.wait_for(
+        gateway.generate("hi", model="llama3"), timeout=2.0
+    )
+    await asyncio.sleep(0)
+    await gateway.close()
+
+    assert result["response"] == "cloud"
+    assert result["is_fallback"] is True
+    assert result["hedged"] is True
+    assert ollama.cancelled
+    assert gateway.stats["hedge_cloud_wins"] == 1
+    # The cancelled local call still counts, at its elapsed time
+    (sample,) = gateway.local_latency.samples
+    assert sample >= 0.05
+
+
+async def test_health_is_cached_between_requests():
+    ollama, adapter = _StubOllama(healthy=False), _StubAdapter()
+    gateway = _gateway(ollama, adapter)
+
+    for _ in range(3):
+        result = await gateway.generate("hi", model="llama3")
+        assert result["response"] == "cloud"
+    await gateway.close()
+
+    assert ollama.health_calls == 1
+    assert ollama.calls == 0
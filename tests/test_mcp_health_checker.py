@@ -0,0 +1,109 @@
+"""Tests for the concurrent MCP health sweep."""
+
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+
+from src.mcp_server.mcp_health_checker import HealthResult, MCPHealthChecker
+
+
+def _check(name, delay, events, status="pass"):
+    async def run():
+        events.append(("start", name))
+        await asyncio.sleep(delay)
+        events.append(("end", name))
+        return HealthResult(
+            component=name,
+            status=status,
+            message="ok",
+            details={},
+            timestamp=datetime.now(),
+            response_time_ms=delay * 1000,
+        )
+
+    return run
+
+
+@pytest.fixture
+async def checker():
+    checker = MCPHealthChecker(check_deadline=0.5, report_max_age=60)
+    checker.check_deadlines = {}
+    checker.delays = dict.fromkeys(
+        [
+            "Backend Server",
+            "YoanÉ AI",
+            "ULTRA Intelligence",
+            "GitHub Integration",
+            "ML Engines",
+            "Command Execution",
+            "MCP Tools",
+        ],
+        0.1,
+    )
+    checker.events = []
+    checker._checks = lambda: [
+        (name, _check(name, delay, checker.events))
+        for name, delay in checker.delays.items()
+    ]
+    yield checker
+    await checker.client.aclose()
+
+
+async def test_checks_run_concurrently(checker):
+    start = time.perf_counter()
+    report = await checker.run_full_health_check()
+    print(f"\n7 checks of 0.1s: sweep took {time.perf_counter() - start:.2f}s")
+
+    assert report.total_checks == 7
+    assert report.overall_status == "pass"
+    # Every check starts before any finishes
+    kinds = [kind for kind, _ in checker.events]
+    assert kinds == ["start"] * 7 + ["end"] * 7
+
+
+async def test_hung_check_times_out_with_partial_results(checker):
+    checker.delays["GitHub Integration"] = 60
+    checker.check_deadlines = {"ML Engines": 0.05}
+
+    start = time.perf_counter()
+    report = await checker.run_full_health_check()
+    assert time.perf_counter() - start < 1.0
+
+    failed = {r.component: r for r in report.results if r.status == "fail"}
+    assert set(failed) == {"GitHub Integration", "ML Engines"}
+    assert failed["GitHub Integration"].details == {
+        "timed_out": True,
+        "deadline_seconds": 0.5,
+    }
+    assert report.passed == 5
+    assert report.overall_status == "fail"
+
+
+async def test_get_report_serves_cached_report_during_refresh(checker):
+    first = await checker.get_report()
+    assert await checker.get_report() is first
+
+    checker.delays["Backend Server"] = 0.3
+    stale = await checker.get_report(max_age=0)
+    assert stale is first
+
+    # The refresh runs in the background; callers share one sweep
+    task = checker.refresh()
+    assert not task.done()
+    assert checker.refresh() is task
+    fresh = await task
+    assert fresh is not first
+    assert await checker.get_report() is fresh
+
+
+async def test_failed_background_refresh_is_logged(checker, caplog):
+    def broken(results):
+        raise RuntimeError("report failed")
+
+    checker.generate_report = broken
+    await asyncio.wait({checker.refresh()})  # nobody awaits the result
+    await asyncio.sleep(0)  # done callbacks run on the next loop pass
+
+    assert "Background health sweep failed" in caplog.text
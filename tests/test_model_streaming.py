@@ -0,0 +1,207 @@
+"""Tests for the streaming generation contract across backends."""
+
+import asyncio
+import json
+from dataclasses import replace
+from types import SimpleNamespace
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from aura_ia_mcp.core.circuit_breaker import CircuitBreaker, CircuitState
+from aura_ia_mcp.services.model_gateway import service
+from aura_ia_mcp.services.model_gateway.adapters.cloud import (
+    MOONSHOT_MODELS,
+    CloudConnectionManager,
+    KimiAdapter,
+)
+from aura_ia_mcp.services.model_gateway.adapters.cloud.gateway import (
+    UnifiedModelGateway,
+)
+from aura_ia_mcp.services.model_gateway.adapters.ollama import OllamaBackend
+
+NDJSON = [
+    {"response": "Hel", "done": False},
+    {"response": "lo", "done": False},
+    {"response": "", "done": True, "prompt_eval_count": 7, "eval_count": 2},
+]
+SSE = [
+    {"choices": [{"delta": {"content": "Hel"}}]},
+    {"choices": [{"delta": {"content": "lo"}}]},
+    {
+        "choices": [{"delta": {}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 5, "completion_tokens": 2},
+    },
+]
+
+
+def _server(body: bytes, content_type: str):
+    async def handle(reader, writer):
+        head = await reader.readuntil(b"\r\n\r\n")
+        for line in head.decode().split("\r\n"):
+            if line.lower().startswith("content-length:"):
+                await reader.readexactly(int(line.split(":", 1)[1]))
+        writer.write(
+            f"HTTP/1.1 200 OK\r\nContent-Type: {content_type}\r\n".encode()
+            + f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+            + body
+        )
+        await writer.drain()
+        writer.close()
+
+    return handle
+
+
+@pytest.fixture
+async def serve():
+    servers = []
+
+    async def start(body: bytes, content_type: str) -> str:
+        server = await asyncio.start_server(
+            _server(body, content_type), "localhost", 0
+        )
+        servers.append(server)
+        return f"http://localhost:{server.sockets[0].getsockname()[1]}"
+
+    yield start
+    for server in servers:
+        server.close()
+        await server.wait_closed()
+
+
+async def _collect(stream):
+    return [event async for event in stream]
+
+
+async def test_ollama_streams_ndjson(serve):
+    body = "\n".join(json.dumps(line) for line in NDJSON).encode()
+    backend = OllamaBackend(base_url=await serve(body, "application/x-ndjson"))
+
+    events = await _collect(backend.generate_stream("hi", user_id="u1"))
+
+    assert [e["chunk"] for e in events if "chunk" in e] == ["Hel", "lo"]
+    done = events[-1]
+    assert done["done"]
+    assert done["total_text"] == "Hello"
+    assert (done["input_tokens"], done["output_tokens"]) == (7, 2)
+    assert backend.token_manager.get_user_stats("u1")["used"] == 9
+
+
+async def test_ollama_stream_truncates_incrementally(serve):
+    body = "\n".join(json.dumps(line) for line in NDJSON).encode()
+    backend = OllamaBackend(base_url=await serve(body, "application/x-ndjson"))
+    backend.security_manager.max_output_length = 4
+
+    events = await _collect(backend.generate_stream("hi"))
+
+    chunks = [e["chunk"] for e in events if "chunk" in e]
+    assert chunks == ["Hel", "l... [truncated]"]
+    assert events[-1]["truncated"] is True
+
+
+def _kimi(url: str) -> KimiAdapter:
+    adapter = KimiAdapter(
+        api_key="k",
+        connection_manager=CloudConnectionManager(
+            metrics_registry=CollectorRegistry()
+        ),
+    )
+    adapter.model_config = replace(
+        MOONSHOT_MODELS["kimi-k2-8k"], api_endpoint=url
+    )
+    return adapter
+
+
+async def test_cloud_stream_parses_sse_and_settles_budget(serve):
+    body = "".join(f"data: {json.dumps(e)}\n\n" for e in SSE)
+    url = await serve(
+        (body + "data: [DONE]\n\n").encode(), "text/event-stream"
+    )
+    adapter = _kimi(url)
+
+    events = await _collect(
+        adapter.generate_stream("hi", max_tokens=100, admission_timeout=0)
+    )
+
+    assert [e["chunk"] for e in events if "chunk" in e] == ["Hel", "lo"]
+    assert events[-1]["done"]
+    assert events[-1]["first_chunk_ms"] is not None
+    stats = adapter.provider_budget.get_stats()
+    assert stats["total_requests"] == 1
+    assert stats["total_input_tokens"] == 5
+    assert stats["total_output_tokens"] == 2
+    await adapter.connections.close()
+
+
+async def test_cloud_stream_settles_when_consumer_stops_early(serve):
+    body = "".join(f"data: {json.dumps(e)}\n\n" for e in SSE)
+    adapter = _kimi(await serve(body.encode(), "text/event-stream"))
+
+    stream = adapter.generate_stream("hi", admission_timeout=0)
+    first = await stream.__anext__()
+    await stream.aclose()
+
+    assert first == {"chunk": "Hel"}
+    assert adapter.provider_budget.get_stats()["total_requests"] == 1
+    await adapter.connections.close()
+
+
+class _FailingOllama:
+    async def generate_stream(self, prompt, model, options):
+        yield {"error": "connection refused"}
+
+    async def health(self):
+        return True
+
+
+class _StreamingAdapter:
+    async def generate_stream(self, prompt, user_id, temperature, max_tokens):
+        yield {"chunk": "cloud"}
+        yield {"done": True, "success": True, "total_text": "cloud"}
+
+
+class _StubFactory:
+    def select_adapter(self, model, estimated_tokens=0):
+        return _StreamingAdapter()
+
+    def get_free_adapter(self):
+        return _StreamingAdapter()
+
+
+async def test_gateway_stream_falls_back_before_first_chunk():
+    gateway = UnifiedModelGateway(
+        ollama_backend=_FailingOllama(), cloud_factory=_StubFactory()
+    )
+
+    events = await _collect(gateway.generate_stream("hi", model="llama3"))
+
+    assert [e for e in events if "error" in e] == []
+    assert events[0] == {"chunk": "cloud", "is_fallback": True}
+    assert events[-1]["routing"]["is_fallback"] is True
+    assert gateway.stats["fallback_count"] == 1
+    await gateway.close()
+
+
+async def test_sse_stream_goes_through_circuit_breaker(monkeypatch):
+    breaker = CircuitBreaker(failure_threshold=1, timeout_seconds=60)
+    monkeypatch.setattr(service, "circuit_breaker", breaker)
+    monkeypatch.setattr(service, "backend", _FailingOllama())
+    monkeypatch.setattr(
+        service,
+        "conversation_logger",
+        SimpleNamespace(log_conversation=lambda **kw: None),
+    )
+    request = service.ChatCompletionRequest(
+        model="llama3",
+        messages=[service.ChatMessage(role="user", content="hi")],
+        stream=True,
+    )
+    req = SimpleNamespace(client=None)
+
+    response = await service.chat_completions(request, req)
+    body = [chunk async for chunk in response.body_iterator]
+
+    assert "connection refused" in body[1]
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(service.HTTPException, match="OPEN"):
+        await service.chat_completions(request, req)
@@ -0,0 +1,204 @@
+"""Tests for the concurrent multi-agent execution graph."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.mcp_server.multi_agent_orchestrator import (
+    AgentNode,
+    MultiAgentOrchestrator,
+)
+
+DELAY = 0.05
+
+
+class AsyncAdapter:
+    """Async-capable adapter recording concurrency and calling threads."""
+
+    def __init__(self, replies=None, max_concurrency=None):
+        self.replies = replies or {}
+        self.active = 0
+        self.peak = 0
+        self.threads: set[int] = set()
+        self.finished: list[str] = []
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+
+    async def agenerate(self, prompt: str) -> str:
+        self.threads.add(threading.get_ident())
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            for marker, (delay, reply) in self.replies.items():
+                if marker in prompt:
+                    await asyncio.sleep(delay)
+                    self.finished.append(marker)
+                    return reply
+            await asyncio.sleep(DELAY)
+            return f"answer to {prompt[-40:]}"
+        finally:
+            self.active -= 1
+
+    def generate(self, prompt: str) -> str:  # pragma: no cover
+        raise AssertionError("sync path used for async adapter")
+
+
+def _agent(name, depends_on=(), adapter=None):
+    return AgentNode(
+        name, name, f"You are {name}.", tuple(depends_on), adapter
+    )
+
+
+async def test_independent_agents_fan_out():
+    adapter = AsyncAdapter()
+    orchestrator = MultiAgentOrchestrator(
+        adapter, None, max_concurrent_per_adapter=4
+    )
+    agents = [
+        _agent("pro"),
+        _agent("con"),
+        _agent("neutral"),
+        _agent("judge", depends_on=("pro", "con", "neutral")),
+    ]
+
+    start = time.perf_counter()
+    run = await orchestrator.run_graph("q", agents)
+    elapsed = time.perf_counter() - start
+
+    assert set(run.outputs) == {"pro", "con", "neutral", "judge"}
+    assert adapter.peak == 3
+    # Two dependency levels, not four serial calls
+    assert elapsed < DELAY * 3
+    # Native async path: every call ran on the event loop thread
+    assert adapter.threads == {threading.get_ident()}
+
+
+async def test_dependency_outputs_become_history():
+    seen = {}
+
+    class Recorder(AsyncAdapter):
+        async def agenerate(self, prompt: str) -> str:
+            name = prompt.split("You are ", 1)[1].split(".", 1)[0]
+            seen[name] = prompt
+            return f"<{name} output>"
+
+    orchestrator = MultiAgentOrchestrator(Recorder(), None)
+    await orchestrator.run_graph(
+        "q",
+        [_agent("a"), _agent("b"), _agent("c", depends_on=("b", "a"))],
+    )
+    assert seen["c"].index("<b output>") < seen["c"].index("<a output>")
+    assert "output>" not in seen["a"]
+
+
+async def test_per_adapter_concurrency_cap():
+    fast = AsyncAdapter()
+    capped = AsyncAdapter(max_concurrency=1)
+    orchestrator = MultiAgentOrchestrator(
+        fast, None, max_concurrent_per_adapter=2
+    )
+    agents = [_agent(f"f{i}") for i in range(4)] + [
+        _agent(f"c{i}", adapter=capped) for i in range(3)
+    ]
+
+    await orchestrator.run_graph("q", agents)
+
+    assert fast.peak == 2
+    assert capped.peak == 1
+
+
+async def test_blocking_adapter_runs_in_thread():
+    calls = []
+
+    class Blocking:
+        def generate(self, prompt: str) -> str:
+            calls.append(threading.get_ident())
+            time.sleep(DELAY)
+            return "done"
+
+    orchestrator = MultiAgentOrchestrator(
+        Blocking(), None, max_concurrent_per_adapter=3
+    )
+    start = time.perf_counter()
+    await orchestrator.run_graph("q", [_agent("a"), _agent("b"), _agent("c")])
+
+    assert time.perf_counter() - start < DELAY * 2.5
+    assert threading.get_ident() not in calls
+
+
+async def test_consensus_cancels_losing_branches():
+    adapter = AsyncAdapter(
+        replies={
+            "You are a1": (0.01, "Use a hash map keyed by user id"),
+            "You are a2": (0.02, "use a hash map keyed by user id"),
+            "You are a3": (1.0, "Rewrite everything in a new language"),
+            "You are a4": (1.0, "Rewrite everything in a new language"),
+        }
+    )
+    orchestrator = MultiAgentOrchestrator(
+        adapter, None, max_concurrent_per_adapter=4
+    )
+    agents = [_agent(f"a{i}") for i in range(1, 5)]
+
+    start = time.perf_counter()
+    result = await orchestrator.run_consensus("q", agents, threshold=0.5)
+
+    assert time.perf_counter() - start < 0.5
+    assert result["consensus"] is True
+    assert sorted(result["supporters"]) == ["a1", "a2"]
+    assert sorted(result["cancelled"]) == ["a3", "a4"]
+    assert result["text"].lower().startswith("use a hash map")
+    await asyncio.sleep(0)
+    assert adapter.active == 0
+    assert "You are a3" not in adapter.finished
+
+
+async def test_no_consensus_runs_every_agent():
+    orchestrator = MultiAgentOrchestrator(
+        AsyncAdapter(), None, max_concurrent_per_adapter=3
+    )
+    agents = [_agent(name) for name in ("x", "y", "z")]
+    result = await orchestrator.run_consensus(
+        "q", agents, threshold=1.0, similarity=lambda a, b: float(a == b)
+    )
+    assert result["consensus"] is False
+    assert result["cancelled"] == []
+    assert len(result["outputs"]) == 3
+
+
+async def test_failure_cancels_running_agents():
+    class Failing(AsyncAdapter):
+        async def agenerate(self, prompt: str) -> str:
+            if "You are bad" in prompt:
+                raise RuntimeError("model crashed")
+            return await super().agenerate(prompt)
+
+    adapter = Failing()
+    orchestrator = MultiAgentOrchestrator(
+        adapter, None, max_concurrent_per_adapter=4
+    )
+    before = len(asyncio.all_tasks())
+    with pytest.raises(RuntimeError):
+        await orchestrator.run_graph(
+            "q", [_agent("slow"), _agent("bad"), _agent("after", ["bad"])]
+        )
+    await asyncio.sleep(0)
+    assert len(asyncio.all_tasks()) == before
+    assert adapter.active == 0
+
+
+@pytest.mark.parametrize(
+    "agents",
+    [
+        [_agent("a", ["b"]), _agent("b", ["a"])],
+        [_agent("a", ["missing"])],
+        [_agent("a"), _agent("a")],
+    ],
+)
+def test_invalid_graphs_rejected(agents):
+    with pytest.raises(ValueError, match="Agent"):
+        MultiAgentOrchestrator(object(), None, agent_graph=agents)
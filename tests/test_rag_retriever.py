@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import time
+
 import pytest
 
-from src.mcp_server.rag_retriever import MockVectorDB, RAGRetriever
+from src.mcp_server.rag_retriever import (
+    ContextPacker,
+    MockVectorDB,
+    RAGRetriever,
+)
 
 
 @pytest.mark.asyncio
@@ -62,3 +68,130 @@ async def test_rag_context_formatting():
     assert "## Retrieved Context" in context
     assert "[1]" in context
     assert "score:" in context
+
+
+class _WordTokenizer:
+    """Whitespace tokenizer that counts encode calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, text: str) -> list[str]:
+        self.calls += 1
+        return text.split()
+
+    def decode(self, tokens: list[str]) -> str:
+        return " ".join(tokens)
+
+
+class _ListVectorDB:
+    def __init__(self, results):
+        self.results = results
+
+    async def search(self, embedding, top_k):
+        return self.results[:top_k]
+
+
+def _doc(words: int, score: float, name: str) -> dict:
+    text = " ".join(f"{name}{i}" for i in range(words))
+    return {"text": text, "score": score, "metadata": {"doc_id": name}}
+
+
+async def _embed(text: str) -> list[float]:
+    return [0.1] * 8
+
+
+@pytest.mark.asyncio
+async def test_rag_packing_prefers_best_fill_over_first_fit():
+    """Smaller later chunks can beat one large top-scoring chunk."""
+    results = [
+        _doc(90, 0.9, "big"),
+        _doc(40, 0.8, "a"),
+        _doc(40, 0.8, "b"),
+        _doc(45, 0.7, "c"),
+    ]
+    retriever = RAGRetriever(
+        vector_db=_ListVectorDB(results),
+        embedding_fn=_embed,
+        top_k=4,
+        retrieval_budget_fraction=1.0,
+        tokenizer=_WordTokenizer(),
+    )
+    result = await retriever.retrieve("q", max_tokens=125)
+
+    ids = [c["metadata"]["doc_id"] for c in result["chunks"]]
+    assert ids == ["a", "b", "c"]
+    assert result["total_tokens"] == 125
+
+
+@pytest.mark.asyncio
+async def test_rag_packing_merges_duplicates_and_caches_counts():
+    """Near-duplicates are merged and each text is tokenized once."""
+    text = "the retry policy backs off exponentially after each failure"
+    results = [
+        {"text": text, "score": 0.9, "metadata": {"doc_id": "1"}},
+        {"text": text + ".", "score": 0.8, "metadata": {"doc_id": "2"}},
+        {"text": "unrelated note on caching", "score": 0.5},
+    ]
+    tokenizer = _WordTokenizer()
+    retriever = RAGRetriever(
+        vector_db=_ListVectorDB(results),
+        embedding_fn=_embed,
+        top_k=3,
+        retrieval_budget_fraction=1.0,
+        tokenizer=tokenizer,
+    )
+    first = await retriever.retrieve("q", max_tokens=1000)
+    await retriever.retrieve("q", max_tokens=1000)
+
+    assert [c["duplicates"] for c in first["chunks"]] == [1, 0]
+    assert tokenizer.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_rag_packing_truncates_with_tokenizer():
+    """Leftover budget is filled with a token-exact truncated chunk."""
+    results = [_doc(30, 0.9, "a"), _doc(200, 0.8, "long")]
+    retriever = RAGRetriever(
+        vector_db=_ListVectorDB(results),
+        embedding_fn=_embed,
+        top_k=2,
+        retrieval_budget_fraction=1.0,
+        tokenizer=_WordTokenizer(),
+    )
+    result = await retriever.retrieve("q", max_tokens=100)
+
+    truncated = result["chunks"][1]
+    assert truncated["truncated"] is True
+    assert truncated["tokens"] == 70
+    assert truncated["text"].split()[-1] == "long69"
+    assert result["total_tokens"] == 100
+
+
+def test_context_packer_empty_budget():
+    packer = ContextPacker()
+    results = [{"text": "some retrieved text", "score": 0.9}]
+    for budget in (0, -50):
+        assert packer.pack(results, budget=budget) == {
+            "chunks": [],
+            "total_tokens": 0,
+        }
+
+
+def test_context_packer_cost_is_bounded():
+    """Large budgets are packed at bounded table resolution."""
+    packer = ContextPacker(dedup_threshold=2)
+    results = [
+        {
+            "text": f"chunk {i} " + "x" * (40 + i * 37 % 900),
+            "score": 1 / (i + 1),
+        }
+        for i in range(200)
+    ]
+    start = time.perf_counter()
+    packed = packer.pack(results, budget=100_000)
+    elapsed = time.perf_counter() - start
+
+    print(f"\npack 200 chunks into 100k tokens: {elapsed * 1e3:.1f}ms")
+    assert packed["total_tokens"] <= 100_000
+    assert elapsed < 1.0
@@ -0,0 +1,97 @@
+"""Tests for the consolidated reasoning loop store."""
+
+import json
+
+from src.mcp_server.reasoning_loop import (
+    ReasoningCycleStore,
+    ReasoningLoopManager,
+)
+
+
+def _run_cycle(manager, category, success, patterns=(), optimizations=()):
+    cycle_id = manager.start_cycle("problem", {"k": 1}, category=category)
+    manager.add_reasoning_step("think", "act", "observe")
+    manager.add_reasoning_step("think more", "act", "observe", 0.9)
+    manager.add_solution_attempt("try", success)
+    manager.complete_cycle(
+        "done",
+        success,
+        lessons=["lesson"],
+        patterns=list(patterns),
+        optimizations=list(optimizations),
+    )
+    return cycle_id
+
+
+def test_stats_and_lookups(tmp_path):
+    manager = ReasoningLoopManager(tmp_path)
+    first = _run_cycle(
+        manager, "debugging", True, patterns=["retry on timeout"]
+    )
+    _run_cycle(
+        manager,
+        "performance",
+        False,
+        patterns=["cache hot paths"],
+        optimizations=["batch database writes"],
+    )
+
+    assert manager.get_cycle_stats() == {
+        "total_cycles": 2,
+        "successful_cycles": 1,
+        "success_rate": 0.5,
+        "avg_reasoning_steps": 2.0,
+        "total_lessons_learned": 2,
+    }
+    # One database instead of a file per cycle, pattern and optimization
+    assert [p.name for p in tmp_path.iterdir() if p.is_dir()] == []
+
+    assert manager.get_cycle(first)["final_solution"] == "done"
+    assert [p["pattern"] for p in manager.find_patterns()] == [
+        "cache hot paths",
+        "retry on timeout",
+    ]
+    (match,) = manager.find_patterns(query="timeout")
+    assert match["cycle_id"] == first
+    assert manager.find_patterns(category="debugging") == [match]
+    (opt,) = manager.find_optimizations(category="performance")
+    assert opt["optimization"] == "batch database writes"
+
+
+def test_totals_persist_across_instances(tmp_path):
+    manager = ReasoningLoopManager(tmp_path)
+    _run_cycle(manager, "general", True)
+
+    reopened = ReasoningLoopManager(tmp_path)
+    assert reopened.get_cycle_stats()["total_cycles"] == 1
+    _run_cycle(reopened, "general", True)
+    assert reopened.get_cycle_stats()["successful_cycles"] == 2
+
+
+def test_legacy_cycle_files_imported_once(tmp_path):
+    legacy = tmp_path / "reasoning_cycles"
+    legacy.mkdir()
+    cycle = {
+        "cycle_id": "cycle_legacy",
+        "timestamp_start": "2025-01-01T00:00:00+00:00",
+        "timestamp_end": "2025-01-01T00:01:00+00:00",
+        "problem_category": "legacy",
+        "reasoning_steps": [{}, {}, {}],
+        "solution_success": True,
+        "lessons_learned": ["a", "b"],
+        "patterns_discovered": ["old pattern"],
+        "optimizations_identified": [],
+    }
+    (legacy / "cycle_legacy.json").write_text(json.dumps(cycle))
+    (legacy / "broken.json").write_text("{")
+
+    manager = ReasoningLoopManager(tmp_path)
+    stats = manager.get_cycle_stats()
+    assert (stats["total_cycles"], stats["total_lessons_learned"]) == (1, 2)
+    assert manager.find_patterns(category="legacy")[0]["pattern"] == (
+        "old pattern"
+    )
+
+    store = ReasoningCycleStore(tmp_path / "reasoning_loop.db")
+    assert store.import_legacy_files(legacy) == 0
+    assert store.stats()["total_cycles"] == 1
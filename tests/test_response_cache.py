@@ -0,0 +1,176 @@
+"""Tests for the model gateway response cache."""
+
+import threading
+import time
+
+from prometheus_client import CollectorRegistry
+
+from aura_ia_mcp.services.model_gateway.adapters.cloud.gateway import (
+    UnifiedModelGateway,
+)
+from aura_ia_mcp.services.model_gateway.response_cache import (
+    ResponseCache,
+    RouteCachePolicy,
+)
+
+PARAMS = {"temperature": 0.0, "max_tokens": 256}
+
+
+def _cache(**kwargs) -> ResponseCache:
+    kwargs.setdefault(
+        "route_policies", {"gateway": RouteCachePolicy(ttl_seconds=60)}
+    )
+    return ResponseCache(metrics_registry=CollectorRegistry(), **kwargs)
+
+
+def test_exact_hit_after_put():
+    cache = _cache()
+    assert cache.get("gateway", "llama3", "What is MCP?", PARAMS) is None
+
+    assert cache.put(
+        "gateway", "llama3", "What is MCP?", PARAMS, {"response": "x"}
+    )
+    hit = cache.get("gateway", "llama3", "  What   is MCP? ", PARAMS)
+
+    assert hit == {"response": "x"}
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_key_includes_model_and_params():
+    cache = _cache()
+    cache.put("gateway", "llama3", "hi", PARAMS, {"response": "a"})
+
+    assert cache.get("gateway", "mistral", "hi", PARAMS) is None
+    assert (
+        cache.get("gateway", "llama3", "hi", {**PARAMS, "max_tokens": 10})
+        is None
+    )
+
+
+def test_returned_response_is_a_copy():
+    cache = _cache()
+    cache.put("gateway", "llama3", "hi", PARAMS, {"response": "a"})
+
+    first = cache.get("gateway", "llama3", "hi", PARAMS)
+    first["response"] = "mutated"
+
+    assert cache.get("gateway", "llama3", "hi", PARAMS)["response"] == "a"
+
+
+def test_non_deterministic_and_disabled_routes_bypass():
+    cache = _cache()
+    hot = {**PARAMS, "temperature": 0.7}
+
+    assert not cache.put("gateway", "llama3", "hi", hot, {"response": "a"})
+    assert not cache.put("other", "llama3", "hi", PARAMS, {"response": "a"})
+
+    disabled = _cache(enabled=False)
+    assert not disabled.put("gateway", "llama3", "hi", PARAMS, {})
+    assert disabled.get("gateway", "llama3", "hi", PARAMS) is None
+
+
+def test_ttl_expiry():
+    cache = _cache()
+    cache.put("gateway", "llama3", "hi", PARAMS, {"response": "a"}, 0.01)
+    time.sleep(0.02)
+
+    assert cache.get("gateway", "llama3", "hi", PARAMS) is None
+    assert cache.get_stats()["expirations"] == 1
+
+
+def test_lru_eviction_is_size_bounded():
+    cache = _cache(max_entries=2)
+    cache.put("gateway", "m", "a", PARAMS, {"response": "a"})
+    cache.put("gateway", "m", "b", PARAMS, {"response": "b"})
+    cache.get("gateway", "m", "a", PARAMS)  # a is now most recent
+    cache.put("gateway", "m", "c", PARAMS, {"response": "c"})
+
+    assert cache.get("gateway", "m", "b", PARAMS) is None
+    assert cache.get("gateway", "m", "a", PARAMS) is not None
+    assert cache.get_stats()["entries"] == 2
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_semantic_lookup_respects_threshold():
+    vectors = {
+        "how do i restart the server": [1.0, 0.0, 0.0],
+        "how can i restart the server": [0.99, 0.01, 0.0],
+        "what is the weather": [0.0, 1.0, 0.0],
+    }
+    cache = _cache(embed_fn=vectors.__getitem__, similarity_threshold=0.95)
+    cache.put(
+        "gateway",
+        "llama3",
+        "how do i restart the server",
+        PARAMS,
+        {"response": "restart"},
+    )
+
+    near = cache.get(
+        "gateway", "llama3", "how can i restart the server", PARAMS
+    )
+    far = cache.get("gateway", "llama3", "what is the weather", PARAMS)
+
+    assert near == {"response": "restart"}
+    assert far is None
+    assert cache.get_stats()["semantic_hits"] == 1
+
+
+async def test_async_lookups_embed_off_the_event_loop():
+    threads = []
+
+    def embed(prompt):
+        threads.append(threading.current_thread())
+        return [1.0, 0.0] if "restart" in prompt else [0.0, 1.0]
+
+    cache = _cache(embed_fn=embed, similarity_threshold=0.95)
+    assert await cache.aput(
+        "gateway", "llama3", "restart it", PARAMS, {"response": "ok"}
+    )
+    hit = await cache.aget("gateway", "llama3", "restart now", PARAMS)
+    miss = await cache.aget("gateway", "llama3", "the weather", PARAMS)
+
+    assert hit == {"response": "ok"}
+    assert miss is None
+    assert len(threads) == 3
+    assert threading.main_thread() not in threads
+
+
+class _StubOllama:
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, prompt, model, options):
+        self.calls += 1
+        return {"response": f"answer to {prompt}"}
+
+    async def health(self):
+        return True
+
+
+class _StubFactory:
+    async def health_check_all(self):
+        return {}
+
+
+async def test_gateway_serves_repeat_requests_from_cache():
+    ollama = _StubOllama()
+    gateway = UnifiedModelGateway(
+        ollama_backend=ollama,
+        cloud_factory=_StubFactory(),
+        response_cache=_cache(),
+    )
+
+    first = await gateway.generate("ping", model="llama3", temperature=0.0)
+    second = await gateway.generate("ping", model="llama3", temperature=0.0)
+
+    assert ollama.calls == 1
+    assert second["response"] == first["response"]
+    assert second["cached"] is True
+    assert gateway.stats["cache_hits"] == 1
+
+    await gateway.generate("ping", model="llama3", temperature=0.5)
+    await gateway.close()
+    assert ollama.calls == 2
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import re
+import time
+
 from src.mcp_server.safety_filter import SafetyFilter
 
 
@@ -41,3 +44,122 @@ def test_safety_filter_confidence_scoring():
 
     assert safe_result["confidence"] == 1.0
     assert severe_result["confidence"] >= 0.8
+
+
+def test_classify_single_pass_stops_at_first_severe():
+    """Moderate terms before a severe one do not change the verdict."""
+    filter_engine = SafetyFilter()
+    result = filter_engine.classify(
+        "A sensitive, controversial hack followed by abuse."
+    )
+    assert result["category"] == "severe"
+    assert result["matches"] == ["hack"]
+
+    moderate = filter_engine.classify("Sensitive and controversial.")
+    assert moderate["matches"] == ["Sensitive", "controversial"]
+
+
+def test_pattern_lists_remain_configurable():
+    """Per-pattern flags survive and list edits are picked up."""
+    filter_engine = SafetyFilter()
+    filter_engine.moderate_patterns.append(re.compile(r"\bRISKY\b"))
+    assert filter_engine.classify("RISKY move")["category"] == "moderate"
+    assert filter_engine.classify("risky move")["category"] == "safe"
+    assert filter_engine.classify("MALWARE")["category"] == "severe"
+
+
+def test_moderate_match_does_not_hide_overlapping_severe_term():
+    """A severe term inside a longer moderate match still blocks."""
+    filter_engine = SafetyFilter()
+    filter_engine.moderate_patterns = [re.compile(r"\bsensitive \w+")]
+    result = filter_engine.classify("a sensitive exploit here")
+    assert result["category"] == "severe"
+    assert result["matches"] == ["exploit"]
+
+    moderate = filter_engine.classify("a sensitive topic, then sensitive data")
+    assert moderate["matches"] == ["sensitive topic", "sensitive data"]
+
+
+def test_patterns_with_named_groups_or_backreferences():
+    """Patterns that cannot be combined are scanned one by one."""
+    filter_engine = SafetyFilter()
+    filter_engine.severe_patterns = [
+        re.compile(r"\b(?P<w>malware)\b"),
+        re.compile(r"\b(?P<w>exploit)\b"),
+    ]
+    filter_engine.moderate_patterns = [re.compile(r"\b(\w+) \1\b")]
+    assert filter_engine.classify("an exploit")["matches"] == ["exploit"]
+    result = filter_engine.classify("very very bad")
+    assert result["category"] == "moderate"
+    assert result["matches"] == ["very very"]
+    assert filter_engine.classify("very bad")["category"] == "safe"
+
+    stream = filter_engine.stream(window=8)
+    stream.feed("some text before mal")
+    stream.feed("ware and more")
+    assert stream.blocked
+
+
+def test_stream_blocks_term_split_across_chunks():
+    """A severe term is caught mid-stream before any of it is released."""
+    stream = SafetyFilter().stream(window=16)
+    released = []
+    chunks = [
+        "Here is a long preamble about Python. Then mal",
+        "ware, followed by the rest of the",
+        " generated answer.",
+    ]
+    for chunk in chunks:
+        released.append(stream.feed(chunk))
+        if stream.blocked:
+            break
+    assert stream.blocked
+    assert len(released) == 2  # stopped before the last chunk
+    assert "mal" not in "".join(released)
+    result = stream.close()
+    assert result["decision"] == "blocked"
+    assert result["classification"]["matches"] == ["malware"]
+
+
+def test_stream_releases_text_and_flags():
+    """Safe and moderate streams release the full text unchanged."""
+    text = "The pharmacy wrote a controversial note on hackathons. " * 5
+    stream = SafetyFilter().stream(window=16)
+    out = [stream.feed(text[i : i + 7]) for i in range(0, len(text), 7)]
+    result = stream.close()
+    assert "".join(out) + result["tail"] == text
+    assert result["filtered_text"] == text
+    assert result["decision"] == "flagged"
+    assert result["classification"]["matches"] == ["controversial"] * 5
+
+
+def test_single_scan_cost_with_early_severe_hit():
+    """Classification cost no longer grows with text after a severe hit."""
+    filter_engine = SafetyFilter()
+    text = "exploit " + "ordinary words " * 20000
+    start = time.perf_counter()
+    for _ in range(20):
+        filter_engine.classify(text)
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(20):
+        for pattern in (
+            filter_engine.severe_patterns + filter_engine.moderate_patterns
+        ):
+            pattern.findall(text)
+    per_pattern = time.perf_counter() - start
+
+    print(
+        f"\nclassify 300KB x20: single pass {single * 1e3:.2f}ms, "
+        f"per-pattern findall {per_pattern * 1e3:.2f}ms"
+    )
+    assert single < per_pattern
+
+
+def test_stream_checks_held_back_tail_on_close():
+    """A term still inside the window is caught when the stream ends."""
+    stream = SafetyFilter().stream()
+    assert stream.feed("All fine until the final hack") == ""
+    assert not stream.blocked
+    assert stream.close()["decision"] == "blocked"
@@ -0,0 +1,184 @@
+"""Tests for content-addressed step memoization."""
+
+import time
+
+from prometheus_client import CollectorRegistry
+
+from aura_ia_mcp.services.model_gateway.core.dag_orchestrator import (
+    DAGOrchestrator,
+)
+from mcp_server.hnsc.step_memo import DEFAULT_TOOL_TTLS, StepMemo
+from mcp_server.hnsc.workflow_engine import (
+    Workflow,
+    WorkflowEngine,
+    WorkflowStatus,
+    WorkflowStep,
+)
+
+
+def test_key_is_canonical_and_bounded():
+    memo = StepMemo(
+        tool_ttls={"search": 60},
+        max_entries=2,
+        metrics_registry=CollectorRegistry(),
+    )
+    memo.put("search", {"q": "a", "k": 5}, ["doc"])
+
+    assert memo.get("search", {"k": 5, "q": "a"}) == (True, ["doc"])
+    assert memo.get("search", {"q": "b", "k": 5}) == (False, None)
+    assert memo.get("write", {"q": "a"}) == (False, None)  # not memoized
+
+    memo.put("search", {"q": "b"}, 2)
+    memo.put("search", {"q": "c"}, 3)
+    stats = memo.get_stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert (stats["hits"], stats["misses"], stats["bypasses"]) == (1, 1, 1)
+
+
+def test_entries_expire_per_tool_ttl():
+    memo = StepMemo({"fast": 0.01, "slow": 60})
+    memo.put("fast", {}, 1)
+    memo.put("slow", {}, 2)
+    time.sleep(0.02)
+
+    assert memo.get("fast", {}) == (False, None)
+    assert memo.get("slow", {}) == (True, 2)
+    assert memo.get_stats()["per_tool"]["fast"] == {"hits": 0, "misses": 1}
+
+
+async def test_dag_memoizes_repeated_tasks_across_runs():
+    calls: list[str] = []
+
+    async def search(inputs, context, task):
+        calls.append(task.id)
+        return {"results": [inputs["query"]]}
+
+    memo = StepMemo(
+        tool_ttls={"search": 60}, metrics_registry=CollectorRegistry()
+    )
+    for _ in range(2):
+        dag = DAGOrchestrator(step_memo=memo)
+        dag.audit_enabled = False
+        dag.create_task(
+            "s",
+            "search",
+            "W",
+            search,
+            inputs={"query": "q"},
+            memo_key="search-v1",
+        )
+        result = await dag.execute()
+
+    assert calls == ["s"]
+    assert result.tasks["s"].output == {"results": ["q"]}
+    assert result.tasks["s"].metadata == {"memoized": True}
+
+
+async def test_dag_does_not_share_memo_between_closures():
+    def make_handler(prefix):
+        async def handler(inputs, context, task):
+            return f"{prefix}:{inputs['query']}"
+
+        return handler
+
+    memo = StepMemo(
+        tool_ttls={"search": 60}, metrics_registry=CollectorRegistry()
+    )
+    outputs = []
+    for prefix in ("a", "b"):
+        dag = DAGOrchestrator(step_memo=memo)
+        dag.audit_enabled = False
+        dag.create_task(
+            "s", "search", "W", make_handler(prefix), inputs={"query": "q"}
+        )
+        result = await dag.execute()
+        outputs.append(result.tasks["s"].output)
+
+    # Same qualname and inputs, different closures: never memoized
+    assert outputs == ["a:q", "b:q"]
+    assert memo.get_stats()["entries"] == 0
+
+
+async def test_failed_tool_results_are_not_memoized():
+    calls: list[str] = []
+
+    async def executor(tool_name, args):
+        calls.append(tool_name)
+        if len(calls) == 1:
+            return {"error": "vector store unavailable"}
+        return {"results": ["doc"]}
+
+    def workflow() -> Workflow:
+        return Workflow(
+            id="wf",
+            name="Search",
+            description="search",
+            steps=[
+                WorkflowStep(
+                    id="search",
+                    name="Search",
+                    tool_name="semantic_search",
+                    arguments={"query": "auth"},
+                ),
+            ],
+        )
+
+    engine = WorkflowEngine(
+        step_memo=StepMemo(metrics_registry=CollectorRegistry())
+    )
+    engine.set_tool_executor(executor)
+    for _ in range(3):
+        await engine.execute_workflow(workflow())
+
+    # The error payload is retried; the first success is reused
+    assert calls == ["semantic_search", "semantic_search"]
+    assert "get_config" not in DEFAULT_TOOL_TTLS
+
+
+async def test_workflow_short_circuits_memoized_steps():
+    calls: list[str] = []
+
+    async def executor(tool_name, args):
+        calls.append(tool_name)
+        return {"tool": tool_name, "query": args.get("query")}
+
+    def workflow(query: str) -> Workflow:
+        return Workflow(
+            id=f"wf-{query}",
+            name="Search",
+            description="search then audit",
+            steps=[
+                WorkflowStep(
+                    id="search",
+                    name="Search",
+                    tool_name="semantic_search",
+                    arguments={"query": "$query"},
+                ),
+                WorkflowStep(
+                    id="audit",
+                    name="Audit",
+                    tool_name="audit_log",
+                    dependencies=["search"],
+                ),
+            ],
+            context={"query": query},
+        )
+
+    engine = WorkflowEngine(step_memo=StepMemo())
+    engine.set_tool_executor(executor)
+    await engine.execute_workflow(workflow("auth"))
+    repeat = await engine.execute_workflow(workflow("auth"))
+    await engine.execute_workflow(workflow("billing"))
+
+    # Resolved arguments form the key; audit_log is never memoized
+    assert calls == [
+        "semantic_search",
+        "audit_log",
+        "audit_log",
+        "semantic_search",
+        "audit_log",
+    ]
+    assert repeat.status == WorkflowStatus.COMPLETED
+    assert repeat.get_step("search").memoized is True
+    assert repeat.context["step_search_result"]["query"] == "auth"
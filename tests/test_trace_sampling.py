@@ -0,0 +1,172 @@
+"""Tests for route, tail and budget-aware trace sampling."""
+
+import json
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_server import trace_sampling
+from observability.otel import otel_integration
+from src.mcp_server import telemetry
+from src.mcp_server.trace_sampling import (
+    AdaptiveBudget,
+    TailSamplingSpanProcessor,
+    TraceSampler,
+    parse_route_rates,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_route_rates_parse_and_match_longest_prefix():
+    rates = parse_route_rates("tool/*=0.2, tool/search*=0.5,chat=2,bad,x=y")
+    assert rates == {"tool/*": 0.2, "tool/search*": 0.5, "chat": 1.0}
+
+    sampler = TraceSampler(default_rate=0.01, route_rates=rates)
+    assert sampler.rate_for("chat") == 1.0
+    assert sampler.rate_for("tool/search_docs") == 0.5
+    assert sampler.rate_for("tool/run") == 0.2
+    assert sampler.rate_for("health") == 0.01
+    assert sampler.active
+    assert not TraceSampler().active
+
+
+def test_slow_and_errored_spans_always_kept():
+    sampler = TraceSampler(default_rate=0.0, slow_threshold=0.5)
+    assert sampler.decide("tool/x", duration=0.01, error=True)
+    assert sampler.decide("tool/x", duration=0.9, error=False)
+    assert not sampler.decide("tool/x", duration=0.01, error=False)
+    assert sampler.stats == {"slow": 1, "error": 1, "sampled": 0, "dropped": 1}
+
+
+def test_fast_successes_sampled_at_route_rate():
+    sampler = TraceSampler(
+        route_rates={"tool/*": 0.1}, rng=random.Random(7).random
+    )
+    kept = sum(
+        sampler.decide("tool/x", duration=0.001, error=False)
+        for _ in range(10000)
+    )
+    assert 850 < kept < 1150
+
+    # Trace ids give the same answer on every call
+    trace_id = 0x1234_5678_9ABC_DEF0
+    first = sampler.head("tool/x", trace_id)
+    assert all(sampler.head("tool/x", trace_id) is first for _ in range(5))
+
+
+def test_budget_holds_export_rate():
+    clock = FakeClock()
+    budget = AdaptiveBudget(100, window=1.0, clock=clock)
+    sampler = TraceSampler(budget=budget, rng=random.Random(1).random)
+
+    def second(offered):
+        kept = 0
+        for _ in range(offered):
+            clock.now += 1.0 / offered
+            kept += sampler.decide("tool/x", duration=0.001, error=False)
+        return kept
+
+    exported = [second(2000) for _ in range(10)]
+    assert exported[0] == 2000
+    assert all(kept < 150 for kept in exported[3:])
+    assert budget.factor == pytest.approx(0.05, rel=0.3)
+
+    # Load drops: the factor recovers towards 1
+    for _ in range(10):
+        second(20)
+    assert budget.factor == 1.0
+
+
+def test_emit_span_skips_dropped_spans(tmp_path, monkeypatch):
+    monkeypatch.setenv("MCP_TOOL_SPANS_DIR", str(tmp_path))
+    monkeypatch.setattr(telemetry, "_sampler", TraceSampler(default_rate=0.0))
+    telemetry.flush_telemetry()
+
+    telemetry.emit_span("fast", start_time=1.0, end_time=1.001)
+    telemetry.emit_span(
+        "failed", start_time=1.0, end_time=1.001, success=False
+    )
+    telemetry.emit_span("slow", start_time=1.0, end_time=3.0)
+    telemetry.flush_telemetry()
+
+    lines = (tmp_path / "mcp_tool_spans.jsonl").read_text().splitlines()
+    assert [json.loads(line)["tool_name"] for line in lines] == [
+        "failed",
+        "slow",
+    ]
+
+
+def _span(trace_id, name, duration, *, root=False, ok=True, sampled=False):
+    return SimpleNamespace(
+        name=name,
+        context=SimpleNamespace(
+            trace_id=trace_id,
+            trace_flags=SimpleNamespace(sampled=sampled),
+        ),
+        parent=None if root else SimpleNamespace(is_remote=False),
+        start_time=0,
+        end_time=int(duration * 1e9),
+        status=SimpleNamespace(is_ok=ok),
+    )
+
+
+class FakeExporter:
+    def __init__(self):
+        self.exported = []
+        self.closed = False
+
+    def export(self, batch):
+        self.exported.extend(span.name for span in batch)
+
+    def shutdown(self):
+        self.closed = True
+
+
+def test_tail_processor_exports_whole_kept_traces():
+    exporter = FakeExporter()
+    sampler = TraceSampler(default_rate=0.0, slow_threshold=0.5)
+    processor = TailSamplingSpanProcessor(sampler, exporter)
+
+    # fast success, not head sampled: dropped
+    processor.on_end(_span(1, "fast.child", 0.01))
+    processor.on_end(_span(1, "fast", 0.02, root=True))
+    # an errored child keeps the trace
+    processor.on_end(_span(2, "err.child", 0.01, ok=False))
+    processor.on_end(_span(2, "err", 0.02, root=True))
+    # slow root
+    processor.on_end(_span(3, "slow", 0.8, root=True))
+    # head sampled fast success
+    processor.on_end(_span(4, "sampled", 0.01, root=True, sampled=True))
+
+    processor.shutdown()
+    assert exporter.exported == ["err.child", "err", "slow", "sampled"]
+    assert exporter.closed
+    assert sampler.stats == {"slow": 1, "error": 1, "sampled": 1, "dropped": 1}
+
+
+def test_tail_processor_evicts_unfinished_traces():
+    exporter = FakeExporter()
+    sampler = TraceSampler(default_rate=0.0, slow_threshold=0.5)
+    processor = TailSamplingSpanProcessor(sampler, exporter, max_traces=2)
+
+    # Roots never end locally; the oldest traces are decided on eviction
+    processor.on_end(_span(1, "a", 0.9))
+    processor.on_end(_span(2, "b", 0.01))
+    processor.on_end(_span(3, "c", 0.01))
+    assert list(processor._traces) == [2, 3]
+
+    processor.force_flush()
+    assert exporter.exported == ["a"]
+    assert processor._traces == {}
+
+
+def test_otel_integration_shares_the_mcp_server_module():
+    assert otel_integration.TraceSampler is trace_sampling.TraceSampler
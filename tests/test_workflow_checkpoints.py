@@ -0,0 +1,174 @@
+"""Tests for checkpointed, resumable DAG and workflow runs."""
+
+import asyncio
+
+import pytest
+
+from aura_ia_mcp.services.model_gateway.core.dag_orchestrator import (
+    DAGOrchestrator,
+    WorkflowExecutionError,
+)
+from mcp_server.hnsc.workflow_engine import (
+    StepStatus,
+    Workflow,
+    WorkflowEngine,
+    WorkflowStatus,
+    WorkflowStep,
+)
+from mcp_server.hnsc.workflow_journal import WorkflowJournal
+
+
+def _build(dag: DAGOrchestrator, calls: list[str], hang: set[str]) -> None:
+    """a -> b -> c, where tasks in ``hang`` block forever (a 'crash')."""
+
+    async def handler(inputs, context, task):
+        calls.append(task.id)
+        if task.id in hang:
+            await asyncio.Event().wait()
+        upstream = [v for k, v in sorted(inputs.items()) if k != "x"]
+        return {"id": task.id, "upstream": upstream}
+
+    dag.create_task("a", "a", "W", handler, inputs={"x": 1})
+    dag.create_task("b", "b", "W", handler, dependencies=["a"])
+    dag.create_task("c", "c", "W", handler, dependencies=["b"])
+
+
+def _orchestrator(store: WorkflowJournal) -> DAGOrchestrator:
+    dag = DAGOrchestrator(checkpoint_store=store)
+    dag.audit_enabled = False
+    return dag
+
+
+async def _interrupt(coro) -> None:
+    """Run a workflow until it stalls, then cancel it like a restart."""
+    run = asyncio.create_task(coro)
+    await asyncio.sleep(0.05)
+    run.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await run
+
+
+async def test_dag_resume_skips_completed_tasks(tmp_path):
+    store = WorkflowJournal(tmp_path / "dag.db")
+    calls: list[str] = []
+    dag = _orchestrator(store)
+    _build(dag, calls, hang={"b"})
+    await _interrupt(dag.execute(name="report", workflow_id="run-1"))
+
+    assert calls == ["a", "b"]
+    assert store.list_resumable() == ["run-1"]
+
+    # "Restarted" process: same tasks, fresh orchestrator
+    calls.clear()
+    dag = _orchestrator(WorkflowJournal(tmp_path / "dag.db"))
+    _build(dag, calls, hang=set())
+    result = await dag.resume("run-1")
+
+    assert calls == ["b", "c"]
+    assert result.workflow_id == "run-1"
+    assert result.metadata["restored"] == 1
+    assert result.tasks["a"].metadata["restored"] is True
+    # Restored output still feeds downstream inputs
+    assert result.tasks["b"].output["upstream"] == [
+        {"id": "a", "upstream": []}
+    ]
+    run = dag.checkpoint_store.load_workflow("run-1")
+    assert run["status"] == "completed"
+
+
+async def test_dag_changed_task_invalidates_checkpoint(tmp_path):
+    store = WorkflowJournal(tmp_path / "dag.db")
+    calls: list[str] = []
+    dag = _orchestrator(store)
+    _build(dag, calls, hang=set())
+    await dag.execute(workflow_id="run-2")
+
+    calls.clear()
+    dag = _orchestrator(store)
+    _build(dag, calls, hang=set())
+    dag.tasks["c"].inputs["x"] = 2
+    result = await dag.execute(workflow_id="run-2")
+
+    assert calls == ["c"]
+    assert result.metadata["restored"] == 2
+
+    # Changing an upstream task invalidates everything downstream of it
+    calls.clear()
+    dag = _orchestrator(store)
+    _build(dag, calls, hang=set())
+    dag.tasks["a"].inputs["x"] = 2
+    dag.tasks["c"].inputs["x"] = 2
+    result = await dag.execute(workflow_id="run-2")
+
+    assert calls == ["a", "b", "c"]
+    assert result.metadata["restored"] == 0
+
+
+async def test_dag_resume_requires_store():
+    dag = DAGOrchestrator()
+    with pytest.raises(WorkflowExecutionError):
+        await dag.resume("missing")
+
+
+def _workflow() -> Workflow:
+    return Workflow(
+        id="wf-1",
+        name="Pipeline",
+        description="edit -> lint -> test",
+        steps=[
+            WorkflowStep(id="edit", name="Edit", tool_name="edit"),
+            WorkflowStep(
+                id="lint", name="Lint", tool_name="lint", dependencies=["edit"]
+            ),
+            WorkflowStep(
+                id="test",
+                name="Test",
+                tool_name="test",
+                arguments={"target": "$target"},
+                dependencies=["lint"],
+            ),
+        ],
+        context={"target": "src"},
+    )
+
+
+async def test_workflow_resume_after_restart(tmp_path):
+    calls: list[str] = []
+
+    async def flaky(tool_name, args):
+        calls.append(tool_name)
+        if tool_name == "lint":
+            raise RuntimeError("linter crashed")
+        return {"tool": tool_name, "args": args}
+
+    engine = WorkflowEngine(journal=WorkflowJournal(tmp_path / "wf.db"))
+    engine.set_tool_executor(flaky)
+    workflow = await engine.execute_workflow(_workflow())
+
+    assert workflow.status == WorkflowStatus.FAILED
+    assert calls == ["edit", "lint"]
+
+    async def healthy(tool_name, args):
+        calls.append(tool_name)
+        return {"tool": tool_name, "args": args}
+
+    calls.clear()
+    restarted = WorkflowEngine(journal=WorkflowJournal(tmp_path / "wf.db"))
+    restarted.set_tool_executor(healthy)
+    assert restarted._journal.list_resumable() == ["wf-1"]
+    workflow = await restarted.resume_workflow("wf-1")
+
+    assert calls == ["lint", "test"]
+    assert workflow.status == WorkflowStatus.COMPLETED
+    assert all(s.status == StepStatus.COMPLETED for s in workflow.steps)
+    assert workflow.context["step_edit_result"] == {
+        "tool": "edit",
+        "args": {},
+    }
+    assert workflow.get_step("test").result["args"] == {"target": "src"}
+    assert restarted._journal.list_resumable() == []
+
+
+async def test_workflow_resume_unknown_id_returns_none():
+    engine = WorkflowEngine()
+    assert await engine.resume_workflow("nope") is None
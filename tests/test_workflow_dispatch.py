@@ -0,0 +1,177 @@
+"""Tests and benchmark for continuous-flow workflow step dispatch."""
+
+import asyncio
+import random
+import time
+
+from mcp_server.hnsc.workflow_engine import (
+    StepStatus,
+    Workflow,
+    WorkflowEngine,
+    WorkflowStatus,
+    WorkflowStep,
+)
+
+
+def _engine(durations: dict[str, float], log: list[str]) -> WorkflowEngine:
+    async def executor(tool_name, args):
+        await asyncio.sleep(durations.get(tool_name, 0))
+        if tool_name == "boom":
+            raise RuntimeError("boom")
+        log.append(tool_name)
+        return tool_name
+
+    engine = WorkflowEngine()
+    engine.set_tool_executor(executor)
+    return engine
+
+
+async def test_freed_slot_is_refilled_immediately():
+    log: list[str] = []
+    engine = _engine({"slow": 0.2}, log)
+    workflow = Workflow(
+        id="wf",
+        name="wf",
+        description="",
+        steps=[
+            WorkflowStep(id=t, name=t, tool_name=t)
+            for t in ("slow", "a", "b", "c")
+        ],
+    )
+
+    start = time.monotonic()
+    await engine.execute_workflow(workflow, max_concurrent=2)
+
+    # Batch dispatch would have held a, b and c behind the slow step
+    assert log == ["a", "b", "c", "slow"]
+    assert time.monotonic() - start < 0.3
+
+
+async def test_failed_dependency_skips_or_blocks_dependents():
+    log: list[str] = []
+    engine = _engine({}, log)
+    workflow = Workflow(
+        id="wf",
+        name="wf",
+        description="",
+        steps=[
+            WorkflowStep(id="bad", name="bad", tool_name="boom"),
+            WorkflowStep(
+                id="skip",
+                name="skip",
+                tool_name="x",
+                dependencies=["bad"],
+                skip_on_failure=True,
+            ),
+            WorkflowStep(
+                id="after_skip",
+                name="after_skip",
+                tool_name="y",
+                dependencies=["skip"],
+                skip_on_failure=True,
+            ),
+            WorkflowStep(
+                id="blocked",
+                name="blocked",
+                tool_name="z",
+                dependencies=["bad"],
+            ),
+            WorkflowStep(id="ok", name="ok", tool_name="ok"),
+        ],
+    )
+
+    await engine.execute_workflow(workflow)
+
+    assert log == ["ok"]
+    assert workflow.status == WorkflowStatus.FAILED
+    assert workflow.get_step("skip").status == StepStatus.SKIPPED
+    assert workflow.get_step("after_skip").status == StepStatus.SKIPPED
+    assert workflow.get_step("blocked").status == StepStatus.PENDING
+
+
+def test_get_step_index_tracks_added_steps():
+    workflow = Workflow(id="wf", name="wf", description="")
+    assert workflow.get_step("a") is None
+    step = WorkflowStep(id="a", name="a", tool_name="a")
+    workflow.steps.append(step)
+    assert workflow.get_step("a") is step
+
+
+# ---------------------------------------------------------------------------
+# Benchmark: steps vs. wall time, batch loop vs. continuous flow
+# ---------------------------------------------------------------------------
+
+
+def _layered_workflow(n_steps: int, seed: int = 11) -> Workflow:
+    """Layers of 20 steps; 10% of steps are 10x slower than the rest."""
+    rng = random.Random(seed)
+    width = 20
+    steps = []
+    for i in range(n_steps):
+        layer = i // width
+        deps = []
+        if layer:
+            prev = range((layer - 1) * width, layer * width)
+            deps = [f"s{j}" for j in rng.sample(prev, 2)]
+        tool = "slow" if rng.random() < 0.1 else "fast"
+        steps.append(
+            WorkflowStep(
+                id=f"s{i}", name=f"s{i}", tool_name=tool, dependencies=deps
+            )
+        )
+    return Workflow(id="bench", name="bench", description="", steps=steps)
+
+
+async def _batch_loop(engine: WorkflowEngine, workflow: Workflow, limit: int):
+    """Reference: the previous slice-and-gather loop with linear lookups."""
+
+    def find(step_id):
+        for step in workflow.steps:
+            if step.id == step_id:
+                return step
+        return None
+
+    while not workflow.is_complete():
+        ready = [
+            s
+            for s in workflow.steps
+            if s.status == StepStatus.PENDING
+            and all(
+                (dep := find(d)) and dep.status == StepStatus.COMPLETED
+                for d in s.dependencies
+            )
+        ]
+        if not ready:
+            break
+        await asyncio.gather(
+            *(engine._execute_step(workflow, s) for s in ready[:limit])
+        )
+
+
+async def test_benchmark_continuous_flow_scaling():
+    durations = {"fast": 0.001, "slow": 0.01}
+    limit = 8
+    rows = []
+    for n_steps in (100, 200, 400):
+        engine = _engine(durations, [])
+
+        workflow = _layered_workflow(n_steps)
+        start = time.monotonic()
+        await _batch_loop(engine, workflow, limit)
+        batch = time.monotonic() - start
+
+        workflow = _layered_workflow(n_steps)
+        start = time.monotonic()
+        await engine.execute_workflow(workflow, max_concurrent=limit)
+        flow = time.monotonic() - start
+
+        assert workflow.status == WorkflowStatus.COMPLETED
+        rows.append((n_steps, batch, flow))
+
+    print("\nsteps   batch_ms   flow_ms   speedup")
+    for n_steps, batch, flow in rows:
+        print(
+            f"{n_steps:5d}  {batch * 1000:9.0f}  {flow * 1000:8.0f}"
+            f"  {batch / flow:7.1f}x"
+        )
+    assert rows[-1][2] < rows[-1][1]
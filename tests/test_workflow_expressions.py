@@ -0,0 +1,128 @@
+"""Tests and micro-benchmark for compiled workflow expressions."""
+
+import time
+
+from mcp_server.hnsc.workflow_engine import WorkflowStep
+from mcp_server.hnsc.workflow_expressions import (
+    compile_arguments,
+    compile_condition,
+)
+
+CONTEXT = {
+    "mode": "fast",
+    "count": 5,
+    "target": "src",
+    "target_dir": "build",
+    "step_search_result": {"hits": [{"path": "a.py"}], "total": 1},
+}
+
+
+def test_conditions():
+    cases = {
+        "true": True,
+        "FALSE": False,
+        "$mode exists": True,
+        "$missing exists": False,
+        "$mode == fast": True,
+        '$mode != "fast"': False,
+        "$count > 3": True,
+        "$count <= 3": False,
+        "$step_search_result.total >= 1": True,
+        "$step_search_result.hits.0.path == a.py": True,
+        "$mode == slow or $count > 3": True,
+        "$mode == fast and $count > 10": False,
+        "not $missing exists": True,
+        "$mode == 'x and y'": False,
+        "unparseable condition": True,  # unchanged default
+    }
+    for condition, expected in cases.items():
+        assert compile_condition(condition)(CONTEXT) is expected, condition
+
+
+def test_arguments_keep_types_and_do_not_corrupt_values():
+    args = {
+        "results": "$step_search_result",
+        "first": "$step_search_result.hits.0.path",
+        "limit": 10,
+        "flags": [True, "$count"],
+        "message": "build $target into $target_dir/$target.tar, $unknown",
+        "nested": {"mode": "$mode", "raw": {"$": 1}},
+    }
+
+    resolved = compile_arguments(args)(CONTEXT)
+
+    assert resolved["results"] is CONTEXT["step_search_result"]
+    assert resolved["first"] == "a.py"
+    assert resolved["limit"] == 10
+    assert resolved["flags"] == [True, 5]
+    # $target must not clobber $target_dir; unknown vars stay literal
+    assert resolved["message"] == "build src into build/src.tar, $unknown"
+    assert resolved["nested"] == {"mode": "fast", "raw": {"$": 1}}
+    assert args["flags"] == [True, "$count"]  # template untouched
+
+
+def test_step_recompiles_when_template_replaced():
+    step = WorkflowStep(
+        id="s", name="s", tool_name="t", arguments={"q": "$mode"}
+    )
+    assert step.resolve_arguments(CONTEXT) == {"q": "fast"}
+    step.arguments = {"q": "$target"}
+    step.condition = "$count > 9"
+    assert step.resolve_arguments(CONTEXT) == {"q": "src"}
+    assert step.should_run(CONTEXT) is False
+
+
+# ---------------------------------------------------------------------------
+# Micro-benchmark: per-step overhead on a large argument payload
+# ---------------------------------------------------------------------------
+
+
+def _legacy_prepare(step: WorkflowStep, context: dict) -> dict:
+    """The previous per-step condition parse and str(args) substitution."""
+    condition = step.condition.strip()
+    if "==" in condition:
+        name, expected = condition.split("==")
+        assert (
+            str(context.get(name.strip().lstrip("$"), "")) == expected.strip()
+        )
+    args = {**step.arguments}
+    for key, value in context.items():
+        if f"${key}" in str(args):
+            for arg_key, arg_val in args.items():
+                if isinstance(arg_val, str):
+                    args[arg_key] = arg_val.replace(f"${key}", str(value))
+    return args
+
+
+def test_benchmark_compiled_step_overhead():
+    context = {f"var{i}": f"value{i}" for i in range(30)}
+    context["step_prev_result"] = {"rows": list(range(2000))}
+    arguments = {f"field{i}": "x" * 200 for i in range(200)}
+    arguments["query"] = "$var3 and $var7"
+    arguments["payload"] = {"matrix": [[i] * 10 for i in range(500)]}
+    step = WorkflowStep(
+        id="s",
+        name="s",
+        tool_name="t",
+        arguments=arguments,
+        condition="$var1 == value1",
+    )
+    rounds = 50
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        _legacy_prepare(step, context)
+    legacy = (time.perf_counter() - start) / rounds
+
+    step.compile()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        step.should_run(context)
+        step.resolve_arguments(context)
+    compiled = (time.perf_counter() - start) / rounds
+
+    print(
+        f"\nper-step overhead: legacy={legacy * 1e6:.0f}us "
+        f"compiled={compiled * 1e6:.0f}us ({legacy / compiled:.0f}x)"
+    )
+    assert compiled < legacy